@@ -1,9 +1,17 @@
-from flask import Flask, jsonify, request
+from flask import Flask, jsonify, request, Response, stream_with_context
 from flask_cors import CORS
+import os
 import time
 import threading
 import json
 from simulacao import Simulacao
+from sessoes import INTERVALO_PUBLICACAO, GerenciadorSessoes, conectar_publicacao
+from utils.config import (
+    EVENT_STREAM_BATCH, SERVER_EVENT_LOG_DIR, SERVER_HOST, SERVER_PORT, SERVER_SNAPSHOT_DIR, SERVER_THREADS,
+    SERVER_TRACE_DIR
+)
+from utils.helpers import caminho_no_diretorio
+from utils.registro_entidades import registro_entidades
 app = Flask(__name__)
 CORS(app)  # Habilitar CORS para todas as rotas
 
@@ -11,8 +19,16 @@ CORS(app)  # Habilitar CORS para todas as rotas
 simulacao = None
 thread_simulacao = None
 executando = False
+feed_alteracoes = None  # Feed de alterações da simulação atual
+publicador_estado = None  # Snapshots serializados servidos pelos endpoints GET
+canal_eventos = None  # Eventos enviados aos clientes de /api/eventos/stream
+trava_simulacao = threading.RLock()  # Serializa os passos da simulação global e as alterações das requisições
 
-import time
+# Mundos servidos em /api/mundos/<mundo_id>/...
+gerenciador_sessoes = GerenciadorSessoes()
+
+# Tempo máximo de espera do long-poll e intervalo de keep-alive do SSE, em segundos
+ESPERA_MAXIMA_ALTERACOES = 30.0
 
 def executar_simulacao():
     """Função para executar a simulação em uma thread separada."""
@@ -32,22 +48,131 @@ def executar_simulacao():
         # Limita para evitar saltos grandes
         delta_tempo_simulacao = min(delta_tempo_simulacao, 0.1)
 
-        # Atualiza o tempo total da simulação
-        simulacao.tempo_simulacao += delta_tempo_simulacao
+        # Avança a simulação (tempo, atualização, eventos, ações divinas e callbacks)
+        with trava_simulacao:
+            simulacao.passo(delta_tempo_simulacao)
 
-        # Chama o método correto
-        simulacao._atualizar(delta_tempo_simulacao)
-        simulacao._processar_eventos_pendentes()
-        simulacao._processar_acoes_divinas_pendentes()
+        time.sleep(simulacao.intervalo_atualizacao)
 
-        # (Opcional) Chama callbacks de atualização, se necessário
-        for callback in simulacao.callbacks["atualizacao"]:
-            try:
-                callback(simulacao)
-            except Exception as e:
-                print(f"Erro em callback de atualização: {e}")
 
-        time.sleep(simulacao.intervalo_atualizacao)
+def conectar_feed(nova_simulacao):
+    """
+    Cria o feed de alterações, o publicador de snapshots e o canal de eventos de
+    uma simulação e os registra como callbacks. Deve ser chamado antes de iniciar
+    a thread da simulação.
+
+    Args:
+        nova_simulacao (Simulacao): Simulação que passa a ser servida pela API.
+    """
+    global feed_alteracoes, publicador_estado, canal_eventos
+
+    feed_alteracoes, publicador_estado, canal_eventos = conectar_publicacao(nova_simulacao, INTERVALO_PUBLICACAO)
+
+
+class _SessaoGlobal:
+    """
+    Visão da simulação global com a interface de uma Sessao, usada pelas rotas /api/...
+    """
+
+    trava = trava_simulacao
+
+    @property
+    def simulacao(self):
+        return simulacao
+
+    @property
+    def feed_alteracoes(self):
+        return feed_alteracoes
+
+    @property
+    def publicador_estado(self):
+        return publicador_estado
+
+    @property
+    def canal_eventos(self):
+        return canal_eventos
+
+
+SESSAO_GLOBAL = _SessaoGlobal()
+
+
+def rota(caminho, **opcoes):
+    """
+    Registra um endpoint em /api<caminho>, para a simulação global, e em
+    /api/mundos/<mundo_id><caminho>, para cada mundo do gerenciador de sessões.
+    A função decorada recebe a sessão como primeiro argumento.
+
+    Args:
+        caminho (str): Caminho do endpoint, a partir de /api.
+        **opcoes: Opções repassadas para `app.add_url_rule` (ex: methods).
+
+    Returns:
+        function: Decorador.
+    """
+    def decorador(funcao):
+        def na_simulacao_global(**argumentos):
+            return funcao(SESSAO_GLOBAL, **argumentos)
+
+        def no_mundo(mundo_id, **argumentos):
+            sessao = gerenciador_sessoes.obter(mundo_id)
+            if sessao is None:
+                return jsonify({"status": "error", "mensagem": "Mundo não encontrado"})
+            return funcao(sessao, **argumentos)
+
+        app.add_url_rule(f"/api{caminho}", funcao.__name__, na_simulacao_global, **opcoes)
+        app.add_url_rule(f"/api/mundos/<mundo_id>{caminho}", f"{funcao.__name__}_mundo", no_mundo, **opcoes)
+        return funcao
+
+    return decorador
+
+
+def responder_json(conteudo):
+    """
+    Cria uma resposta a partir de JSON já serializado.
+
+    Args:
+        conteudo (str): JSON serializado.
+
+    Returns:
+        Response: Resposta HTTP com mimetype application/json.
+    """
+    return Response(conteudo, mimetype='application/json')
+
+
+def obter_snapshot(sessao=SESSAO_GLOBAL):
+    """
+    Obtém o último snapshot publicado da simulação, sem tocar nos objetos vivos.
+
+    Args:
+        sessao (Sessao, optional): Sessão consultada. Default é a simulação global.
+
+    Returns:
+        SnapshotEstado: Snapshot atual, ou None se não houver simulação.
+    """
+    publicador = sessao.publicador_estado
+    if sessao.simulacao is None or publicador is None:
+        return None
+    return publicador.atual
+
+
+def diretorio_log_eventos(dados):
+    """
+    Obtém o diretório do log de eventos em disco pedido no corpo de uma requisição.
+    O cliente informa apenas o nome do diretório, criado dentro de SERVER_EVENT_LOG_DIR.
+
+    Args:
+        dados (dict): Corpo da requisição.
+
+    Returns:
+        str: Caminho do diretório, ou None se o log não foi pedido.
+
+    Raises:
+        ValueError: Se o nome for inválido.
+    """
+    nome = dados.get('diretorio_log_eventos')
+    if nome is None:
+        return None
+    return caminho_no_diretorio(SERVER_EVENT_LOG_DIR, nome)
 
 
 @app.route('/api/iniciar', methods=['POST'])
@@ -55,19 +180,29 @@ def iniciar_simulacao():
     """Inicia uma nova simulação."""
     global simulacao, thread_simulacao, executando
 
+    # Obter parâmetros da requisição
+    dados = request.json or {}
+    tamanho_mundo = dados.get('tamanho_mundo', (100, 100))
+    num_senciantes_iniciais = dados.get('num_senciantes_iniciais', 10)
+    try:
+        diretorio_eventos = diretorio_log_eventos(dados)
+    except ValueError as e:
+        return jsonify({"status": "error", "mensagem": str(e)})
+
     # Parar simulação existente, se houver
     if executando:
         executando = False
         if thread_simulacao:
             thread_simulacao.join()
 
-    # Obter parâmetros da requisição
-    dados = request.json
-    tamanho_mundo = dados.get('tamanho_mundo', (100, 100))
-    num_senciantes_iniciais = dados.get('num_senciantes_iniciais', 10)
+    # Fechar o log de eventos da simulação anterior antes que outra o reabra
+    if simulacao:
+        simulacao.mundo.historico.fechar_log_eventos()
 
     # Criar nova simulação
-    simulacao = Simulacao(tamanho_mundo=tamanho_mundo, num_senciantes_inicial=num_senciantes_iniciais)
+    simulacao = Simulacao(tamanho_mundo=tamanho_mundo, num_senciantes_inicial=num_senciantes_iniciais,
+                          diretorio_log_eventos=diretorio_eventos)
+    conectar_feed(simulacao)
 
     # Iniciar thread de simulação
     executando = True
@@ -88,126 +223,297 @@ def parar_simulacao():
     else:
         return jsonify({"status": "error", "mensagem": "Nenhuma simulação em execução"})
 
-@app.route('/api/pausar', methods=['POST'])
-def pausar_simulacao():
+@rota('/pausar', methods=['POST'])
+def pausar_simulacao(sessao):
     """Pausa a simulação em execução."""
-    global simulacao
+    simulacao = sessao.simulacao
 
     if simulacao:
-        simulacao.pausar()
+        with sessao.trava:
+            simulacao.pausar()
         return jsonify({"status": "success", "mensagem": "Simulação pausada com sucesso"})
     else:
         return jsonify({"status": "error", "mensagem": "Nenhuma simulação em execução"})
 
-@app.route('/api/retomar', methods=['POST'])
-def retomar_simulacao():
+@rota('/retomar', methods=['POST'])
+def retomar_simulacao(sessao):
     """Retoma a simulação pausada."""
-    global simulacao
+    simulacao = sessao.simulacao
 
     if simulacao:
-        simulacao.retomar()
+        with sessao.trava:
+            simulacao.retomar()
         return jsonify({"status": "success", "mensagem": "Simulação retomada com sucesso"})
     else:
         return jsonify({"status": "error", "mensagem": "Nenhuma simulação em execução"})
 
-@app.route('/api/acelerar', methods=['POST'])
-def acelerar_simulacao():
+@rota('/acelerar', methods=['POST'])
+def acelerar_simulacao(sessao):
     """Acelera a simulação."""
-    global simulacao
+    simulacao = sessao.simulacao
 
     if simulacao:
         fator = request.json.get('fator', 2)
-        simulacao.acelerar(fator)
+        with sessao.trava:
+            simulacao.acelerar(fator)
         return jsonify({"status": "success", "mensagem": f"Simulação acelerada por um fator de {fator}"})
     else:
         return jsonify({"status": "error", "mensagem": "Nenhuma simulação em execução"})
 
-@app.route('/api/desacelerar', methods=['POST'])
-def desacelerar_simulacao():
+@rota('/desacelerar', methods=['POST'])
+def desacelerar_simulacao(sessao):
     """Desacelera a simulação."""
-    global simulacao
+    simulacao = sessao.simulacao
 
     if simulacao:
         fator = request.json.get('fator', 2)
-        simulacao.desacelerar(fator)
+        with sessao.trava:
+            simulacao.desacelerar(fator)
         return jsonify({"status": "success", "mensagem": f"Simulação desacelerada por um fator de {fator}"})
     else:
         return jsonify({"status": "error", "mensagem": "Nenhuma simulação em execução"})
 
-@app.route('/api/estado', methods=['GET'])
-def obter_estado():
+@rota('/estado', methods=['GET'])
+def obter_estado(sessao):
     """Obtém o estado atual da simulação."""
-    global simulacao
+    snapshot = obter_snapshot(sessao)
 
-    if simulacao:
-        return jsonify(simulacao.to_dict())
+    if snapshot:
+        return responder_json(snapshot.secoes["estado"])
     else:
         return jsonify({"status": "error", "mensagem": "Nenhuma simulação em execução"})
 
-@app.route('/api/senciantes', methods=['GET'])
-def obter_senciantes():
+@rota('/senciantes', methods=['GET'])
+def obter_senciantes(sessao):
     """Obtém informações sobre os Senciantes."""
-    global simulacao
+    snapshot = obter_snapshot(sessao)
 
-    if simulacao:
-        return jsonify({k: v.to_dict() for k, v in simulacao.senciantes.items()})
+    if snapshot:
+        return responder_json(snapshot.secoes["senciantes"])
     else:
         return jsonify({"status": "error", "mensagem": "Nenhuma simulação em execução"})
 
-@app.route('/api/senciante/<id_senciante>', methods=['GET'])
-def obter_senciante(id_senciante):
+@rota('/alteracoes', methods=['GET'])
+def obter_alteracoes(sessao):
+    """
+    Obtém as alterações dos Senciantes desde uma versão (long-poll).
+    Parâmetros: `desde` (versão conhecida, 0 para o estado completo), `feed_id`
+    (ID do feed conhecido) e `espera` (segundos a aguardar por uma versão nova).
+    """
+    feed = sessao.feed_alteracoes
+
+    if feed is None:
+        return jsonify({"status": "error", "mensagem": "Nenhuma simulação em execução"})
+
+    desde = request.args.get('desde', 0, type=int)
+    feed_id = request.args.get('feed_id')
+    espera = min(request.args.get('espera', 0.0, type=float), ESPERA_MAXIMA_ALTERACOES)
+
+    if espera > 0 and (feed_id is None or feed_id == feed.id):
+        feed.aguardar(desde, timeout=espera)
+
+    return jsonify(feed.alteracoes_desde(desde, feed_id))
+
+@rota('/alteracoes/stream', methods=['GET'])
+def transmitir_alteracoes(sessao):
+    """
+    Transmite as alterações dos Senciantes via Server-Sent Events.
+    Cada evento "alteracoes" tem como id a versão do feed; reconexões usam o
+    cabeçalho Last-Event-ID (ou o parâmetro `desde`) para continuar de onde pararam.
+    """
+    feed = sessao.feed_alteracoes
+
+    if feed is None:
+        return jsonify({"status": "error", "mensagem": "Nenhuma simulação em execução"})
+
+    desde = request.headers.get('Last-Event-ID', request.args.get('desde', 0), type=int)
+    feed_id = request.args.get('feed_id')
+
+    def gerar():
+        versao = desde
+        conhecido = feed_id
+        while feed is sessao.feed_alteracoes:
+            if versao and conhecido == feed.id and not feed.aguardar(versao, timeout=ESPERA_MAXIMA_ALTERACOES):
+                # Manter a conexão viva
+                yield ": keep-alive\n\n"
+                continue
+
+            alteracoes = feed.alteracoes_desde(versao, conhecido)
+            versao = alteracoes["versao"]
+            conhecido = alteracoes["feed_id"]
+            yield f"id: {versao}\nevent: alteracoes\ndata: {json.dumps(alteracoes)}\n\n"
+
+    return Response(stream_with_context(gerar()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache'})
+
+@rota('/eventos/stream', methods=['GET'])
+def transmitir_eventos(sessao):
+    """
+    Transmite nascimentos, mortes, construções e tecnologias via Server-Sent Events,
+    em lotes de até `lote` eventos. Filtros: `tipos` (separados por vírgula),
+    `entidade` (IDs inteiros separados por vírgula) e `regiao` (x_min,y_min,x_max,y_max).
+    Clientes lentos perdem os eventos mais antigos; cada lote informa quantos foram descartados.
+    """
+    canal = sessao.canal_eventos
+
+    if canal is None:
+        return jsonify({"status": "error", "mensagem": "Nenhuma simulação em execução"})
+
+    tipos = request.args.get('tipos')
+    entidades = request.args.get('entidade')
+    regiao = request.args.get('regiao')
+    max_eventos = max(1, min(request.args.get('lote', EVENT_STREAM_BATCH, type=int), EVENT_STREAM_BATCH))
+
+    try:
+        regiao = [float(v) for v in regiao.split(',')] if regiao else None
+        if regiao is not None and len(regiao) != 4:
+            raise ValueError
+    except ValueError:
+        return jsonify({"status": "error", "mensagem": "Região deve ser x_min,y_min,x_max,y_max"})
+
+    assinante = canal.assinar(
+        tipos=tipos.split(',') if tipos else None,
+        entidades=[registro_entidades.interno(v) for v in entidades.split(',')] if entidades else None,
+        regiao=regiao
+    )
+
+    # Senciantes na região acompanhada pelo cliente são atualizados a cada passo
+    nivel_detalhe = getattr(sessao.simulacao, 'nivel_detalhe', None)
+    if nivel_detalhe is not None and regiao is not None:
+        nivel_detalhe.observar(regiao)
+
+    def gerar():
+        try:
+            # Enviar os cabeçalhos e confirmar a assinatura antes do primeiro evento
+            yield ": conectado\n\n"
+            while canal is sessao.canal_eventos:
+                eventos, descartados = assinante.receber(max_eventos, timeout=ESPERA_MAXIMA_ALTERACOES)
+                if not eventos and not descartados:
+                    # Manter a conexão viva
+                    yield ": keep-alive\n\n"
+                    continue
+
+                lote = {"eventos": eventos, "descartados": descartados}
+                yield f"event: eventos\ndata: {json.dumps(lote, default=str)}\n\n"
+        finally:
+            canal.cancelar(assinante)
+            if nivel_detalhe is not None and regiao is not None:
+                nivel_detalhe.deixar_de_observar(regiao)
+
+    return Response(stream_with_context(gerar()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache'})
+
+@rota('/senciante/<id_senciante>', methods=['GET'])
+def obter_senciante(sessao, id_senciante):
     """Obtém informações sobre um Senciante específico."""
-    global simulacao
+    snapshot = obter_snapshot(sessao)
+    id_senciante = registro_entidades.interno(id_senciante)
 
-    if simulacao and id_senciante in simulacao.ambiente.senciantes:
-        return jsonify(simulacao.senciantes[id_senciante].to_dict())
+    if snapshot and id_senciante in snapshot.senciantes:
+        return responder_json(snapshot.senciantes[id_senciante])
     else:
         return jsonify({"status": "error", "mensagem": "Senciante não encontrado"})
 
-@app.route('/api/recursos', methods=['GET'])
-def obter_recursos():
+@rota('/recursos', methods=['GET'])
+def obter_recursos(sessao):
     """Obtém informações sobre os recursos."""
-    global simulacao
+    snapshot = obter_snapshot(sessao)
 
-    if simulacao:
-        return jsonify({k: v.to_dict() for k, v in simulacao.mundo.recursos.items()})
+    if snapshot:
+        return responder_json(snapshot.secoes["recursos"])
     else:
         return jsonify({"status": "error", "mensagem": "Nenhuma simulação em execução"})
 
-@app.route('/api/construcoes', methods=['GET'])
-def obter_construcoes():
+@rota('/construcoes', methods=['GET'])
+def obter_construcoes(sessao):
     """Obtém informações sobre as construções."""
-    global simulacao
+    snapshot = obter_snapshot(sessao)
 
-    if simulacao:
-        return jsonify([c.to_dict() for c in simulacao.mundo.construcoes.values()])
+    if snapshot:
+        return responder_json(snapshot.secoes["construcoes"])
     else:
         return jsonify({"status": "error", "mensagem": "Nenhuma simulação em execução"})
 
-@app.route('/api/historico', methods=['GET'])
-def obter_historico():
+@rota('/historico', methods=['GET'])
+def obter_historico(sessao):
     """Obtém o histórico da simulação."""
-    global simulacao
+    snapshot = obter_snapshot(sessao)
 
-    if simulacao:
-        return jsonify(simulacao.mundo.historico.to_dict())
+    if snapshot:
+        return responder_json(snapshot.secoes["historico"])
     else:
         return jsonify({"status": "error", "mensagem": "Nenhuma simulação em execução"})
 
-@app.route('/api/clima', methods=['GET'])
-def obter_clima():
+@rota('/historico/serie', methods=['GET'])
+def obter_serie_historico(sessao):
+    """
+    Consulta uma série de estatísticas do histórico em um intervalo de tempo.
+    Parâmetros: `nome` ("populacao" ou "recursos"), `recurso` (tipo de recurso),
+    `inicio` e `fim` (tempo de simulação, em horas) e `resolucao` ("bruto", "hora" ou "dia").
+    As séries são lidas de forma consistente sem bloquear a thread da simulação.
+    """
+    simulacao = sessao.simulacao
+
+    if not simulacao:
+        return jsonify({"status": "error", "mensagem": "Nenhuma simulação em execução"})
+
+    try:
+        serie = simulacao.mundo.historico.obter_serie(
+            request.args.get('nome', 'populacao'),
+            recurso=request.args.get('recurso'),
+            tempo_inicio=request.args.get('inicio', type=float),
+            tempo_fim=request.args.get('fim', type=float),
+            resolucao=request.args.get('resolucao', 'bruto')
+        )
+    except ValueError as e:
+        return jsonify({"status": "error", "mensagem": str(e)})
+
+    if serie is None:
+        return jsonify({"status": "error", "mensagem": "Série não encontrada"})
+
+    return jsonify(serie)
+
+@rota('/historico/eventos', methods=['GET'])
+def obter_eventos_historico(sessao):
+    """
+    Consulta os eventos gravados no log em disco em um intervalo de tempo.
+    Parâmetros: `inicio` e `fim` (tempo de simulação, em horas), `tipo` e `limite`
+    (número máximo de eventos, default 1000).
+    """
+    simulacao = sessao.simulacao
+
+    if not simulacao:
+        return jsonify({"status": "error", "mensagem": "Nenhuma simulação em execução"})
+
+    log_eventos = simulacao.mundo.historico.log_eventos
+    if log_eventos is None:
+        return jsonify({"status": "error", "mensagem": "Log de eventos em disco não está ativo"})
+
+    limite = request.args.get('limite', 1000, type=int)
+    eventos = []
+    for evento in log_eventos.reproduzir(request.args.get('inicio', type=float),
+                                         request.args.get('fim', type=float),
+                                         request.args.get('tipo')):
+        if len(eventos) >= limite:
+            break
+        eventos.append(evento)
+
+    return jsonify(eventos)
+
+@rota('/clima', methods=['GET'])
+def obter_clima(sessao):
     """Obtém informações sobre o clima."""
-    global simulacao
+    snapshot = obter_snapshot(sessao)
 
-    if simulacao:
-        return jsonify(simulacao.mundo.clima.to_dict())
+    if snapshot:
+        return responder_json(snapshot.secoes["clima"])
     else:
         return jsonify({"status": "error", "mensagem": "Nenhuma simulação em execução"})
 
-@app.route('/api/acao_jogador', methods=['POST'])
-def executar_acao_jogador():
+@rota('/acao_jogador', methods=['POST'])
+def executar_acao_jogador(sessao):
     """Executa uma ação do jogador."""
-    global simulacao
+    simulacao = sessao.simulacao
 
     if simulacao:
         dados = request.json
@@ -216,23 +522,94 @@ def executar_acao_jogador():
         intensidade = dados.get('intensidade', 0.5)
         duracao = dados.get('duracao', 10)
 
-        id_acao = simulacao.adicionar_acao_jogador(tipo, alvo, intensidade, duracao)
+        with sessao.trava:
+            id_acao = simulacao.adicionar_acao_jogador(tipo, alvo, intensidade, duracao)
         return jsonify({"status": "success", "id_acao": id_acao})
     else:
         return jsonify({"status": "error", "mensagem": "Nenhuma simulação em execução"})
 
-@app.route('/api/salvar', methods=['POST'])
-def salvar_estado():
-    """Salva o estado atual da simulação."""
-    global simulacao
+@rota('/perf', methods=['GET'])
+def obter_perfil(sessao):
+    """
+    Obtém o perfil de desempenho dos passos: passos por segundo, p50/p95/máximo
+    de cada fase e contagens de entidades.
+    """
+    simulacao = sessao.simulacao
+
+    if not simulacao:
+        return jsonify({"status": "error", "mensagem": "Nenhuma simulação em execução"})
+
+    perfil = simulacao.perfil
+    if perfil is None:
+        return jsonify({"ativo": False})
+
+    resumo = perfil.resumo()
+    resumo["ativo"] = True
+    resumo["arquivo_trace"] = perfil.arquivo_trace
+    return jsonify(resumo)
+
+@rota('/perf', methods=['POST'])
+def configurar_perfil(sessao):
+    """
+    Ativa ou desativa o perfil de desempenho.
+    Corpo: {"ativo": bool, "janela": int, "arquivo_trace": str}; `arquivo_trace` é apenas o
+    nome de um arquivo .jsonl, gravado em SERVER_TRACE_DIR.
+    """
+    simulacao = sessao.simulacao
+
+    if not simulacao:
+        return jsonify({"status": "error", "mensagem": "Nenhuma simulação em execução"})
+
+    dados = request.json or {}
+    if dados.get('ativo', True):
+        arquivo_trace = dados.get('arquivo_trace')
+        if arquivo_trace is not None:
+            try:
+                arquivo_trace = caminho_no_diretorio(SERVER_TRACE_DIR, arquivo_trace, ('.jsonl',))
+            except ValueError as e:
+                return jsonify({"status": "error", "mensagem": str(e)})
+            os.makedirs(SERVER_TRACE_DIR, exist_ok=True)
+
+        with sessao.trava:
+            simulacao.ativar_perfil(dados.get('janela', 1000), arquivo_trace)
+        return jsonify({"status": "success", "mensagem": "Perfil de desempenho ativado"})
+    else:
+        with sessao.trava:
+            simulacao.desativar_perfil()
+        return jsonify({"status": "success", "mensagem": "Perfil de desempenho desativado"})
+
+@rota('/salvar', methods=['POST'])
+def salvar_estado(sessao):
+    """
+    Salva o estado atual da simulação em SERVER_SNAPSHOT_DIR (ou, para os mundos do gerenciador
+    de sessões, no diretório de snapshots salvos do gerenciador).
+    Corpo: {"nome": str}, apenas o nome do arquivo. Por padrão grava um snapshot binário
+    completo; nomes terminados em .json recebem apenas a exportação legível de `to_dict()`,
+    que não pode ser recarregada.
+    """
+    simulacao = sessao.simulacao
 
     if simulacao:
-        caminho = request.json.get('caminho', 'simulacao_estado.json')
+        nome = (request.json or {}).get('nome', 'simulacao_estado.snap')
+
+        try:
+            if sessao is SESSAO_GLOBAL:
+                caminho = caminho_no_diretorio(SERVER_SNAPSHOT_DIR, nome, ('.snap', '.json'))
+            else:
+                caminho = gerenciador_sessoes.caminho_salvo(nome, ('.snap', '.json'))
+        except ValueError as e:
+            return jsonify({"status": "error", "mensagem": str(e)})
 
         try:
-            with open(caminho, 'w') as f:
-                json.dump(simulacao.to_dict(), f, indent=2)
-            return jsonify({"status": "success", "mensagem": f"Estado salvo em {caminho}"})
+            os.makedirs(os.path.dirname(caminho), exist_ok=True)
+            # Salvar entre dois passos, com o estado consistente
+            with sessao.trava:
+                if nome.endswith('.json'):
+                    with open(caminho, 'w') as f:
+                        json.dump(simulacao.to_dict(), f, indent=2)
+                else:
+                    simulacao.salvar(caminho)
+            return jsonify({"status": "success", "mensagem": f"Estado salvo em {nome}"})
         except Exception as e:
             return jsonify({"status": "error", "mensagem": f"Erro ao salvar estado: {str(e)}"})
     else:
@@ -240,32 +617,165 @@ def salvar_estado():
 
 @app.route('/api/carregar', methods=['POST'])
 def carregar_estado():
-    """Carrega um estado salvo da simulação."""
+    """
+    Carrega um snapshot salvo em SERVER_SNAPSHOT_DIR e retoma a execução a partir dele.
+    Corpo: {"nome": str}, apenas o nome do arquivo.
+    """
     global simulacao, thread_simulacao, executando
 
+    nome = (request.json or {}).get('nome', 'simulacao_estado.snap')
+
+    try:
+        # Snapshots executam código ao serem carregados: só os do diretório do servidor
+        caminho = caminho_no_diretorio(SERVER_SNAPSHOT_DIR, nome, ('.snap',))
+    except ValueError as e:
+        return jsonify({"status": "error", "mensagem": str(e)})
+
+    try:
+        # Restaurar antes de parar a simulação atual, para não perdê-la se o arquivo for inválido
+        simulacao_restaurada = Simulacao.carregar(caminho)
+    except Exception as e:
+        return jsonify({"status": "error", "mensagem": f"Erro ao carregar estado: {str(e)}"})
+
     # Parar simulação existente, se houver
     if executando:
         executando = False
         if thread_simulacao:
             thread_simulacao.join()
 
-    caminho = request.json.get('caminho', 'simulacao_estado.json')
+    # O log de eventos restaurado só é reaberto no primeiro uso, depois que o anterior for fechado
+    if simulacao:
+        simulacao.mundo.historico.fechar_log_eventos()
+
+    simulacao = simulacao_restaurada
+    conectar_feed(simulacao)
 
+    # Iniciar thread de simulação
+    executando = True
+    thread_simulacao = threading.Thread(target=executar_simulacao)
+    thread_simulacao.daemon = True
+    thread_simulacao.start()
+
+    return jsonify({"status": "success", "mensagem": f"Estado carregado de {nome}"})
+
+@app.route('/api/mundos', methods=['GET'])
+def listar_mundos():
+    """Lista os mundos do gerenciador de sessões, carregados ou descarregados em disco."""
+    return jsonify(gerenciador_sessoes.listar())
+
+@app.route('/api/mundos', methods=['POST'])
+def criar_mundo():
+    """
+    Cria um novo mundo.
+    Corpo: {"mundo_id": str, "iniciar": bool, "tamanho_mundo": [int, int],
+    "num_senciantes_iniciais": int, "diretorio_log_eventos": str}.
+    """
+    dados = request.json or {}
+
+    try:
+        sessao = gerenciador_sessoes.criar(
+            dados.get('mundo_id'),
+            iniciar=dados.get('iniciar', True),
+            tamanho_mundo=tuple(dados.get('tamanho_mundo', (100, 100))),
+            num_senciantes_inicial=dados.get('num_senciantes_iniciais', 10),
+            diretorio_log_eventos=diretorio_log_eventos(dados)
+        )
+    except ValueError as e:
+        return jsonify({"status": "error", "mensagem": str(e)})
+
+    return jsonify({"status": "success", "mundo_id": sessao.mundo_id})
+
+@app.route('/api/mundos/<mundo_id>', methods=['DELETE'])
+def remover_mundo(mundo_id):
+    """Remove um mundo da memória e do disco."""
+    if gerenciador_sessoes.remover(mundo_id):
+        return jsonify({"status": "success", "mensagem": f"Mundo {mundo_id} removido"})
+    else:
+        return jsonify({"status": "error", "mensagem": "Mundo não encontrado"})
+
+@app.route('/api/mundos/<mundo_id>/iniciar', methods=['POST'])
+def iniciar_mundo(mundo_id):
+    """Passa a executar os passos de um mundo."""
+    sessao = gerenciador_sessoes.obter(mundo_id)
+
+    if sessao:
+        gerenciador_sessoes.iniciar_mundo(sessao)
+        return jsonify({"status": "success", "mensagem": f"Mundo {mundo_id} em execução"})
+    else:
+        return jsonify({"status": "error", "mensagem": "Mundo não encontrado"})
+
+@app.route('/api/mundos/<mundo_id>/parar', methods=['POST'])
+def parar_mundo(mundo_id):
+    """Para a execução dos passos de um mundo, mantendo-o carregado."""
+    sessao = gerenciador_sessoes.obter(mundo_id)
+
+    if sessao:
+        gerenciador_sessoes.parar_mundo(sessao)
+        return jsonify({"status": "success", "mensagem": f"Mundo {mundo_id} parado"})
+    else:
+        return jsonify({"status": "error", "mensagem": "Mundo não encontrado"})
+
+@app.route('/api/mundos/<mundo_id>/descarregar', methods=['POST'])
+def descarregar_mundo(mundo_id):
+    """Salva um mundo em disco e o retira da memória; o próximo acesso o recarrega."""
     try:
-        # Em uma implementação completa, reconstruiríamos a simulação a partir dos dados
-        # Por simplicidade, criamos uma nova simulação
-        simulacao = Simulacao()
+        descarregado = gerenciador_sessoes.descarregar(mundo_id)
+    except Exception as e:
+        return jsonify({"status": "error", "mensagem": f"Erro ao descarregar mundo: {str(e)}"})
+
+    if descarregado:
+        return jsonify({"status": "success", "mensagem": f"Mundo {mundo_id} descarregado"})
+    else:
+        return jsonify({"status": "error", "mensagem": "Mundo não está carregado"})
+
+@app.route('/api/mundos/<mundo_id>/carregar', methods=['POST'])
+def carregar_mundo(mundo_id):
+    """
+    Substitui o estado de um mundo por um snapshot salvo com /api/mundos/<mundo_id>/salvar.
+    Corpo: {"nome": str}, apenas o nome do arquivo.
+    """
+    if gerenciador_sessoes.obter(mundo_id) is None:
+        return jsonify({"status": "error", "mensagem": "Mundo não encontrado"})
 
-        # Iniciar thread de simulação
-        executando = True
-        thread_simulacao = threading.Thread(target=executar_simulacao)
-        thread_simulacao.daemon = True
-        thread_simulacao.start()
+    nome = (request.json or {}).get('nome', 'simulacao_estado.snap')
+
+    try:
+        # Snapshots executam código ao serem carregados: só os do diretório do gerenciador
+        caminho = gerenciador_sessoes.caminho_salvo(nome)
+    except ValueError as e:
+        return jsonify({"status": "error", "mensagem": str(e)})
 
-        return jsonify({"status": "success", "mensagem": f"Estado carregado de {caminho}"})
+    try:
+        simulacao_restaurada = Simulacao.carregar(caminho)
     except Exception as e:
         return jsonify({"status": "error", "mensagem": f"Erro ao carregar estado: {str(e)}"})
 
+    gerenciador_sessoes.substituir(mundo_id, simulacao_restaurada)
+    return jsonify({"status": "success", "mensagem": f"Estado carregado de {nome}"})
+
+def servir(host=SERVER_HOST, port=SERVER_PORT, threads=SERVER_THREADS):
+    """
+    Serve a API com um servidor multithread de produção: waitress, se instalado,
+    ou o servidor threaded do werkzeug. Ao encerrar, salva os mundos em disco.
+
+    Args:
+        host (str, optional): Endereço de escuta. Default é SERVER_HOST.
+        port (int, optional): Porta. Default é SERVER_PORT.
+        threads (int, optional): Threads que atendem requisições (apenas waitress).
+            Default é SERVER_THREADS.
+    """
+    try:
+        try:
+            from waitress import serve
+        except ImportError:
+            from werkzeug.serving import make_server
+
+            make_server(host, port, app, threaded=True).serve_forever()
+        else:
+            serve(app, host=host, port=port, threads=threads)
+    finally:
+        gerenciador_sessoes.encerrar()
+
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    servir()
 
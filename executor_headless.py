@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Executor headless do projeto Senciantes.
+Avança a simulação em passos de tempo fixos, sem relógio real e sem pausas,
+para varreduras de parâmetros e geração de mundos em lote.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+
+import numpy as np
+
+# Adicionar o diretório atual ao PYTHONPATH
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from simulacao import Simulacao
+from utils.config import DEFAULT_UPDATE_INTERVAL
+
+
+def semear(semente):
+    """
+    Semeia os geradores aleatórios usados pela simulação.
+
+    Args:
+        semente (int): Semente para `random` e `numpy.random`.
+    """
+    random.seed(semente)
+    np.random.seed(semente)
+
+
+def executar_headless(num_passos=None, tempo_final=None, delta_tempo=DEFAULT_UPDATE_INTERVAL,
+                      semente=None, tamanho_mundo=None, num_senciantes=None, populacao_colunar=False,
+                      perfil=False, arquivo_trace=None, diretorio_log_eventos=None,
+                      processos_particionamento=None, nivel_detalhe=False):
+    """
+    Cria uma simulação e a executa em passos fixos até `num_passos` ou `tempo_final`.
+    Com a mesma semente e os mesmos parâmetros, a execução é reproduzível.
+
+    Args:
+        num_passos (int, optional): Número máximo de passos a executar.
+        tempo_final (float, optional): Tempo de simulação (em horas) em que a execução termina.
+        delta_tempo (float, optional): Passo fixo de tempo em horas. Default é DEFAULT_UPDATE_INTERVAL.
+        semente (int, optional): Semente dos geradores aleatórios. Se None, não semeia.
+        tamanho_mundo (list, optional): Tamanho do mundo [largura, altura].
+        num_senciantes (int, optional): Número inicial de Senciantes.
+        populacao_colunar (bool, optional): Se True, usa a população colunar vetorizada. Default é False.
+        perfil (bool, optional): Se True, mede o tempo de cada fase e inclui o resumo no
+            relatório. Default é False.
+        arquivo_trace (str, optional): Arquivo JSON Lines com as fases de cada passo
+            (ativa o perfil).
+        diretorio_log_eventos (str, optional): Diretório do log em disco com todos os eventos do histórico.
+        processos_particionamento (int, optional): Se informado, divide o mapa em tiles e atualiza
+            os Senciantes de cada tile nesse número de processos.
+        nivel_detalhe (bool, optional): Se True, atualiza Senciantes sem necessidades iminentes
+            com menor frequência (LOD_INTERVALS). Default é False.
+
+    Returns:
+        tuple: (Simulacao executada, dict com o relatório da execução).
+    """
+    # A semente precisa ser aplicada antes de gerar o mundo e os Senciantes
+    if semente is not None:
+        semear(semente)
+
+    simulacao = Simulacao(tamanho_mundo, num_senciantes, populacao_colunar=populacao_colunar,
+                          diretorio_log_eventos=diretorio_log_eventos)
+    if perfil or arquivo_trace:
+        simulacao.ativar_perfil(arquivo_trace=arquivo_trace)
+    if processos_particionamento:
+        simulacao.ativar_particionamento(processos=processos_particionamento)
+    if nivel_detalhe:
+        simulacao.ativar_nivel_detalhe()
+
+    try:
+        relatorio = simulacao.executar_lote(delta_tempo, num_passos=num_passos, tempo_final=tempo_final)
+    finally:
+        simulacao.desativar_particionamento()
+    relatorio["semente"] = semente
+
+    if simulacao.perfil is not None:
+        relatorio["perfil"] = simulacao.perfil.resumo()
+        simulacao.desativar_perfil()
+
+    if simulacao.mundo.historico.log_eventos is not None:
+        relatorio["eventos_em_disco"] = simulacao.mundo.historico.log_eventos.num_registros
+        simulacao.mundo.historico.log_eventos.sincronizar()
+
+    return simulacao, relatorio
+
+
+def _criar_parser():
+    """
+    Cria o parser de argumentos da linha de comando.
+
+    Returns:
+        argparse.ArgumentParser: Parser configurado.
+    """
+    parser = argparse.ArgumentParser(description="Executa a simulação Senciantes sem interface, em passos fixos.")
+    parser.add_argument("--passos", type=int, default=None, help="Número de passos a executar.")
+    parser.add_argument("--tempo-final", type=float, default=None, help="Tempo de simulação final, em horas.")
+    parser.add_argument("--delta-tempo", type=float, default=DEFAULT_UPDATE_INTERVAL,
+                        help="Passo fixo de tempo, em horas.")
+    parser.add_argument("--semente", type=int, default=None, help="Semente dos geradores aleatórios.")
+    parser.add_argument("--largura", type=int, default=None, help="Largura do mundo.")
+    parser.add_argument("--altura", type=int, default=None, help="Altura do mundo.")
+    parser.add_argument("--senciantes", type=int, default=None, help="Número inicial de Senciantes.")
+    parser.add_argument("--populacao-colunar", action="store_true",
+                        help="Atualiza a fisiologia dos Senciantes de forma vetorizada.")
+    parser.add_argument("--perfil", action="store_true",
+                        help="Mede o tempo de cada fase do passo (p50/p95/máximo).")
+    parser.add_argument("--trace", default=None, help="Arquivo JSON Lines com as fases de cada passo.")
+    parser.add_argument("--log-eventos", default=None,
+                        help="Diretório do log em disco com todos os eventos do histórico.")
+    parser.add_argument("--particionar", type=int, default=None, metavar="PROCESSOS",
+                        help="Divide o mapa em tiles e atualiza os Senciantes de cada tile em PROCESSOS processos.")
+    parser.add_argument("--nivel-detalhe", action="store_true",
+                        help="Atualiza Senciantes sem necessidades iminentes com menor frequência.")
+    parser.add_argument("--saida", default=None, help="Arquivo JSON onde salvar o relatório.")
+    return parser
+
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando.
+
+    Args:
+        argv (list, optional): Argumentos da linha de comando. Se None, usa sys.argv.
+
+    Returns:
+        int: Código de saída.
+    """
+    parser = _criar_parser()
+    args = parser.parse_args(argv)
+
+    if args.passos is None and args.tempo_final is None:
+        parser.error("informe --passos ou --tempo-final")
+
+    tamanho_mundo = None
+    if args.largura or args.altura:
+        tamanho_mundo = [args.largura or args.altura, args.altura or args.largura]
+
+    _, relatorio = executar_headless(
+        num_passos=args.passos,
+        tempo_final=args.tempo_final,
+        delta_tempo=args.delta_tempo,
+        semente=args.semente,
+        tamanho_mundo=tamanho_mundo,
+        num_senciantes=args.senciantes,
+        populacao_colunar=args.populacao_colunar,
+        perfil=args.perfil,
+        arquivo_trace=args.trace,
+        diretorio_log_eventos=args.log_eventos,
+        processos_particionamento=args.particionar,
+        nivel_detalhe=args.nivel_detalhe
+    )
+
+    print("=== Execução headless Senciantes ===")
+    print(f"Passos: {relatorio['passos']} (delta_tempo={relatorio['delta_tempo']}h)")
+    print(f"Tempo simulado: {relatorio['tempo_simulacao']:.2f}h")
+    print(f"Tempo real: {relatorio['tempo_real']:.2f}s")
+    print(f"Passos por segundo: {relatorio['passos_por_segundo']:.1f}")
+    print(f"Senciantes vivos: {relatorio['num_senciantes']}")
+
+    if "perfil" in relatorio:
+        print("Fase                       p50 (ms)   p95 (ms)   máx (ms)")
+        for fase, resumo in sorted(relatorio["perfil"]["fases"].items(), key=lambda item: -item[1]["media"]):
+            print(f"{fase:<25}{resumo['p50'] * 1000:>10.3f}{resumo['p95'] * 1000:>11.3f}{resumo['max'] * 1000:>11.3f}")
+
+    if args.saida:
+        with open(args.saida, 'w') as f:
+            json.dump(relatorio, f, indent=2)
+        print(f"Relatório salvo em {args.saida}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
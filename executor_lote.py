@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Executor em lote de múltiplos mundos do projeto Senciantes.
+Distribui execuções headless independentes (cada uma com sua semente e suas
+sobrescritas de `utils/config.py`) entre processos de um ProcessPoolExecutor.
+As métricas de `FerramentasAdmin` de cada mundo são enviadas ao processo pai
+durante a execução e agregadas em um único arquivo colunar (.npz).
+"""
+
+import argparse
+import ast
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from multiprocessing import Manager
+from queue import Empty
+
+import numpy as np
+
+# Adicionar o diretório atual ao PYTHONPATH
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import utils.config as config
+from executor_headless import semear
+from mecanicas.ferramentas_admin import FerramentasAdmin
+from simulacao import Simulacao
+from utils.config import DEFAULT_UPDATE_INTERVAL
+
+
+@contextmanager
+def configuracao(sobrescritas=None):
+    """
+    Sobrescreve parâmetros de `utils/config.py` durante o bloco.
+    Como os módulos importam as constantes com `from utils.config import ...`, a
+    sobrescrita é aplicada em todos os módulos carregados que ainda apontam para
+    o valor original. Valores padrão de argumentos de funções não são alterados.
+
+    Args:
+        sobrescritas (dict, optional): Dicionário de nome do parâmetro: valor.
+
+    Raises:
+        ValueError: Se algum parâmetro não existir em `utils/config.py`.
+    """
+    sobrescritas = sobrescritas or {}
+    desconhecidos = [nome for nome in sobrescritas if not nome.isupper() or not hasattr(config, nome)]
+    if desconhecidos:
+        raise ValueError(f"Parâmetros de configuração desconhecidos: {', '.join(desconhecidos)}")
+
+    originais = []  # Lista de (namespace, nome, valor original)
+    try:
+        for nome, valor in sobrescritas.items():
+            original = getattr(config, nome)
+            for modulo in list(sys.modules.values()):
+                namespace = getattr(modulo, "__dict__", None)
+                if namespace is not None and namespace.get(nome, None) is original:
+                    originais.append((namespace, nome, original))
+                    namespace[nome] = valor
+        yield
+    finally:
+        for namespace, nome, original in reversed(originais):
+            namespace[nome] = original
+
+
+def executar_mundo(indice, especificacao, num_passos=None, tempo_final=None,
+                   delta_tempo=DEFAULT_UPDATE_INTERVAL, intervalo_metricas=24.0, emitir=None):
+    """
+    Executa um mundo headless, calculando as métricas a cada `intervalo_metricas` horas.
+
+    Args:
+        indice (int): Índice do mundo no lote.
+        especificacao (dict): Parâmetros do mundo: "semente", "config" (sobrescritas de
+            `utils/config.py`), "tamanho_mundo", "num_senciantes" e "populacao_colunar".
+        num_passos (int, optional): Número máximo de passos a executar.
+        tempo_final (float, optional): Tempo de simulação (em horas) em que a execução termina.
+        delta_tempo (float, optional): Passo fixo de tempo em horas. Default é DEFAULT_UPDATE_INTERVAL.
+        intervalo_metricas (float, optional): Intervalo, em horas de simulação, entre as
+            métricas. Default é 24.0.
+        emitir (callable, optional): Função chamada com (indice, métricas) a cada medição.
+
+    Returns:
+        dict: Relatório da execução do mundo.
+    """
+    if num_passos is None and tempo_final is None:
+        raise ValueError("Informe num_passos ou tempo_final.")
+    if intervalo_metricas <= 0:
+        raise ValueError("intervalo_metricas deve ser positivo.")
+
+    semente = especificacao.get("semente")
+
+    with configuracao(especificacao.get("config")):
+        # A semente precisa ser aplicada antes de gerar o mundo e os Senciantes
+        if semente is not None:
+            semear(semente)
+
+        simulacao = Simulacao(especificacao.get("tamanho_mundo"), especificacao.get("num_senciantes"),
+                              populacao_colunar=especificacao.get("populacao_colunar", False))
+        admin = FerramentasAdmin(simulacao.mundo, simulacao)
+
+        passos = 0
+        tempo_real = 0.0
+        while True:
+            limite = simulacao.tempo_simulacao + intervalo_metricas
+            if tempo_final is not None:
+                limite = min(limite, tempo_final)
+            restantes = None if num_passos is None else num_passos - passos
+
+            resumo = simulacao.executar_lote(delta_tempo, num_passos=restantes, tempo_final=limite)
+            passos += resumo["passos"]
+            tempo_real += resumo["tempo_real"]
+
+            if emitir is not None:
+                emitir(indice, admin._calcular_metricas(simulacao.tempo_simulacao, simulacao.senciantes))
+
+            terminou_passos = num_passos is not None and passos >= num_passos
+            terminou_tempo = tempo_final is not None and \
+                simulacao.tempo_simulacao >= tempo_final - delta_tempo * 1e-6
+            if terminou_passos or terminou_tempo or resumo["passos"] == 0:
+                break
+
+    return {
+        "mundo": indice,
+        "semente": semente,
+        "config": dict(especificacao.get("config") or {}),
+        "passos": passos,
+        "tempo_simulacao": simulacao.tempo_simulacao,
+        "tempo_real": tempo_real,
+        "passos_por_segundo": passos / tempo_real if tempo_real > 0 else float("inf"),
+        "num_senciantes": len(simulacao.senciantes),
+        "estatisticas": dict(simulacao.estatisticas)
+    }
+
+
+def _executar_mundo_em_processo(fila, indice, especificacao, *args):
+    # Executado nos processos do pool: as métricas voltam ao pai pela fila
+    return executar_mundo(indice, especificacao, *args, emitir=lambda i, metricas: fila.put((i, metricas)))
+
+
+class AcumuladorMetricas:
+    """
+    Tabela colunar com as métricas de todos os mundos do lote.
+    Cada medição vira uma linha; as colunas são "mundo" e as chaves das métricas.
+    """
+
+    def __init__(self):
+        """
+        Inicializa um novo acumulador vazio.
+        """
+        self.colunas = {"mundo": []}  # Dicionário de coluna: lista de valores
+        self.num_linhas = 0
+
+    def adicionar(self, indice, metricas):
+        """
+        Adiciona uma medição de um mundo.
+
+        Args:
+            indice (int): Índice do mundo no lote.
+            metricas (dict): Métricas calculadas por `FerramentasAdmin`.
+        """
+        self.colunas["mundo"].append(indice)
+        for chave, valor in metricas.items():
+            # Colunas novas são preenchidas com NaN nas linhas anteriores
+            coluna = self.colunas.setdefault(chave, [np.nan] * self.num_linhas)
+            coluna.append(valor)
+        self.num_linhas += 1
+
+        for coluna in self.colunas.values():
+            if len(coluna) < self.num_linhas:
+                coluna.append(np.nan)
+
+    def arrays(self):
+        """
+        Converte as colunas em arrays NumPy.
+
+        Returns:
+            dict: Dicionário de coluna: numpy.ndarray.
+        """
+        return {chave: np.asarray(valores) for chave, valores in self.colunas.items()}
+
+
+def gerar_especificacoes(num_mundos, semente_base=0, config=None, **parametros):
+    """
+    Gera as especificações de um lote de mundos com sementes consecutivas.
+
+    Args:
+        num_mundos (int): Número de mundos.
+        semente_base (int, optional): Semente do primeiro mundo. Default é 0.
+        config (dict, optional): Sobrescritas de `utils/config.py` comuns a todos os mundos.
+        **parametros: Outros parâmetros comuns ("tamanho_mundo", "num_senciantes", ...).
+
+    Returns:
+        list: Lista de especificações.
+    """
+    return [
+        dict(parametros, semente=semente_base + i, config=dict(config or {}))
+        for i in range(num_mundos)
+    ]
+
+
+def executar_mundos(especificacoes, num_passos=None, tempo_final=None, delta_tempo=DEFAULT_UPDATE_INTERVAL,
+                    intervalo_metricas=24.0, processos=None, arquivo_saida=None, ao_receber_metricas=None):
+    """
+    Executa um lote de mundos independentes em paralelo.
+
+    Args:
+        especificacoes (list): Especificações dos mundos (ver `executar_mundo`).
+        num_passos (int, optional): Número máximo de passos de cada mundo.
+        tempo_final (float, optional): Tempo de simulação (em horas) em que cada mundo termina.
+        delta_tempo (float, optional): Passo fixo de tempo em horas. Default é DEFAULT_UPDATE_INTERVAL.
+        intervalo_metricas (float, optional): Intervalo, em horas de simulação, entre as
+            métricas. Default é 24.0.
+        processos (int, optional): Número de processos. Se None, um por núcleo; com 1, os
+            mundos são executados no processo atual.
+        arquivo_saida (str, optional): Arquivo .npz onde salvar as métricas e os relatórios.
+        ao_receber_metricas (callable, optional): Função chamada com (indice, métricas) a
+            cada medição recebida, na ordem de chegada.
+
+    Returns:
+        dict: {"relatorios": lista de relatórios na ordem das especificações,
+            "metricas": dicionário de coluna: array, "tempo_real": duração do lote}.
+    """
+    if processos is None:
+        processos = os.cpu_count() or 1
+    processos = max(1, min(processos, len(especificacoes)))
+
+    acumulador = AcumuladorMetricas()
+    relatorios = [None] * len(especificacoes)
+    argumentos = (num_passos, tempo_final, delta_tempo, intervalo_metricas)
+    inicio = time.perf_counter()
+
+    def receber(indice, metricas):
+        acumulador.adicionar(indice, metricas)
+        if ao_receber_metricas is not None:
+            ao_receber_metricas(indice, metricas)
+
+    if processos == 1:
+        for indice, especificacao in enumerate(especificacoes):
+            relatorios[indice] = executar_mundo(indice, especificacao, *argumentos, emitir=receber)
+    else:
+        with Manager() as gerenciador, ProcessPoolExecutor(max_workers=processos) as executor:
+            fila = gerenciador.Queue()
+            pendentes = {
+                executor.submit(_executar_mundo_em_processo, fila, indice, especificacao, *argumentos): indice
+                for indice, especificacao in enumerate(especificacoes)
+            }
+
+            while pendentes:
+                concluidos, _ = wait(pendentes, timeout=0.1, return_when=FIRST_COMPLETED)
+                # Métricas chegam enquanto os mundos executam
+                _esvaziar_fila(fila, receber)
+                for futuro in concluidos:
+                    relatorios[pendentes.pop(futuro)] = futuro.result()
+
+            _esvaziar_fila(fila, receber)
+
+    resultado = {
+        "relatorios": relatorios,
+        "metricas": acumulador.arrays(),
+        "tempo_real": time.perf_counter() - inicio
+    }
+
+    if arquivo_saida:
+        salvar_resultado(resultado, arquivo_saida)
+
+    return resultado
+
+
+def _esvaziar_fila(fila, receber):
+    while True:
+        try:
+            indice, metricas = fila.get_nowait()
+        except Empty:
+            return
+        receber(indice, metricas)
+
+
+def salvar_resultado(resultado, arquivo):
+    """
+    Salva as métricas e os relatórios de um lote em um único arquivo colunar.
+    As métricas ficam em "metricas/<coluna>" e os relatórios por mundo em "mundos/<campo>".
+
+    Args:
+        resultado (dict): Resultado de `executar_mundos`.
+        arquivo (str): Caminho do arquivo .npz.
+    """
+    colunas = {f"metricas/{chave}": valores for chave, valores in resultado["metricas"].items()}
+
+    campos = ("mundo", "semente", "passos", "tempo_simulacao", "tempo_real", "passos_por_segundo", "num_senciantes")
+    for campo in campos:
+        valores = [relatorio[campo] for relatorio in resultado["relatorios"]]
+        colunas[f"mundos/{campo}"] = np.asarray([np.nan if v is None else v for v in valores])
+
+    np.savez_compressed(arquivo, **colunas)
+
+
+def _interpretar_sobrescrita(texto):
+    """
+    Interpreta uma sobrescrita NOME=VALOR da linha de comando.
+
+    Args:
+        texto (str): Texto no formato NOME=VALOR (VALOR é um literal Python).
+
+    Returns:
+        tuple: (nome, valor).
+    """
+    nome, separador, valor = texto.partition("=")
+    if not separador:
+        raise argparse.ArgumentTypeError(f"sobrescrita inválida: {texto} (use NOME=VALOR)")
+    try:
+        return nome.strip(), ast.literal_eval(valor.strip())
+    except (ValueError, SyntaxError):
+        # Valores que não são literais são tratados como texto
+        return nome.strip(), valor.strip()
+
+
+def _criar_parser():
+    """
+    Cria o parser de argumentos da linha de comando.
+
+    Returns:
+        argparse.ArgumentParser: Parser configurado.
+    """
+    parser = argparse.ArgumentParser(description="Executa vários mundos Senciantes em paralelo.")
+    parser.add_argument("--mundos", type=int, required=True, help="Número de mundos.")
+    parser.add_argument("--semente-base", type=int, default=0, help="Semente do primeiro mundo.")
+    parser.add_argument("--processos", type=int, default=None, help="Número de processos (padrão: um por núcleo).")
+    parser.add_argument("--passos", type=int, default=None, help="Número de passos de cada mundo.")
+    parser.add_argument("--tempo-final", type=float, default=None, help="Tempo de simulação final, em horas.")
+    parser.add_argument("--delta-tempo", type=float, default=DEFAULT_UPDATE_INTERVAL,
+                        help="Passo fixo de tempo, em horas.")
+    parser.add_argument("--intervalo-metricas", type=float, default=24.0,
+                        help="Intervalo entre as métricas, em horas de simulação.")
+    parser.add_argument("--largura", type=int, default=None, help="Largura do mundo.")
+    parser.add_argument("--altura", type=int, default=None, help="Altura do mundo.")
+    parser.add_argument("--senciantes", type=int, default=None, help="Número inicial de Senciantes.")
+    parser.add_argument("--config", type=_interpretar_sobrescrita, action="append", default=[],
+                        metavar="NOME=VALOR", help="Sobrescreve um parâmetro de utils/config.py.")
+    parser.add_argument("--saida", default="lote_senciantes.npz", help="Arquivo .npz com os resultados.")
+    return parser
+
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando.
+
+    Args:
+        argv (list, optional): Argumentos da linha de comando. Se None, usa sys.argv.
+
+    Returns:
+        int: Código de saída.
+    """
+    parser = _criar_parser()
+    args = parser.parse_args(argv)
+
+    if args.passos is None and args.tempo_final is None:
+        parser.error("informe --passos ou --tempo-final")
+
+    tamanho_mundo = None
+    if args.largura or args.altura:
+        tamanho_mundo = [args.largura or args.altura, args.altura or args.largura]
+
+    especificacoes = gerar_especificacoes(
+        args.mundos, args.semente_base, dict(args.config),
+        tamanho_mundo=tamanho_mundo, num_senciantes=args.senciantes
+    )
+    resultado = executar_mundos(
+        especificacoes,
+        num_passos=args.passos,
+        tempo_final=args.tempo_final,
+        delta_tempo=args.delta_tempo,
+        intervalo_metricas=args.intervalo_metricas,
+        processos=args.processos,
+        arquivo_saida=args.saida,
+        ao_receber_metricas=lambda indice, metricas: print(
+            f"[mundo {indice}] t={metricas['tempo']:.1f}h população={metricas['populacao_total']}"
+        )
+    )
+
+    print("=== Lote de mundos Senciantes ===")
+    for relatorio in resultado["relatorios"]:
+        print(f"Mundo {relatorio['mundo']} (semente {relatorio['semente']}): {relatorio['passos']} passos, "
+              f"{relatorio['passos_por_segundo']:.1f} passos/s, {relatorio['num_senciantes']} Senciantes vivos")
+    print(f"Tempo real do lote: {resultado['tempo_real']:.2f}s")
+    print(f"Resultados salvos em {args.saida}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,7 @@ Implementação das mecânicas de conflito e diplomacia para o jogo "O Mundo dos
 
 import random
 from utils.helpers import chance, calcular_distancia
+from utils.agenda import Agenda
 
 class MecanicaConflitoDiplomacia:
     """
@@ -21,6 +22,25 @@ class MecanicaConflitoDiplomacia:
         self.conflitos = {}  # Dicionário de id_conflito: conflito
         self.tratados = {}  # Dicionário de id_tratado: tratado
         self.trocas_comerciais = {}  # Dicionário de id_troca: troca
+        self.tempo = 0.0  # Tempo acumulado da mecânica em horas
+        
+        # Índices dos conflitos e tratados ativos (pares de grupos em ordem crescente)
+        self.conflitos_ativos = {}  # Dicionário de id_conflito: conflito ativo
+        self.tratados_ativos = {}  # Dicionário de id_tratado: tratado ativo
+        self.conflitos_por_par = {}  # Dicionário de (grupo_id, grupo_id): {id_conflito: None}
+        self.tratados_por_par = {}  # Dicionário de (grupo_id, grupo_id): {id_tratado: None}
+        self.tratados_por_tipo = {}  # Dicionário de tipo: {id_tratado: None}
+        
+        # Vencimentos de tratados e de termos periódicos
+        self.agenda_expiracoes = Agenda()  # Itens: id_tratado
+        self.agenda_tributos = Agenda()  # Itens: (id_tratado, índice do termo)
+        self.agenda_trocas = Agenda()  # Itens: (id_tratado, índice do termo)
+        self._entradas_agenda = {}  # Dicionário de id_tratado: entradas agendadas
+        
+        # Eventos estocásticos sorteados pelo agendador do mundo (taxas por hora)
+        self.agendador = mundo.agendador_riscos
+        self.agendador.registrar("diplomacia:novo_conflito", 0.02)
+        self.agendador.registrar("diplomacia:negociacao", 0.01)
         
         # Tipos de conflitos
         self.tipos_conflitos = [
@@ -40,6 +60,8 @@ class MecanicaConflitoDiplomacia:
             delta_tempo (float): Tempo decorrido desde a última atualização em horas.
             senciantes (dict): Dicionário de Senciantes para referência.
         """
+        self.tempo += delta_tempo
+        
         # Identificar grupos de Senciantes
         grupos = self._identificar_grupos(senciantes)
         
@@ -60,7 +82,8 @@ class MecanicaConflitoDiplomacia:
     
     def _identificar_grupos(self, senciantes):
         """
-        Identifica grupos de Senciantes.
+        Identifica grupos de Senciantes usando o registro de grupos do mundo,
+        que é construído uma única vez por passo e compartilhado entre as mecânicas.
         
         Args:
             senciantes (dict): Dicionário de Senciantes para referência.
@@ -68,81 +91,101 @@ class MecanicaConflitoDiplomacia:
         Returns:
             dict: Dicionário de grupos identificados.
         """
-        grupos = {}
+        return self.mundo.registro_grupos.obter(senciantes)
+    
+    @staticmethod
+    def _par(grupo1_id, grupo2_id):
+        """
+        Obtém a chave de um par não ordenado de grupos.
         
-        for senciante_id, senciante in senciantes.items():
-            # Verificar se o Senciante tem um grupo
-            grupo_id = senciante.grupo_id if hasattr(senciante, "grupo_id") else None
-            
-            # Se não tiver grupo, considerar como indivíduo
-            if grupo_id is None:
-                grupo_id = f"individual_{senciante_id}"
-            
-            # Adicionar ao dicionário de grupos
-            if grupo_id not in grupos:
-                grupos[grupo_id] = {
-                    "membros": [],
-                    "lider_id": None,
-                    "posicao_media": [0.0, 0.0],
-                    "forca_total": 0.0,
-                    "recursos": {},
-                    "valores_morais": {},
-                    "tecnologias": set()
-                }
-            
-            grupos[grupo_id]["membros"].append(senciante_id)
+        Args:
+            grupo1_id (str): ID do primeiro grupo.
+            grupo2_id (str): ID do segundo grupo.
             
-            # Atualizar posição média
-            if len(grupos[grupo_id]["membros"]) == 1:
-                grupos[grupo_id]["posicao_media"] = senciante.posicao.copy()
+        Returns:
+            tuple: IDs dos grupos em ordem crescente.
+        """
+        return (grupo1_id, grupo2_id) if grupo1_id <= grupo2_id else (grupo2_id, grupo1_id)
+    
+    @staticmethod
+    def _indexar(indice, chave, item_id):
+        indice.setdefault(chave, {})[item_id] = None
+    
+    @staticmethod
+    def _desindexar(indice, chave, item_id):
+        ids = indice.get(chave)
+        if ids is not None:
+            ids.pop(item_id, None)
+            if not ids:
+                del indice[chave]
+    
+    def _registrar_conflito(self, conflito_id):
+        """
+        Adiciona um conflito recém-criado aos índices de conflitos ativos.
+        
+        Args:
+            conflito_id (str): ID do conflito.
+        """
+        conflito = self.conflitos[conflito_id]
+        self.conflitos_ativos[conflito_id] = conflito
+        self._indexar(self.conflitos_por_par, self._par(conflito["grupo1_id"], conflito["grupo2_id"]), conflito_id)
+        self.agendador.registrar(f"diplomacia:batalha:{conflito_id}", 0.05)
+    
+    def _registrar_tratado(self, tratado_id):
+        """
+        Adiciona um tratado recém-criado aos índices de tratados ativos e agenda
+        sua expiração e seus termos periódicos.
+        
+        Args:
+            tratado_id (str): ID do tratado.
+        """
+        tratado = self.tratados[tratado_id]
+        self.tratados_ativos[tratado_id] = tratado
+        self._indexar(self.tratados_por_par, self._par(tratado["grupo1_id"], tratado["grupo2_id"]), tratado_id)
+        self._indexar(self.tratados_por_tipo, tratado["tipo"], tratado_id)
+        
+        entradas = [(self.agenda_expiracoes, self.agenda_expiracoes.agendar(self.tempo + tratado["duracao"], tratado_id))]
+        for indice, termo in enumerate(tratado["termos"]):
+            if "periodicidade" not in termo:
+                continue
+            if termo["tipo"] == "tributo":
+                agenda = self.agenda_tributos
+            elif termo["tipo"] == "troca_comercial":
+                agenda = self.agenda_trocas
             else:
-                n = len(grupos[grupo_id]["membros"])
-                grupos[grupo_id]["posicao_media"][0] = ((n - 1) * grupos[grupo_id]["posicao_media"][0] + senciante.posicao[0]) / n
-                grupos[grupo_id]["posicao_media"][1] = ((n - 1) * grupos[grupo_id]["posicao_media"][1] + senciante.posicao[1]) / n
-            
-            # Calcular força individual
-            forca_individual = 1.0
-            
-            if hasattr(senciante, "habilidades"):
-                forca_individual += senciante.habilidades.get("combate", 0.0) * 2.0
-                forca_individual += senciante.habilidades.get("lideranca", 0.0) * 1.0
-            
-            grupos[grupo_id]["forca_total"] += forca_individual
-            
-            # Verificar se é líder
-            if hasattr(senciante, "habilidades") and senciante.habilidades.get("lideranca", 0.0) > 0.5:
-                if grupos[grupo_id]["lider_id"] is None or senciante.habilidades.get("lideranca", 0.0) > senciantes[grupos[grupo_id]["lider_id"]].habilidades.get("lideranca", 0.0):
-                    grupos[grupo_id]["lider_id"] = senciante_id
-            
-            # Coletar recursos
-            for recurso, quantidade in senciante.inventario.items():
-                if recurso not in grupos[grupo_id]["recursos"]:
-                    grupos[grupo_id]["recursos"][recurso] = 0.0
-                
-                grupos[grupo_id]["recursos"][recurso] += quantidade
-            
-            # Coletar valores morais
-            if hasattr(senciante, "moralidade") and senciante.moralidade is not None:
-                for valor, nivel in senciante.moralidade.valores.items():
-                    if valor not in grupos[grupo_id]["valores_morais"]:
-                        grupos[grupo_id]["valores_morais"][valor] = []
-                    
-                    grupos[grupo_id]["valores_morais"][valor].append(nivel)
-            
-            # Coletar tecnologias
-            if hasattr(senciante, "tecnologias"):
-                grupos[grupo_id]["tecnologias"].update(senciante.tecnologias)
+                continue
+            entradas.append((agenda, agenda.agendar(self.tempo + termo["periodicidade"], (tratado_id, indice))))
+        self._entradas_agenda[tratado_id] = entradas
+    
+    def conflitos_entre(self, grupo1_id, grupo2_id):
+        """
+        Obtém os conflitos ativos entre dois grupos.
         
-        # Calcular valores morais médios
-        for grupo_id, grupo in grupos.items():
-            valores_medios = {}
-            
-            for valor, niveis in grupo["valores_morais"].items():
-                valores_medios[valor] = sum(niveis) / len(niveis)
+        Args:
+            grupo1_id (str): ID do primeiro grupo.
+            grupo2_id (str): ID do segundo grupo.
             
-            grupo["valores_morais"] = valores_medios
+        Returns:
+            list: Conflitos ativos entre os grupos.
+        """
+        return [self.conflitos[id] for id in self.conflitos_por_par.get(self._par(grupo1_id, grupo2_id), ())]
+    
+    def tratados_entre(self, grupo1_id, grupo2_id, tipo=None):
+        """
+        Obtém os tratados ativos entre dois grupos.
         
-        return grupos
+        Args:
+            grupo1_id (str): ID do primeiro grupo.
+            grupo2_id (str): ID do segundo grupo.
+            tipo (str, optional): Tipo de tratado. Se None, todos os tipos.
+            
+        Returns:
+            list: Tratados ativos entre os grupos.
+        """
+        tratados = [self.tratados[id] for id in self.tratados_por_par.get(self._par(grupo1_id, grupo2_id), ())]
+        if tipo is not None:
+            tratados = [t for t in tratados if t["tipo"] == tipo]
+        return tratados
     
     def _atualizar_conflitos(self, delta_tempo, grupos, senciantes):
         """
@@ -153,7 +196,10 @@ class MecanicaConflitoDiplomacia:
             grupos (dict): Dicionário de grupos identificados.
             senciantes (dict): Dicionário de Senciantes para referência.
         """
-        for conflito_id, conflito in list(self.conflitos.items()):
+        for conflito_id, conflito in list(self.conflitos_ativos.items()):
+            if not conflito["ativo"]:
+                continue
+            
             # Verificar se os grupos ainda existem
             if conflito["grupo1_id"] not in grupos or conflito["grupo2_id"] not in grupos:
                 # Encerrar conflito
@@ -240,10 +286,8 @@ class MecanicaConflitoDiplomacia:
         """
         conflito = self.conflitos[conflito_id]
         
-        # Chance de batalha baseada no tempo
-        chance_batalha = 0.05 * delta_tempo
-        
-        if chance(chance_batalha):
+        # Batalhas sorteadas no intervalo (taxa registrada ao criar o conflito)
+        for _ in range(self.agendador.disparos(f"diplomacia:batalha:{conflito_id}")):
             # Iniciar batalha
             grupo1_id = conflito["grupo1_id"]
             grupo2_id = conflito["grupo2_id"]
@@ -382,6 +426,12 @@ class MecanicaConflitoDiplomacia:
         """
         conflito = self.conflitos[conflito_id]
         
+        # Remover dos índices de conflitos ativos
+        if conflito["ativo"]:
+            del self.conflitos_ativos[conflito_id]
+            self._desindexar(self.conflitos_por_par, self._par(conflito["grupo1_id"], conflito["grupo2_id"]), conflito_id)
+            self.agendador.remover(f"diplomacia:batalha:{conflito_id}")
+        
         # Atualizar estado do conflito
         conflito["ativo"] = False
         conflito["motivo_encerramento"] = motivo
@@ -459,6 +509,7 @@ class MecanicaConflitoDiplomacia:
             "ativo": True,
             "violacoes": []
         }
+        self._registrar_tratado(tratado_id)
         
         # Registrar no histórico do mundo
         self.mundo.historico.registrar_evento(
@@ -479,6 +530,11 @@ class MecanicaConflitoDiplomacia:
             grupos (dict): Dicionário de grupos identificados.
             senciantes (dict): Dicionário de Senciantes para referência.
         """
+        # Novos conflitos sorteados no intervalo
+        disparos = self.agendador.disparos("diplomacia:novo_conflito")
+        if disparos == 0:
+            return
+        
         # Ignorar grupos individuais
         grupos_reais = {id: g for id, g in grupos.items() if not id.startswith("individual_") or len(g["membros"]) > 1}
         
@@ -486,32 +542,22 @@ class MecanicaConflitoDiplomacia:
         if len(grupos_reais) < 2:
             return
         
-        # Chance de novo conflito baseada no tempo
-        chance_conflito = 0.02 * delta_tempo
-        
-        if chance(chance_conflito):
+        for _ in range(disparos):
             # Escolher dois grupos aleatórios
             grupo_ids = list(grupos_reais.keys())
             grupo1_id, grupo2_id = random.sample(grupo_ids, 2)
             
             # Verificar se já existe conflito entre estes grupos
-            for conflito in self.conflitos.values():
-                if conflito["ativo"] and (
-                    (conflito["grupo1_id"] == grupo1_id and conflito["grupo2_id"] == grupo2_id) or
-                    (conflito["grupo1_id"] == grupo2_id and conflito["grupo2_id"] == grupo1_id)
-                ):
-                    return
+            if self._par(grupo1_id, grupo2_id) in self.conflitos_por_par:
+                continue
             
-            # Verificar se existe tratado de paz entre estes grupos
-            for tratado in self.tratados.values():
-                if tratado["ativo"] and tratado["tipo"] == "paz" and (
-                    (tratado["grupo1_id"] == grupo1_id and tratado["grupo2_id"] == grupo2_id) or
-                    (tratado["grupo1_id"] == grupo2_id and tratado["grupo2_id"] == grupo1_id)
-                ):
-                    # Verificar se o tratado tem termo de não agressão
-                    for termo in tratado["termos"]:
-                        if termo["tipo"] == "nao_agressao":
-                            return
+            # Verificar se existe tratado de paz com termo de não agressão entre estes grupos
+            if any(
+                termo["tipo"] == "nao_agressao"
+                for tratado in self.tratados_entre(grupo1_id, grupo2_id, "paz")
+                for termo in tratado["termos"]
+            ):
+                continue
             
             # Determinar tipo de conflito
             tipo_conflito = random.choice(self.tipos_conflitos)
@@ -558,6 +604,7 @@ class MecanicaConflitoDiplomacia:
             "vencedor_id": None,
             "perdedor_id": None
         }
+        self._registrar_conflito(conflito_id)
         
         # Adicionar informações específicas do tipo de conflito
         if tipo_conflito == "territorial" and "territorio_id" in causa:
@@ -632,94 +679,101 @@ class MecanicaConflitoDiplomacia:
     
     def _atualizar_tratados(self, delta_tempo, grupos, senciantes):
         """
-        Atualiza os tratados existentes.
+        Atualiza os tratados existentes. Apenas tratados ativos de grupos dissolvidos,
+        expirações vencidas e termos que venceram são processados.
         
         Args:
             delta_tempo (float): Tempo decorrido desde a última atualização em horas.
             grupos (dict): Dicionário de grupos identificados.
             senciantes (dict): Dicionário de Senciantes para referência.
         """
-        for tratado_id, tratado in list(self.tratados.items()):
-            # Verificar se os grupos ainda existem
-            if tratado["grupo1_id"] not in grupos or tratado["grupo2_id"] not in grupos:
-                # Encerrar tratado
-                self._encerrar_tratado(tratado_id, "dissolucao", "Um dos grupos envolvidos foi dissolvido")
-                continue
-            
-            # Verificar se o tratado ainda está ativo
-            if not tratado["ativo"]:
-                continue
-            
-            # Atualizar duração
-            tratado["tempo_atual"] = tratado.get("tempo_atual", 0.0) + delta_tempo
-            
-            # Verificar expiração
-            if tratado["tempo_atual"] >= tratado["duracao"]:
+        # Encerrar tratados de grupos dissolvidos
+        for par, tratado_ids in list(self.tratados_por_par.items()):
+            if par[0] not in grupos or par[1] not in grupos:
+                for tratado_id in list(tratado_ids):
+                    self._encerrar_tratado(tratado_id, "dissolucao", "Um dos grupos envolvidos foi dissolvido")
+        
+        # Encerrar tratados expirados
+        for _, tratado_id in list(self.agenda_expiracoes.vencidos(self.tempo)):
+            if self.tratados[tratado_id]["ativo"]:
                 self._encerrar_tratado(tratado_id, "expiracao", "Tratado expirou")
-                continue
-            
-            # Verificar cumprimento dos termos
-            self._verificar_cumprimento_termos(tratado_id, delta_tempo, grupos, senciantes)
+        
+        # Verificar cumprimento dos termos
+        self._verificar_cumprimento_termos(delta_tempo, grupos, senciantes)
     
-    def _verificar_cumprimento_termos(self, tratado_id, delta_tempo, grupos, senciantes):
+    def _verificar_cumprimento_termos(self, delta_tempo, grupos, senciantes):
         """
-        Verifica o cumprimento dos termos de um tratado.
+        Verifica o cumprimento dos termos dos tratados: agressões entre grupos com
+        termo de não agressão e tributos vencidos.
         
         Args:
-            tratado_id (str): ID do tratado.
             delta_tempo (float): Tempo decorrido desde a última atualização em horas.
             grupos (dict): Dicionário de grupos identificados.
             senciantes (dict): Dicionário de Senciantes para referência.
         """
-        tratado = self.tratados[tratado_id]
-        
-        for termo in tratado["termos"]:
-            # Verificar tipo de termo
-            if termo["tipo"] == "nao_agressao":
-                # Verificar se houve agressão
-                for conflito in self.conflitos.values():
-                    if conflito["ativo"] and (
-                        (conflito["grupo1_id"] == tratado["grupo1_id"] and conflito["grupo2_id"] == tratado["grupo2_id"]) or
-                        (conflito["grupo1_id"] == tratado["grupo2_id"] and conflito["grupo2_id"] == tratado["grupo1_id"])
-                    ):
+        # Agressões: apenas pares com conflito ativo e tratado ativo
+        for par, conflito_ids in list(self.conflitos_por_par.items()):
+            for tratado_id in list(self.tratados_por_par.get(par, ())):
+                tratado = self.tratados[tratado_id]
+                for termo in tratado["termos"]:
+                    if termo["tipo"] != "nao_agressao":
+                        continue
+                    for conflito_id in list(conflito_ids):
+                        if not tratado["ativo"]:
+                            break
+                        conflito = self.conflitos[conflito_id]
                         # Registrar violação
                         self._registrar_violacao_tratado(
                             tratado_id,
                             "agressao",
                             f"Conflito iniciado entre grupos {conflito['grupo1_id']} e {conflito['grupo2_id']}"
                         )
+        
+        # Tributos vencidos
+        for _, (tratado_id, indice) in list(self.agenda_tributos.vencidos(self.tempo)):
+            tratado = self.tratados[tratado_id]
+            if not tratado["ativo"]:
+                continue
+            termo = tratado["termos"][indice]
+            self._reagendar_termo(self.agenda_tributos, tratado_id, indice)
+            
+            # Verificar se o grupo tem recursos suficientes
+            grupo_pagador_id = tratado["grupo2_id"]  # Assumindo que o grupo2 é o perdedor/pagador
             
-            elif termo["tipo"] == "tributo":
-                # Verificar se é hora de pagar tributo
-                termo["tempo_atual"] = termo.get("tempo_atual", 0.0) + delta_tempo
+            if grupo_pagador_id in grupos:
+                grupo_pagador = grupos[grupo_pagador_id]
                 
-                if termo["tempo_atual"] >= termo["periodicidade"]:
-                    # Resetar contador
-                    termo["tempo_atual"] = 0.0
-                    
-                    # Verificar se o grupo tem recursos suficientes
-                    grupo_pagador_id = tratado["grupo2_id"]  # Assumindo que o grupo2 é o perdedor/pagador
-                    
-                    if grupo_pagador_id in grupos:
-                        grupo_pagador = grupos[grupo_pagador_id]
-                        
-                        if termo["recurso"] in grupo_pagador["recursos"] and grupo_pagador["recursos"][termo["recurso"]] >= termo["quantidade"]:
-                            # Pagar tributo
-                            self._transferir_recurso(
-                                grupo_pagador_id,
-                                tratado["grupo1_id"],
-                                termo["recurso"],
-                                termo["quantidade"],
-                                grupos,
-                                senciantes
-                            )
-                        else:
-                            # Registrar violação
-                            self._registrar_violacao_tratado(
-                                tratado_id,
-                                "falta_pagamento",
-                                f"Grupo {grupo_pagador_id} não pagou tributo de {termo['quantidade']} {termo['recurso']}"
-                            )
+                if termo["recurso"] in grupo_pagador["recursos"] and grupo_pagador["recursos"][termo["recurso"]] >= termo["quantidade"]:
+                    # Pagar tributo
+                    self._transferir_recurso(
+                        grupo_pagador_id,
+                        tratado["grupo1_id"],
+                        termo["recurso"],
+                        termo["quantidade"],
+                        grupos,
+                        senciantes
+                    )
+                else:
+                    # Registrar violação
+                    self._registrar_violacao_tratado(
+                        tratado_id,
+                        "falta_pagamento",
+                        f"Grupo {grupo_pagador_id} não pagou tributo de {termo['quantidade']} {termo['recurso']}"
+                    )
+    
+    def _reagendar_termo(self, agenda, tratado_id, indice):
+        """
+        Agenda o próximo vencimento de um termo periódico a partir do tempo atual.
+        
+        Args:
+            agenda (Agenda): Agenda do tipo de termo.
+            tratado_id (str): ID do tratado.
+            indice (int): Índice do termo no tratado.
+        """
+        termo = self.tratados[tratado_id]["termos"][indice]
+        entradas = [(a, e) for a, e in self._entradas_agenda[tratado_id] if Agenda.pendente(e)]  # Descartar as já vencidas
+        entradas.append((agenda, agenda.agendar(self.tempo + termo["periodicidade"], (tratado_id, indice))))
+        self._entradas_agenda[tratado_id] = entradas
     
     def _transferir_recurso(self, grupo_origem_id, grupo_destino_id, recurso, quantidade, grupos, senciantes):
         """
@@ -772,6 +826,9 @@ class MecanicaConflitoDiplomacia:
                 
                 senciantes[membro_id].inventario[recurso] += quantidade_por_membro
         
+        # Os inventários mudaram; a tabela de grupos precisa ser recalculada
+        self.mundo.registro_grupos.invalidar()
+        
         # Registrar no histórico do mundo
         self.mundo.historico.registrar_evento(
             "transferencia_recurso",
@@ -825,6 +882,14 @@ class MecanicaConflitoDiplomacia:
         """
         tratado = self.tratados[tratado_id]
         
+        # Remover dos índices de tratados ativos e cancelar vencimentos agendados
+        if tratado["ativo"]:
+            del self.tratados_ativos[tratado_id]
+            self._desindexar(self.tratados_por_par, self._par(tratado["grupo1_id"], tratado["grupo2_id"]), tratado_id)
+            self._desindexar(self.tratados_por_tipo, tratado["tipo"], tratado_id)
+            for agenda, entrada in self._entradas_agenda.pop(tratado_id, ()):
+                agenda.cancelar(entrada)
+        
         # Atualizar estado do tratado
         tratado["ativo"] = False
         tratado["motivo_encerramento"] = motivo
@@ -847,6 +912,11 @@ class MecanicaConflitoDiplomacia:
             grupos (dict): Dicionário de grupos identificados.
             senciantes (dict): Dicionário de Senciantes para referência.
         """
+        # Negociações sorteadas no intervalo
+        disparos = self.agendador.disparos("diplomacia:negociacao")
+        if disparos == 0:
+            return
+        
         # Ignorar grupos individuais
         grupos_reais = {id: g for id, g in grupos.items() if not id.startswith("individual_") or len(g["membros"]) > 1}
         
@@ -854,23 +924,13 @@ class MecanicaConflitoDiplomacia:
         if len(grupos_reais) < 2:
             return
         
-        # Chance de nova negociação baseada no tempo
-        chance_negociacao = 0.01 * delta_tempo
-        
-        if chance(chance_negociacao):
+        for _ in range(disparos):
             # Escolher dois grupos aleatórios
             grupo_ids = list(grupos_reais.keys())
             grupo1_id, grupo2_id = random.sample(grupo_ids, 2)
             
             # Verificar se existe conflito ativo entre estes grupos
-            conflito_ativo = False
-            for conflito in self.conflitos.values():
-                if conflito["ativo"] and (
-                    (conflito["grupo1_id"] == grupo1_id and conflito["grupo2_id"] == grupo2_id) or
-                    (conflito["grupo1_id"] == grupo2_id and conflito["grupo2_id"] == grupo1_id)
-                ):
-                    conflito_ativo = True
-                    break
+            conflito_ativo = self._par(grupo1_id, grupo2_id) in self.conflitos_por_par
             
             # Determinar tipo de negociação
             if conflito_ativo:
@@ -938,11 +998,11 @@ class MecanicaConflitoDiplomacia:
                 "grupo2_id": grupo2_id,
                 "termos": termos,
                 "tempo_criacao": 0,  # Será preenchido pelo motor
-                "tempo_atual": 0.0,
                 "duracao": 168.0,  # 7 dias
                 "ativo": True,
                 "violacoes": []
             }
+            self._registrar_tratado(tratado_id)
             
             # Registrar no histórico do mundo
             self.mundo.historico.registrar_evento(
@@ -954,16 +1014,12 @@ class MecanicaConflitoDiplomacia:
             
             # Se for um tratado de paz, encerrar conflitos ativos
             if tipo_tratado == "paz":
-                for conflito_id, conflito in list(self.conflitos.items()):
-                    if conflito["ativo"] and (
-                        (conflito["grupo1_id"] == grupo1_id and conflito["grupo2_id"] == grupo2_id) or
-                        (conflito["grupo1_id"] == grupo2_id and conflito["grupo2_id"] == grupo1_id)
-                    ):
-                        self._encerrar_conflito(
-                            conflito_id,
-                            "acordo",
-                            f"Acordo de paz entre grupos {grupo1_id} e {grupo2_id}"
-                        )
+                for conflito_id in list(self.conflitos_por_par.get(self._par(grupo1_id, grupo2_id), ())):
+                    self._encerrar_conflito(
+                        conflito_id,
+                        "acordo",
+                        f"Acordo de paz entre grupos {grupo1_id} e {grupo2_id}"
+                    )
             
             return tratado_id
         else:
@@ -1094,38 +1150,29 @@ class MecanicaConflitoDiplomacia:
             grupos (dict): Dicionário de grupos identificados.
             senciantes (dict): Dicionário de Senciantes para referência.
         """
-        # Processar trocas comerciais de tratados
-        for tratado_id, tratado in self.tratados.items():
-            if not tratado["ativo"] or tratado["tipo"] != "comercio":
+        # Processar apenas os termos de troca comercial vencidos
+        for _, (tratado_id, indice) in list(self.agenda_trocas.vencidos(self.tempo)):
+            tratado = self.tratados[tratado_id]
+            if not tratado["ativo"]:
                 continue
+            termo = tratado["termos"][indice]
+            self._reagendar_termo(self.agenda_trocas, tratado_id, indice)
             
             # Verificar se os grupos ainda existem
             if tratado["grupo1_id"] not in grupos or tratado["grupo2_id"] not in grupos:
                 continue
             
-            # Processar termos de troca comercial
-            for termo in tratado["termos"]:
-                if termo["tipo"] != "troca_comercial":
-                    continue
-                
-                # Verificar se é hora de realizar a troca
-                termo["tempo_atual"] = termo.get("tempo_atual", 0.0) + delta_tempo
-                
-                if termo["tempo_atual"] >= termo["periodicidade"]:
-                    # Resetar contador
-                    termo["tempo_atual"] = 0.0
-                    
-                    # Realizar troca
-                    self._realizar_troca_comercial(
-                        tratado["grupo1_id"],
-                        tratado["grupo2_id"],
-                        termo["recurso1"],
-                        termo["quantidade1"],
-                        termo["recurso2"],
-                        termo["quantidade2"],
-                        grupos,
-                        senciantes
-                    )
+            # Realizar troca
+            self._realizar_troca_comercial(
+                tratado["grupo1_id"],
+                tratado["grupo2_id"],
+                termo["recurso1"],
+                termo["quantidade1"],
+                termo["recurso2"],
+                termo["quantidade2"],
+                grupos,
+                senciantes
+            )
     
     def _realizar_troca_comercial(self, grupo1_id, grupo2_id, recurso1, quantidade1, recurso2, quantidade2, grupos, senciantes):
         """
@@ -1258,11 +1305,11 @@ class MecanicaConflitoDiplomacia:
                 "grupo2_id": grupo2_id,
                 "termos": termos,
                 "tempo_criacao": 0,  # Será preenchido pelo motor
-                "tempo_atual": 0.0,
                 "duracao": 168.0,  # 7 dias
                 "ativo": True,
                 "violacoes": []
             }
+            self._registrar_tratado(tratado_id)
             
             # Registrar no histórico do mundo
             self.mundo.historico.registrar_evento(
@@ -1292,7 +1339,7 @@ class MecanicaConflitoDiplomacia:
         Returns:
             dict: Dicionário de conflitos ativos.
         """
-        return {id: c for id, c in self.conflitos.items() if c["ativo"]}
+        return dict(self.conflitos_ativos)
     
     def obter_tratados_ativos(self):
         """
@@ -1301,5 +1348,5 @@ class MecanicaConflitoDiplomacia:
         Returns:
             dict: Dicionário de tratados ativos.
         """
-        return {id: t for id, t in self.tratados.items() if t["ativo"]}
+        return dict(self.tratados_ativos)
 
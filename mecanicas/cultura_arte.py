@@ -73,7 +73,8 @@ class MecanicaCulturaArte:
     
     def _identificar_grupos(self, senciantes):
         """
-        Identifica grupos de Senciantes.
+        Identifica grupos de Senciantes usando o registro de grupos do mundo,
+        que é construído uma única vez por passo e compartilhado entre as mecânicas.
         
         Args:
             senciantes (dict): Dicionário de Senciantes para referência.
@@ -81,64 +82,7 @@ class MecanicaCulturaArte:
         Returns:
             dict: Dicionário de grupos identificados.
         """
-        grupos = {}
-        
-        for senciante_id, senciante in senciantes.items():
-            # Verificar se o Senciante tem um grupo
-            grupo_id = senciante.grupo_id if hasattr(senciante, "grupo_id") else None
-            
-            # Se não tiver grupo, considerar como indivíduo
-            if grupo_id is None:
-                grupo_id = f"individual_{senciante_id}"
-            
-            # Adicionar ao dicionário de grupos
-            if grupo_id not in grupos:
-                grupos[grupo_id] = {
-                    "membros": [],
-                    "lider_id": None,
-                    "posicao_media": [0.0, 0.0],
-                    "nivel_cultural": 0.0,
-                    "artefatos": [],
-                    "locais_sagrados": [],
-                    "tradicoes": []
-                }
-            
-            grupos[grupo_id]["membros"].append(senciante_id)
-            
-            # Atualizar posição média
-            if len(grupos[grupo_id]["membros"]) == 1:
-                grupos[grupo_id]["posicao_media"] = senciante.posicao.copy()
-            else:
-                n = len(grupos[grupo_id]["membros"])
-                grupos[grupo_id]["posicao_media"][0] = ((n - 1) * grupos[grupo_id]["posicao_media"][0] + senciante.posicao[0]) / n
-                grupos[grupo_id]["posicao_media"][1] = ((n - 1) * grupos[grupo_id]["posicao_media"][1] + senciante.posicao[1]) / n
-            
-            # Calcular nível cultural
-            nivel_cultural_individual = 0.0
-            
-            if hasattr(senciante, "habilidades"):
-                nivel_cultural_individual += senciante.habilidades.get("arte", 0.0) * 0.5
-                nivel_cultural_individual += senciante.habilidades.get("comunicacao", 0.0) * 0.3
-                nivel_cultural_individual += senciante.habilidades.get("espiritualidade", 0.0) * 0.2
-            
-            grupos[grupo_id]["nivel_cultural"] += nivel_cultural_individual / len(grupos[grupo_id]["membros"])
-            
-            # Verificar se é líder
-            if hasattr(senciante, "habilidades") and senciante.habilidades.get("lideranca", 0.0) > 0.5:
-                if grupos[grupo_id]["lider_id"] is None or senciante.habilidades.get("lideranca", 0.0) > senciantes[grupos[grupo_id]["lider_id"]].habilidades.get("lideranca", 0.0):
-                    grupos[grupo_id]["lider_id"] = senciante_id
-            
-            # Coletar artefatos, locais sagrados e tradições
-            if hasattr(senciante, "artefatos_conhecidos"):
-                grupos[grupo_id]["artefatos"].extend([a for a in senciante.artefatos_conhecidos if a not in grupos[grupo_id]["artefatos"]])
-            
-            if hasattr(senciante, "locais_sagrados_conhecidos"):
-                grupos[grupo_id]["locais_sagrados"].extend([l for l in senciante.locais_sagrados_conhecidos if l not in grupos[grupo_id]["locais_sagrados"]])
-            
-            if hasattr(senciante, "tradicoes_conhecidas"):
-                grupos[grupo_id]["tradicoes"].extend([t for t in senciante.tradicoes_conhecidas if t not in grupos[grupo_id]["tradicoes"]])
-        
-        return grupos
+        return self.mundo.registro_grupos.obter(senciantes)
     
     def _verificar_criacao_artefatos(self, delta_tempo, grupos, senciantes):
         """
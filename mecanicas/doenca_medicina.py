@@ -4,7 +4,7 @@ Implementação das mecânicas de doenças e medicina evolutiva para o jogo "O M
 
 import random
 from modelos.doenca import Doenca
-from utils.helpers import chance, calcular_distancia
+from utils.helpers import chance
 
 class MecanicaDoencaMedicina:
     """
@@ -37,6 +37,9 @@ class MecanicaDoencaMedicina:
             delta_tempo (float): Tempo decorrido desde a última atualização em horas.
             senciantes (dict): Dicionário de Senciantes para referência.
         """
+        # Manter o índice espacial usado na transmissão sincronizado
+        self.mundo.sincronizar_senciantes(senciantes)
+        
         # Chance de surgimento de nova doença
         if chance(0.01 * delta_tempo):
             self._gerar_nova_doenca()
@@ -260,8 +263,10 @@ class MecanicaDoencaMedicina:
             doenca (Doenca): Doença a ser transmitida.
             senciantes (dict): Dicionário de Senciantes para referência.
         """
-        # Verificar Senciantes próximos
-        for outro_id, outro_senciante in senciantes.items():
+        # Verificar Senciantes próximos o suficiente para transmissão
+        for outro_senciante in self.mundo.encontrar_senciantes_proximos(senciante_infectado.posicao, 2.0, senciantes):
+            outro_id = outro_senciante.id
+            
             # Ignorar o próprio Senciante infectado
             if outro_id == senciante_infectado.id:
                 continue
@@ -270,17 +275,12 @@ class MecanicaDoencaMedicina:
             if outro_id in self.senciantes_infectados and doenca.id in self.senciantes_infectados[outro_id]:
                 continue
             
-            # Calcular distância
-            distancia = calcular_distancia(senciante_infectado.posicao, outro_senciante.posicao)
+            # Calcular chance de transmissão
+            chance_transmissao = doenca.calcular_chance_transmissao(senciante_infectado, outro_senciante)
             
-            # Verificar se está próximo o suficiente para transmissão
-            if distancia <= 2.0:
-                # Calcular chance de transmissão
-                chance_transmissao = doenca.calcular_chance_transmissao(senciante_infectado, outro_senciante)
-                
-                # Tentar transmitir
-                if chance(chance_transmissao):
-                    self.infectar_senciante(outro_id, doenca.id, senciantes)
+            # Tentar transmitir
+            if chance(chance_transmissao):
+                self.infectar_senciante(outro_id, doenca.id, senciantes)
     
     def infectar_senciante(self, senciante_id, doenca_id, senciantes):
         """
@@ -6,6 +6,7 @@ import random
 import numpy as np
 from modelos.fauna import Fauna
 from modelos.flora import Flora
+from mecanicas.ecossistema_vetorizado import MotorEcossistemaVetorizado
 from utils.helpers import chance, calcular_distancia
 
 class MecanicaEcossistema:
@@ -13,12 +14,14 @@ class MecanicaEcossistema:
     Classe que implementa as mecânicas de ecossistema simbiótico e predadores.
     """
     
-    def __init__(self, mundo):
+    def __init__(self, mundo, vetorizado=False):
         """
         Inicializa a mecânica de ecossistema.
         
         Args:
             mundo (Mundo): Objeto mundo para referência.
+            vetorizado (bool, optional): Se True, os grupos de fauna e flora são atualizados
+                em lote pelo MotorEcossistemaVetorizado. Default é False.
         """
         self.mundo = mundo
         self.fauna = {}  # Dicionário de id_fauna: fauna
@@ -44,6 +47,9 @@ class MecanicaEcossistema:
         
         # Inicializar ecossistema
         self._inicializar_ecossistema()
+        
+        # Motor vetorizado opcional para os grupos de fauna e flora
+        self.motor_vetorizado = MotorEcossistemaVetorizado(self) if vetorizado else None
     
     def _inicializar_ecossistema(self):
         """
@@ -605,11 +611,15 @@ class MecanicaEcossistema:
             delta_tempo (float): Tempo decorrido desde a última atualização em horas.
             senciantes (dict): Dicionário de Senciantes para referência.
         """
-        # Atualizar fauna
-        self._atualizar_fauna(delta_tempo, senciantes)
-        
-        # Atualizar flora
-        self._atualizar_flora(delta_tempo, senciantes)
+        if self.motor_vetorizado is not None:
+            # Atualizar fauna e flora em lote
+            self.motor_vetorizado.atualizar(delta_tempo)
+        else:
+            # Atualizar fauna
+            self._atualizar_fauna(delta_tempo, senciantes)
+            
+            # Atualizar flora
+            self._atualizar_flora(delta_tempo, senciantes)
         
         # Atualizar relações simbióticas
         self._atualizar_relacoes_simbioticas(delta_tempo)
@@ -890,18 +900,27 @@ class MecanicaEcossistema:
             delta_tempo (float): Tempo decorrido desde a última atualização em horas.
             senciantes (dict): Dicionário de Senciantes para referência.
         """
+        agendador = self.mundo.agendador_riscos
+        
         for flora_id, flora in self.flora.items():
             # Atualizar grupos
             if hasattr(flora, "grupos"):
+                maduros = []
                 for grupo in flora.grupos:
                     # Crescimento
                     self._crescer_grupo_flora(grupo, flora, delta_tempo)
-                    
-                    # Reprodução
-                    self._reproduzir_grupo_flora(grupo, flora, delta_tempo)
+                    if grupo["maturidade"] >= 1.0:
+                        maduros.append(grupo)
                     
                     # Morte natural
                     self._morte_natural_grupo_flora(grupo, delta_tempo)
+                
+                # Reprodução: cada grupo maduro se reproduz a uma taxa de 0.01 por hora, e a
+                # soma desses processos é um único evento da espécie com a taxa total
+                chave = f"ecossistema:reproducao_flora:{flora_id}"
+                for _ in range(agendador.disparos(chave) if maduros else 0):
+                    self._reproduzir_grupo_flora(random.choice(maduros), flora)
+                agendador.registrar(chave, 0.01 * len(maduros))
             
             # Atualizar população total
             if hasattr(flora, "grupos"):
@@ -934,61 +953,56 @@ class MecanicaEcossistema:
             # Aumentar maturidade
             grupo["maturidade"] = min(1.0, grupo["maturidade"] + taxa_crescimento)
     
-    def _reproduzir_grupo_flora(self, grupo, flora, delta_tempo):
+    def _reproduzir_grupo_flora(self, grupo, flora):
         """
-        Reproduz um grupo de flora.
+        Reproduz um grupo de flora (um disparo da reprodução sorteada pelo agendador).
         
         Args:
             grupo (dict): Grupo de flora.
             flora (Flora): Espécie de flora.
-            delta_tempo (float): Tempo decorrido desde a última atualização em horas.
         """
         # Verificar se o grupo está maduro
         if grupo["maturidade"] >= 1.0:
-            # Chance de reprodução baseada no tempo
-            chance_reproducao = 0.01 * delta_tempo
+            # Taxa de reprodução
+            taxa_reproducao = 0.05
+            
+            # Crescimento
+            crescimento = grupo["tamanho"] * taxa_reproducao
+            
+            # Adicionar ao tamanho do grupo
+            grupo["tamanho"] += crescimento
             
-            if chance(chance_reproducao):
-                # Taxa de reprodução
-                taxa_reproducao = 0.05
+            # Chance de criar novo grupo próximo
+            if chance(0.2):
+                # Determinar posição próxima
+                angulo = random.uniform(0, 2 * 3.14159)
+                distancia = random.uniform(5.0, 15.0)
                 
-                # Crescimento
-                crescimento = grupo["tamanho"] * taxa_reproducao
+                nova_pos_x = grupo["posicao"][0] + distancia * np.cos(angulo)
+                nova_pos_y = grupo["posicao"][1] + distancia * np.sin(angulo)
                 
-                # Adicionar ao tamanho do grupo
-                grupo["tamanho"] += crescimento
+                # Verificar limites do mundo
+                nova_pos_x = max(0, min(self.mundo.tamanho[0], nova_pos_x))
+                nova_pos_y = max(0, min(self.mundo.tamanho[1], nova_pos_y))
                 
-                # Chance de criar novo grupo próximo
-                if chance(0.2):
-                    # Determinar posição próxima
-                    angulo = random.uniform(0, 2 * 3.14159)
-                    distancia = random.uniform(5.0, 15.0)
-                    
-                    nova_pos_x = grupo["posicao"][0] + distancia * np.cos(angulo)
-                    nova_pos_y = grupo["posicao"][1] + distancia * np.sin(angulo)
-                    
-                    # Verificar limites do mundo
-                    nova_pos_x = max(0, min(self.mundo.tamanho[0], nova_pos_x))
-                    nova_pos_y = max(0, min(self.mundo.tamanho[1], nova_pos_y))
+                # Verificar bioma
+                novo_bioma = self.mundo.obter_bioma([nova_pos_x, nova_pos_y])
+                
+                # Se o bioma for adequado, criar novo grupo
+                if novo_bioma in flora.biomas_adequados:
+                    novo_grupo = {
+                        "especie_id": flora.id,
+                        "posicao": [nova_pos_x, nova_pos_y],
+                        "tamanho": grupo["tamanho"] * 0.2,  # 20% do tamanho do grupo original
+                        "bioma": novo_bioma,
+                        "maturidade": 0.0  # Começa como semente
+                    }
                     
-                    # Verificar bioma
-                    novo_bioma = self.mundo.obter_bioma([nova_pos_x, nova_pos_y])
+                    # Reduzir tamanho do grupo original
+                    grupo["tamanho"] *= 0.8  # 80% do tamanho original
                     
-                    # Se o bioma for adequado, criar novo grupo
-                    if novo_bioma in flora.biomas_adequados:
-                        novo_grupo = {
-                            "especie_id": flora.id,
-                            "posicao": [nova_pos_x, nova_pos_y],
-                            "tamanho": grupo["tamanho"] * 0.2,  # 20% do tamanho do grupo original
-                            "bioma": novo_bioma,
-                            "maturidade": 0.0  # Começa como semente
-                        }
-                        
-                        # Reduzir tamanho do grupo original
-                        grupo["tamanho"] *= 0.8  # 80% do tamanho original
-                        
-                        # Adicionar novo grupo
-                        flora.grupos.append(novo_grupo)
+                    # Adicionar novo grupo
+                    flora.grupos.append(novo_grupo)
     
     def _morte_natural_grupo_flora(self, grupo, delta_tempo):
         """
@@ -0,0 +1,774 @@
+"""
+Motor vetorizado de atualização de grupos de fauna e flora para o jogo "O Mundo dos Senciantes".
+Os grupos de todas as espécies ficam em arrays empacotados (posição, tamanho,
+maturidade, espécie e bioma) e movimento, alimentação, crescimento, reprodução
+e morte natural são aplicados em lote com NumPy a cada passo. A busca de
+alimento usa um índice espacial de grade uniforme por armazenamento, e grupos
+extintos são removidos dos arrays periodicamente.
+"""
+
+from collections.abc import MutableMapping
+
+import numpy as np
+
+from utils.indice_espacial import IndiceEspacial
+
+# Chaves de um grupo que ficam nos arrays empacotados
+CHAVES_GRUPO = ("especie_id", "posicao", "tamanho", "bioma", "maturidade")
+
+# Raios de busca de alimento (os mesmos de MecanicaEcossistema._alimentar_herbivoro/_carnivoro)
+RAIO_PASTO = 20.0
+RAIO_CACA = 30.0
+
+# Grupos com menos de meio indivíduo estão extintos e saem dos arrays na compactação
+TAMANHO_MINIMO_GRUPO = 0.5
+FRACAO_COMPACTACAO = 0.25  # Fração de linhas extintas a partir da qual os arrays são compactados
+
+# Dietas codificadas
+DIETA_HERBIVORO = 0
+DIETA_CARNIVORO = 1
+DIETA_ONIVORO = 2
+
+
+class GrupoEmpacotado(MutableMapping):
+    """
+    Visão com interface de dicionário sobre um grupo guardado em `GruposEmpacotados`.
+    Substitui os dicionários de grupo nas listas `especie.grupos`, de forma que o
+    restante da mecânica continue lendo e escrevendo `grupo["tamanho"]` etc.
+    """
+
+    def __init__(self, grupos, linha):
+        """
+        Inicializa uma nova visão de grupo.
+
+        Args:
+            grupos (GruposEmpacotados): Armazenamento empacotado.
+            linha (int): Linha do grupo nos arrays.
+        """
+        self.grupos = grupos
+        self.linha = linha
+
+    def __getitem__(self, chave):
+        grupos = self.grupos
+        linha = self.linha
+        if chave == "tamanho":
+            return float(grupos.tamanhos[linha])
+        if chave == "posicao":
+            return [float(grupos.posicoes[linha, 0]), float(grupos.posicoes[linha, 1])]
+        if chave == "especie_id":
+            return grupos.motor.ids_especies[grupos.tipo][grupos.especies[linha]]
+        if chave == "bioma":
+            return grupos.motor.biomas[grupos.biomas[linha]]
+        if chave == "maturidade" and grupos.com_maturidade:
+            return float(grupos.maturidades[linha])
+        return grupos.extras[linha][chave]
+
+    def __setitem__(self, chave, valor):
+        grupos = self.grupos
+        linha = self.linha
+        if chave == "tamanho":
+            grupos.tamanhos[linha] = valor
+        elif chave == "posicao":
+            grupos.mover([linha], [valor])
+        elif chave == "especie_id":
+            grupos.especies[linha] = grupos.motor.indices_especies[grupos.tipo][valor]
+        elif chave == "bioma":
+            grupos.biomas[linha] = grupos.motor.indice_bioma(valor)
+        elif chave == "maturidade" and grupos.com_maturidade:
+            grupos.maturidades[linha] = valor
+        else:
+            grupos.extras[linha][chave] = valor
+
+    def __delitem__(self, chave):
+        if chave in self._chaves_fixas():
+            raise KeyError(f"A chave '{chave}' é um campo empacotado e não pode ser removida")
+        del self.grupos.extras[self.linha][chave]
+
+    def _chaves_fixas(self):
+        if self.grupos.com_maturidade:
+            return CHAVES_GRUPO
+        return CHAVES_GRUPO[:-1]
+
+    def __iter__(self):
+        yield from self._chaves_fixas()
+        yield from self.grupos.extras[self.linha]
+
+    def __len__(self):
+        return len(self._chaves_fixas()) + len(self.grupos.extras[self.linha])
+
+    def copy(self):
+        """
+        Copia os valores do grupo para um dicionário comum.
+
+        Returns:
+            dict: Cópia do grupo.
+        """
+        return dict(self.items())
+
+    def __repr__(self):
+        return repr(self.copy())
+
+
+class GruposEmpacotados:
+    """
+    Arrays empacotados com os grupos de todas as espécies de fauna ou de flora.
+    Um índice espacial (IndiceEspacial, com as linhas como IDs) acompanha as posições;
+    posições devem ser alteradas por `mover` para mantê-lo sincronizado.
+    """
+
+    def __init__(self, motor, tipo, com_maturidade, capacidade_inicial=64, tamanho_celula=RAIO_PASTO):
+        """
+        Inicializa um novo armazenamento empacotado.
+
+        Args:
+            motor (MotorEcossistemaVetorizado): Motor dono do armazenamento.
+            tipo (str): "fauna" ou "flora".
+            com_maturidade (bool): Se os grupos têm maturidade (flora).
+            capacidade_inicial (int, optional): Número inicial de linhas. Default é 64.
+            tamanho_celula (float, optional): Lado das células do índice espacial, normalmente
+                o raio das buscas feitas nele. Default é RAIO_PASTO.
+        """
+        capacidade = max(1, int(capacidade_inicial))
+
+        self.motor = motor
+        self.tipo = tipo
+        self.com_maturidade = com_maturidade
+        self.n = 0  # Número de linhas em uso
+        self.indice = IndiceEspacial(tamanho_celula)
+
+        self.posicoes = np.zeros((capacidade, 2))
+        self.tamanhos = np.zeros(capacidade)
+        self.maturidades = np.zeros(capacidade)
+        self.especies = np.zeros(capacidade, dtype=np.int64)
+        self.biomas = np.zeros(capacidade, dtype=np.int64)
+        self.extras = []  # Chaves não empacotadas, por linha
+
+    def __len__(self):
+        return self.n
+
+    def _expandir(self, minimo):
+        """
+        Aumenta a capacidade dos arrays para pelo menos `minimo` linhas.
+
+        Args:
+            minimo (int): Número mínimo de linhas.
+        """
+        capacidade = len(self.tamanhos)
+        if minimo <= capacidade:
+            return
+
+        nova_capacidade = max(minimo, capacidade * 2)
+        for nome in ("posicoes", "tamanhos", "maturidades", "especies", "biomas"):
+            antigo = getattr(self, nome)
+            novo = np.zeros((nova_capacidade,) + antigo.shape[1:], dtype=antigo.dtype)
+            novo[:capacidade] = antigo
+            setattr(self, nome, novo)
+
+    def adicionar(self, especies, posicoes, tamanhos, biomas, maturidades=None):
+        """
+        Adiciona grupos em lote.
+
+        Args:
+            especies (numpy.ndarray): Índices das espécies.
+            posicoes (numpy.ndarray): Posições (k, 2).
+            tamanhos (numpy.ndarray): Tamanhos.
+            biomas (numpy.ndarray): Índices dos biomas.
+            maturidades (numpy.ndarray, optional): Maturidades (apenas flora).
+
+        Returns:
+            range: Linhas ocupadas pelos novos grupos.
+        """
+        k = len(tamanhos)
+        inicio = self.n
+        self._expandir(inicio + k)
+
+        self.especies[inicio:inicio + k] = especies
+        self.posicoes[inicio:inicio + k] = posicoes
+        self.tamanhos[inicio:inicio + k] = tamanhos
+        self.biomas[inicio:inicio + k] = biomas
+        if maturidades is not None:
+            self.maturidades[inicio:inicio + k] = maturidades
+        self.extras.extend({} for _ in range(k))
+        self.n += k
+
+        for linha, posicao in enumerate(self.posicoes[inicio:inicio + k].tolist(), inicio):
+            self.indice.inserir(linha, posicao)
+
+        return range(inicio, inicio + k)
+
+    def mover(self, linhas, posicoes):
+        """
+        Altera as posições de grupos, atualizando o índice espacial.
+
+        Args:
+            linhas (iterable): Linhas dos grupos.
+            posicoes (iterable): Novas posições [x, y], na mesma ordem.
+        """
+        for linha, posicao in zip(linhas, posicoes):
+            self.posicoes[linha] = posicao
+            self.indice.atualizar(int(linha), (float(posicao[0]), float(posicao[1])))
+
+    def compactar(self, tamanho_minimo):
+        """
+        Remove as linhas dos grupos com tamanho abaixo de `tamanho_minimo`, mantendo a ordem
+        das restantes, e reconstrói o índice espacial.
+
+        Args:
+            tamanho_minimo (float): Tamanho mínimo de um grupo vivo.
+
+        Returns:
+            numpy.ndarray: Nova linha de cada linha antiga (-1 para as removidas), ou None se
+                nenhuma linha foi removida.
+        """
+        n = self.n
+        vivas = np.flatnonzero(self.tamanhos[:n] >= tamanho_minimo)
+        if len(vivas) == n:
+            return None
+
+        k = len(vivas)
+        for nome in ("posicoes", "tamanhos", "maturidades", "especies", "biomas"):
+            array = getattr(self, nome)
+            array[:k] = array[vivas]
+            array[k:n] = 0
+        self.extras = [self.extras[linha] for linha in vivas.tolist()]
+        self.n = k
+
+        self.indice.limpar()
+        for linha, posicao in enumerate(self.posicoes[:k].tolist()):
+            self.indice.inserir(linha, posicao)
+
+        novas_linhas = np.full(n, -1, dtype=np.int64)
+        novas_linhas[vivas] = np.arange(k)
+        return novas_linhas
+
+    def visoes(self, linhas):
+        """
+        Cria visões de dicionário para as linhas informadas.
+
+        Args:
+            linhas (iterable): Linhas dos grupos.
+
+        Returns:
+            list: Lista de GrupoEmpacotado.
+        """
+        return [GrupoEmpacotado(self, linha) for linha in linhas]
+
+
+class MotorEcossistemaVetorizado:
+    """
+    Classe que atualiza todos os grupos de fauna e flora de uma `MecanicaEcossistema` em lote.
+    Os métodos por grupo da mecânica (`_movimentar_grupo_fauna`, `_crescer_grupo_flora`, etc.)
+    continuam sendo a implementação de referência.
+    """
+
+    def __init__(self, mecanica):
+        """
+        Inicializa o motor e empacota os grupos existentes da mecânica.
+
+        Args:
+            mecanica (MecanicaEcossistema): Mecânica de ecossistema cujos grupos serão atualizados.
+        """
+        self.mecanica = mecanica
+        self.mundo = mecanica.mundo
+
+        self.biomas = []  # Lista de índice: nome do bioma
+        self.indices_biomas = {}  # Dicionário de nome do bioma: índice
+        self.ids_especies = {"fauna": [], "flora": []}
+        self.indices_especies = {"fauna": {}, "flora": {}}
+
+        self.carregar()
+
+    def indice_bioma(self, bioma):
+        """
+        Obtém o índice de um bioma, registrando-o se ainda não for conhecido.
+
+        Args:
+            bioma (str): Nome do bioma.
+
+        Returns:
+            int: Índice do bioma.
+        """
+        indice = self.indices_biomas.get(bioma)
+        if indice is None:
+            indice = len(self.biomas)
+            self.biomas.append(bioma)
+            self.indices_biomas[bioma] = indice
+
+            # Nenhuma espécie conhece o bioma novo
+            for nome in ("adequacao_fauna", "adequacao_flora"):
+                adequacao = getattr(self, nome, None)
+                if adequacao is not None:
+                    setattr(self, nome, np.hstack([adequacao, np.zeros((len(adequacao), 1), dtype=bool)]))
+        return indice
+
+    def _carregar_especies(self, tipo, especies):
+        """
+        Registra as espécies de um tipo e monta a matriz de biomas adequados.
+
+        Args:
+            tipo (str): "fauna" ou "flora".
+            especies (dict): Dicionário de id: espécie.
+
+        Returns:
+            numpy.ndarray: Matriz booleana (espécie, bioma) de adequação.
+        """
+        self.ids_especies[tipo] = list(especies)
+        self.indices_especies[tipo] = {especie_id: i for i, especie_id in enumerate(especies)}
+
+        for especie in especies.values():
+            for bioma in especie.biomas_adequados:
+                self.indice_bioma(bioma)
+
+        adequacao = np.zeros((len(especies), len(self.biomas)), dtype=bool)
+        for i, especie in enumerate(especies.values()):
+            for bioma in especie.biomas_adequados:
+                adequacao[i, self.indices_biomas[bioma]] = True
+        return adequacao
+
+    def _empacotar_grupos(self, tipo, especies, com_maturidade, tamanho_celula):
+        """
+        Copia os grupos das espécies para arrays empacotados e troca as listas
+        `especie.grupos` por visões sobre esses arrays.
+
+        Args:
+            tipo (str): "fauna" ou "flora".
+            especies (dict): Dicionário de id: espécie.
+            com_maturidade (bool): Se os grupos têm maturidade.
+            tamanho_celula (float): Lado das células do índice espacial dos grupos.
+
+        Returns:
+            GruposEmpacotados: Armazenamento com todos os grupos.
+        """
+        total = sum(len(getattr(especie, "grupos", [])) for especie in especies.values())
+        grupos = GruposEmpacotados(self, tipo, com_maturidade, capacidade_inicial=max(64, total * 2),
+                                   tamanho_celula=tamanho_celula)
+
+        for especie_id, especie in especies.items():
+            if not hasattr(especie, "grupos"):
+                especie.grupos = []
+
+            originais = [dict(grupo) for grupo in especie.grupos]
+            linhas = grupos.adicionar(
+                np.full(len(originais), self.indices_especies[tipo][especie_id]),
+                np.array([g["posicao"] for g in originais], dtype=float).reshape(-1, 2),
+                np.array([g["tamanho"] for g in originais], dtype=float),
+                np.array([self.indice_bioma(g["bioma"]) for g in originais], dtype=np.int64),
+                np.array([g.get("maturidade", 0.0) for g in originais], dtype=float) if com_maturidade else None
+            )
+
+            # Preservar chaves que não são empacotadas
+            for linha, original in zip(linhas, originais):
+                for chave, valor in original.items():
+                    if chave not in CHAVES_GRUPO:
+                        grupos.extras[linha][chave] = valor
+
+            especie.grupos = grupos.visoes(linhas)
+
+        return grupos
+
+    def carregar(self):
+        """
+        Empacota as espécies e grupos atuais da mecânica.
+        Deve ser chamado novamente se espécies forem adicionadas ou removidas.
+        """
+        fauna = self.mecanica.fauna
+        flora = self.mecanica.flora
+
+        self.adequacao_fauna = None
+        self.adequacao_flora = None
+        adequacao_fauna = self._carregar_especies("fauna", fauna)
+        adequacao_flora = self._carregar_especies("flora", flora)
+
+        # Alinhar as matrizes com todos os biomas conhecidos
+        self.adequacao_fauna = np.zeros((len(fauna), len(self.biomas)), dtype=bool)
+        self.adequacao_fauna[:, :adequacao_fauna.shape[1]] = adequacao_fauna
+        self.adequacao_flora = np.zeros((len(flora), len(self.biomas)), dtype=bool)
+        self.adequacao_flora[:, :adequacao_flora.shape[1]] = adequacao_flora
+
+        # Atributos das espécies de fauna
+        especies_fauna = list(fauna.values())
+        self.velocidade_fauna = np.array([e.velocidade for e in especies_fauna], dtype=float)
+        self.forca_fauna = np.array([e.forca for e in especies_fauna], dtype=float)
+        self.nutricao_fauna = np.array([e.valor_nutricional for e in especies_fauna], dtype=float)
+        self.grande_fauna = np.array([e.tamanho == "grande" for e in especies_fauna], dtype=bool)
+        self.dieta_fauna = np.array([
+            DIETA_HERBIVORO if e.dieta == "herbivoro" else
+            DIETA_CARNIVORO if e.dieta == "carnivoro" else DIETA_ONIVORO
+            for e in especies_fauna
+        ], dtype=np.int64)
+
+        # Atributos das espécies de flora
+        especies_flora = list(flora.values())
+        self.tempo_crescimento_flora = np.array([e.tempo_crescimento for e in especies_flora], dtype=float)
+        self.nutricao_flora = np.array([e.valor_nutricional for e in especies_flora], dtype=float)
+        self.comestivel_flora = np.array([bool(e.comestivel) for e in especies_flora], dtype=bool)
+
+        # Cada índice tem células do tamanho do raio das buscas feitas nele
+        self.grupos_fauna = self._empacotar_grupos("fauna", fauna, com_maturidade=False, tamanho_celula=RAIO_CACA)
+        self.grupos_flora = self._empacotar_grupos("flora", flora, com_maturidade=True, tamanho_celula=RAIO_PASTO)
+
+    def _biomas_em(self, posicoes):
+        """
+        Obtém os índices dos biomas em um conjunto de posições.
+        Usa a grade de biomas do mundo quando disponível e, caso contrário,
+        consulta `mundo.obter_bioma` posição a posição.
+
+        Args:
+            posicoes (numpy.ndarray): Posições (k, 2).
+
+        Returns:
+            numpy.ndarray: Índices dos biomas.
+        """
+        geografia = getattr(self.mundo, "geografia", None)
+        if isinstance(geografia, dict) and "biomas" in geografia:
+            grade = geografia["biomas"]
+            xs = np.clip(posicoes[:, 0].astype(np.int64), 0, grade.shape[0] - 1)
+            ys = np.clip(posicoes[:, 1].astype(np.int64), 0, grade.shape[1] - 1)
+            nomes = grade[xs, ys]
+        else:
+            nomes = [self.mundo.obter_bioma([float(x), float(y)]) for x, y in posicoes]
+
+        return np.array([self.indice_bioma(nome) for nome in nomes], dtype=np.int64).reshape(-1)
+
+    def _limitar_ao_mundo(self, posicoes):
+        """
+        Limita posições aos limites do mundo.
+
+        Args:
+            posicoes (numpy.ndarray): Posições (k, 2), alteradas no lugar.
+        """
+        np.clip(posicoes[:, 0], 0, self.mundo.tamanho[0], out=posicoes[:, 0])
+        np.clip(posicoes[:, 1], 0, self.mundo.tamanho[1], out=posicoes[:, 1])
+
+    def atualizar(self, delta_tempo):
+        """
+        Atualiza todos os grupos de fauna e flora e as populações das espécies.
+        Equivale a `MecanicaEcossistema._atualizar_fauna` seguido de `_atualizar_flora`,
+        exceto que os grupos que se alimentam no mesmo passo veem os tamanhos do início da fase.
+
+        Args:
+            delta_tempo (float): Tempo decorrido desde a última atualização em horas.
+        """
+        # Fauna
+        self._movimentar_fauna(delta_tempo)
+        self._alimentar_fauna(delta_tempo)
+        self._reproduzir_fauna(delta_tempo)
+        self._morte_natural_fauna(delta_tempo)
+        self._compactar("fauna", self.mecanica.fauna, self.grupos_fauna)
+        self._atualizar_populacoes("fauna", self.mecanica.fauna, self.grupos_fauna)
+
+        # Flora
+        self._crescer_flora(delta_tempo)
+        self._reproduzir_flora(delta_tempo)
+        self._morte_natural_flora(delta_tempo)
+        self._compactar("flora", self.mecanica.flora, self.grupos_flora)
+        self._atualizar_populacoes("flora", self.mecanica.flora, self.grupos_flora)
+
+    def _movimentar_fauna(self, delta_tempo):
+        """
+        Movimenta os grupos de fauna em direções aleatórias, apenas para biomas adequados.
+
+        Args:
+            delta_tempo (float): Tempo decorrido desde a última atualização em horas.
+        """
+        grupos = self.grupos_fauna
+        n = grupos.n
+        if n == 0:
+            return
+
+        velocidades = self.velocidade_fauna[grupos.especies[:n]]
+
+        # Chance de movimento baseada na velocidade
+        movem = np.flatnonzero(np.random.random(n) < velocidades * delta_tempo)
+        if len(movem) == 0:
+            return
+
+        angulos = np.random.uniform(0, 2 * 3.14159, len(movem))
+        distancias = velocidades[movem] * 10.0 * delta_tempo
+
+        novas = grupos.posicoes[movem].copy()
+        novas[:, 0] += distancias * np.cos(angulos)
+        novas[:, 1] += distancias * np.sin(angulos)
+        self._limitar_ao_mundo(novas)
+
+        # Mover apenas para biomas adequados à espécie
+        novos_biomas = self._biomas_em(novas)
+        adequados = self.adequacao_fauna[grupos.especies[movem], novos_biomas]
+
+        movem = movem[adequados]
+        grupos.mover(movem.tolist(), novas[adequados].tolist())
+        grupos.biomas[movem] = novos_biomas[adequados]
+
+    def _alimentar_fauna(self, delta_tempo):
+        """
+        Alimenta os grupos de fauna que buscam comida neste passo.
+
+        Args:
+            delta_tempo (float): Tempo decorrido desde a última atualização em horas.
+        """
+        grupos = self.grupos_fauna
+        n = grupos.n
+        if n == 0:
+            return
+
+        # Chance de alimentação baseada no tempo
+        alimentam = np.flatnonzero(np.random.random(n) < 0.1 * delta_tempo)
+        if len(alimentam) == 0:
+            return
+
+        dietas = self.dieta_fauna[grupos.especies[alimentam]]
+
+        # Onívoros escolhem entre flora e fauna
+        herbivoros = dietas == DIETA_HERBIVORO
+        onivoros = np.flatnonzero(dietas == DIETA_ONIVORO)
+        herbivoros[onivoros] = np.random.random(len(onivoros)) < 0.5
+
+        self._alimentar_herbivoros(alimentam[herbivoros])
+        self._alimentar_carnivoros(alimentam[~herbivoros])
+
+    def _alimentar_herbivoros(self, linhas):
+        """
+        Alimenta grupos de fauna com o grupo de flora comestível mais próximo (até RAIO_PASTO unidades).
+
+        Args:
+            linhas (numpy.ndarray): Linhas dos grupos de fauna que se alimentam.
+        """
+        flora = self.grupos_flora
+        if len(linhas) == 0 or flora.n == 0:
+            return
+
+        fauna = self.grupos_fauna
+        especies_flora = flora.especies
+        comestivel = self.comestivel_flora
+
+        # Grupo comestível mais próximo de cada herbívoro, pelas células vizinhas do índice
+        alimentados = []
+        alvos = []
+        for linha, posicao in zip(linhas.tolist(), fauna.posicoes[linhas].tolist()):
+            for _, alvo in flora.indice.buscar_raio_com_distancias(posicao, RAIO_PASTO):
+                if comestivel[especies_flora[alvo]]:
+                    alimentados.append(linha)
+                    alvos.append(alvo)
+                    break
+        if not alvos:
+            return
+        linhas = np.array(alimentados, dtype=np.int64)
+        alvos = np.array(alvos, dtype=np.int64)
+
+        # Quantidade consumida, com os tamanhos do início da fase
+        consumido = np.minimum(fauna.tamanhos[linhas] * 0.1, flora.tamanhos[alvos] * 0.2)
+
+        np.subtract.at(flora.tamanhos, alvos, consumido)
+        np.maximum(flora.tamanhos[:flora.n], 0, out=flora.tamanhos[:flora.n])
+
+        crescimento = consumido * self.nutricao_flora[flora.especies[alvos]] * 0.1
+        np.add.at(fauna.tamanhos, linhas, np.where(consumido > 0, crescimento, 0.0))
+
+    def _alimentar_carnivoros(self, linhas):
+        """
+        Faz grupos de fauna caçarem o grupo de presa mais próximo (até RAIO_CACA unidades).
+
+        Args:
+            linhas (numpy.ndarray): Linhas dos grupos de fauna que caçam.
+        """
+        fauna = self.grupos_fauna
+        n = fauna.n
+        if len(linhas) == 0:
+            return
+
+        especies = fauna.especies
+        grande = self.grande_fauna
+
+        # Presa válida mais próxima de cada predador: outra espécie, e presas grandes
+        # apenas para predadores grandes
+        cacadores = []
+        alvos = []
+        for linha, posicao in zip(linhas.tolist(), fauna.posicoes[linhas].tolist()):
+            especie = especies[linha]
+            predador_grande = grande[especie]
+            for _, alvo in fauna.indice.buscar_raio_com_distancias(posicao, RAIO_CACA):
+                especie_presa = especies[alvo]
+                if especie_presa != especie and (predador_grande or not grande[especie_presa]):
+                    cacadores.append(linha)
+                    alvos.append(alvo)
+                    break
+        if not alvos:
+            return
+        linhas = np.array(cacadores, dtype=np.int64)
+        alvos = np.array(alvos, dtype=np.int64)
+        especies_predador = fauna.especies[linhas]
+
+        # Chance de sucesso na caça
+        forca = self.forca_fauna[especies_predador]
+        chance_sucesso = forca / (forca + self.velocidade_fauna[fauna.especies[alvos]])
+        sucesso = np.random.random(len(linhas)) < chance_sucesso
+        linhas = linhas[sucesso]
+        alvos = alvos[sucesso]
+
+        # Quantidade consumida, com os tamanhos do início da fase
+        consumido = np.minimum(fauna.tamanhos[linhas] * 0.2, fauna.tamanhos[alvos] * 0.5)
+        crescimento = consumido * self.nutricao_fauna[fauna.especies[alvos]] * 0.1
+
+        np.subtract.at(fauna.tamanhos, alvos, consumido)
+        np.maximum(fauna.tamanhos[:n], 0, out=fauna.tamanhos[:n])
+        np.add.at(fauna.tamanhos, linhas, np.where(consumido > 0, crescimento, 0.0))
+
+    def _reproduzir_fauna(self, delta_tempo):
+        """
+        Aplica reprodução aos grupos de fauna.
+
+        Args:
+            delta_tempo (float): Tempo decorrido desde a última atualização em horas.
+        """
+        grupos = self.grupos_fauna
+        n = grupos.n
+        reproduzem = np.random.random(n) < 0.02 * delta_tempo
+
+        tamanhos = grupos.tamanhos[:n]
+        tamanhos[reproduzem] += tamanhos[reproduzem] * 0.1
+
+    def _morte_natural_fauna(self, delta_tempo):
+        """
+        Aplica morte natural aos grupos de fauna.
+
+        Args:
+            delta_tempo (float): Tempo decorrido desde a última atualização em horas.
+        """
+        tamanhos = self.grupos_fauna.tamanhos[:self.grupos_fauna.n]
+        np.maximum(tamanhos - tamanhos * (0.01 * delta_tempo), 0, out=tamanhos)
+
+    def _crescer_flora(self, delta_tempo):
+        """
+        Aumenta a maturidade dos grupos de flora ainda imaturos.
+
+        Args:
+            delta_tempo (float): Tempo decorrido desde a última atualização em horas.
+        """
+        grupos = self.grupos_flora
+        n = grupos.n
+        maturidades = grupos.maturidades[:n]
+        imaturos = maturidades < 1.0
+
+        taxas = delta_tempo / self.tempo_crescimento_flora[grupos.especies[:n][imaturos]]
+        maturidades[imaturos] = np.minimum(1.0, maturidades[imaturos] + taxas)
+
+    def _reproduzir_flora(self, delta_tempo):
+        """
+        Aplica reprodução aos grupos de flora maduros, criando novos grupos próximos.
+
+        Args:
+            delta_tempo (float): Tempo decorrido desde a última atualização em horas.
+        """
+        grupos = self.grupos_flora
+        n = grupos.n
+        if n == 0:
+            return
+
+        maduros = grupos.maturidades[:n] >= 1.0
+        reproduzem = np.flatnonzero(maduros & (np.random.random(n) < 0.01 * delta_tempo))
+        if len(reproduzem) == 0:
+            return
+
+        grupos.tamanhos[reproduzem] += grupos.tamanhos[reproduzem] * 0.05
+
+        # Chance de criar novo grupo próximo
+        espalham = reproduzem[np.random.random(len(reproduzem)) < 0.2]
+        if len(espalham) == 0:
+            return
+
+        angulos = np.random.uniform(0, 2 * 3.14159, len(espalham))
+        distancias = np.random.uniform(5.0, 15.0, len(espalham))
+
+        novas = grupos.posicoes[espalham].copy()
+        novas[:, 0] += distancias * np.cos(angulos)
+        novas[:, 1] += distancias * np.sin(angulos)
+        self._limitar_ao_mundo(novas)
+
+        # Criar grupos apenas em biomas adequados à espécie
+        novos_biomas = self._biomas_em(novas)
+        especies = grupos.especies[espalham]
+        adequados = self.adequacao_flora[especies, novos_biomas]
+
+        origens = espalham[adequados]
+        if len(origens) == 0:
+            return
+
+        tamanhos_novos = grupos.tamanhos[origens] * 0.2  # 20% do tamanho do grupo original
+        grupos.tamanhos[origens] *= 0.8  # 80% do tamanho original
+
+        linhas = grupos.adicionar(
+            especies[adequados],
+            novas[adequados],
+            tamanhos_novos,
+            novos_biomas[adequados],
+            np.zeros(len(origens))  # Começa como semente
+        )
+
+        # Registrar os novos grupos nas listas das espécies
+        ids_especies = self.ids_especies["flora"]
+        for linha in linhas:
+            especie = self.mecanica.flora[ids_especies[grupos.especies[linha]]]
+            especie.grupos.append(GrupoEmpacotado(grupos, linha))
+
+    def _morte_natural_flora(self, delta_tempo):
+        """
+        Aplica morte natural aos grupos de flora.
+
+        Args:
+            delta_tempo (float): Tempo decorrido desde a última atualização em horas.
+        """
+        tamanhos = self.grupos_flora.tamanhos[:self.grupos_flora.n]
+        np.maximum(tamanhos - tamanhos * (0.005 * delta_tempo), 0, out=tamanhos)
+
+    def _compactar(self, tipo, especies, grupos):
+        """
+        Remove dos arrays os grupos extintos (tamanho abaixo de TAMANHO_MINIMO_GRUPO) quando
+        passam de FRACAO_COMPACTACAO das linhas, e atualiza as visões das listas `especie.grupos`.
+
+        Args:
+            tipo (str): "fauna" ou "flora".
+            especies (dict): Dicionário de id: espécie.
+            grupos (GruposEmpacotados): Grupos empacotados do tipo.
+        """
+        n = grupos.n
+        extintos = np.count_nonzero(grupos.tamanhos[:n] < TAMANHO_MINIMO_GRUPO)
+        if extintos == 0 or extintos < FRACAO_COMPACTACAO * n:
+            return
+
+        novas_linhas = grupos.compactar(TAMANHO_MINIMO_GRUPO).tolist()
+        for especie in especies.values():
+            vivos = []
+            for grupo in especie.grupos:
+                linha = novas_linhas[grupo.linha]
+                if linha >= 0:
+                    grupo.linha = linha
+                    vivos.append(grupo)
+            especie.grupos[:] = vivos
+
+    def _atualizar_populacoes(self, tipo, especies, grupos):
+        """
+        Atualiza a população total de cada espécie e registra extinções.
+
+        Args:
+            tipo (str): "fauna" ou "flora".
+            especies (dict): Dicionário de id: espécie.
+            grupos (GruposEmpacotados): Grupos empacotados do tipo.
+        """
+        populacoes = np.bincount(
+            grupos.especies[:grupos.n],
+            weights=grupos.tamanhos[:grupos.n],
+            minlength=len(self.ids_especies[tipo])
+        )
+
+        for i, especie_id in enumerate(self.ids_especies[tipo]):
+            especie = especies[especie_id]
+            especie.populacao = float(populacoes[i])
+
+            # Verificar extinção
+            if especie.populacao <= 0:
+                self.mundo.historico.registrar_evento(
+                    f"extincao_{tipo}",
+                    f"Espécie de {tipo} extinta: {especie.nome}",
+                    0,  # Tempo atual (será preenchido pelo motor de simulação)
+                    []
+                )
@@ -238,12 +238,13 @@ class FerramentasAdmin:
         Returns:
             int: Número de grupos.
         """
-        # Verificar se temos acesso à mecânica social
-        if not hasattr(self.simulacao, "mecanica_social"):
+        # Verificar se temos acesso ao registro de grupos do mundo
+        registro = getattr(getattr(self.simulacao, "mundo", None), "registro_grupos", None)
+        if registro is None:
             return 0
         
-        # Contar grupos
-        return len(self.simulacao.mecanica_social.grupos)
+        # Contar grupos (sem os Senciantes isolados)
+        return registro.contar_grupos(senciantes)
     
     def _contar_conflitos(self):
         """
@@ -701,20 +702,13 @@ class FerramentasAdmin:
         if len(senciantes) < 2:
             return None
         
-        # Criar grafo
-        G = nx.Graph()
-        
-        # Adicionar nós (Senciantes)
-        for senciante_id, senciante in senciantes.items():
-            G.add_node(senciante_id, nome=senciante.nome)
-        
-        # Adicionar arestas (relações)
-        for senciante_id, senciante in senciantes.items():
-            if hasattr(senciante, "relacoes"):
-                for outro_id, relacao in senciante.relacoes.items():
-                    if outro_id in senciantes:
-                        # Adicionar aresta com peso baseado na afinidade
-                        G.add_edge(senciante_id, outro_id, weight=relacao["afinidade"])
+        # O grafo social do mundo já guarda cada relação uma única vez
+        G = self.mundo.grafo_social.para_networkx(senciantes)
+        for senciante_id in G.nodes():
+            G.nodes[senciante_id]["nome"] = senciantes[senciante_id].nome
+        for _, _, dados in G.edges(data=True):
+            # Peso baseado na afinidade, ou na força para relações ainda sem afinidade
+            dados["weight"] = dados["afinidade"] or dados["forca"]
         
         # Verificar se temos arestas
         if not G.edges():
@@ -1204,15 +1198,15 @@ class FerramentasAdmin:
             
             G.add_node(senciante_id, nome=senciante.nome, influencia=influencia)
         
-        # Adicionar arestas (influências)
-        for senciante_id, senciante in senciantes.items():
-            if hasattr(senciante, "relacoes"):
-                for outro_id, relacao in senciante.relacoes.items():
-                    if outro_id in senciantes:
-                        # Calcular influência
-                        influencia = relacao.get("influencia", 0.0)
-                        if influencia > 0.1:  # Apenas influências significativas
-                            G.add_edge(senciante_id, outro_id, weight=influencia)
+        # Adicionar arestas (influências) a partir das relações do grafo social do mundo,
+        # do Senciante mais influente para o menos influente, com peso baseado na afinidade
+        # ou na força para relações ainda sem afinidade
+        for senciante_a, senciante_b, relacao in self.mundo.grafo_social.para_networkx(senciantes).edges(data=True):
+            influencia = relacao["afinidade"] or relacao["forca"]
+            if influencia > 0.1:  # Apenas influências significativas
+                if G.nodes[senciante_a]["influencia"] < G.nodes[senciante_b]["influencia"]:
+                    senciante_a, senciante_b = senciante_b, senciante_a
+                G.add_edge(senciante_a, senciante_b, weight=influencia)
         
         # Verificar se temos arestas
         if not G.edges():
@@ -1529,7 +1523,7 @@ class FerramentasAdmin:
             eventos = self.mundo.historico.eventos
             
             if eventos:
-                df_eventos = pd.DataFrame(eventos)
+                df_eventos = pd.DataFrame(list(eventos))
                 caminho_eventos = f"{diretorio_dados}/eventos.csv"
                 df_eventos.to_csv(caminho_eventos, index=False)
         
@@ -47,34 +47,28 @@ class FerramentasAdministracao:
         """
         # Verificar se o cache está atualizado (recalcular a cada 24 horas simuladas)
         if tempo_atual - self.ultimo_calculo["redes_sociais"] >= 24.0:
-            # Construir grafo de relações
+            # Construir a visão a partir do grafo social do mundo
+            grafo_social = self.mundo.grafo_social
+
+            # Influência de cada Senciante: soma das forças atuais das suas relações
+            influencias = grafo_social.centralidade(ponderada=True)
+
             grafo = {}
-            
-            for senciante_id, senciante in self.senciantes.items():
+            for senciante_id in grafo_social.nos:
+                senciante = self.senciantes.get(senciante_id)
+                if senciante is None:
+                    continue
+
+                # Só adicionar relações significativas
                 grafo[senciante_id] = {
-                    "conexoes": {},
-                    "influencia": 0.0,
+                    "conexoes": {
+                        outro_id: {"tipo": relacao["tipo"], "forca": relacao["forca"]}
+                        for outro_id, relacao in grafo_social.vizinhos_de(senciante_id).items()
+                        if outro_id in self.senciantes and abs(relacao["forca"]) >= 0.3
+                    },
+                    "influencia": influencias[senciante_id],
                     "posicao": senciante.posicao
                 }
-                
-                # Adicionar conexões baseadas nas relações
-                for outro_id, relacao in senciante.relacoes.items():
-                    if outro_id in self.senciantes:
-                        # Só adicionar relações significativas
-                        if abs(relacao["forca"]) >= 0.3:
-                            grafo[senciante_id]["conexoes"][outro_id] = {
-                                "tipo": relacao["tipo"],
-                                "forca": relacao["forca"]
-                            }
-            
-            # Calcular influência de cada Senciante (centralidade)
-            for senciante_id in grafo:
-                # Influência baseada no número de conexões e força delas
-                influencia = 0.0
-                for _, conexao in grafo[senciante_id]["conexoes"].items():
-                    influencia += abs(conexao["forca"])
-                
-                grafo[senciante_id]["influencia"] = influencia
             
             # Identificar comunidades (simplificado)
             comunidades = self._identificar_comunidades(grafo)
@@ -406,7 +400,7 @@ class FerramentasAdministracao:
                 "titulo": "Evolução da População",
                 "eixo_x": "Tempo (horas)",
                 "eixo_y": "Número de Senciantes",
-                "dados": self.mundo.historico.estatisticas["populacao"]
+                "dados": self.mundo.historico.estatisticas["populacao"].pontos()
             }
         
         elif tipo == "recursos":
@@ -416,7 +410,10 @@ class FerramentasAdministracao:
                 "titulo": "Evolução dos Recursos",
                 "eixo_x": "Tempo (horas)",
                 "eixo_y": "Quantidade",
-                "dados": self.mundo.historico.estatisticas["recursos"]
+                "dados": {
+                    tipo: serie.pontos()
+                    for tipo, serie in self.mundo.historico.estatisticas["recursos"].items()
+                }
             }
         
         elif tipo == "saude":
@@ -22,7 +22,7 @@ class ArtefatoCultural:
             criador_id (str, optional): ID do Senciante criador. Se None, é considerado de origem desconhecida.
             posicao (list, optional): Posição do artefato [x, y]. Se None, deve ser definida posteriormente.
         """
-        self.id = gerar_id()
+        self.id = gerar_id("artefato")
         self.nome = nome if nome else self._gerar_nome_aleatorio()
         self.tipo = tipo if tipo else self._escolher_tipo_aleatorio()
         self.criador_id = criador_id
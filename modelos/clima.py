@@ -9,7 +9,8 @@ from utils.config import (
     CLIMATE_HUMIDITY_RANGE, CLIMATE_PRECIPITATION_RANGE,
     CLIMATE_WIND_RANGE, CLIMATE_CHANGE_RATE
 )
-from utils.helpers import limitar_valor, chance
+from utils.helpers import limitar_valor
+from utils.agendador_riscos import AgendadorRiscos
 
 class Clima:
     """
@@ -17,9 +18,21 @@ class Clima:
     Controla temperatura, umidade, precipitação, vento e eventos climáticos.
     """
     
-    def __init__(self):
+    # Taxas (por hora) dos eventos climáticos enquanto suas condições são satisfeitas
+    TAXAS_EVENTOS = {
+        "chuva": 0.05,
+        "tempestade": 0.02,
+        "nevasca": 0.01,
+        "onda_de_calor": 0.01
+    }
+    
+    def __init__(self, agendador=None):
         """
         Inicializa um novo Clima com valores padrão.
+        
+        Args:
+            agendador (AgendadorRiscos, optional): Agendador de eventos compartilhado, avançado
+                pelo dono (ex: o Mundo). Se None, o Clima cria e avança o seu próprio.
         """
         self.temperatura = CLIMATE_BASE_TEMPERATURE  # Celsius
         self.umidade = 0.5  # 0-1
@@ -27,6 +40,19 @@ class Clima:
         self.vento = 5.0  # km/h
         self.eventos_climaticos = []  # Lista de eventos ativos
         self.ciclo_dia_noite = 0.0  # 0-24 (horas)
+        self._registrar_eventos(agendador)
+    
+    def _registrar_eventos(self, agendador):
+        """
+        Registra as taxas dos eventos climáticos no agendador.
+        
+        Args:
+            agendador (AgendadorRiscos): Agendador compartilhado, ou None para criar um próprio.
+        """
+        self.agendador_proprio = agendador is None
+        self.agendador = AgendadorRiscos() if agendador is None else agendador
+        for tipo, taxa in self.TAXAS_EVENTOS.items():
+            self.agendador.registrar(f"clima:{tipo}", taxa)
     
     def atualizar(self, delta_tempo):
         """
@@ -35,6 +61,9 @@ class Clima:
         Args:
             delta_tempo (float): Tempo decorrido desde a última atualização em horas.
         """
+        if self.agendador_proprio:
+            self.agendador.avancar(delta_tempo)
+        
         # Atualizar ciclo dia/noite
         self.ciclo_dia_noite = (self.ciclo_dia_noite + delta_tempo) % 24
         
@@ -58,48 +87,53 @@ class Clima:
     
     def _gerar_eventos_climaticos(self, delta_tempo):
         """
-        Gera eventos climáticos aleatórios com base nas condições atuais.
+        Gera os eventos climáticos sorteados pelo agendador no intervalo, se as
+        condições atuais os permitirem.
         
         Args:
             delta_tempo (float): Tempo decorrido desde a última atualização em horas.
         """
-        # Chance de chuva baseada na umidade
-        if self.umidade > 0.7 and self.precipitacao < 0.3 and chance(0.05 * delta_tempo):
-            self.eventos_climaticos.append({
-                "tipo": "chuva",
-                "intensidade": random.uniform(0.3, 0.8),
-                "duracao_restante": random.uniform(1.0, 3.0)  # Horas
-            })
-            self.precipitacao = 0.5  # Aumentar precipitação
+        # Chuva baseada na umidade
+        for _ in range(self.agendador.disparos("clima:chuva")):
+            if self.umidade > 0.7 and self.precipitacao < 0.3:
+                self.eventos_climaticos.append({
+                    "tipo": "chuva",
+                    "intensidade": random.uniform(0.3, 0.8),
+                    "duracao_restante": random.uniform(1.0, 3.0)  # Horas
+                })
+                self.precipitacao = 0.5  # Aumentar precipitação
         
-        # Chance de tempestade baseada na umidade e vento
-        if self.umidade > 0.8 and self.vento > 20.0 and chance(0.02 * delta_tempo):
-            self.eventos_climaticos.append({
-                "tipo": "tempestade",
-                "intensidade": random.uniform(0.6, 1.0),
-                "duracao_restante": random.uniform(0.5, 2.0)  # Horas
-            })
-            self.precipitacao = 0.8  # Aumentar precipitação
-            self.vento += 10.0  # Aumentar vento
+        # Tempestade baseada na umidade e vento
+        for _ in range(self.agendador.disparos("clima:tempestade")):
+            if self.umidade > 0.8 and self.vento > 20.0:
+                self.eventos_climaticos.append({
+                    "tipo": "tempestade",
+                    "intensidade": random.uniform(0.6, 1.0),
+                    "duracao_restante": random.uniform(0.5, 2.0)  # Horas
+                })
+                self.precipitacao = 0.8  # Aumentar precipitação
+                self.vento += 10.0  # Aumentar vento
         
-        # Chance de nevasca baseada na temperatura
-        if self.temperatura < 0 and self.umidade > 0.6 and chance(0.01 * delta_tempo):
-            self.eventos_climaticos.append({
-                "tipo": "nevasca",
-                "intensidade": random.uniform(0.4, 0.9),
-                "duracao_restante": random.uniform(2.0, 6.0)  # Horas
-            })
-            self.precipitacao = 0.7  # Aumentar precipitação
+        # Nevasca baseada na temperatura
+        for _ in range(self.agendador.disparos("clima:nevasca")):
+            if self.temperatura < 0 and self.umidade > 0.6:
+                self.eventos_climaticos.append({
+                    "tipo": "nevasca",
+                    "intensidade": random.uniform(0.4, 0.9),
+                    "duracao_restante": random.uniform(2.0, 6.0)  # Horas
+                })
+                self.precipitacao = 0.7  # Aumentar precipitação
         
-        # Chance de onda de calor baseada na temperatura
-        if self.temperatura > 30 and chance(0.01 * delta_tempo):
-            self.eventos_climaticos.append({
-                "tipo": "onda_de_calor",
-                "intensidade": random.uniform(0.5, 0.9),
-                "duracao_restante": random.uniform(12.0, 48.0)  # Horas
-            })
-            self.temperatura += 5.0  # Aumentar temperatura
-            self.umidade -= 0.2  # Diminuir umidade
+        # Onda de calor baseada na temperatura
+        for _ in range(self.agendador.disparos("clima:onda_de_calor")):
+            if self.temperatura > 30:
+                self.eventos_climaticos.append({
+                    "tipo": "onda_de_calor",
+                    "intensidade": random.uniform(0.5, 0.9),
+                    "duracao_restante": random.uniform(12.0, 48.0)  # Horas
+                })
+                self.temperatura += 5.0  # Aumentar temperatura
+                self.umidade -= 0.2  # Diminuir umidade
     
     def _atualizar_eventos_climaticos(self, delta_tempo):
         """
@@ -22,7 +22,7 @@ class Construcao:
             tamanho (float): Tamanho da construção.
             proprietario_id (str, optional): ID do Senciante proprietário. Default é None.
         """
-        self.id = gerar_id()
+        self.id = gerar_id("construcao")
         self.tipo = tipo
         self.posicao = posicao
         self.tamanho = tamanho
@@ -32,6 +32,22 @@ class Construcao:
         self.durabilidade_maxima = self.durabilidade
         self.recursos_armazenados = {}  # Dicionário de recursos armazenados na construção
         self.funcionalidades = self._obter_funcionalidades()
+        self.indice_espacial = None  # IndiceEspacialPorTipo ao qual a construção está vinculada
+    
+    def vincular_indice(self, indice):
+        """
+        Vincula a construção a um índice espacial.
+        
+        Args:
+            indice (IndiceEspacialPorTipo): Índice espacial, ou None para desvincular.
+        """
+        if self.indice_espacial is not None and self.indice_espacial is not indice:
+            self.indice_espacial.remover(self.id)
+        
+        self.indice_espacial = indice
+        
+        if indice is not None:
+            indice.inserir(self.id, self.tipo, self.posicao)
     
     def _obter_durabilidade_inicial(self):
         """
@@ -23,7 +23,7 @@ class Doenca:
             transmissibilidade (float, optional): Taxa de transmissão (0.0 a 1.0). Se None, gera aleatoriamente.
             duracao (float, optional): Duração média em horas. Se None, gera aleatoriamente.
         """
-        self.id = gerar_id()
+        self.id = gerar_id("doenca")
         self.nome = nome if nome else self._gerar_nome_aleatorio()
         self.tipo = tipo if tipo else self._escolher_tipo_aleatorio()
         self.gravidade = gravidade if gravidade is not None else random.uniform(0.1, 0.9)
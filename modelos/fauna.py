@@ -21,7 +21,7 @@ class Fauna:
             posicao (list, optional): Posição inicial do animal [x, y]. Se None, escolhe aleatoriamente.
             mundo (Mundo, optional): Objeto mundo para referência.
         """
-        self.id = gerar_id()
+        self.id = gerar_id("fauna")
         self.especie = especie if especie else self._escolher_especie_aleatoria()
         self.posicao = posicao if posicao else [random.uniform(0, mundo.tamanho[0]), random.uniform(0, mundo.tamanho[1])] if mundo else [50, 50]
         
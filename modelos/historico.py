@@ -3,8 +3,28 @@ Módulo que define a classe Historico para o jogo "O Mundo dos Senciantes".
 O Historico registra eventos e estatísticas do mundo ao longo do tempo.
 """
 
-from utils.config import HISTORY_MAX_EVENTS
+from utils.config import (
+    HISTORY_MAX_EVENTS, HISTORY_TIME_BUCKET, HISTORY_SERIES_RESOLUTIONS,
+    HISTORY_SERIES_MAX_RAW_POINTS, HISTORY_SERIES_MAX_AGGREGATED_POINTS
+)
 from utils.helpers import registrar_evento
+from utils.armazem_eventos import ArmazemEventos
+from utils.serie_temporal import SerieTemporal
+from utils.log_eventos import LogEventos
+from utils.genealogia import GrafoGenealogico
+
+def _nova_serie():
+    """
+    Cria uma série temporal com as resoluções e limites configurados.
+    
+    Returns:
+        SerieTemporal: Série vazia.
+    """
+    return SerieTemporal(
+        HISTORY_SERIES_RESOLUTIONS,
+        HISTORY_SERIES_MAX_RAW_POINTS,
+        HISTORY_SERIES_MAX_AGGREGATED_POINTS
+    )
 
 class Historico:
     """
@@ -16,20 +36,45 @@ class Historico:
         """
         Inicializa um novo Histórico.
         """
-        self.eventos = []  # Lista de eventos
+        self.eventos = ArmazemEventos(HISTORY_MAX_EVENTS, HISTORY_TIME_BUCKET)  # Eventos mais recentes, indexados
         self.estatisticas = {
-            "populacao": [],  # Lista de [tempo, quantidade]
-            "recursos": {},   # Dicionário de tipo_recurso: lista de [tempo, quantidade]
+            "populacao": _nova_serie(),  # SerieTemporal da quantidade de Senciantes
+            "recursos": {},   # Dicionário de tipo_recurso: SerieTemporal da quantidade
             "tecnologias": [],  # Lista de [tempo, tecnologia]
             "construcoes": [],  # Lista de [tempo, tipo_construcao]
             "mortes": [],       # Lista de [tempo, causa]
             "nascimentos": []   # Lista de [tempo]
         }
-        self.genealogia = {}  # Dicionário de senciante_id: {progenitores: [], descendentes: []}
+        self.genealogia = GrafoGenealogico()  # Progenitores e descendentes de cada Senciante
         self.avancos = []  # Lista de avanços tecnológicos e culturais
         self.palavras_inventadas = {}  # Dicionário de palavra: {significado, inventor_id, tempo}
         self.conceitos_filosoficos = []  # Lista de conceitos filosóficos
         self.religioes = []  # Lista de religiões
+        self.log_eventos = None  # LogEventos em disco com todos os eventos (opcional)
+    
+    def ativar_log_eventos(self, diretorio, **opcoes):
+        """
+        Passa a gravar todos os eventos registrados em um log em disco, além do
+        armazém em memória (que guarda apenas os mais recentes).
+        
+        Args:
+            diretorio (str): Diretório do log. Um log existente é continuado.
+            **opcoes: Opções de `LogEventos` (tamanho_segmento, registros_por_bloco, registros_por_fsync).
+            
+        Returns:
+            LogEventos: Log ativado.
+        """
+        self.fechar_log_eventos()
+        self.log_eventos = LogEventos(diretorio, **opcoes)
+        return self.log_eventos
+    
+    def fechar_log_eventos(self):
+        """
+        Grava os eventos pendentes e fecha o log em disco, se houver.
+        """
+        if self.log_eventos is not None:
+            self.log_eventos.fechar()
+            self.log_eventos = None
     
     def registrar_evento(self, tipo, descricao, tempo, envolvidos=None):
         """
@@ -46,12 +91,12 @@ class Historico:
         """
         evento = registrar_evento(tipo, descricao, tempo, envolvidos)
         
-        # Adicionar evento à lista
+        # Adicionar evento ao armazém (o mais antigo é descartado quando está cheio)
         self.eventos.append(evento)
         
-        # Limitar o número de eventos
-        if len(self.eventos) > HISTORY_MAX_EVENTS:
-            self.eventos = self.eventos[-HISTORY_MAX_EVENTS:]
+        # Gravar no log em disco
+        if self.log_eventos is not None:
+            self.log_eventos.registrar(evento)
         
         return evento
     
@@ -65,15 +110,45 @@ class Historico:
             recursos (dict, optional): Dicionário de tipo_recurso: quantidade.
         """
         # Registrar população
-        self.estatisticas["populacao"].append([tempo, populacao])
+        self.estatisticas["populacao"].registrar(tempo, populacao)
         
         # Registrar recursos
         if recursos:
+            series = self.estatisticas["recursos"]
             for tipo, quantidade in recursos.items():
-                if tipo not in self.estatisticas["recursos"]:
-                    self.estatisticas["recursos"][tipo] = []
+                if tipo not in series:
+                    series[tipo] = _nova_serie()
                 
-                self.estatisticas["recursos"][tipo].append([tempo, quantidade])
+                series[tipo].registrar(tempo, quantidade)
+    
+    def obter_serie(self, nome, recurso=None, tempo_inicio=None, tempo_fim=None, resolucao="bruto"):
+        """
+        Consulta uma série de estatísticas em um intervalo de tempo.
+        
+        Args:
+            nome (str): "populacao" ou "recursos".
+            recurso (str, optional): Tipo de recurso, quando `nome` é "recursos".
+            tempo_inicio (float, optional): Tempo inicial. Se None, desde o início.
+            tempo_fim (float, optional): Tempo final. Se None, até o fim.
+            resolucao (str, optional): "bruto", "hora" ou "dia". Default é "bruto".
+            
+        Returns:
+            dict: Colunas da série (ver `SerieTemporal.consultar`), ou None se a série não existir.
+            
+        Raises:
+            ValueError: Se a resolução não existir.
+        """
+        if nome == "populacao":
+            serie = self.estatisticas["populacao"]
+        elif nome == "recursos":
+            serie = self.estatisticas["recursos"].get(recurso)
+        else:
+            serie = None
+        
+        if serie is None:
+            return None
+        
+        return serie.consultar(tempo_inicio, tempo_fim, resolucao)
     
     def registrar_nascimento(self, tempo, senciante_id, progenitores):
         """
@@ -87,21 +162,8 @@ class Historico:
         # Registrar na lista de nascimentos
         self.estatisticas["nascimentos"].append([tempo])
         
-        # Registrar na genealogia
-        self.genealogia[senciante_id] = {
-            "progenitores": progenitores,
-            "descendentes": []
-        }
-        
-        # Atualizar genealogia dos progenitores
-        for progenitor_id in progenitores:
-            if progenitor_id in self.genealogia:
-                self.genealogia[progenitor_id]["descendentes"].append(senciante_id)
-            else:
-                self.genealogia[progenitor_id] = {
-                    "progenitores": [],
-                    "descendentes": [senciante_id]
-                }
+        # Registrar na genealogia (progenitores desconhecidos entram como fundadores)
+        self.genealogia.registrar_nascimento(senciante_id, progenitores)
         
         # Registrar evento
         self.registrar_evento(
@@ -300,7 +362,7 @@ class Historico:
         Returns:
             list: Lista de eventos do tipo especificado.
         """
-        return [e for e in self.eventos if e["tipo"] == tipo]
+        return self.eventos.obter_por_tipo(tipo)
     
     def obter_eventos_por_envolvido(self, senciante_id):
         """
@@ -312,7 +374,7 @@ class Historico:
         Returns:
             list: Lista de eventos que envolvem o Senciante.
         """
-        return [e for e in self.eventos if "envolvidos" in e and senciante_id in e["envolvidos"]]
+        return self.eventos.obter_por_envolvido(senciante_id)
     
     def obter_eventos_por_periodo(self, tempo_inicio, tempo_fim):
         """
@@ -325,7 +387,36 @@ class Historico:
         Returns:
             list: Lista de eventos ocorridos no período.
         """
-        return [e for e in self.eventos if tempo_inicio <= e["tempo"] <= tempo_fim]
+        # Períodos anteriores aos eventos retidos em memória são lidos do log em disco
+        if self.log_eventos is not None and self.eventos.descartados and \
+                (not self.eventos or tempo_inicio < self.eventos[0]["tempo"]):
+            return self.log_eventos.consultar(tempo_inicio, tempo_fim)
+        
+        return self.eventos.obter_por_periodo(tempo_inicio, tempo_fim)
+    
+    def reproduzir_eventos(self, tempo_inicio=None, tempo_fim=None, tipo=None):
+        """
+        Reproduz os eventos de um intervalo de tempo na ordem em que foram registrados.
+        Com o log em disco ativo, inclui eventos já descartados da memória.
+        
+        Args:
+            tempo_inicio (float, optional): Tempo inicial (inclusivo). Se None, desde o início.
+            tempo_fim (float, optional): Tempo final (inclusivo). Se None, até o fim.
+            tipo (str, optional): Se informado, apenas eventos desse tipo.
+            
+        Yields:
+            dict: Eventos do intervalo.
+        """
+        if self.log_eventos is not None:
+            yield from self.log_eventos.reproduzir(tempo_inicio, tempo_fim, tipo)
+            return
+        
+        inicio = float("-inf") if tempo_inicio is None else tempo_inicio
+        fim = float("inf") if tempo_fim is None else tempo_fim
+        eventos = self.eventos.obter_por_tipo(tipo) if tipo is not None else self.eventos.obter_por_periodo(inicio, fim)
+        for evento in eventos:
+            if inicio <= evento["tempo"] <= fim:
+                yield evento
     
     def obter_arvore_genealogica(self, senciante_id, gerações_acima=2, gerações_abaixo=2):
         """
@@ -348,32 +439,41 @@ class Historico:
             "descendentes": []
         }
         
-        # Adicionar progenitores recursivamente
+        # Adicionar progenitores recursivamente (sem incluir descendentes dos progenitores)
         if gerações_acima > 0:
-            for progenitor_id in self.genealogia[senciante_id]["progenitores"]:
-                if progenitor_id in self.genealogia:
-                    arvore["progenitores"].append(
-                        self.obter_arvore_genealogica(
-                            progenitor_id,
-                            gerações_acima - 1,
-                            0  # Não incluir descendentes dos progenitores
-                        )
-                    )
-        
-        # Adicionar descendentes recursivamente
+            for progenitor_id in self.genealogia.progenitores_de(senciante_id):
+                arvore["progenitores"].append(
+                    self.obter_arvore_genealogica(progenitor_id, gerações_acima - 1, 0)
+                )
+        
+        # Adicionar descendentes recursivamente (sem incluir progenitores dos descendentes)
         if gerações_abaixo > 0:
-            for descendente_id in self.genealogia[senciante_id]["descendentes"]:
-                if descendente_id in self.genealogia:
-                    arvore["descendentes"].append(
-                        self.obter_arvore_genealogica(
-                            descendente_id,
-                            0,  # Não incluir progenitores dos descendentes
-                            gerações_abaixo - 1
-                        )
-                    )
+            for descendente_id in self.genealogia.filhos_de(senciante_id):
+                arvore["descendentes"].append(
+                    self.obter_arvore_genealogica(descendente_id, 0, gerações_abaixo - 1)
+                )
         
         return arvore
     
+    def estatisticas_para_dict(self, max_pontos=500):
+        """
+        Converte as estatísticas para um dicionário serializável. As séries vêm como
+        listas de [tempo, valor] na resolução mais fina que caiba em `max_pontos`.
+        
+        Args:
+            max_pontos (int, optional): Número máximo de pontos por série. Default é 500.
+            
+        Returns:
+            dict: Estatísticas como dicionário.
+        """
+        estatisticas = dict(self.estatisticas)
+        estatisticas["populacao"] = self.estatisticas["populacao"].pontos(max_pontos)
+        estatisticas["recursos"] = {
+            tipo: serie.pontos(max_pontos)
+            for tipo, serie in self.estatisticas["recursos"].items()
+        }
+        return estatisticas
+    
     def to_dict(self):
         """
         Converte o histórico para um dicionário.
@@ -383,7 +483,7 @@ class Historico:
         """
         return {
             "eventos": self.eventos[-100:],  # Limitar a 100 eventos mais recentes
-            "estatisticas": self.estatisticas,
+            "estatisticas": self.estatisticas_para_dict(),
             "avancos": self.avancos,
             "palavras_inventadas": len(self.palavras_inventadas),
             "conceitos_filosoficos": len(self.conceitos_filosoficos),
@@ -1,10 +1,23 @@
 """
 Módulo que define a classe Memoria para o jogo "O Mundo dos Senciantes".
 A Memoria representa as experiências e conhecimentos adquiridos por um Senciante.
+O ArmazemMemorias guarda as memórias de um Senciante de forma compacta, com
+envelhecimento calculado na leitura.
 """
 
+import heapq
+import math
+from collections import namedtuple
+from collections.abc import Sequence
+
 from utils.helpers import gerar_id
-from utils.config import MEMORY_DECAY_RATE, MEMORY_THRESHOLD
+from utils.config import MEMORY_CAPACITY, MEMORY_DECAY_RATE, MEMORY_INDEXED_TYPES, MEMORY_THRESHOLD
+
+# Memórias a partir desta importância não perdem importância com o tempo
+IMPORTANCIA_PERMANENTE = 0.8
+
+# Alterações de um armazém desde uma marca, replicáveis em uma cópia (ver ArmazemMemorias.alteracoes_desde)
+AlteracoesMemoria = namedtuple("AlteracoesMemoria", ["tempo", "sequencia", "sequencias", "novas"])
 
 class Memoria:
     """
@@ -12,7 +25,7 @@ class Memoria:
     Contém informações sobre eventos, experiências e conhecimentos adquiridos.
     """
     
-    def __init__(self, tipo, conteudo, tempo, importancia=0.5):
+    def __init__(self, tipo, conteudo, tempo, importancia=0.5, id=None):
         """
         Inicializa uma nova Memória.
         
@@ -21,8 +34,10 @@ class Memoria:
             conteudo (str): Conteúdo da memória.
             tempo (float): Tempo da simulação em que a memória foi criada.
             importancia (float, optional): Importância da memória (0.0 a 1.0). Default é 0.5.
+            id (int ou tuple, optional): ID da memória. Se None, gera um novo. As memórias
+                lidas de um ArmazemMemorias têm o ID (dono, sequência), ver ArmazemMemorias.
         """
-        self.id = gerar_id()
+        self.id = id if id is not None else gerar_id("memoria")
         self.tipo = tipo
         self.conteudo = conteudo
         self.tempo = tempo
@@ -41,7 +56,7 @@ class Memoria:
             bool: True se a memória ainda é relevante, False se deve ser esquecida.
         """
         # Memórias muito importantes não perdem importância
-        if self.importancia < 0.8:
+        if self.importancia < IMPORTANCIA_PERMANENTE:
             # Reduzir importância com base no tempo decorrido
             self.importancia *= (1 - MEMORY_DECAY_RATE * delta_tempo)
         
@@ -92,3 +107,222 @@ class Memoria:
             "conexoes": self.conexoes
         }
 
+
+
+class ArmazemMemorias(Sequence):
+    """
+    Memórias de um Senciante em um heap mínimo de capacidade fixa.
+    Cada entrada guarda (tipo, conteúdo, tempo de criação, importância inicial);
+    a importância atual é calculada na leitura a partir do tempo decorrido, de
+    modo que avançar o tempo custa O(1) em vez de envelhecer cada memória.
+
+    Como todas as memórias que envelhecem decaem à mesma taxa exponencial, a
+    ordem entre elas não muda com o tempo: a chave do heap é o instante em que a
+    memória cai abaixo de MEMORY_THRESHOLD (infinito para as permanentes). O
+    topo do heap é ao mesmo tempo a próxima memória a ser esquecida e a menos
+    importante, descartada em O(log k) quando a capacidade é excedida.
+
+    Como sequência, se comporta como a lista das memórias retidas, da mais
+    antiga para a mais recente, materializadas como objetos Memoria. O ID de
+    cada uma é a tupla (dono, sequência): a sequência só é única dentro do
+    armazém, por isso vem acompanhada do ID do Senciante dono.
+
+    Uma cópia do armazém em outro processo acompanha o original recebendo só as
+    alterações desde uma marca (`alteracoes_desde`): o relógio e as entradas novas,
+    em vez de todas as memórias retidas.
+    """
+
+    def __init__(self, dono=None, capacidade=MEMORY_CAPACITY, tipos_indexados=MEMORY_INDEXED_TYPES):
+        """
+        Inicializa um novo armazém vazio.
+
+        Args:
+            dono (int, optional): ID do Senciante dono das memórias, que compõe o ID de cada uma.
+            capacidade (int, optional): Número máximo de memórias. Default é MEMORY_CAPACITY.
+            tipos_indexados (iterable, optional): Tipos com índice próprio, consultados por
+                `por_tipo` sem percorrer as demais memórias. Default é MEMORY_INDEXED_TYPES.
+        """
+        if capacidade <= 0:
+            raise ValueError("A capacidade deve ser positiva.")
+
+        self.dono = dono
+        self.capacidade = capacidade
+        self.tempo = 0.0  # Relógio do armazém, em horas
+        self.heap = []  # (expira_em, importância inicial, sequência)
+        self.entradas = {}  # Dicionário de sequência: (tipo, conteúdo, tempo, importância inicial), em ordem de inserção
+        self.indices = {tipo: {} for tipo in tipos_indexados}  # Dicionário de tipo: {sequência: None}
+        self.sequencia = 0
+
+    def __len__(self):
+        self._esquecer()
+        return len(self.entradas)
+
+    def __iter__(self):
+        self._esquecer()
+        for sequencia, entrada in list(self.entradas.items()):
+            yield self._materializar(sequencia, entrada)
+
+    def __getitem__(self, indice):
+        self._esquecer()
+        itens = list(self.entradas.items())
+        if isinstance(indice, slice):
+            return [self._materializar(sequencia, entrada) for sequencia, entrada in itens[indice]]
+        sequencia, entrada = itens[indice]
+        return self._materializar(sequencia, entrada)
+
+    @staticmethod
+    def _expiracao(tempo, importancia):
+        """
+        Calcula o instante em que uma memória deixa de ser relevante.
+
+        Args:
+            tempo (float): Tempo de criação.
+            importancia (float): Importância inicial.
+
+        Returns:
+            float: Instante em que a importância cai abaixo de MEMORY_THRESHOLD.
+        """
+        if importancia >= IMPORTANCIA_PERMANENTE or MEMORY_DECAY_RATE <= 0:
+            return math.inf
+        if importancia <= MEMORY_THRESHOLD:
+            return tempo
+        return tempo + math.log(importancia / MEMORY_THRESHOLD) / MEMORY_DECAY_RATE
+
+    def importancia(self, tempo_criacao, importancia_inicial):
+        """
+        Calcula a importância atual de uma memória.
+
+        Args:
+            tempo_criacao (float): Tempo de criação.
+            importancia_inicial (float): Importância no momento da criação.
+
+        Returns:
+            float: Importância no tempo atual do armazém.
+        """
+        if importancia_inicial >= IMPORTANCIA_PERMANENTE:
+            return importancia_inicial
+        return importancia_inicial * math.exp(-MEMORY_DECAY_RATE * (self.tempo - tempo_criacao))
+
+    def _materializar(self, sequencia, entrada):
+        tipo, conteudo, tempo, importancia = entrada
+        return Memoria(tipo, conteudo, tempo, self.importancia(tempo, importancia),
+                       id=(self.dono, sequencia))
+
+    def _incluir(self, sequencia, entrada):
+        tipo, _, tempo, importancia = entrada
+        self.entradas[sequencia] = entrada
+        heapq.heappush(self.heap, (self._expiracao(tempo, importancia), importancia, sequencia))
+        indice = self.indices.get(tipo)
+        if indice is not None:
+            indice[sequencia] = None
+
+    def _remover_topo(self):
+        _, _, sequencia = heapq.heappop(self.heap)
+        tipo = self.entradas.pop(sequencia)[0]
+        indice = self.indices.get(tipo)
+        if indice is not None:
+            del indice[sequencia]
+
+    def _esquecer(self):
+        """
+        Descarta as memórias cuja importância já caiu abaixo do limiar.
+        """
+        while self.heap and self.heap[0][0] < self.tempo:
+            self._remover_topo()
+
+    def adicionar(self, tipo, conteudo, importancia=0.5):
+        """
+        Adiciona uma memória no tempo atual, descartando a menos importante se a
+        capacidade for excedida.
+
+        Args:
+            tipo (str): Tipo da memória.
+            conteudo (str): Conteúdo da memória.
+            importancia (float, optional): Importância da memória (0.0 a 1.0). Default é 0.5.
+        """
+        self.sequencia += 1
+        self._incluir(self.sequencia, (tipo, conteudo, self.tempo, importancia))
+
+        if len(self.entradas) > self.capacidade:
+            self._remover_topo()
+
+    def avancar(self, delta_tempo):
+        """
+        Avança o relógio do armazém e descarta as memórias esquecidas.
+
+        Args:
+            delta_tempo (float): Tempo decorrido em horas.
+        """
+        self.tempo += delta_tempo
+        self._esquecer()
+
+    def por_tipo(self, tipo):
+        """
+        Obtém as memórias de um tipo, da mais antiga para a mais recente.
+        Usa o índice do tipo, se houver; caso contrário, percorre o armazém.
+
+        Args:
+            tipo (str): Tipo da memória.
+
+        Returns:
+            list: Memórias do tipo.
+        """
+        self._esquecer()
+        indice = self.indices.get(tipo)
+        if indice is None:
+            return [self._materializar(sequencia, entrada)
+                    for sequencia, entrada in self.entradas.items() if entrada[0] == tipo]
+        return [self._materializar(sequencia, self.entradas[sequencia]) for sequencia in indice]
+
+    def alteracoes_desde(self, sequencia, tamanho):
+        """
+        Obtém as alterações do armazém desde uma marca, para replicá-las com `aplicar_alteracoes`
+        em uma cópia que ainda está na marca.
+
+        Args:
+            sequencia (int): Valor de `sequencia` na marca.
+            tamanho (int): Número de memórias retidas na marca.
+
+        Returns:
+            AlteracoesMemoria: Relógio, sequência, sequências retidas (None se nenhuma memória
+                entrou ou saiu) e entradas adicionadas depois da marca.
+        """
+        if self.sequencia == sequencia and len(self.entradas) == tamanho:
+            return AlteracoesMemoria(self.tempo, sequencia, None, {})
+
+        novas = {s: entrada for s, entrada in self.entradas.items() if s > sequencia}
+        return AlteracoesMemoria(self.tempo, self.sequencia, tuple(self.entradas), novas)
+
+    def aplicar_alteracoes(self, alteracoes):
+        """
+        Aplica as alterações obtidas de outro armazém por `alteracoes_desde`.
+
+        Args:
+            alteracoes (AlteracoesMemoria): Alterações a aplicar.
+        """
+        entradas, novas = self.entradas, alteracoes.novas
+        if alteracoes.sequencias is not None and len(alteracoes.sequencias) == len(entradas) + len(novas):
+            # Nenhuma memória saiu: basta incluir as novas
+            for sequencia, entrada in novas.items():
+                self._incluir(sequencia, entrada)
+        elif alteracoes.sequencias is not None:
+            self.entradas = {s: novas[s] if s in novas else entradas[s] for s in alteracoes.sequencias}
+            self.heap = [
+                (self._expiracao(tempo, importancia), importancia, s)
+                for s, (_, _, tempo, importancia) in self.entradas.items()
+            ]
+            heapq.heapify(self.heap)
+            for tipo in self.indices:
+                self.indices[tipo] = {s: None for s, entrada in self.entradas.items() if entrada[0] == tipo}
+
+        self.tempo = alteracoes.tempo
+        self.sequencia = alteracoes.sequencia
+
+    def limpar(self):
+        """
+        Esquece todas as memórias.
+        """
+        self.heap.clear()
+        self.entradas.clear()
+        for indice in self.indices.values():
+            indice.clear()
@@ -2,6 +2,10 @@ from modelos.clima import Clima
 from modelos.recurso import Recurso
 from modelos.construcao import Construcao
 from modelos.historico import Historico
+from utils.indice_espacial import IndiceEspacial, ColecaoEspacial
+from utils.registro_grupos import RegistroGrupos
+from utils.grafo_social import GrafoSocial
+from utils.agendador_riscos import AgendadorRiscos
 import numpy as np
 import random
 
@@ -22,11 +26,39 @@ class Mundo:
         self.geografia = self._gerar_geografia()  # Elevação, biomas, etc.
         self.recursos = {}  # Dicionário de id: Recurso
         self.construcoes = {}  # Dicionário de id: Construcao
-        self.clima = Clima()  # Objeto de clima
+        self.agendador_riscos = AgendadorRiscos()  # Eventos estocásticos do clima e das mecânicas
+        self.clima = Clima(self.agendador_riscos)  # Objeto de clima
         self.historico = Historico()  # Objeto de histórico
+        self.indice_senciantes = IndiceEspacial(tamanho_celula=2.0)  # Índice espacial dos Senciantes
+        self.registro_grupos = RegistroGrupos()  # Tabela de grupos compartilhada pelas mecânicas
+        self.grafo_social = GrafoSocial()  # Relações sociais de todos os Senciantes
         
         # Inicializar recursos
         self._inicializar_recursos()
+    
+    @property
+    def recursos(self):
+        """
+        ColecaoEspacial: Dicionário de id: Recurso indexado espacialmente por tipo.
+        """
+        return self._recursos
+    
+    @recursos.setter
+    def recursos(self, valor):
+        # Qualquer dicionário atribuído passa a ser indexado
+        self._recursos = valor if isinstance(valor, ColecaoEspacial) else ColecaoEspacial(valor, tamanho_celula=10.0)
+    
+    @property
+    def construcoes(self):
+        """
+        ColecaoEspacial: Dicionário de id: Construcao indexado espacialmente por tipo.
+        """
+        return self._construcoes
+    
+    @construcoes.setter
+    def construcoes(self, valor):
+        # Qualquer dicionário atribuído passa a ser indexado
+        self._construcoes = valor if isinstance(valor, ColecaoEspacial) else ColecaoEspacial(valor, tamanho_celula=10.0)
         
     def inicializar(self, tamanho):
         """
@@ -39,8 +71,12 @@ class Mundo:
         self.geografia = self._gerar_geografia()
         self.recursos = {}
         self.construcoes = {}
-        self.clima = Clima()
+        self.agendador_riscos = AgendadorRiscos()
+        self.clima = Clima(self.agendador_riscos)
         self.historico = Historico()
+        self.indice_senciantes = IndiceEspacial(tamanho_celula=2.0)
+        self.registro_grupos = RegistroGrupos()
+        self.grafo_social = GrafoSocial()
         self._inicializar_recursos()
 
     def _gerar_geografia(self):
@@ -77,9 +113,59 @@ class Mundo:
         Args:
             delta_tempo (float): Tempo decorrido desde a última atualização em horas.
         """
+        # Sortear os eventos estocásticos do intervalo antes de os subsistemas os consumirem
+        self.agendador_riscos.avancar(delta_tempo)
         self.clima.atualizar(delta_tempo)
+        self.grafo_social.avancar(delta_tempo)
+        
+        # A tabela de grupos é reconstruída uma vez por passo, na primeira consulta
+        self.registro_grupos.invalidar()
         # Outras atualizações do mundo (ex: crescimento de recursos)
 
+    def sincronizar_senciantes(self, senciantes):
+        """
+        Sincroniza o índice espacial e o grafo social com um dicionário de Senciantes.
+        Senciantes ainda não indexados são vinculados ao índice (e passam a atualizá-lo
+        a cada movimento) e ao grafo, e entradas de Senciantes ausentes são removidas.
+
+        Args:
+            senciantes (dict): Dicionário de id: Senciante.
+        """
+        indice = self.indice_senciantes
+        grafo = self.grafo_social
+        
+        for senciante in senciantes.values():
+            if senciante.indice_espacial is not indice:
+                senciante.vincular_indice(indice)
+            if senciante.grafo_social is not grafo:
+                senciante.vincular_grafo(grafo)
+        grafo.sincronizar(senciantes)
+        
+        # Remover Senciantes que não fazem mais parte do dicionário
+        if len(indice) > len(senciantes):
+            for senciante_id in indice.ids():
+                if senciante_id not in senciantes:
+                    indice.remover(senciante_id)
+
+    def encontrar_senciantes_proximos(self, posicao, raio, senciantes):
+        """
+        Encontra Senciantes próximos a uma posição usando o índice espacial.
+        O índice deve estar sincronizado com `senciantes` (ver `sincronizar_senciantes`).
+
+        Args:
+            posicao (tuple): Posição (x, y).
+            raio (float): Raio de busca.
+            senciantes (dict): Dicionário de id: Senciante.
+
+        Returns:
+            list: Lista de Senciantes encontrados, do mais próximo para o mais distante.
+        """
+        return [
+            senciantes[senciante_id]
+            for senciante_id in self.indice_senciantes.buscar_raio(posicao, raio)
+            if senciante_id in senciantes
+        ]
+
     def encontrar_construcoes_proximas(self, posicao, raio, tipo=None):
         """
         Encontra construções próximas a uma posição.
@@ -90,19 +176,13 @@ class Mundo:
             tipo (str, optional): Tipo de construção a buscar. Se None, busca todas.
 
         Returns:
-            list: Lista de construções encontradas.
+            list: Lista de construções encontradas, da mais próxima para a mais distante.
         """
-        construcoes_encontradas = []
-        for construcao_id, construcao in self.construcoes.items():
-            distancia = ((posicao[0] - construcao.posicao[0]) ** 2 + (posicao[1] - construcao.posicao[1]) ** 2) ** 0.5
-            if distancia <= raio:
-                if tipo is None or construcao.tipo == tipo:
-                    construcoes_encontradas.append(construcao)
-        return construcoes_encontradas
+        return self.construcoes.buscar_raio(posicao, raio, tipo)
         
     def encontrar_recursos_proximos(self, posicao, raio, tipo=None):
         """
-        Encontra recursos próximos a uma posição.
+        Encontra recursos não esgotados próximos a uma posição.
         
         Args:
             posicao (tuple): Posição (x, y).
@@ -110,15 +190,28 @@ class Mundo:
             tipo (str, optional): Tipo de recurso a buscar. Se None, busca todos.
             
         Returns:
-            list: Lista de recursos encontrados.
-        """
-        recursos_encontrados = []
-        for recurso_id, recurso in self.recursos.items():
-            distancia = ((posicao[0] - recurso.posicao[0])**2 + (posicao[1] - recurso.posicao[1])**2)**0.5
-            if distancia <= raio:
-                if tipo is None or recurso.tipo == tipo:
-                    recursos_encontrados.append(recurso)
-        return recursos_encontrados
+            list: Lista de recursos encontrados, do mais próximo para o mais distante.
+        """
+        return self.recursos.buscar_raio(posicao, raio, tipo)
+
+    def adicionar_recurso(self, recurso):
+        """
+        Adiciona um recurso ao mundo.
+        
+        Args:
+            recurso (Recurso): Objeto Recurso a ser adicionado.
+        """
+        self.recursos[recurso.id] = recurso
+
+    def remover_recurso(self, recurso_id):
+        """
+        Remove um recurso do mundo.
+        
+        Args:
+            recurso_id (str): ID do recurso a ser removido.
+        """
+        if recurso_id in self.recursos:
+            del self.recursos[recurso_id]
 
     def adicionar_construcao(self, construcao):
         """
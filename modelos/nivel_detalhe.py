@@ -0,0 +1,243 @@
+"""
+Módulo que define o nível de detalhe (LOD) da atualização dos Senciantes.
+Cada Senciante é classificado, após cada atualização, em um nível que define
+de quantos em quantos passos ele volta a ser atualizado. Um Senciante fora da
+vez não executa decisões, aprendizado nem manutenção social e de memória; na
+vez seguinte, recebe o tempo acumulado de uma só vez (necessidades e idade
+crescem linearmente, e memórias e relações já decaem na leitura).
+
+Um nível reduzido só é escolhido se, projetando as necessidades e a idade pelo
+intervalo inteiro, nenhuma necessidade se torna urgente, fome e sede não chegam
+ao limiar crítico e a idade não passa da máxima, de modo que nenhum Senciante
+morre ou deixa de reagir a uma nova urgência fora da vez. Interações, eventos e
+regiões observadas por clientes devolvem os Senciantes envolvidos à atualização
+a cada passo.
+"""
+
+import threading
+
+from utils.config import (
+    LOD_INTERVALS, SENCIANTE_MAX_AGE, SENCIANTE_NEEDS_CRITICAL_THRESHOLDS, SENCIANTE_NEEDS_DECAY_RATES,
+    SENCIANTE_NEEDS_URGENT_THRESHOLDS
+)
+
+# Níveis, do mais ao menos detalhado
+NIVEIS = ("completo", "reduzido", "minimo")
+
+# Atividades em que o Senciante fica parado e cujo progresso depende só do tempo decorrido
+ATIVIDADES_PARADAS = frozenset((None, "descansar", "limpar"))
+
+# Necessidades que matam ao atingir o limiar crítico (ver Senciante._verificar_morte)
+NECESSIDADES_FATAIS = frozenset(("fome", "sede"))
+
+
+class AgendadorNivelDetalhe:
+    """
+    Agenda de atualização dos Senciantes por nível de detalhe.
+    Os vencimentos ficam em baldes por passo; reagendar um Senciante custa O(1)
+    e cada passo toca apenas os Senciantes que vencem nele.
+    """
+
+    def __init__(self, intervalos=None):
+        """
+        Inicializa um novo agendador.
+
+        Args:
+            intervalos (dict, optional): Dicionário de nível: passos entre atualizações.
+                Default é LOD_INTERVALS.
+        """
+        self.intervalos = dict(LOD_INTERVALS if intervalos is None else intervalos)
+        self.intervalos["completo"] = 1
+        self.passo = 0
+        self.tempo = 0.0  # Tempo acumulado dos passos, em horas
+        self.vencimentos = {}  # Dicionário de passo: [senciante_id]
+        self.proximo = {}  # Dicionário de senciante_id: passo da próxima atualização
+        self.ultima = {}  # Dicionário de senciante_id: (passo, tempo) da última atualização
+        self.niveis = {}  # Dicionário de senciante_id: nível atual
+        self.promovidos = set()  # Senciantes a atualizar no próximo passo em nível completo
+        self._completos = set()  # Promovidos atualizados no passo atual
+        self.regioes_observadas = ()  # Tuplas (x_min, y_min, x_max, y_max)
+        self._regioes_alteradas = False
+        self._trava = threading.Lock()
+
+    def __getstate__(self):
+        # As regiões observadas pertencem às conexões do processo atual
+        estado = self.__dict__.copy()
+        estado["regioes_observadas"] = ()
+        estado["_regioes_alteradas"] = False
+        del estado["_trava"]
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self._trava = threading.Lock()
+
+    def avancar(self, delta_tempo, senciantes):
+        """
+        Avança um passo e obtém os Senciantes a atualizar nele.
+
+        Args:
+            delta_tempo (float): Tempo do passo, em horas.
+            senciantes (dict): Dicionário de id: Senciante.
+
+        Returns:
+            dict: Dicionário de senciante_id: (tempo acumulado desde a última atualização,
+                número de passos acumulados).
+        """
+        self.passo += 1
+        self.tempo += delta_tempo
+
+        # Esquecer Senciantes removidos
+        for senciante_id in self.proximo.keys() - senciantes.keys():
+            del self.proximo[senciante_id]
+            self.ultima.pop(senciante_id, None)
+            self.niveis.pop(senciante_id, None)
+
+        devidos = set(senciantes.keys() - self.proximo.keys())  # Novos Senciantes
+        for senciante_id in devidos:
+            self.ultima[senciante_id] = (self.passo - 1, self.tempo - delta_tempo)
+
+        # Promovidos por interações e eventos, e Senciantes nas regiões recém-observadas
+        promovidos, self.promovidos = self.promovidos, set()
+        if self._regioes_alteradas:
+            self._regioes_alteradas = False
+            promovidos.update(
+                senciante_id for senciante_id, senciante in senciantes.items()
+                if self._observado(senciante.posicao)
+            )
+        promovidos.intersection_update(senciantes.keys())
+        self._completos = promovidos
+        devidos |= promovidos
+
+        # Senciantes cuja vez chegou (entradas de Senciantes reagendados são ignoradas)
+        for senciante_id in self.vencimentos.pop(self.passo, ()):
+            if self.proximo.get(senciante_id) == self.passo:
+                devidos.add(senciante_id)
+
+        atualizacoes = {}
+        for senciante_id in devidos:
+            passo, tempo = self.ultima.get(senciante_id, (self.passo - 1, self.tempo - delta_tempo))
+            atualizacoes[senciante_id] = (self.tempo - tempo, self.passo - passo)
+        return atualizacoes
+
+    def reagendar(self, senciante, delta_tempo):
+        """
+        Classifica um Senciante recém-atualizado e agenda sua próxima atualização.
+
+        Args:
+            senciante (Senciante): Senciante atualizado no passo atual.
+            delta_tempo (float): Tempo do passo, em horas, usado para projetar o intervalo.
+
+        Returns:
+            str: Nível atribuído.
+        """
+        nivel = self.classificar(senciante, delta_tempo)
+        vencimento = self.passo + self.intervalos[nivel]
+
+        self.niveis[senciante.id] = nivel
+        self.ultima[senciante.id] = (self.passo, self.tempo)
+        self.proximo[senciante.id] = vencimento
+        self.vencimentos.setdefault(vencimento, []).append(senciante.id)
+        return nivel
+
+    def classificar(self, senciante, delta_tempo):
+        """
+        Escolhe o nível de detalhe de um Senciante.
+
+        Args:
+            senciante (Senciante): Senciante a classificar.
+            delta_tempo (float): Tempo do passo, em horas.
+
+        Returns:
+            str: Um de NIVEIS.
+        """
+        if senciante.id in self._completos or self._observado(senciante.posicao):
+            return "completo"
+
+        # Quem se desloca chega mais cedo ao destino; só Senciantes parados vão ao nível mínimo
+        indice = len(NIVEIS) - 1 if senciante.atividade_atual in ATIVIDADES_PARADAS else len(NIVEIS) - 2
+        while indice > 0 and not self._seguro(senciante, self.intervalos[NIVEIS[indice]] * delta_tempo):
+            indice -= 1
+        return NIVEIS[indice]
+
+    @staticmethod
+    def _seguro(senciante, horizonte):
+        """
+        Verifica se, em um intervalo, nenhuma necessidade se torna urgente nem fatal e a idade não
+        passa da máxima. Necessidades que já eram urgentes não impedem o intervalo: o Senciante
+        já reagiu a elas.
+
+        Args:
+            senciante (Senciante): Senciante.
+            horizonte (float): Duração do intervalo, em horas.
+
+        Returns:
+            bool: True se o Senciante pode ficar o intervalo sem ser atualizado.
+        """
+        modificadores = senciante.modificadores
+        if senciante.estado["idade"] + horizonte > SENCIANTE_MAX_AGE * modificadores.get("longevidade", 1.0):
+            return False
+
+        metabolismo = modificadores.get("metabolismo", 1.0)
+        necessidades = senciante.necessidades
+        for necessidade, taxa in SENCIANTE_NEEDS_DECAY_RATES.items():
+            if necessidade in ("fome", "sede"):
+                taxa *= metabolismo
+            valor = necessidades[necessidade]
+            projetado = valor + taxa * horizonte
+            if valor < SENCIANTE_NEEDS_URGENT_THRESHOLDS[necessidade] <= projetado:
+                return False
+            if necessidade in NECESSIDADES_FATAIS and projetado >= SENCIANTE_NEEDS_CRITICAL_THRESHOLDS[necessidade]:
+                return False
+        return True
+
+    def promover(self, senciante_id):
+        """
+        Atualiza um Senciante no próximo passo, em nível completo.
+
+        Args:
+            senciante_id (str): ID do Senciante.
+        """
+        self.promovidos.add(senciante_id)
+
+    def _observado(self, posicao):
+        for x_min, y_min, x_max, y_max in self.regioes_observadas:
+            if x_min <= posicao[0] <= x_max and y_min <= posicao[1] <= y_max:
+                return True
+        return False
+
+    def observar(self, regiao):
+        """
+        Passa a atualizar a cada passo os Senciantes de uma região.
+
+        Args:
+            regiao (tuple): Região (x_min, y_min, x_max, y_max).
+        """
+        with self._trava:
+            self.regioes_observadas = self.regioes_observadas + (tuple(regiao),)
+            self._regioes_alteradas = True
+
+    def deixar_de_observar(self, regiao):
+        """
+        Remove uma região observada.
+
+        Args:
+            regiao (tuple): Região passada a `observar`.
+        """
+        with self._trava:
+            regioes = list(self.regioes_observadas)
+            if tuple(regiao) in regioes:
+                regioes.remove(tuple(regiao))
+            self.regioes_observadas = tuple(regioes)
+
+    def contagens(self):
+        """
+        Conta os Senciantes em cada nível.
+
+        Returns:
+            dict: Dicionário de nível: número de Senciantes.
+        """
+        contagens = dict.fromkeys(NIVEIS, 0)
+        for nivel in self.niveis.values():
+            contagens[nivel] += 1
+        return contagens
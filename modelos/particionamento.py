@@ -0,0 +1,1028 @@
+"""
+Módulo que define o particionamento espacial do passo da simulação.
+O mapa é dividido em tiles e o comportamento dos Senciantes de cada tile é
+atualizado por um trabalhador que guarda, para cada tile, cópias dos recursos
+e construções da área mais uma borda replicada dos tiles vizinhos (o halo).
+Com vários processos, cada trabalhador mantém residentes réplicas dos seus
+Senciantes: as colunas da população e as posições chegam em memória
+compartilhada, e a cada passo trafegam apenas os campos replicados que mudaram
+de cada lado, as cópias do halo que mudaram e, inteiros, os Senciantes que
+entram em um tile de outro trabalhador. Na troca de halo, o processo principal
+aplica as coletas de todos os tiles aos recursos e construções reais.
+"""
+
+import copy
+import multiprocessing
+import os
+import random
+from collections import namedtuple
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from modelos.construcao import Construcao
+from modelos.memoria import AlteracoesMemoria
+from modelos.mundo import Mundo
+from modelos.populacao import CHAVES_POR_GRUPO, VisaoColunar
+from modelos.recurso import Recurso
+from modelos.relacoes import RelacoesSociais
+from modelos.senciante import Senciante
+from utils.config import PARTITION_HALO, PARTITION_TILES
+from utils.indice_espacial import ColecaoEspacial
+
+# Colunas da população lidas e escritas pelo comportamento, copiadas para a memória compartilhada e de volta a cada passo
+COLUNAS_COMPARTILHADAS = ("necessidades", "estado", "habilidades")
+
+# Atributos do Senciante lidos ou escritos pelo comportamento, mantidos iguais nas réplicas
+ATRIBUTOS_REPLICADOS = (
+    "modificadores", "memoria", "tecnologias_conhecidas", "inventario",
+    "atividade_atual", "alvo_atual", "nivel_comunicacao", "passos_atualizacao"
+)
+# Campos do estado replicado: os atributos acima e, por grupo de colunas, as chaves extras do slot
+CAMPOS_REPLICADOS = ATRIBUTOS_REPLICADOS + tuple(CHAVES_POR_GRUPO)
+
+# Referência serializável ao alvo de um Senciante (recurso ou construção)
+ReferenciaAlvo = namedtuple("ReferenciaAlvo", ["tipo", "id"])
+
+# Blocos de memória compartilhada já anexados por um processo trabalhador, por nome
+_blocos_anexados = {}
+
+
+class GradeTiles:
+    """
+    Grade regular de tiles sobre o mapa. Cada posição pertence a um único tile,
+    e pode estar também no halo de até oito vizinhos.
+    """
+
+    def __init__(self, tamanho_mundo, tiles=None, halo=None):
+        """
+        Inicializa uma nova grade.
+
+        Args:
+            tamanho_mundo (tuple): Dimensões do mundo (largura, altura).
+            tiles (tuple, optional): Número de tiles (colunas, linhas). Default é PARTITION_TILES.
+            halo (float, optional): Largura da borda replicada. Default é PARTITION_HALO.
+        """
+        self.tiles = tuple(tiles) if tiles else tuple(PARTITION_TILES)
+        self.halo = PARTITION_HALO if halo is None else float(halo)
+        if min(self.tiles) < 1 or self.halo < 0:
+            raise ValueError("A grade precisa de pelo menos um tile e de um halo não negativo.")
+
+        self.largura_tile = tamanho_mundo[0] / self.tiles[0]
+        self.altura_tile = tamanho_mundo[1] / self.tiles[1]
+
+    def __len__(self):
+        return self.tiles[0] * self.tiles[1]
+
+    def _coluna(self, x):
+        return min(max(int(x // self.largura_tile), 0), self.tiles[0] - 1)
+
+    def _linha(self, y):
+        return min(max(int(y // self.altura_tile), 0), self.tiles[1] - 1)
+
+    def tile(self, posicao):
+        """
+        Obtém o tile que contém uma posição. Posições fora do mapa ficam no tile da borda.
+
+        Args:
+            posicao (list): Posição [x, y].
+
+        Returns:
+            int: Índice do tile.
+        """
+        return self._coluna(posicao[0]) + self._linha(posicao[1]) * self.tiles[0]
+
+    def tiles_de(self, posicoes):
+        """
+        Obtém o tile de várias posições de uma vez.
+
+        Args:
+            posicoes (numpy.ndarray): Array (n, 2) de posições.
+
+        Returns:
+            numpy.ndarray: Índice do tile de cada posição.
+        """
+        colunas = np.clip((posicoes[:, 0] // self.largura_tile).astype(np.intp), 0, self.tiles[0] - 1)
+        linhas = np.clip((posicoes[:, 1] // self.altura_tile).astype(np.intp), 0, self.tiles[1] - 1)
+        return colunas + linhas * self.tiles[0]
+
+    def tiles_com_halo(self, posicao):
+        """
+        Obtém os tiles que enxergam uma posição: o tile que a contém e aqueles
+        em cujo halo ela está.
+
+        Args:
+            posicao (list): Posição [x, y].
+
+        Returns:
+            list: Índices dos tiles.
+        """
+        x, y = posicao[0], posicao[1]
+        colunas = range(self._coluna(x - self.halo), self._coluna(x + self.halo) + 1)
+        linhas = range(self._linha(y - self.halo), self._linha(y + self.halo) + 1)
+        return [coluna + linha * self.tiles[0] for linha in linhas for coluna in colunas]
+
+
+class ParticionamentoEspacial:
+    """
+    Atualiza o comportamento dos Senciantes tile a tile em processos trabalhadores.
+
+    A fisiologia de toda a população é vetorizada no processo principal, como no passo
+    serial; o comportamento de cada Senciante é o mesmo (`Senciante.atualizar_comportamento`),
+    mas cada tile enxerga apenas os recursos e as construções da sua área mais o halo, que
+    deve ser maior que o raio de busca dos Senciantes. Um recurso do halo pode ser coletado
+    por dois tiles no mesmo passo: a troca de halo aplica as duas coletas ao recurso real,
+    que nunca fica negativo. Interações entre Senciantes e reprodução continuam no processo
+    principal, depois da troca.
+
+    Com um único processo, os tiles atualizam os próprios Senciantes. Com vários, cada
+    tile pertence sempre ao mesmo trabalhador, que guarda réplicas dos Senciantes dos
+    seus tiles entre os passos. Os Senciantes do processo principal continuam completos:
+    a troca de halo aplica a eles os campos alterados pelas réplicas, e o passo seguinte
+    envia às réplicas os campos alterados no processo principal (interações, reprodução,
+    ações divinas). Os dois lados detectam as alterações comparando o estado replicado
+    (`_estado`) com o da última sincronização.
+    """
+
+    def __init__(self, tamanho_mundo, processos=None, tiles=None, halo=None):
+        """
+        Inicializa um novo particionamento.
+
+        Args:
+            tamanho_mundo (tuple): Dimensões do mundo (largura, altura).
+            processos (int, optional): Número de processos trabalhadores. Default é o número de CPUs.
+                Com 1, os tiles atualizam os próprios Senciantes no processo principal, sem réplicas.
+            tiles (tuple, optional): Número de tiles (colunas, linhas). Default é PARTITION_TILES.
+            halo (float, optional): Largura da borda replicada. Default é PARTITION_HALO.
+        """
+        self.grade = GradeTiles(tamanho_mundo, tiles, halo)
+        self.processos = max(1, int(processos or os.cpu_count() or 1))
+        if self.processos > 1:
+            # Os trabalhadores devem herdar o rastreador de memória compartilhada do processo
+            # principal; com um rastreador próprio, os blocos seriam removidos quando saíssem
+            resource_tracker.ensure_running()
+            self.trabalhadores = [_ProcessoTrabalhador() for _ in range(self.processos)]
+        else:
+            self.trabalhadores = [_TrabalhadorLocal()]
+
+        self._blocos = {}  # Dicionário de nome da coluna: SharedMemory
+        self._arrays = {}  # Dicionário de nome da coluna: array sobre o bloco
+        self._capacidade = 0
+        self._populacao = None  # População cujas colunas estão nos arrays
+        self._versao_arrays = 0  # Incrementada a cada realocação dos arrays
+
+        self.residentes = {}  # Dicionário de senciante_id: (slot, trabalhador) da réplica
+        self.marcas = {}  # Dicionário de senciante_id: estado replicado na última sincronização
+        self.enviados = {}  # Dicionário de tile: {entidade_id: assinatura da cópia no tile}
+
+    def _trabalhador(self, tile):
+        """
+        Obtém o trabalhador responsável por um tile.
+
+        Args:
+            tile (int): Índice do tile.
+
+        Returns:
+            int: Índice do trabalhador.
+        """
+        return tile % self.processos
+
+    def _preparar_arrays(self, populacao):
+        """
+        Copia as colunas da população para a memória compartilhada, realocando os
+        blocos quando a população cresce. Sem processos trabalhadores, usa as próprias colunas.
+
+        Args:
+            populacao (PopulacaoColunar): População da simulação.
+
+        Returns:
+            tuple: (dict de nome: array, dict de nome: descritor enviado aos trabalhadores).
+        """
+        capacidade = populacao.capacidade
+        realocar = self._capacidade != capacidade or self._populacao is not populacao
+
+        if self.processos == 1:
+            if realocar:
+                self._arrays = {nome: getattr(populacao, nome) for nome in COLUNAS_COMPARTILHADAS}
+                self._arrays["posicoes"] = np.zeros((capacidade, 2))
+            descritores = self._arrays
+        else:
+            if realocar:
+                self._liberar_blocos()
+                formas = {nome: getattr(populacao, nome).shape for nome in COLUNAS_COMPARTILHADAS}
+                formas["posicoes"] = (capacidade, 2)
+                for nome, forma in formas.items():
+                    bloco = shared_memory.SharedMemory(create=True, size=max(8, int(np.prod(forma)) * 8))
+                    self._blocos[nome] = bloco
+                    self._arrays[nome] = np.ndarray(forma, dtype=np.float64, buffer=bloco.buf)
+
+            n = populacao.limite
+            for nome in COLUNAS_COMPARTILHADAS:
+                self._arrays[nome][:n] = getattr(populacao, nome)[:n]
+            descritores = {
+                nome: (self._blocos[nome].name, array.shape)
+                for nome, array in self._arrays.items()
+            }
+
+        if realocar:
+            self._capacidade = capacidade
+            self._populacao = populacao
+            self._versao_arrays += 1
+        return self._arrays, descritores
+
+    def _liberar_blocos(self):
+        """
+        Libera os blocos de memória compartilhada.
+        """
+        self._arrays = {}
+        for bloco in self._blocos.values():
+            bloco.close()
+            bloco.unlink()
+        self._blocos = {}
+        self._capacidade = 0
+        self._populacao = None
+
+    def fechar(self):
+        """
+        Encerra os processos trabalhadores e libera a memória compartilhada.
+        """
+        for trabalhador in self.trabalhadores:
+            trabalhador.fechar()
+        self.trabalhadores = []
+        self._liberar_blocos()
+        self.residentes.clear()
+        self.marcas.clear()
+        self.enviados.clear()
+
+    def atualizar(self, senciantes, populacao, mundo, delta_tempo):
+        """
+        Atualiza a fisiologia de toda a população e o comportamento dos Senciantes vivos,
+        tile a tile, e faz a troca de halo. A população deve estar sincronizada com `senciantes`.
+
+        Args:
+            senciantes (dict): Dicionário de id: Senciante.
+            populacao (PopulacaoColunar): População colunar da simulação.
+            mundo (Mundo): Mundo da simulação.
+            delta_tempo (float): Tempo decorrido desde a última atualização em horas.
+
+        Returns:
+            list: IDs dos Senciantes que morreram.
+        """
+        if not senciantes:
+            return []
+
+        # Fisiologia vetorizada de uma vez, como no passo serial; os mortos não vão aos tiles
+        mortos = populacao.atualizar_fisiologia(delta_tempo)
+        descartados = set(mortos)
+        lista = [s for s in senciantes.values() if s.id not in descartados]
+        if not lista:
+            # As réplicas dos mortos saem no próximo passo com Senciantes vivos
+            return mortos
+
+        mensagens = [
+            {"saem": [], "entram": {}, "alteracoes": {}, "tiles": []}
+            for _ in self.trabalhadores
+        ]
+
+        # Réplicas dos mortos e de Senciantes que saíram da simulação fora do passo particionado
+        for senciante_id in [i for i in self.residentes if i in descartados or i not in senciantes]:
+            slot, trabalhador = self.residentes.pop(senciante_id)
+            del self.marcas[senciante_id]
+            mensagens[trabalhador]["saem"].append(slot)
+
+        slots = np.fromiter((populacao.slots[s.id] for s in lista), dtype=np.intp, count=len(lista))
+
+        arrays, descritores = self._preparar_arrays(populacao)
+        posicoes = arrays["posicoes"]
+        posicoes[slots] = [s.posicao for s in lista]
+
+        # Agrupar os Senciantes por tile, mantendo a ordem do dicionário dentro de cada tile,
+        # e levar às réplicas o que mudou no processo principal
+        membros = {}
+        for indice, (senciante, slot, tile) in enumerate(
+                zip(lista, slots.tolist(), self.grade.tiles_de(posicoes[slots]).tolist())):
+            membros.setdefault(tile, []).append(indice)
+            if self.processos > 1:
+                self._sincronizar_replica(senciante, slot, self._trabalhador(tile), populacao.extras, mensagens)
+        if self.processos == 1:
+            mensagens[0]["senciantes"] = dict(zip(slots.tolist(), lista))
+
+        recursos = self._distribuir(mundo.recursos.values(), membros)
+        construcoes = self._distribuir(mundo.construcoes.values(), membros)
+
+        for tile in sorted(membros):
+            grupo = [lista[i] for i in membros[tile]]
+            alvos = self._incluir_alvos(grupo, mundo, recursos[tile], construcoes[tile])
+            copias, removidos = self._atualizar_halo(tile, recursos[tile], construcoes[tile])
+            mensagens[self._trabalhador(tile)]["tiles"].append((
+                tile, slots[membros[tile]], copias, removidos, alvos,
+                # Semente própria por tile: o resultado não depende do número de processos
+                random.getrandbits(64)
+            ))
+
+        for trabalhador, mensagem in zip(self.trabalhadores, mensagens):
+            mensagem["arrays"] = descritores if trabalhador.versao_arrays != self._versao_arrays else None
+            mensagem["tamanho"] = mundo.tamanho
+            mensagem["delta_tempo"] = delta_tempo
+            trabalhador.versao_arrays = self._versao_arrays
+            trabalhador.enviar(mensagem)
+
+        resultados = []
+        for trabalhador in self.trabalhadores:
+            resultados.extend(trabalhador.receber())
+        resultados.sort(key=lambda resultado: resultado[0])
+
+        self._trocar_halo(resultados, lista, slots, senciantes, populacao, mundo, arrays, delta_tempo)
+        return mortos
+
+    def _sincronizar_replica(self, senciante, slot, trabalhador, extras, mensagens):
+        """
+        Prepara a sincronização de um Senciante com a sua réplica: o estado completo se a
+        réplica ainda não existe no trabalhador do tile, ou só os campos alterados.
+
+        Args:
+            senciante (Senciante): Senciante do processo principal.
+            slot (int): Slot do Senciante na população.
+            trabalhador (int): Trabalhador do tile do Senciante.
+            extras (dict): Chaves extras da população, por grupo e slot.
+            mensagens (list): Mensagens dos trabalhadores, completadas aqui.
+        """
+        residente = self.residentes.get(senciante.id)
+        estado = _estado(senciante, extras, slot)
+
+        if residente == (slot, trabalhador):
+            marca = self.marcas[senciante.id]
+            if estado != marca:
+                mensagens[trabalhador]["alteracoes"][slot] = _exportar(senciante, extras, slot, estado, marca)
+        else:
+            # Novo, ou passou para um tile de outro trabalhador: a réplica antiga é descartada
+            if residente is not None:
+                mensagens[residente[1]]["saem"].append(residente[0])
+            mensagens[trabalhador]["entram"][slot] = (
+                senciante.id, senciante.genoma, _exportar(senciante, extras, slot, estado)
+            )
+            self.residentes[senciante.id] = (slot, trabalhador)
+
+        self.marcas[senciante.id] = estado
+
+    def _distribuir(self, entidades, membros):
+        """
+        Distribui entidades (recursos ou construções) pelos tiles ocupados que as enxergam.
+
+        Args:
+            entidades (iterable): Entidades com atributo `posicao`.
+            membros (dict): Dicionário de tile: índices dos Senciantes do tile.
+
+        Returns:
+            dict: Dicionário de tile: {id: entidade}.
+        """
+        por_tile = {tile: {} for tile in membros}
+        for entidade in entidades:
+            for tile in self.grade.tiles_com_halo(entidade.posicao):
+                if tile in por_tile:
+                    por_tile[tile][entidade.id] = entidade
+        return por_tile
+
+    def _incluir_alvos(self, grupo, mundo, recursos, construcoes):
+        """
+        Torna visíveis no tile os alvos dos seus Senciantes que estão fora do halo.
+
+        Args:
+            grupo (list): Senciantes do tile.
+            mundo (Mundo): Mundo da simulação.
+            recursos (dict): Recursos visíveis no tile, completados aqui.
+            construcoes (dict): Construções visíveis no tile, completadas aqui.
+
+        Returns:
+            list: Cópias dos alvos que já não estão no mundo (ex: recursos removidos).
+        """
+        alvos = {}
+        for senciante in grupo:
+            alvo = senciante.alvo_atual
+            if isinstance(alvo, Recurso) and alvo.id not in recursos:
+                if mundo.recursos.get(alvo.id) is alvo:
+                    recursos[alvo.id] = alvo
+                else:
+                    alvos[alvo.id] = alvo
+            elif isinstance(alvo, Construcao) and alvo.id not in construcoes:
+                if mundo.construcoes.get(alvo.id) is alvo:
+                    construcoes[alvo.id] = alvo
+                else:
+                    alvos[alvo.id] = alvo
+        return [_copiar_entidade(alvo) for alvo in alvos.values()]
+
+    def _atualizar_halo(self, tile, recursos, construcoes):
+        """
+        Compara as entidades visíveis em um tile com as cópias que o trabalhador já tem.
+
+        Args:
+            tile (int): Índice do tile.
+            recursos (dict): Recursos visíveis no tile (área, halo e alvos).
+            construcoes (dict): Construções visíveis no tile (área, halo e alvos).
+
+        Returns:
+            tuple: (cópias das entidades novas ou alteradas, IDs das cópias a descartar).
+        """
+        enviados = self.enviados.setdefault(tile, {})
+        copias = []
+        for entidades in (recursos, construcoes):
+            for entidade_id, entidade in entidades.items():
+                assinatura = _assinatura_entidade(entidade)
+                if entidade_id not in enviados or enviados[entidade_id] != assinatura:
+                    enviados[entidade_id] = assinatura
+                    copias.append(_copiar_entidade(entidade))
+
+        removidos = []
+        if len(enviados) > len(recursos) + len(construcoes):
+            removidos = [i for i in enviados if i not in recursos and i not in construcoes]
+            for entidade_id in removidos:
+                del enviados[entidade_id]
+        return copias, removidos
+
+    def _trocar_halo(self, resultados, lista, slots, senciantes, populacao, mundo, arrays, delta_tempo):
+        """
+        Aplica os resultados dos tiles aos Senciantes, recursos e construções reais.
+
+        Args:
+            resultados (list): Resultados de `_TrabalhadorTiles._atualizar_tile`, em ordem de tile.
+            lista (list): Senciantes atualizados, na ordem de `slots`.
+            slots (numpy.ndarray): Slots dos Senciantes na população.
+            senciantes (dict): Dicionário de id: Senciante.
+            populacao (PopulacaoColunar): População colunar da simulação.
+            mundo (Mundo): Mundo da simulação.
+            arrays (dict): Colunas compartilhadas atualizadas pelos tiles.
+            delta_tempo (float): Tempo decorrido em horas.
+        """
+        # Trazer de volta da memória compartilhada as colunas escritas pelos tiles; o relógio
+        # das memórias avança como nas réplicas, que só enviam as memórias que entraram ou saíram
+        if self.processos > 1:
+            n = populacao.limite
+            for nome in COLUNAS_COMPARTILHADAS:
+                getattr(populacao, nome)[:n] = arrays[nome][:n]
+            for senciante in lista:
+                senciante.memoria.avancar(delta_tempo)
+
+        extras = populacao.extras
+        for tile, alteracoes, coletas, retiradas, ocupacao, assinaturas in resultados:
+            for slot, campos in alteracoes.items():
+                senciante = senciantes[populacao.ids[slot]]
+                _aplicar_campos(senciante, campos, extras, slot, mundo)
+                if self.processos > 1:
+                    self.marcas[senciante.id] = _estado(senciante, extras, slot)
+
+            # Um recurso do halo pode ter sido coletado por mais de um tile
+            for recurso_id, quantidade in coletas.items():
+                recurso = mundo.recursos.get(recurso_id)
+                if recurso is not None:
+                    recurso.coletar(quantidade)
+
+            for construcao_id, retiradas_construcao in retiradas.items():
+                construcao = mundo.construcoes.get(construcao_id)
+                if construcao is not None:
+                    for tipo, quantidade in retiradas_construcao.items():
+                        construcao.retirar_recurso(tipo, quantidade)
+
+            for construcao_id, (entraram, sairam) in ocupacao.items():
+                construcao = mundo.construcoes.get(construcao_id)
+                if construcao is not None:
+                    for senciante_id in entraram:
+                        construcao.adicionar_ocupante(senciante_id)
+                    for senciante_id in sairam:
+                        construcao.remover_ocupante(senciante_id)
+
+            # Cópias alteradas no tile são reenviadas no próximo passo se diferirem das reais
+            self.enviados[tile].update(assinaturas)
+
+        # O setter mantém o índice espacial do mundo atualizado
+        for senciante, (x, y) in zip(lista, arrays["posicoes"][slots].tolist()):
+            if senciante.posicao[0] != x or senciante.posicao[1] != y:
+                senciante.posicao = [x, y]
+
+
+class _PopulacaoTile:
+    """
+    População mínima sobre as colunas compartilhadas, usada pelas réplicas dos Senciantes de um trabalhador.
+    """
+
+    def __init__(self):
+        self.colunas_por_grupo = {
+            grupo: {chave: i for i, chave in enumerate(chaves)}
+            for grupo, chaves in CHAVES_POR_GRUPO.items()
+        }
+        self.versao = 0
+        self.extras = {grupo: {} for grupo in CHAVES_POR_GRUPO}  # Dicionário de grupo: {slot: extras}
+
+    def vincular_arrays(self, arrays):
+        """
+        Passa a usar novas colunas, renovando as linhas guardadas pelas visões.
+
+        Args:
+            arrays (dict): Dicionário de nome: array.
+        """
+        for nome in COLUNAS_COMPARTILHADAS:
+            setattr(self, nome, arrays[nome])
+        self.posicoes = arrays["posicoes"]
+        self.versao += 1
+
+
+class _MundoTile:
+    """
+    Visão de um tile do mundo com cópias dos recursos e construções da área mais o halo.
+    Oferece as consultas usadas por `Senciante.atualizar_comportamento`.
+    """
+
+    encontrar_recursos_proximos = Mundo.encontrar_recursos_proximos
+    encontrar_construcoes_proximas = Mundo.encontrar_construcoes_proximas
+
+    def __init__(self, tamanho):
+        self.tamanho = tuple(tamanho)
+        self.recursos = ColecaoEspacial(tamanho_celula=10.0)
+        self.construcoes = ColecaoEspacial(tamanho_celula=10.0)
+
+    def aplicar(self, copias, removidos):
+        """
+        Atualiza as cópias do tile com as enviadas pelo processo principal.
+
+        Args:
+            copias (list): Cópias de recursos e construções novas ou alteradas.
+            removidos (list): IDs das entidades que o tile deixou de enxergar.
+        """
+        for entidade_id in removidos:
+            self.recursos.pop(entidade_id, None)
+            self.construcoes.pop(entidade_id, None)
+        for copia in copias:
+            colecao = self.construcoes if isinstance(copia, Construcao) else self.recursos
+            colecao[copia.id] = copia
+
+
+class _TrabalhadorTiles:
+    """
+    Estado residente de um trabalhador: réplicas dos Senciantes dos seus tiles (ou, no
+    processo principal, os próprios Senciantes) e, para cada tile, as cópias dos recursos
+    e construções que ele enxerga.
+    """
+
+    def __init__(self, replicas=True):
+        """
+        Inicializa um novo trabalhador.
+
+        Args:
+            replicas (bool, optional): Se os Senciantes são réplicas. Se False, a mensagem traz
+                os próprios Senciantes, e só os alvos alterados voltam para a troca de halo.
+                Default é True.
+        """
+        self.replicas = replicas
+        self.senciantes = {}  # Dicionário de slot: réplica do Senciante
+        self.marcas = {}  # Dicionário de slot: estado replicado na última sincronização
+        self.mundos = {}  # Dicionário de tile: _MundoTile
+        self.populacao = _PopulacaoTile()
+
+    def processar(self, mensagem):
+        """
+        Aplica uma mensagem do processo principal e atualiza os tiles ocupados.
+
+        Args:
+            mensagem (dict): Mensagem montada por `ParticionamentoEspacial.atualizar`.
+
+        Returns:
+            list: Resultados de `_atualizar_tile`, um por tile.
+        """
+        populacao = self.populacao
+        if mensagem["arrays"] is not None:
+            populacao.vincular_arrays(_anexar_arrays(mensagem["arrays"]))
+
+        if not self.replicas:
+            self.senciantes = mensagem["senciantes"]
+        for slot in mensagem["saem"]:
+            self._remover(slot)
+        for slot, (senciante_id, genoma, campos) in mensagem["entram"].items():
+            self.senciantes[slot] = self._criar_replica(slot, senciante_id, genoma)
+        alteracoes = list(mensagem["alteracoes"].items())
+        alteracoes.extend((slot, campos) for slot, (_, _, campos) in mensagem["entram"].items())
+        for slot, campos in alteracoes:
+            _aplicar_campos(self.senciantes[slot], campos, populacao.extras, slot)
+            self.marcas[slot] = _estado(self.senciantes[slot], populacao.extras, slot)
+
+        return [
+            self._atualizar_tile(*tile, mensagem["tamanho"], mensagem["delta_tempo"])
+            for tile in mensagem["tiles"]
+        ]
+
+    def _criar_replica(self, slot, senciante_id, genoma):
+        """
+        Cria uma réplica ligada às colunas compartilhadas, a ser completada com os campos
+        enviados pelo processo principal.
+
+        Args:
+            slot (int): Slot do Senciante na população.
+            senciante_id (int): ID do Senciante.
+            genoma (Genoma): Genoma do Senciante, que o comportamento só lê.
+
+        Returns:
+            Senciante: Réplica.
+        """
+        senciante = Senciante.__new__(Senciante)
+        senciante.id = senciante_id
+        senciante.genoma = genoma
+        senciante.indice_espacial = None
+        senciante.populacao = self.populacao
+        # As relações ficam no grafo social do processo principal; o comportamento não as lê
+        senciante.grafo_social = None
+        senciante.relacoes = RelacoesSociais()
+        for grupo in CHAVES_POR_GRUPO:
+            self.populacao.extras[grupo][slot] = {}
+            setattr(senciante, grupo, VisaoColunar(self.populacao, grupo, slot))
+        return senciante
+
+    def _remover(self, slot):
+        """
+        Descarta a réplica de um slot.
+
+        Args:
+            slot (int): Slot do Senciante na população.
+        """
+        self.senciantes.pop(slot, None)
+        self.marcas.pop(slot, None)
+        for extras in self.populacao.extras.values():
+            extras.pop(slot, None)
+
+    def _atualizar_tile(self, tile, linhas, copias, removidos, alvos, semente, tamanho, delta_tempo):
+        """
+        Atualiza o comportamento dos Senciantes de um tile.
+
+        Args:
+            tile (int): Índice do tile.
+            linhas (numpy.ndarray): Slots dos Senciantes do tile, na ordem de atualização.
+            copias (list): Cópias novas ou alteradas de recursos e construções do tile.
+            removidos (list): IDs das cópias que o tile deixou de enxergar.
+            alvos (list): Cópias dos alvos que já não estão no mundo.
+            semente (int): Semente do gerador aleatório do tile.
+            tamanho (tuple): Dimensões do mundo.
+            delta_tempo (float): Tempo decorrido em horas.
+
+        Returns:
+            tuple: (tile, campos alterados das réplicas por slot, coletas por recurso,
+                retiradas por construção, (entraram, saíram) dos ocupantes por construção,
+                assinaturas das cópias alteradas no tile).
+        """
+        populacao = self.populacao
+        posicoes = populacao.posicoes
+        extras = populacao.extras
+
+        mundo = self.mundos.get(tile)
+        if mundo is None:
+            mundo = self.mundos[tile] = _MundoTile(tamanho)
+        mundo.aplicar(copias, removidos)
+        avulsos = {entidade.id: entidade for entidade in alvos}
+
+        entidades = list(mundo.recursos.values()) + list(mundo.construcoes.values())
+        antes = {entidade.id: _assinatura_entidade(entidade) for entidade in entidades}
+
+        # Sem processos trabalhadores o tile roda no processo principal, cujo gerador não deve ser alterado
+        estado_aleatorio = random.getstate()
+        random.seed(semente)
+        alteracoes = {}
+        try:
+            for slot in linhas.tolist():
+                senciante = self.senciantes[slot]
+                alvo = senciante.alvo_atual
+                if not self.replicas:
+                    # A posição e o índice espacial do mundo só mudam na troca de halo, na ordem da população
+                    posicao, indice = senciante._posicao, senciante.indice_espacial
+                    senciante.indice_espacial = None
+                senciante._posicao = posicoes[slot].tolist()
+                senciante.alvo_atual = _resolver_alvo(_referencia(alvo), mundo.recursos, mundo.construcoes, avulsos)
+
+                senciante.atualizar_comportamento(delta_tempo, mundo)
+
+                posicoes[slot] = senciante.posicao
+                if self.replicas:
+                    # Entre passos a réplica só muda pelas colunas e pelas mensagens, já marcadas
+                    estado = _estado(senciante, extras, slot)
+                    marca = self.marcas[slot]
+                    if estado != marca:
+                        alteracoes[slot] = _exportar(senciante, extras, slot, estado, marca)
+                        self.marcas[slot] = estado
+                    continue
+
+                senciante._posicao, senciante.indice_espacial = posicao, indice
+                # Alvos do tile são cópias: o Senciante volta ao alvo real, e um alvo novo é resolvido na troca de halo
+                referencia = _referencia(senciante.alvo_atual)
+                if not isinstance(referencia, ReferenciaAlvo):
+                    continue
+                senciante.alvo_atual = alvo
+                if referencia != _referencia(alvo):
+                    alteracoes[slot] = {"alvo_atual": referencia}
+        finally:
+            random.setstate(estado_aleatorio)
+
+        coletas = {}
+        retiradas = {}
+        ocupacao = {}
+        assinaturas = {}
+        for entidade in entidades:
+            assinatura = _assinatura_entidade(entidade)
+            anterior = antes[entidade.id]
+            if assinatura == anterior:
+                continue
+            assinaturas[entidade.id] = assinatura
+
+            if isinstance(entidade, Recurso):
+                if assinatura < anterior:
+                    coletas[entidade.id] = anterior - assinatura
+                continue
+
+            ocupantes, armazenados = anterior
+            if assinatura[0] != ocupantes:
+                ocupacao[entidade.id] = (
+                    [i for i in assinatura[0] if i not in ocupantes],
+                    [i for i in ocupantes if i not in assinatura[0]]
+                )
+
+            depois = entidade.recursos_armazenados
+            diferencas = {
+                tipo: valor - depois.get(tipo, 0.0)
+                for tipo, valor in armazenados
+                if depois.get(tipo, 0.0) < valor
+            }
+            if diferencas:
+                retiradas[entidade.id] = diferencas
+
+        return tile, alteracoes, coletas, retiradas, ocupacao, assinaturas
+
+
+class _TrabalhadorLocal:
+    """
+    Trabalhador no próprio processo principal, usado com um único processo. Atualiza os
+    próprios Senciantes, e as mensagens não passam pelo pickle.
+    """
+
+    def __init__(self):
+        self.trabalhador = _TrabalhadorTiles(replicas=False)
+        self.versao_arrays = None  # Versão dos arrays já enviada
+        self._resultado = None
+
+    def enviar(self, mensagem):
+        self._resultado = self.trabalhador.processar(mensagem)
+
+    def receber(self):
+        return self._resultado
+
+    def fechar(self):
+        self.trabalhador = None
+
+
+class _ProcessoTrabalhador:
+    """
+    Trabalhador em um processo próprio, que recebe as mensagens por um pipe.
+    """
+
+    def __init__(self):
+        self.versao_arrays = None  # Versão dos arrays já enviada
+        self.conexao, conexao_trabalhador = multiprocessing.Pipe()
+        self.processo = multiprocessing.Process(
+            target=_executar_trabalhador, args=(conexao_trabalhador,), daemon=True
+        )
+        self.processo.start()
+        conexao_trabalhador.close()
+
+    def enviar(self, mensagem):
+        self.conexao.send(mensagem)
+
+    def receber(self):
+        resultado = self.conexao.recv()
+        if isinstance(resultado, Exception):
+            raise resultado
+        return resultado
+
+    def fechar(self):
+        try:
+            self.conexao.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.processo.join()
+        self.conexao.close()
+
+
+def _executar_trabalhador(conexao):
+    """
+    Laço de um processo trabalhador: processa mensagens até receber None.
+
+    Args:
+        conexao (multiprocessing.connection.Connection): Ponta do pipe do trabalhador.
+    """
+    trabalhador = _TrabalhadorTiles()
+    try:
+        while True:
+            mensagem = conexao.recv()
+            if mensagem is None:
+                break
+            try:
+                resultado = trabalhador.processar(mensagem)
+            except Exception as e:
+                resultado = e
+            conexao.send(resultado)
+    finally:
+        conexao.close()
+        for bloco in _blocos_anexados.values():
+            bloco.close()
+        _blocos_anexados.clear()
+
+
+def _copiar_entidade(entidade):
+    """
+    Copia um recurso ou construção sem o vínculo com o índice espacial do mundo.
+
+    Args:
+        entidade (Recurso ou Construcao): Entidade a copiar.
+
+    Returns:
+        Recurso ou Construcao: Cópia desvinculada.
+    """
+    copia = copy.copy(entidade)
+    copia.indice_espacial = None
+    if isinstance(copia, Construcao):
+        copia.recursos_armazenados = dict(copia.recursos_armazenados)
+        copia.ocupantes = list(copia.ocupantes)
+    return copia
+
+
+def _assinatura_entidade(entidade):
+    """
+    Calcula a assinatura do que os Senciantes de um tile leem e alteram em uma entidade.
+
+    Args:
+        entidade (Recurso ou Construcao): Entidade.
+
+    Returns:
+        Quantidade do recurso, ou (ocupantes, recursos armazenados) da construção.
+    """
+    if isinstance(entidade, Construcao):
+        return tuple(entidade.ocupantes), tuple(entidade.recursos_armazenados.items())
+    return entidade.quantidade
+
+
+def _referencia(valor):
+    """
+    Troca um recurso ou construção por uma referência serializável.
+
+    Args:
+        valor: Valor de um atributo (normalmente o alvo de um Senciante).
+
+    Returns:
+        ReferenciaAlvo para recursos e construções; outros valores como estão.
+    """
+    if isinstance(valor, Recurso):
+        return ReferenciaAlvo("recurso", valor.id)
+    if isinstance(valor, Construcao):
+        return ReferenciaAlvo("construcao", valor.id)
+    return valor
+
+
+def _estado(senciante, extras, slot):
+    """
+    Resume o estado replicado de um Senciante em uma tupla com um item por campo de
+    CAMPOS_REPLICADOS: dicionários e listas como tuplas dos seus itens, o armazém de
+    memórias como (sequência, tamanho) e o alvo como referência. Tuplas iguais indicam
+    réplicas iguais, e a comparação da tupla inteira é uma só. O relógio das memórias
+    avança com o passo dos dois lados e fica de fora.
+
+    Args:
+        senciante (Senciante): Senciante ou réplica.
+        extras (dict): Chaves extras da população, por grupo e slot.
+        slot (int): Slot do Senciante.
+
+    Returns:
+        tuple: Estado replicado.
+    """
+    memoria = senciante.memoria
+    return (
+        tuple(senciante.modificadores.items()),
+        (memoria.sequencia, len(memoria.entradas)),
+        tuple(senciante.tecnologias_conhecidas),
+        tuple(senciante.inventario.items()),
+        senciante.atividade_atual,
+        _referencia(senciante.alvo_atual),
+        senciante.nivel_comunicacao,
+        senciante.passos_atualizacao,
+        tuple(extras["necessidades"][slot].items()),
+        tuple(extras["estado"][slot].items()),
+        tuple(extras["habilidades"][slot].items()),
+    )
+
+
+def _exportar(senciante, extras, slot, estado, marca=None):
+    """
+    Extrai os campos de um Senciante cujo estado difere da marca, como valores que não
+    compartilham objetos mutáveis com ele. Sem marca, extrai todos os campos.
+
+    Args:
+        senciante (Senciante): Senciante ou réplica.
+        extras (dict): Chaves extras da população, por grupo e slot.
+        slot (int): Slot do Senciante.
+        estado (tuple): Estado replicado atual (`_estado`).
+        marca (tuple, optional): Estado replicado da última sincronização.
+
+    Returns:
+        dict: Dicionário de campo: valor, com alvos trocados por referências e, havendo
+            marca, o armazém de memórias trocado pelas suas alterações.
+    """
+    campos = {}
+    for indice, campo in enumerate(CAMPOS_REPLICADOS):
+        if marca is not None and marca[indice] == estado[indice]:
+            continue
+
+        if campo in extras:
+            campos[campo] = dict(extras[campo][slot])
+        elif campo == "memoria":
+            campos[campo] = (
+                copy.deepcopy(senciante.memoria) if marca is None
+                else senciante.memoria.alteracoes_desde(*marca[indice])
+            )
+        elif isinstance(estado[indice], ReferenciaAlvo):
+            campos[campo] = estado[indice]
+        else:
+            campos[campo] = copy.copy(getattr(senciante, campo))
+    return campos
+
+
+def _aplicar_campos(senciante, campos, extras, slot, mundo=None):
+    """
+    Aplica a um Senciante ou réplica os campos extraídos por `_exportar`.
+
+    Args:
+        senciante (Senciante): Senciante ou réplica.
+        campos (dict): Dicionário de campo: valor.
+        extras (dict): Chaves extras da população, por grupo e slot.
+        slot (int): Slot do Senciante.
+        mundo (Mundo, optional): Mundo onde resolver as referências de alvo. Se None (réplicas),
+            as referências são resolvidas pelo tile a cada passo.
+    """
+    for campo, valor in campos.items():
+        if campo in extras:
+            extras[campo][slot] = valor
+        elif isinstance(valor, AlteracoesMemoria):
+            senciante.memoria.aplicar_alteracoes(valor)
+        else:
+            if mundo is not None and isinstance(valor, ReferenciaAlvo):
+                anterior = senciante.alvo_atual
+                valor = _resolver_alvo(
+                    valor, mundo.recursos, mundo.construcoes,
+                    {anterior.id: anterior} if isinstance(anterior, (Recurso, Construcao)) else {}
+                )
+            setattr(senciante, campo, valor)
+
+
+def _resolver_alvo(alvo, recursos, construcoes, avulsos):
+    """
+    Troca uma referência de alvo pelo objeto correspondente.
+
+    Args:
+        alvo: Alvo exportado (ReferenciaAlvo ou outro valor, mantido como está).
+        recursos (dict): Recursos por id.
+        construcoes (dict): Construções por id.
+        avulsos (dict): Alvos por id que não estão nas coleções (ex: recursos já removidos do mundo).
+
+    Returns:
+        Alvo resolvido, ou None se não for encontrado.
+    """
+    if not isinstance(alvo, ReferenciaAlvo):
+        return alvo
+
+    colecao = recursos if alvo.tipo == "recurso" else construcoes
+    objeto = colecao.get(alvo.id)
+    return objeto if objeto is not None else avulsos.get(alvo.id)
+
+
+def _anexar_arrays(descritores):
+    """
+    Obtém as colunas compartilhadas descritas em uma mensagem, anexando os blocos ainda
+    não conhecidos por este processo e soltando os que o processo principal realocou.
+
+    Args:
+        descritores (dict): Dicionário de nome: array ou (nome do bloco, forma).
+
+    Returns:
+        dict: Dicionário de nome: array.
+    """
+    arrays = {}
+    em_uso = set()
+    for nome, descritor in descritores.items():
+        if isinstance(descritor, np.ndarray):
+            arrays[nome] = descritor
+            continue
+
+        nome_bloco, forma = descritor
+        bloco = _blocos_anexados.get(nome_bloco)
+        if bloco is None:
+            bloco = shared_memory.SharedMemory(name=nome_bloco)
+            _blocos_anexados[nome_bloco] = bloco
+        arrays[nome] = np.ndarray(forma, dtype=np.float64, buffer=bloco.buf)
+        em_uso.add(nome_bloco)
+
+    # Blocos antigos já foram liberados pelo processo principal
+    for nome_bloco in list(_blocos_anexados):
+        if nome_bloco not in em_uso:
+            _blocos_anexados.pop(nome_bloco).close()
+
+    return arrays
@@ -0,0 +1,361 @@
+"""
+Módulo que define o armazenamento colunar da população de Senciantes.
+As necessidades, o estado e as habilidades de todos os Senciantes ficam em
+arrays NumPy indexados por slot, e cada Senciante passa a enxergar a sua linha
+através de visões com interface de dicionário.
+"""
+
+from collections.abc import MutableMapping
+
+import numpy as np
+
+from utils.config import (
+    SENCIANTE_MAX_AGE, SENCIANTE_NEEDS_DECAY_RATES,
+    SENCIANTE_NEEDS_CRITICAL_THRESHOLDS
+)
+
+# Chaves armazenadas em colunas, na ordem das colunas de cada grupo
+CHAVES_NECESSIDADES = ("fome", "sede", "sono", "higiene", "social")
+CHAVES_ESTADO = ("idade", "saude", "energia", "felicidade", "estresse")
+CHAVES_HABILIDADES = ("coleta", "construcao", "comunicacao", "combate", "aprendizado")
+
+CHAVES_POR_GRUPO = {
+    "necessidades": CHAVES_NECESSIDADES,
+    "estado": CHAVES_ESTADO,
+    "habilidades": CHAVES_HABILIDADES
+}
+
+# Índices das colunas usadas na atualização vetorizada
+_FOME, _SEDE, _SONO, _HIGIENE, _SOCIAL = range(5)
+_IDADE, _SAUDE, _ENERGIA, _FELICIDADE, _ESTRESSE = range(5)
+
+
+class VisaoColunar(MutableMapping):
+    """
+    Visão com interface de dicionário sobre a linha de um Senciante em um grupo
+    de colunas da população. Chaves fora das colunas fixas (por exemplo,
+    habilidades adquiridas pelas mecânicas) ficam em um dicionário extra do slot.
+    """
+
+    def __init__(self, populacao, grupo, slot):
+        """
+        Inicializa uma nova visão.
+
+        Args:
+            populacao (PopulacaoColunar): População que armazena os dados.
+            grupo (str): Nome do grupo ("necessidades", "estado" ou "habilidades").
+            slot (int): Slot do Senciante na população.
+        """
+        self.populacao = populacao
+        self.grupo = grupo
+        self.slot = slot
+        self.colunas = populacao.colunas_por_grupo[grupo]
+        self._linha = None
+        self._versao = -1
+
+    def __reduce__(self):
+        # A linha guardada é uma visão sobre o array e não deve ser serializada
+        return (self.__class__, (self.populacao, self.grupo, self.slot))
+
+    def _obter_linha(self):
+        """
+        Obtém a linha do Senciante no array do grupo.
+        Os arrays são realocados quando a população cresce, então a linha
+        guardada é renovada sempre que a versão da população muda.
+
+        Returns:
+            numpy.ndarray: Linha do Senciante (uma visão sobre o array do grupo).
+        """
+        if self._versao != self.populacao.versao:
+            self._linha = getattr(self.populacao, self.grupo)[self.slot]
+            self._versao = self.populacao.versao
+        return self._linha
+
+    def __getitem__(self, chave):
+        coluna = self.colunas.get(chave)
+        if coluna is not None:
+            return float(self._obter_linha()[coluna])
+        return self.populacao.extras[self.grupo][self.slot][chave]
+
+    def __setitem__(self, chave, valor):
+        coluna = self.colunas.get(chave)
+        if coluna is not None:
+            self._obter_linha()[coluna] = valor
+        else:
+            self.populacao.extras[self.grupo][self.slot][chave] = valor
+
+    def __delitem__(self, chave):
+        if chave in self.colunas:
+            raise KeyError(f"A chave '{chave}' é uma coluna fixa e não pode ser removida")
+        del self.populacao.extras[self.grupo][self.slot][chave]
+
+    def __iter__(self):
+        yield from self.colunas
+        yield from self.populacao.extras[self.grupo][self.slot]
+
+    def __len__(self):
+        return len(self.colunas) + len(self.populacao.extras[self.grupo][self.slot])
+
+    def __contains__(self, chave):
+        return chave in self.colunas or chave in self.populacao.extras[self.grupo][self.slot]
+
+    def copy(self):
+        """
+        Copia os valores da visão para um dicionário comum.
+
+        Returns:
+            dict: Cópia dos valores.
+        """
+        return dict(self.items())
+
+    def __repr__(self):
+        return repr(self.copy())
+
+
+class PopulacaoColunar:
+    """
+    Classe que armazena os dados fisiológicos de uma população de Senciantes em arrays NumPy.
+    Permite atualizar necessidades, saúde e verificar mortes de toda a população
+    com poucas operações vetorizadas.
+    """
+
+    def __init__(self, capacidade_inicial=64):
+        """
+        Inicializa uma nova população colunar.
+
+        Args:
+            capacidade_inicial (int, optional): Número inicial de slots. Default é 64.
+        """
+        capacidade = max(1, int(capacidade_inicial))
+
+        self.colunas_por_grupo = {
+            grupo: {chave: i for i, chave in enumerate(chaves)}
+            for grupo, chaves in CHAVES_POR_GRUPO.items()
+        }
+
+        # Colunas (uma linha por slot)
+        self.necessidades = np.zeros((capacidade, len(CHAVES_NECESSIDADES)))
+        self.estado = np.zeros((capacidade, len(CHAVES_ESTADO)))
+        self.habilidades = np.zeros((capacidade, len(CHAVES_HABILIDADES)))
+        self.metabolismo = np.ones(capacidade)
+        self.longevidade = np.ones(capacidade)
+        self.ativos = np.zeros(capacidade, dtype=bool)
+
+        # Chaves extras por slot, para cada grupo
+        self.extras = {grupo: [{} for _ in range(capacidade)] for grupo in CHAVES_POR_GRUPO}
+
+        # Mapeamentos entre slots e Senciantes
+        self.slots = {}  # Dicionário de senciante_id: slot
+        self.ids = [None] * capacidade  # Lista de slot: senciante_id
+        self.slots_livres = []
+        self.limite = 0  # Maior slot já usado + 1
+        self.versao = 0  # Incrementada sempre que os arrays são realocados
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __contains__(self, senciante_id):
+        return senciante_id in self.slots
+
+    @property
+    def capacidade(self):
+        """
+        int: Número de slots alocados.
+        """
+        return len(self.ativos)
+
+    def _expandir(self):
+        """
+        Dobra a capacidade dos arrays da população.
+        """
+        capacidade = self.capacidade
+        nova_capacidade = capacidade * 2
+
+        for nome in ("necessidades", "estado", "habilidades"):
+            antigo = getattr(self, nome)
+            novo = np.zeros((nova_capacidade, antigo.shape[1]))
+            novo[:capacidade] = antigo
+            setattr(self, nome, novo)
+
+        for nome, preenchimento in (("metabolismo", 1.0), ("longevidade", 1.0)):
+            novo = np.full(nova_capacidade, preenchimento)
+            novo[:capacidade] = getattr(self, nome)
+            setattr(self, nome, novo)
+
+        ativos = np.zeros(nova_capacidade, dtype=bool)
+        ativos[:capacidade] = self.ativos
+        self.ativos = ativos
+
+        for grupo in self.extras:
+            self.extras[grupo].extend({} for _ in range(nova_capacidade - capacidade))
+        self.ids.extend([None] * (nova_capacidade - capacidade))
+        self.versao += 1
+
+    def adicionar(self, senciante):
+        """
+        Copia os dados de um Senciante para um slot livre da população.
+        Normalmente chamado por `Senciante.vincular_populacao`.
+
+        Args:
+            senciante (Senciante): Senciante a ser adicionado.
+
+        Returns:
+            int: Slot ocupado pelo Senciante.
+        """
+        if senciante.id in self.slots:
+            return self.slots[senciante.id]
+
+        if self.slots_livres:
+            slot = self.slots_livres.pop()
+        else:
+            if self.limite >= self.capacidade:
+                self._expandir()
+            slot = self.limite
+            self.limite += 1
+
+        for grupo, colunas in self.colunas_por_grupo.items():
+            array = getattr(self, grupo)
+            extras = {}
+            for chave, valor in getattr(senciante, grupo).items():
+                if chave in colunas:
+                    array[slot, colunas[chave]] = valor
+                else:
+                    extras[chave] = valor
+            self.extras[grupo][slot] = extras
+
+        self.metabolismo[slot] = senciante.modificadores.get("metabolismo", 1.0)
+        self.longevidade[slot] = senciante.modificadores.get("longevidade", 1.0)
+        self.ativos[slot] = True
+        self.slots[senciante.id] = slot
+        self.ids[slot] = senciante.id
+
+        return slot
+
+    def remover(self, senciante_id):
+        """
+        Libera o slot de um Senciante.
+
+        Args:
+            senciante_id (str): ID do Senciante.
+
+        Returns:
+            bool: True se o Senciante foi removido, False se não estava na população.
+        """
+        slot = self.slots.pop(senciante_id, None)
+        if slot is None:
+            return False
+
+        self.ativos[slot] = False
+        self.ids[slot] = None
+        for grupo in self.extras:
+            self.extras[grupo][slot] = {}
+        self.slots_livres.append(slot)
+
+        return True
+
+    def obter_linha(self, senciante_id, grupo):
+        """
+        Obtém os valores de um grupo de colunas de um Senciante como dicionário.
+
+        Args:
+            senciante_id (str): ID do Senciante.
+            grupo (str): Nome do grupo ("necessidades", "estado" ou "habilidades").
+
+        Returns:
+            dict: Valores do grupo, incluindo chaves extras.
+        """
+        return VisaoColunar(self, grupo, self.slots[senciante_id]).copy()
+
+    def sincronizar(self, senciantes):
+        """
+        Sincroniza a população com um dicionário de Senciantes.
+        Senciantes ainda não vinculados passam a usar a população e entradas de
+        Senciantes ausentes são liberadas.
+
+        Args:
+            senciantes (dict): Dicionário de id: Senciante.
+        """
+        for senciante in senciantes.values():
+            if senciante.populacao is not self:
+                senciante.vincular_populacao(self)
+
+        # Liberar slots de Senciantes que não fazem mais parte do dicionário
+        if len(self.slots) > len(senciantes):
+            for senciante_id in list(self.slots):
+                if senciante_id not in senciantes:
+                    self.remover(senciante_id)
+
+    def atualizar_fisiologia(self, delta_tempo):
+        """
+        Atualiza idade, necessidades, saúde e felicidade de toda a população e verifica mortes.
+        Equivale a chamar `Senciante.atualizar_fisiologia` em cada Senciante ativo.
+
+        Args:
+            delta_tempo (float): Tempo decorrido desde a última atualização em horas.
+
+        Returns:
+            list: IDs dos Senciantes que morreram, em ordem de slot.
+        """
+        n = self.limite
+        if n == 0:
+            return []
+
+        ativos = self.ativos[:n]
+        necessidades = self.necessidades[:n]
+        estado = self.estado[:n]
+
+        # Trabalhar em cópias para não alterar slots livres
+        nec = necessidades.copy()
+        est = estado.copy()
+
+        # Atualizar idade
+        est[:, _IDADE] += delta_tempo
+
+        # Aumentar fome e sede
+        nec[:, _FOME] += SENCIANTE_NEEDS_DECAY_RATES["fome"] * delta_tempo * self.metabolismo[:n]
+        nec[:, _SEDE] += SENCIANTE_NEEDS_DECAY_RATES["sede"] * delta_tempo * self.metabolismo[:n]
+
+        # Aumentar sono (diminuir energia)
+        com_energia = est[:, _ENERGIA] > 0
+        est[com_energia, _ENERGIA] -= SENCIANTE_NEEDS_DECAY_RATES["sono"] * delta_tempo
+        nec[:, _SONO] = 1.0 - est[:, _ENERGIA]
+
+        # Aumentar necessidades de higiene e social
+        nec[:, _HIGIENE] += SENCIANTE_NEEDS_DECAY_RATES["higiene"] * delta_tempo
+        nec[:, _SOCIAL] += SENCIANTE_NEEDS_DECAY_RATES["social"] * delta_tempo
+
+        # Limitar valores
+        np.clip(nec, 0.0, 1.0, out=nec)
+
+        # Ajustar saúde gradualmente em direção à saúde alvo
+        saude_alvo = 1.0 - (
+            nec[:, _FOME] * 0.5 + nec[:, _SEDE] * 0.7 + nec[:, _SONO] * 0.3 +
+            nec[:, _HIGIENE] * 0.2 + nec[:, _SOCIAL] * 0.1
+        ) / 5.0
+        est[:, _SAUDE] += (saude_alvo - est[:, _SAUDE]) * 0.1
+        np.clip(est[:, _SAUDE], 0.0, 1.0, out=est[:, _SAUDE])
+
+        # Ajustar felicidade com base na saúde e necessidades
+        felicidade_alvo = (
+            est[:, _SAUDE] * 0.5 +
+            (1.0 - nec[:, _FOME]) * 0.1 +
+            (1.0 - nec[:, _SEDE]) * 0.1 +
+            (1.0 - nec[:, _SONO]) * 0.1 +
+            (1.0 - nec[:, _SOCIAL]) * 0.2
+        )
+        est[:, _FELICIDADE] += (felicidade_alvo - est[:, _FELICIDADE]) * 0.05
+        np.clip(est[:, _FELICIDADE], 0.0, 1.0, out=est[:, _FELICIDADE])
+
+        # Gravar apenas as linhas ativas
+        necessidades[ativos] = nec[ativos]
+        estado[ativos] = est[ativos]
+
+        # Verificar morte por idade, saúde, fome ou sede extremas
+        mortos = ativos & (
+            (est[:, _IDADE] > SENCIANTE_MAX_AGE * self.longevidade[:n]) |
+            (est[:, _SAUDE] <= 0.0) |
+            (nec[:, _FOME] >= SENCIANTE_NEEDS_CRITICAL_THRESHOLDS["fome"]) |
+            (nec[:, _SEDE] >= SENCIANTE_NEEDS_CRITICAL_THRESHOLDS["sede"])
+        )
+
+        return [self.ids[slot] for slot in np.flatnonzero(mortos)]
@@ -22,13 +22,30 @@ class Recurso:
             renovavel (bool, optional): Se o recurso é renovável. Default é False.
             taxa_renovacao (float, optional): Taxa de renovação por hora. Default é 0.0.
         """
-        self.id = gerar_id()
+        self.id = gerar_id("recurso")
         self.tipo = tipo
         self.posicao = posicao
         self.quantidade = quantidade
         self.renovavel = renovavel
         self.taxa_renovacao = taxa_renovacao
         self.quantidade_maxima = quantidade
+        self.indice_espacial = None  # IndiceEspacialPorTipo ao qual o recurso está vinculado
+    
+    def vincular_indice(self, indice):
+        """
+        Vincula o recurso a um índice espacial. Recursos esgotados ficam fora do índice
+        até serem renovados.
+        
+        Args:
+            indice (IndiceEspacialPorTipo): Índice espacial, ou None para desvincular.
+        """
+        if self.indice_espacial is not None and self.indice_espacial is not indice:
+            self.indice_espacial.remover(self.id)
+        
+        self.indice_espacial = indice
+        
+        if indice is not None and not self.esta_esgotado():
+            indice.inserir(self.id, self.tipo, self.posicao)
     
     def atualizar(self, delta_tempo, clima):
         """
@@ -39,6 +56,8 @@ class Recurso:
             clima (Clima): Objeto clima atual do mundo.
         """
         if self.renovavel and self.quantidade < self.quantidade_maxima:
+            estava_esgotado = self.esta_esgotado()
+            
             # Calcular taxa de renovação baseada no clima
             taxa_efetiva = self.taxa_renovacao
             
@@ -73,6 +92,10 @@ class Recurso:
                 self.quantidade_maxima,
                 self.quantidade + taxa_efetiva * delta_tempo
             )
+            
+            # Recurso renovado volta ao índice espacial
+            if estava_esgotado and not self.esta_esgotado() and self.indice_espacial is not None:
+                self.indice_espacial.inserir(self.id, self.tipo, self.posicao)
     
     def coletar(self, quantidade):
         """
@@ -90,6 +113,10 @@ class Recurso:
         # Reduzir a quantidade disponível
         self.quantidade -= quantidade_coletada
         
+        # Recurso esgotado sai do índice espacial
+        if self.indice_espacial is not None and self.esta_esgotado():
+            self.indice_espacial.remover(self.id)
+        
         return quantidade_coletada
     
     def esta_esgotado(self):
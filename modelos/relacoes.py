@@ -0,0 +1,117 @@
+"""
+Módulo que define as relações sociais de um Senciante para o jogo "O Mundo dos Senciantes".
+A força de cada relação decai exponencialmente com o tempo; em vez de decair
+todas as relações a cada passo, cada uma guarda a força e o instante da última
+alteração, e a força atual é calculada na leitura.
+"""
+
+import math
+from collections.abc import MutableMapping
+
+from utils.config import RELATION_STRENGTH_DECAY_RATE, RELATION_STRENGTH_THRESHOLD, RELATION_SWEEP_INTERVAL
+
+
+class RelacoesSociais(MutableMapping):
+    """
+    Relações de um Senciante, como dicionário de senciante_id: {"tipo": tipo, "forca": valor}.
+    Avançar o tempo custa O(1); relações cuja força caiu abaixo de
+    RELATION_STRENGTH_THRESHOLD deixam de aparecer imediatamente e são removidas
+    da memória por uma compactação a cada RELATION_SWEEP_INTERVAL horas.
+
+    Os dicionários devolvidos são cópias: alterações devem ser gravadas de volta
+    com `relacoes[senciante_id] = relacao`.
+    """
+
+    def __init__(self, relacoes=None):
+        """
+        Inicializa um novo conjunto de relações.
+
+        Args:
+            relacoes (dict, optional): Relações iniciais, no formato de `to_dict`.
+        """
+        self.tempo = 0.0  # Relógio das relações, em horas
+        self.proxima_compactacao = RELATION_SWEEP_INTERVAL
+        self.entradas = {}  # Dicionário de senciante_id: [tipo, força na última alteração, tempo da última alteração]
+        if relacoes:
+            self.update(relacoes)
+
+    def _forca(self, entrada):
+        _, forca, tempo = entrada
+        if self.tempo == tempo:
+            return forca
+        return forca * math.exp(-RELATION_STRENGTH_DECAY_RATE * (self.tempo - tempo))
+
+    def _entrada(self, senciante_id):
+        """
+        Obtém a entrada de uma relação ainda relevante.
+
+        Args:
+            senciante_id (str): ID do outro Senciante.
+
+        Returns:
+            list: Entrada da relação, ou None se não existir ou já tiver sido esquecida.
+        """
+        entrada = self.entradas.get(senciante_id)
+        if entrada is None or self._forca(entrada) < RELATION_STRENGTH_THRESHOLD:
+            return None
+        return entrada
+
+    def __getitem__(self, senciante_id):
+        entrada = self._entrada(senciante_id)
+        if entrada is None:
+            raise KeyError(senciante_id)
+        return {"tipo": entrada[0], "forca": self._forca(entrada)}
+
+    def __setitem__(self, senciante_id, relacao):
+        self.entradas[senciante_id] = [relacao["tipo"], relacao["forca"], self.tempo]
+
+    def __delitem__(self, senciante_id):
+        if self._entrada(senciante_id) is None:
+            raise KeyError(senciante_id)
+        del self.entradas[senciante_id]
+
+    def __contains__(self, senciante_id):
+        return self._entrada(senciante_id) is not None
+
+    def __iter__(self):
+        for senciante_id, entrada in list(self.entradas.items()):
+            if self._forca(entrada) >= RELATION_STRENGTH_THRESHOLD:
+                yield senciante_id
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def avancar(self, delta_tempo):
+        """
+        Avança o relógio das relações, compactando-as quando chegar a hora.
+
+        Args:
+            delta_tempo (float): Tempo decorrido em horas.
+        """
+        self.tempo += delta_tempo
+        if self.tempo >= self.proxima_compactacao:
+            self.compactar()
+
+    def compactar(self):
+        """
+        Remove da memória as relações já esquecidas.
+
+        Returns:
+            int: Número de relações removidas.
+        """
+        esquecidas = [senciante_id for senciante_id, entrada in self.entradas.items()
+                      if self._forca(entrada) < RELATION_STRENGTH_THRESHOLD]
+        for senciante_id in esquecidas:
+            del self.entradas[senciante_id]
+
+        self.proxima_compactacao = self.tempo + RELATION_SWEEP_INTERVAL
+        return len(esquecidas)
+
+    def to_dict(self):
+        """
+        Converte as relações para um dicionário.
+
+        Returns:
+            dict: Dicionário de senciante_id: {"tipo": tipo, "forca": valor}.
+        """
+        return {senciante_id: self[senciante_id] for senciante_id in self}
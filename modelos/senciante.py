@@ -5,15 +5,19 @@ O Senciante representa um ser artificial inteligente no mundo.
 
 import random
 from modelos.genoma import Genoma
-from modelos.memoria import Memoria
+from modelos.memoria import ArmazemMemorias
+from modelos.relacoes import RelacoesSociais
+from utils.grafo_social import VisaoRelacoes
+from modelos.recurso import Recurso
+from modelos.construcao import Construcao
+from modelos.populacao import VisaoColunar
 from utils.helpers import gerar_id, calcular_distancia, chance, mover_em_direcao
 from utils.config import (
     SENCIANTE_MAX_AGE, SENCIANTE_REPRODUCTION_MIN_AGE,
     SENCIANTE_NEEDS_DECAY_RATES, SENCIANTE_NEEDS_CRITICAL_THRESHOLDS,
     SENCIANTE_NEEDS_URGENT_THRESHOLDS, SENCIANTE_NEEDS_WEIGHTS,
     LEARNING_BASE_RATE, COMMUNICATION_EVOLUTION_STAGES,
-    COMMUNICATION_EVOLUTION_THRESHOLDS, RELATION_TYPES,
-    RELATION_STRENGTH_DECAY_RATE, RELATION_STRENGTH_THRESHOLD
+    COMMUNICATION_EVOLUTION_THRESHOLDS, RELATION_TYPES
 )
 
 class Senciante:
@@ -31,7 +35,10 @@ class Senciante:
             genoma (Genoma, optional): Genoma do Senciante. Se None, gera um genoma aleatório.
             idade_inicial (float, optional): Idade inicial em horas. Default é 0.0.
         """
-        self.id = gerar_id()
+        self.id = gerar_id("senciante")
+        self.indice_espacial = None  # IndiceEspacial ao qual o Senciante está vinculado
+        self.populacao = None  # PopulacaoColunar à qual o Senciante está vinculado
+        self.grafo_social = None  # GrafoSocial ao qual o Senciante está vinculado
         self.posicao = posicao
         self.genoma = genoma if genoma else Genoma()
         self.modificadores = self.genoma.aplicar_efeitos_mutacoes()
@@ -64,10 +71,10 @@ class Senciante:
         }
         
         # Memória
-        self.memoria = []
+        self.memoria = ArmazemMemorias(self.id)
         
         # Relações sociais
-        self.relacoes = {}  # Dicionário de senciante_id: {"tipo": tipo, "forca": valor}
+        self.relacoes = RelacoesSociais()  # Dicionário de senciante_id: {"tipo": tipo, "forca": valor}
         
         # Tecnologias conhecidas
         self.tecnologias_conhecidas = []
@@ -81,6 +88,93 @@ class Senciante:
         
         # Nível de comunicação
         self.nivel_comunicacao = 0  # Índice no COMMUNICATION_EVOLUTION_STAGES
+        
+        # Passos da simulação cobertos pela atualização de comportamento em curso (nível de detalhe)
+        self.passos_atualizacao = 1
+    
+    @property
+    def posicao(self):
+        """
+        list: Posição atual do Senciante no mundo [x, y].
+        """
+        return self._posicao
+    
+    @posicao.setter
+    def posicao(self, valor):
+        self._posicao = valor
+        
+        # Manter o índice espacial atualizado
+        if self.indice_espacial is not None:
+            self.indice_espacial.atualizar(self.id, valor)
+    
+    def vincular_indice(self, indice):
+        """
+        Vincula o Senciante a um índice espacial, que passa a ser atualizado a cada movimento.
+        
+        Args:
+            indice (IndiceEspacial): Índice espacial, ou None para desvincular.
+        """
+        if self.indice_espacial is not None and self.indice_espacial is not indice:
+            self.indice_espacial.remover(self.id)
+        
+        self.indice_espacial = indice
+        
+        if indice is not None:
+            indice.inserir(self.id, self._posicao)
+    
+    def vincular_populacao(self, populacao):
+        """
+        Vincula o Senciante a uma população colunar. Necessidades, estado e habilidades
+        passam a ser visões sobre os arrays da população.
+        
+        Args:
+            populacao (PopulacaoColunar): População colunar, ou None para desvincular.
+        """
+        if self.populacao is populacao:
+            return
+        
+        # Trazer os valores de volta para dicionários próprios antes de sair da população atual
+        if self.populacao is not None:
+            self.necessidades = dict(self.necessidades)
+            self.estado = dict(self.estado)
+            self.habilidades = dict(self.habilidades)
+            self.populacao.remover(self.id)
+        
+        self.populacao = populacao
+        
+        if populacao is not None:
+            slot = populacao.adicionar(self)
+            self.necessidades = VisaoColunar(populacao, "necessidades", slot)
+            self.estado = VisaoColunar(populacao, "estado", slot)
+            self.habilidades = VisaoColunar(populacao, "habilidades", slot)
+    
+    def vincular_grafo(self, grafo):
+        """
+        Vincula o Senciante a um grafo social. As relações próprias são mescladas no
+        grafo e `relacoes` passa a ser uma visão sobre as arestas do Senciante.
+        
+        Args:
+            grafo (GrafoSocial): Grafo social, ou None para desvincular.
+        """
+        if self.grafo_social is grafo:
+            return
+        
+        # Trazer as relações de volta para um armazém próprio antes de sair do grafo atual
+        relacoes = dict(self.relacoes.items())
+        if self.grafo_social is not None:
+            self.grafo_social.remover(self.id)
+        
+        self.grafo_social = grafo
+        
+        if grafo is None:
+            self.relacoes = RelacoesSociais(relacoes)
+            return
+        
+        grafo.adicionar(self.id)
+        self.relacoes = VisaoRelacoes(grafo, self.id)
+        # Relações também conhecidas pelo outro lado mantêm o tipo mais forte e a maior força
+        for senciante_id, relacao in relacoes.items():
+            self.estabelecer_relacao(senciante_id, relacao["tipo"], relacao["forca"])
     
     def atualizar(self, delta_tempo, mundo):
         """
@@ -90,6 +184,27 @@ class Senciante:
             delta_tempo (float): Tempo decorrido desde a última atualização em horas.
             mundo (Mundo): Objeto mundo atual.
             
+        Returns:
+            bool: True se o Senciante ainda está vivo, False se morreu.
+        """
+        if not self.atualizar_fisiologia(delta_tempo):
+            return False
+        
+        self.atualizar_comportamento(delta_tempo, mundo)
+        
+        return True
+    
+    def atualizar_fisiologia(self, delta_tempo, passos=1):
+        """
+        Atualiza idade, necessidades e saúde do Senciante e verifica se ele morreu.
+        Para uma população colunar, `PopulacaoColunar.atualizar_fisiologia` faz o mesmo
+        para todos os Senciantes de uma vez.
+        
+        Args:
+            delta_tempo (float): Tempo decorrido desde a última atualização em horas.
+            passos (int, optional): Número de passos da simulação cobertos por `delta_tempo`
+                (mais de um para Senciantes em nível de detalhe reduzido). Default é 1.
+            
         Returns:
             bool: True se o Senciante ainda está vivo, False se morreu.
         """
@@ -100,28 +215,48 @@ class Senciante:
         self._atualizar_necessidades(delta_tempo)
         
         # Atualizar saúde
-        self._atualizar_saude()
+        self._atualizar_saude(passos)
         
         # Verificar morte
-        if self._verificar_morte():
-            return False
+        return not self._verificar_morte()
+    
+    def atualizar_comportamento(self, delta_tempo, mundo, perfil=None, passos=1):
+        """
+        Executa as decisões, o aprendizado e a manutenção social e de memória do Senciante.
+        
+        Args:
+            delta_tempo (float): Tempo decorrido desde a última atualização em horas.
+            mundo (Mundo): Objeto mundo atual.
+            perfil (PerfilPassos, optional): Perfil que mede as fases do passo.
+            passos (int, optional): Número de passos da simulação cobertos por `delta_tempo`;
+                os deslocamentos percorrem a distância de todos eles. Default é 1.
+        """
+        self.passos_atualizacao = passos
         
         # Tomar decisões e agir
         self._tomar_decisao(delta_tempo, mundo)
+        if perfil is not None:
+            perfil.marcar("senciantes.decisao")
         
         # Aprender
         self._aprender(delta_tempo)
+        if perfil is not None:
+            perfil.marcar("senciantes.aprendizado")
         
         # Atualizar relações
         self._atualizar_relacoes(delta_tempo)
+        if perfil is not None:
+            perfil.marcar("senciantes.relacoes")
         
         # Atualizar memórias
         self._atualizar_memorias(delta_tempo)
+        if perfil is not None:
+            perfil.marcar("senciantes.memorias")
         
         # Atualizar nível de comunicação
         self._atualizar_nivel_comunicacao()
-        
-        return True
+        if perfil is not None:
+            perfil.marcar("senciantes.comunicacao")
     
     def _atualizar_necessidades(self, delta_tempo):
         """
@@ -151,10 +286,17 @@ class Senciante:
         for necessidade in self.necessidades:
             self.necessidades[necessidade] = max(0.0, min(1.0, self.necessidades[necessidade]))
     
-    def _atualizar_saude(self):
+    def _atualizar_saude(self, passos=1):
         """
         Atualiza o estado de saúde do Senciante com base nas necessidades.
+        
+        Args:
+            passos (int, optional): Número de passos de ajuste gradual a aplicar de uma vez. Default é 1.
         """
+        # Fração da distância até o alvo percorrida em `passos` ajustes sucessivos
+        ajuste_saude = 0.1 if passos == 1 else 1.0 - 0.9 ** passos
+        ajuste_felicidade = 0.05 if passos == 1 else 1.0 - 0.95 ** passos
+        
         # Calcular penalidades de saúde baseadas nas necessidades
         penalidade_fome = self.necessidades["fome"] * 0.5
         penalidade_sede = self.necessidades["sede"] * 0.7
@@ -169,7 +311,7 @@ class Senciante:
         ) / 5.0
         
         # Ajustar saúde gradualmente
-        self.estado["saude"] += (saude_alvo - self.estado["saude"]) * 0.1
+        self.estado["saude"] += (saude_alvo - self.estado["saude"]) * ajuste_saude
         
         # Limitar valor
         self.estado["saude"] = max(0.0, min(1.0, self.estado["saude"]))
@@ -184,7 +326,7 @@ class Senciante:
         )
         
         # Ajustar felicidade gradualmente
-        self.estado["felicidade"] += (felicidade_alvo - self.estado["felicidade"]) * 0.05
+        self.estado["felicidade"] += (felicidade_alvo - self.estado["felicidade"]) * ajuste_felicidade
         
         # Limitar valor
         self.estado["felicidade"] = max(0.0, min(1.0, self.estado["felicidade"]))
@@ -383,8 +525,7 @@ class Senciante:
             self.alvo_atual = None
         else:
             # Mover em direção ao alvo
-            velocidade = 2.0 * self.genoma.genes["velocidade"]
-            self.posicao = mover_em_direcao(self.posicao, self.alvo_atual.posicao, velocidade)
+            self._mover_ate(self.alvo_atual.posicao)
     
     def _buscar_agua(self, mundo):
         """
@@ -467,8 +608,7 @@ class Senciante:
             self.alvo_atual = None
         else:
             # Mover em direção ao alvo
-            velocidade = 2.0 * self.genoma.genes["velocidade"]
-            self.posicao = mover_em_direcao(self.posicao, self.alvo_atual.posicao, velocidade)
+            self._mover_ate(self.alvo_atual.posicao)
     
     def _descansar(self, mundo):
         """
@@ -503,8 +643,7 @@ class Senciante:
             
             if distancia > 1.0:
                 # Mover em direção ao abrigo
-                velocidade = 2.0 * self.genoma.genes["velocidade"]
-                self.posicao = mover_em_direcao(self.posicao, self.alvo_atual.posicao, velocidade)
+                self._mover_ate(self.alvo_atual.posicao)
                 return
             
             # Chegou ao abrigo, ocupá-lo
@@ -578,8 +717,7 @@ class Senciante:
             
             if distancia > 1.0:
                 # Mover em direção à água
-                velocidade = 2.0 * self.genoma.genes["velocidade"]
-                self.posicao = mover_em_direcao(self.posicao, self.alvo_atual.posicao, velocidade)
+                self._mover_ate(self.alvo_atual.posicao)
                 return
         
         # Melhorar higiene
@@ -715,8 +853,18 @@ class Senciante:
                     )
         else:
             # Mover em direção ao alvo
-            velocidade = 2.0 * self.genoma.genes["velocidade"]
-            self.posicao = mover_em_direcao(self.posicao, self.alvo_atual["posicao"], velocidade)
+            self._mover_ate(self.alvo_atual["posicao"])
+    
+    def _mover_ate(self, destino):
+        """
+        Move o Senciante em direção a um destino. Em atualizações que cobrem vários
+        passos, percorre de uma vez a distância de todos eles.
+        
+        Args:
+            destino (list): Posição de destino [x, y].
+        """
+        velocidade = 2.0 * self.genoma.genes["velocidade"] * self.passos_atualizacao
+        self.posicao = mover_em_direcao(self.posicao, destino, velocidade)
     
     def _melhorar_habilidades(self, delta_tempo):
         """
@@ -825,19 +973,8 @@ class Senciante:
             conteudo (str): Conteúdo da memória.
             importancia (float, optional): Importância da memória (0.0 a 1.0). Default é 0.5.
         """
-        # Criar nova memória
-        memoria = Memoria(tipo, conteudo, 0, importancia)  # Tempo será preenchido pelo motor de simulação
-        
-        # Adicionar à lista de memórias
-        self.memoria.append(memoria)
-        
-        # Limitar número de memórias (manter as mais importantes)
-        if len(self.memoria) > 50:
-            # Ordenar por importância (decrescente)
-            self.memoria.sort(key=lambda m: m.importancia, reverse=True)
-            
-            # Manter apenas as 50 mais importantes
-            self.memoria = self.memoria[:50]
+        # O armazém descarta a memória menos importante se a capacidade for excedida
+        self.memoria.adicionar(tipo, conteudo, importancia)
     
     def _atualizar_memorias(self, delta_tempo):
         """
@@ -846,16 +983,8 @@ class Senciante:
         Args:
             delta_tempo (float): Tempo decorrido desde a última atualização em horas.
         """
-        # Atualizar cada memória
-        memorias_atualizadas = []
-        
-        for memoria in self.memoria:
-            # Envelhecer a memória
-            if memoria.envelhecer(delta_tempo):
-                # Manter memória se ainda for relevante
-                memorias_atualizadas.append(memoria)
-        
-        self.memoria = memorias_atualizadas
+        # A importância é calculada na leitura; basta avançar o relógio do armazém
+        self.memoria.avancar(delta_tempo)
     
     def _atualizar_relacoes(self, delta_tempo):
         """
@@ -864,20 +993,10 @@ class Senciante:
         Args:
             delta_tempo (float): Tempo decorrido desde a última atualização em horas.
         """
-        # Atualizar cada relação
-        relacoes_para_remover = []
-        
-        for senciante_id, relacao in self.relacoes.items():
-            # Reduzir força da relação com o tempo
-            relacao["forca"] *= (1.0 - RELATION_STRENGTH_DECAY_RATE * delta_tempo)
-            
-            # Marcar relações fracas para remoção
-            if relacao["forca"] < RELATION_STRENGTH_THRESHOLD:
-                relacoes_para_remover.append(senciante_id)
-        
-        # Remover relações fracas
-        for senciante_id in relacoes_para_remover:
-            del self.relacoes[senciante_id]
+        # A força é calculada na leitura e as relações esquecidas saem na compactação periódica;
+        # no grafo social o relógio é o do mundo
+        if self.grafo_social is None:
+            self.relacoes.avancar(delta_tempo)
     
     def _atualizar_nivel_comunicacao(self):
         """
@@ -908,15 +1027,17 @@ class Senciante:
             tipo = "conhecido"
         
         # Atualizar relação existente ou criar nova
-        if senciante_id in self.relacoes:
+        relacao = self.relacoes.get(senciante_id)
+        if relacao is not None:
             # Atualizar tipo se for mais "forte"
             tipos_ordem = {t: i for i, t in enumerate(RELATION_TYPES)}
             
-            if tipos_ordem.get(tipo, 0) > tipos_ordem.get(self.relacoes[senciante_id]["tipo"], 0):
-                self.relacoes[senciante_id]["tipo"] = tipo
+            if tipos_ordem.get(tipo, 0) > tipos_ordem.get(relacao["tipo"], 0):
+                relacao["tipo"] = tipo
             
             # Atualizar força
-            self.relacoes[senciante_id]["forca"] = max(self.relacoes[senciante_id]["forca"], forca)
+            relacao["forca"] = max(relacao["forca"], forca)
+            self.relacoes[senciante_id] = relacao
         else:
             # Criar nova relação
             self.relacoes[senciante_id] = {
@@ -935,8 +1056,10 @@ class Senciante:
         Returns:
             bool: True se a relação foi fortalecida, False se não existe.
         """
-        if senciante_id in self.relacoes:
-            self.relacoes[senciante_id]["forca"] = min(1.0, self.relacoes[senciante_id]["forca"] + valor)
+        relacao = self.relacoes.get(senciante_id)
+        if relacao is not None:
+            relacao["forca"] = min(1.0, relacao["forca"] + valor)
+            self.relacoes[senciante_id] = relacao
             return True
         return False
     
@@ -951,11 +1074,25 @@ class Senciante:
         Returns:
             bool: True se a relação foi enfraquecida, False se não existe.
         """
-        if senciante_id in self.relacoes:
-            self.relacoes[senciante_id]["forca"] = max(0.0, self.relacoes[senciante_id]["forca"] - valor)
+        relacao = self.relacoes.get(senciante_id)
+        if relacao is not None:
+            relacao["forca"] = max(0.0, relacao["forca"] - valor)
+            self.relacoes[senciante_id] = relacao
             return True
         return False
     
+    def compartilha_relacoes(self, outro_senciante):
+        """
+        Verifica se a relação com outro Senciante é uma única aresta compartilhada.
+        
+        Args:
+            outro_senciante (Senciante): Outro Senciante.
+            
+        Returns:
+            bool: True se os dois estão vinculados ao mesmo grafo social.
+        """
+        return self.grafo_social is not None and self.grafo_social is outro_senciante.grafo_social
+    
     def comunicar(self, outro_senciante, assunto):
         """
         Tenta comunicar um assunto a outro Senciante.
@@ -993,9 +1130,10 @@ class Senciante:
                         0.8
                     )
             
-            # Fortalecer relação
+            # Fortalecer relação (uma única aresta quando os dois estão no mesmo grafo)
             self.fortalecer_relacao(outro_senciante.id, 0.1)
-            outro_senciante.fortalecer_relacao(self.id, 0.1)
+            if not self.compartilha_relacoes(outro_senciante):
+                outro_senciante.fortalecer_relacao(self.id, 0.1)
             
             # Melhorar habilidade de comunicação
             self._ganhar_experiencia("comunicacao", 0.01)
@@ -1088,7 +1226,7 @@ class Senciante:
             bool: True se o Senciante está morto, False caso contrário.
         """
         return self._verificar_morte()
-    
+
     def to_dict(self):
         """
         Converte o Senciante para um dicionário.
@@ -1100,11 +1238,11 @@ class Senciante:
             "id": self.id,
             "posicao": self.posicao,
             "genoma": self.genoma.to_dict(),
-            "necessidades": self.necessidades,
-            "estado": self.estado,
-            "habilidades": self.habilidades,
+            "necessidades": dict(self.necessidades),
+            "estado": dict(self.estado),
+            "habilidades": dict(self.habilidades),
             "memoria": [m.to_dict() for m in self.memoria],
-            "relacoes": self.relacoes,
+            "relacoes": self.relacoes.to_dict(),
             "tecnologias_conhecidas": self.tecnologias_conhecidas,
             "inventario": self.inventario,
             "atividade_atual": self.atividade_atual,
@@ -22,7 +22,7 @@ class Territorio:
             raio (float, optional): Raio do território. Se None, gera aleatoriamente.
             mundo (Mundo, optional): Objeto mundo para referência.
         """
-        self.id = gerar_id()
+        self.id = gerar_id("territorio")
         self.nome = nome if nome else self._gerar_nome_aleatorio()
         self.posicao_central = posicao_central if posicao_central else [random.uniform(0, mundo.tamanho[0]), random.uniform(0, mundo.tamanho[1])] if mundo else [50, 50]
         self.raio = raio if raio is not None else random.uniform(5, 20)
@@ -159,8 +159,8 @@ class Territorio:
         pontos_interesse = []
         
         # Adicionar recursos conhecidos pelo Senciante dentro do território
-        for memoria in senciante_explorador.memoria:
-            if memoria.tipo == "localizacao" and "recurso" in memoria.conteudo:
+        for memoria in senciante_explorador.memoria.por_tipo("localizacao"):
+            if "recurso" in memoria.conteudo:
                 # Extrair posição da memória (simplificado)
                 try:
                     pos_str = memoria.conteudo.split("em ")[-1].replace("[", "").replace("]", "")
@@ -10,7 +10,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 if __name__ == "__main__":
-    from api_server import app
+    from api_server import servir
     
     print("=== Servidor Backend Senciantes ===")
     print("Iniciando servidor na porta 5001...")
@@ -19,7 +19,7 @@ if __name__ == "__main__":
     print("=====================================")
     
     try:
-        app.run(host='0.0.0.0', port=5001, debug=True)
+        servir(port=5001)
     except KeyboardInterrupt:
         print("\nServidor parado pelo usuário.")
     except Exception as e:
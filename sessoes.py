@@ -0,0 +1,545 @@
+"""
+Gerenciador de sessões do projeto Senciantes.
+Mantém vários mundos (uma Simulacao por sessão) no mesmo processo: os passos de
+todos os mundos em execução são distribuídos por um pool limitado de threads,
+as leituras são servidas pelos snapshots publicados de cada sessão e mundos
+sem acesso por algum tempo são salvos em disco e descarregados, voltando à
+memória no próximo acesso.
+"""
+
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from simulacao import Simulacao
+from utils.canal_eventos import CanalEventos
+from utils.config import SESSION_IDLE_TIMEOUT, SESSION_MAX_WORKERS, SESSION_SNAPSHOT_DIR
+from utils.feed_alteracoes import FeedAlteracoes
+from utils.helpers import caminho_no_diretorio, gerar_uuid, log_error, log_info
+from utils.publicador_estado import PublicadorEstado
+
+# Intervalo mínimo entre snapshots publicados para os endpoints GET, em segundos
+INTERVALO_PUBLICACAO = 0.05
+
+# IDs de mundo também são nomes de arquivo dos snapshots
+_PADRAO_MUNDO_ID = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+# Subdiretório dos snapshots salvos e carregados pela API, separado dos mundos descarregados
+_DIRETORIO_SALVOS = "salvos"
+
+
+def conectar_publicacao(simulacao, intervalo_publicacao=INTERVALO_PUBLICACAO):
+    """
+    Cria o feed de alterações, o publicador de snapshots e o canal de eventos de
+    uma simulação e os registra como callbacks.
+
+    Args:
+        simulacao (Simulacao): Simulação servida pela API.
+        intervalo_publicacao (float, optional): Intervalo mínimo entre snapshots publicados.
+
+    Returns:
+        tuple: (FeedAlteracoes, PublicadorEstado, CanalEventos).
+    """
+    feed = FeedAlteracoes()
+    feed.registrar(simulacao)
+    simulacao.registrar_callback("atualizacao", feed.registrar)
+
+    publicador = PublicadorEstado(intervalo_publicacao)
+    publicador.publicar(simulacao)
+    simulacao.registrar_callback("atualizacao", publicador)
+
+    canal = CanalEventos()
+    canal.conectar(simulacao)
+
+    return feed, publicador, canal
+
+
+class Sessao:
+    """
+    Classe que representa um mundo servido pela API.
+    A trava serializa os passos e as alterações feitas pelas requisições;
+    leituras usam o snapshot publicado e não precisam dela.
+    """
+
+    def __init__(self, mundo_id, simulacao):
+        """
+        Inicializa uma nova sessão.
+
+        Args:
+            mundo_id (str): ID do mundo.
+            simulacao (Simulacao): Simulação do mundo.
+        """
+        self.mundo_id = mundo_id
+        self.simulacao = simulacao
+        self.trava = threading.RLock()
+        self.feed_alteracoes, self.publicador_estado, self.canal_eventos = conectar_publicacao(simulacao)
+
+        self.executando = False  # Se os passos do mundo estão sendo agendados
+        self.descartada = False  # Sessão descarregada ou removida; passos pendentes são ignorados
+        self.passo_pendente = False  # Passo já enviado ao pool e ainda não concluído
+        self.proximo_passo = 0.0  # Instante (time.monotonic) a partir do qual o próximo passo pode rodar
+        self.ultimo_passo = None  # Instante do último passo, para converter tempo real em tempo simulado
+        self.ultimo_acesso = time.monotonic()
+
+    def tocar(self):
+        """
+        Registra um acesso à sessão, adiando seu descarregamento.
+        """
+        self.ultimo_acesso = time.monotonic()
+
+    def avancar(self):
+        """
+        Executa um passo do mundo, convertendo o tempo real desde o último passo
+        em tempo de simulação (como o loop da simulação). Executado pelo pool.
+        """
+        try:
+            with self.trava:
+                if self.descartada or not self.executando:
+                    return
+
+                agora = time.monotonic()
+                simulacao = self.simulacao
+                if simulacao.pausada or self.ultimo_passo is None:
+                    self.ultimo_passo = agora
+                else:
+                    delta_tempo = min((agora - self.ultimo_passo) * simulacao.velocidade, 0.1)
+                    self.ultimo_passo = agora
+                    simulacao.passo(delta_tempo)
+
+                self.proximo_passo = agora + simulacao.intervalo_atualizacao
+        except Exception as e:
+            log_error(f"Erro no passo do mundo {self.mundo_id}: {e}")
+            self.executando = self.simulacao.executando = False
+        finally:
+            self.passo_pendente = False
+
+    def resumo(self):
+        """
+        Obtém um resumo da sessão para listagens.
+
+        Returns:
+            dict: ID, estado de execução, tempo de simulação e número de Senciantes.
+        """
+        return {
+            "mundo_id": self.mundo_id,
+            "carregado": True,
+            "executando": self.executando,
+            "pausada": self.simulacao.pausada,
+            "tempo_simulacao": self.simulacao.tempo_simulacao,
+            "num_senciantes": len(self.simulacao.senciantes)
+        }
+
+
+class GerenciadorSessoes:
+    """
+    Classe que mapeia IDs de mundo para sessões.
+    Uma thread agendadora envia os passos vencidos dos mundos em execução para
+    um pool limitado de threads (no máximo um passo pendente por mundo) e
+    descarrega os mundos ociosos para snapshots em disco.
+    """
+
+    def __init__(self, diretorio=SESSION_SNAPSHOT_DIR, max_trabalhadores=SESSION_MAX_WORKERS,
+                 tempo_ocioso=SESSION_IDLE_TIMEOUT):
+        """
+        Inicializa um novo gerenciador.
+
+        Args:
+            diretorio (str, optional): Diretório dos snapshots dos mundos descarregados.
+                Default é SESSION_SNAPSHOT_DIR.
+            max_trabalhadores (int, optional): Número de threads que executam os passos.
+                Default é SESSION_MAX_WORKERS.
+            tempo_ocioso (float, optional): Segundos sem acesso até um mundo ser descarregado.
+                None desativa o descarregamento. Default é SESSION_IDLE_TIMEOUT.
+        """
+        self.diretorio = diretorio
+        self.max_trabalhadores = max_trabalhadores
+        self.tempo_ocioso = tempo_ocioso
+
+        self.sessoes = {}  # Dicionário de mundo_id: Sessao carregada
+        self.executando_descarregados = set()  # Mundos descarregados que estavam em execução
+        self.trava = threading.RLock()
+
+        self.executor = ThreadPoolExecutor(max_workers=max_trabalhadores, thread_name_prefix="mundo")
+        self._thread_agendador = None
+        self._encerrar = threading.Event()
+
+    def caminho_snapshot(self, mundo_id):
+        """
+        Obtém o caminho do snapshot de um mundo descarregado.
+
+        Args:
+            mundo_id (str): ID do mundo.
+
+        Returns:
+            str: Caminho do arquivo.
+        """
+        return os.path.join(self.diretorio, f"{mundo_id}.snap")
+
+    def caminho_salvo(self, nome, extensoes=(".snap",)):
+        """
+        Obtém o caminho de um snapshot salvo ou carregado pela API (/api/mundos/<mundo_id>/salvar e
+        /carregar). Apenas nomes simples são aceitos, sempre dentro do diretório do gerenciador.
+
+        Args:
+            nome (str): Nome do arquivo.
+            extensoes (tuple, optional): Extensões aceitas. Default é (".snap",).
+
+        Returns:
+            str: Caminho do arquivo.
+
+        Raises:
+            ValueError: Se o nome for inválido.
+        """
+        return caminho_no_diretorio(os.path.join(self.diretorio, _DIRETORIO_SALVOS), nome, extensoes)
+
+    @staticmethod
+    def _validar_id(mundo_id):
+        if not isinstance(mundo_id, str) or not _PADRAO_MUNDO_ID.match(mundo_id):
+            raise ValueError("O ID do mundo deve ter de 1 a 64 letras, dígitos, '_' ou '-'.")
+
+    def _existe(self, mundo_id):
+        return mundo_id in self.sessoes or os.path.exists(self.caminho_snapshot(mundo_id))
+
+    def criar(self, mundo_id=None, iniciar=True, **parametros):
+        """
+        Cria um novo mundo.
+
+        Args:
+            mundo_id (str, optional): ID do mundo. Se None, gera um novo.
+            iniciar (bool, optional): Se True, o mundo começa em execução. Default é True.
+            **parametros: Argumentos repassados para Simulacao.
+
+        Returns:
+            Sessao: Sessão criada.
+
+        Raises:
+            ValueError: Se o ID for inválido ou já estiver em uso.
+        """
+        mundo_id = mundo_id or gerar_uuid()
+        self._validar_id(mundo_id)
+
+        if self._existe(mundo_id):
+            raise ValueError(f"O mundo {mundo_id} já existe.")
+
+        # Criar o mundo fora da trava, para não bloquear os acessos aos outros mundos
+        sessao = Sessao(mundo_id, Simulacao(**parametros))
+
+        with self.trava:
+            if self._existe(mundo_id):
+                self._descartar(sessao)
+                raise ValueError(f"O mundo {mundo_id} já existe.")
+            self.sessoes[mundo_id] = sessao
+
+        if iniciar:
+            self.iniciar_mundo(sessao)
+        return sessao
+
+    def obter(self, mundo_id):
+        """
+        Obtém a sessão de um mundo, recarregando-o do disco se tiver sido descarregado.
+        Conta como acesso ao mundo.
+
+        Args:
+            mundo_id (str): ID do mundo.
+
+        Returns:
+            Sessao: Sessão do mundo, ou None se o mundo não existir.
+        """
+        try:
+            self._validar_id(mundo_id)
+        except ValueError:
+            return None
+
+        with self.trava:
+            sessao = self.sessoes.get(mundo_id)
+            if sessao is not None:
+                sessao.tocar()
+                return sessao
+
+        caminho = self.caminho_snapshot(mundo_id)
+        if not os.path.exists(caminho):
+            return None
+
+        # Carregar o mundo fora da trava, para não bloquear os acessos aos outros mundos
+        try:
+            carregada = Sessao(mundo_id, Simulacao.carregar(caminho))
+        except FileNotFoundError:
+            # Removido enquanto era lido
+            return None
+
+        with self.trava:
+            sessao = self.sessoes.get(mundo_id)
+            if sessao is None and not os.path.exists(caminho):
+                # Removido enquanto era carregado
+                self._descartar(carregada)
+                return None
+
+            if sessao is None:
+                sessao = carregada
+                self.sessoes[mundo_id] = sessao
+                log_info(f"Mundo {mundo_id} recarregado de {caminho}")
+
+                if mundo_id in self.executando_descarregados:
+                    self.executando_descarregados.discard(mundo_id)
+                    self.iniciar_mundo(sessao)
+            else:
+                # Outro acesso carregou o mundo primeiro
+                self._descartar(carregada)
+
+            sessao.tocar()
+            return sessao
+
+    def listar(self):
+        """
+        Lista os mundos carregados e descarregados, sem recarregar nenhum.
+
+        Returns:
+            list: Resumos dos mundos, ordenados por ID.
+        """
+        with self.trava:
+            mundos = {mundo_id: sessao.resumo() for mundo_id, sessao in self.sessoes.items()}
+
+        if os.path.isdir(self.diretorio):
+            for nome in os.listdir(self.diretorio):
+                mundo_id, extensao = os.path.splitext(nome)
+                if extensao == ".snap" and mundo_id not in mundos:
+                    mundos[mundo_id] = {
+                        "mundo_id": mundo_id,
+                        "carregado": False,
+                        "executando": mundo_id in self.executando_descarregados
+                    }
+
+        return [mundos[mundo_id] for mundo_id in sorted(mundos)]
+
+    def iniciar_mundo(self, sessao):
+        """
+        Passa a agendar os passos de um mundo.
+
+        Args:
+            sessao (Sessao): Sessão do mundo.
+        """
+        with sessao.trava:
+            # Espelhado na Simulacao para que pausar/retomar funcionem e iniciar() não crie outro loop
+            sessao.executando = sessao.simulacao.executando = True
+            sessao.ultimo_passo = None
+            sessao.proximo_passo = 0.0
+        self._garantir_agendador()
+
+    def parar_mundo(self, sessao):
+        """
+        Deixa de agendar os passos de um mundo. O passo em andamento, se houver, termina normalmente.
+
+        Args:
+            sessao (Sessao): Sessão do mundo.
+        """
+        with sessao.trava:
+            sessao.executando = sessao.simulacao.executando = False
+
+    def substituir(self, mundo_id, simulacao):
+        """
+        Troca a simulação de um mundo (por exemplo, por um snapshot carregado), mantendo o ID
+        e o estado de execução.
+
+        Args:
+            mundo_id (str): ID do mundo.
+            simulacao (Simulacao): Nova simulação.
+
+        Returns:
+            Sessao: Nova sessão do mundo.
+        """
+        with self.trava:
+            anterior = self.sessoes.get(mundo_id)
+            executando = anterior.executando if anterior else False
+            if anterior is not None:
+                self._descartar(anterior)
+
+            sessao = Sessao(mundo_id, simulacao)
+            self.sessoes[mundo_id] = sessao
+
+        if executando:
+            self.iniciar_mundo(sessao)
+        return sessao
+
+    def remover(self, mundo_id):
+        """
+        Remove um mundo da memória e do disco.
+
+        Args:
+            mundo_id (str): ID do mundo.
+
+        Returns:
+            bool: True se o mundo existia.
+        """
+        try:
+            self._validar_id(mundo_id)
+        except ValueError:
+            return False
+
+        with self.trava:
+            sessao = self.sessoes.pop(mundo_id, None)
+            if sessao is not None:
+                self._descartar(sessao)
+
+            caminho = self.caminho_snapshot(mundo_id)
+            existia_em_disco = os.path.exists(caminho)
+            if existia_em_disco:
+                os.remove(caminho)
+            self.executando_descarregados.discard(mundo_id)
+
+        return sessao is not None or existia_em_disco
+
+    def descarregar(self, mundo_id, acessado_antes_de=None):
+        """
+        Salva o snapshot de um mundo em disco e o retira da memória.
+
+        Args:
+            mundo_id (str): ID do mundo.
+            acessado_antes_de (float, optional): Se informado, o mundo só é descarregado se o último
+                acesso (time.monotonic) for anterior a esse instante, verificado sob a trava.
+
+        Returns:
+            bool: True se o mundo estava carregado e foi descarregado.
+        """
+        with self.trava:
+            sessao = self.sessoes.get(mundo_id)
+            if sessao is None:
+                return False
+            if acessado_antes_de is not None and sessao.ultimo_acesso >= acessado_antes_de:
+                # Acessado depois de ser escolhido para o descarregamento
+                return False
+
+            os.makedirs(self.diretorio, exist_ok=True)
+            caminho = self.caminho_snapshot(mundo_id)
+            with sessao.trava:
+                # Gravar em um arquivo temporário para não deixar um snapshot pela metade
+                sessao.simulacao.salvar(caminho + ".tmp")
+                os.replace(caminho + ".tmp", caminho)
+                if sessao.executando:
+                    self.executando_descarregados.add(mundo_id)
+                self._descartar(sessao)
+
+            del self.sessoes[mundo_id]
+
+        log_info(f"Mundo {mundo_id} descarregado para {caminho}")
+        return True
+
+    def descarregar_ociosos(self, agora=None):
+        """
+        Descarrega os mundos sem acesso há mais de `tempo_ocioso` segundos.
+
+        Args:
+            agora (float, optional): Instante atual (time.monotonic). Default é o relógio atual.
+
+        Returns:
+            list: IDs dos mundos descarregados.
+        """
+        if self.tempo_ocioso is None:
+            return []
+
+        agora = time.monotonic() if agora is None else agora
+        limite = agora - self.tempo_ocioso
+        with self.trava:
+            ociosos = [mundo_id for mundo_id, sessao in self.sessoes.items() if sessao.ultimo_acesso < limite]
+
+        descarregados = []
+        for mundo_id in ociosos:
+            try:
+                # A ociosidade é verificada de novo: o mundo pode ter sido acessado desde a listagem
+                if self.descarregar(mundo_id, acessado_antes_de=limite):
+                    descarregados.append(mundo_id)
+            except Exception as e:
+                log_error(f"Erro ao descarregar o mundo {mundo_id}: {e}")
+        return descarregados
+
+    def _descartar(self, sessao):
+        """
+        Marca uma sessão como descartada e fecha seus recursos.
+
+        Args:
+            sessao (Sessao): Sessão a descartar.
+        """
+        with sessao.trava:
+            sessao.descartada = True
+            sessao.executando = sessao.simulacao.executando = False
+            sessao.simulacao.desativar_particionamento()
+            sessao.simulacao.mundo.historico.fechar_log_eventos()
+
+    def agendar_passos(self, agora=None):
+        """
+        Envia ao pool os passos vencidos dos mundos em execução.
+
+        Args:
+            agora (float, optional): Instante atual (time.monotonic). Default é o relógio atual.
+
+        Returns:
+            float: Instante do próximo passo agendado, ou None se nenhum mundo estiver em execução.
+        """
+        agora = time.monotonic() if agora is None else agora
+        proximo = None
+
+        with self.trava:
+            sessoes = list(self.sessoes.values())
+
+        for sessao in sessoes:
+            if not sessao.executando or sessao.passo_pendente:
+                continue
+            if sessao.proximo_passo <= agora:
+                sessao.passo_pendente = True
+                self.executor.submit(sessao.avancar)
+            elif proximo is None or sessao.proximo_passo < proximo:
+                proximo = sessao.proximo_passo
+
+        return proximo
+
+    def _garantir_agendador(self):
+        """
+        Inicia a thread agendadora, se ainda não estiver rodando.
+        """
+        with self.trava:
+            if self._thread_agendador is not None and self._thread_agendador.is_alive():
+                return
+            self._encerrar.clear()
+            self._thread_agendador = threading.Thread(target=self._loop_agendador, name="agendador-mundos")
+            self._thread_agendador.daemon = True
+            self._thread_agendador.start()
+
+    def _loop_agendador(self):
+        """
+        Loop da thread agendadora.
+        """
+        ultima_verificacao = time.monotonic()
+        while not self._encerrar.is_set():
+            agora = time.monotonic()
+            proximo = self.agendar_passos(agora)
+
+            # Verificar mundos ociosos algumas vezes por período de ociosidade
+            if self.tempo_ocioso is not None and agora - ultima_verificacao >= min(self.tempo_ocioso / 4, 10.0):
+                ultima_verificacao = agora
+                self.descarregar_ociosos(agora)
+
+            espera = 0.05 if proximo is None else min(max(proximo - time.monotonic(), 0.001), 0.05)
+            self._encerrar.wait(espera)
+
+    def encerrar(self, descarregar=True):
+        """
+        Para o agendador e o pool. Com `descarregar`, salva todos os mundos em disco.
+
+        Args:
+            descarregar (bool, optional): Se True, descarrega todos os mundos. Default é True.
+        """
+        self._encerrar.set()
+        if self._thread_agendador is not None:
+            self._thread_agendador.join(timeout=5.0)
+            self._thread_agendador = None
+        self.executor.shutdown(wait=True)
+
+        with self.trava:
+            mundos = list(self.sessoes)
+        for mundo_id in mundos:
+            if descarregar:
+                self.descarregar(mundo_id)
+            else:
+                with self.trava:
+                    self._descartar(self.sessoes.pop(mundo_id))
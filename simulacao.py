@@ -3,11 +3,18 @@ import threading
 import random
 from modelos.mundo import Mundo
 from modelos.senciante import Senciante
+from modelos.populacao import PopulacaoColunar
+from modelos.particionamento import ParticionamentoEspacial
+from modelos.nivel_detalhe import AgendadorNivelDetalhe
 from utils.config import (
     DEFAULT_WORLD_SIZE, DEFAULT_INITIAL_SENCIANTES,
-    DEFAULT_SIMULATION_SPEED, DEFAULT_UPDATE_INTERVAL
+    DEFAULT_SIMULATION_SPEED, DEFAULT_UPDATE_INTERVAL,
+    SENCIANTE_MAX_AGE
 )
 from utils.helpers import posicao_aleatoria, log_info, log_error
+from utils.persistencia import salvar_snapshot, carregar_snapshot
+from utils.perfil import PerfilPassos
+from utils.registro_entidades import registro_entidades
 
 class Simulacao:
     """
@@ -15,13 +22,18 @@ class Simulacao:
     Coordena a atualização do mundo e dos Senciantes.
     """
     
-    def __init__(self, tamanho_mundo=None, num_senciantes_inicial=None):
+    def __init__(self, tamanho_mundo=None, num_senciantes_inicial=None, populacao_colunar=False,
+                 diretorio_log_eventos=None):
         """
         Inicializa uma nova Simulação.
         
         Args:
             tamanho_mundo (list, optional): Tamanho do mundo [largura, altura]. Default é DEFAULT_WORLD_SIZE.
             num_senciantes_inicial (int, optional): Número inicial de Senciantes. Default é DEFAULT_INITIAL_SENCIANTES.
+            populacao_colunar (bool, optional): Se True, guarda a fisiologia dos Senciantes em arrays
+                NumPy e a atualiza de forma vetorizada. Default é False.
+            diretorio_log_eventos (str, optional): Se informado, todos os eventos do histórico
+                também são gravados em um log em disco nesse diretório.
         """
         # Garante que tamanho_mundo seja uma tupla
         self.tamanho_mundo = tuple(tamanho_mundo) if tamanho_mundo else tuple(DEFAULT_WORLD_SIZE)
@@ -29,11 +41,28 @@ class Simulacao:
         
         # Criar mundo
         self.mundo = Mundo(self.tamanho_mundo)
+        if diretorio_log_eventos:
+            self.mundo.historico.ativar_log_eventos(diretorio_log_eventos)
         
         # Criar Senciantes iniciais
         self.senciantes = {}  # Dicionário de id: Senciante
         self._criar_senciantes_iniciais()
         
+        # Armazenamento colunar opcional da população
+        self.populacao = None
+        if populacao_colunar:
+            self.populacao = PopulacaoColunar(capacidade_inicial=max(64, len(self.senciantes) * 2))
+            self.populacao.sincronizar(self.senciantes)
+        
+        # Perfil de desempenho por fase (desativado por padrão)
+        self.perfil = None
+        
+        # Passo particionado em tiles e processos (desativado por padrão)
+        self.particionamento = None
+        
+        # Nível de detalhe da atualização dos Senciantes (desativado por padrão)
+        self.nivel_detalhe = None
+        
         # Configurações de simulação
         self.velocidade = DEFAULT_SIMULATION_SPEED
         self.intervalo_atualizacao = DEFAULT_UPDATE_INTERVAL
@@ -182,6 +211,10 @@ class Simulacao:
             self.thread_simulacao.join(timeout=1.0)
             self.thread_simulacao = None
         
+        # Gravar em disco os eventos pendentes do log
+        if self.mundo.historico.log_eventos is not None:
+            self.mundo.historico.log_eventos.sincronizar()
+        
         log_info("Simulação parada")
         return True
     
@@ -225,24 +258,8 @@ class Simulacao:
                 # Limitar delta tempo para evitar saltos muito grandes
                 delta_tempo_simulacao = min(delta_tempo_simulacao, 0.1)
                 
-                # Atualizar tempo de simulação
-                self.tempo_simulacao += delta_tempo_simulacao
-                
-                # Atualizar simulação
-                self._atualizar(delta_tempo_simulacao)
-                
-                # Processar eventos pendentes
-                self._processar_eventos_pendentes()
-                
-                # Processar ações divinas pendentes
-                self._processar_acoes_divinas_pendentes()
-                
-                # Chamar callbacks de atualização
-                for callback in self.callbacks["atualizacao"]:
-                    try:
-                        callback(self)
-                    except Exception as e:
-                        log_error(f"Erro em callback de atualização: {e}")
+                # Avançar a simulação
+                self.passo(delta_tempo_simulacao)
                 
                 # Aguardar intervalo de atualização
                 time.sleep(self.intervalo_atualizacao)
@@ -251,22 +268,144 @@ class Simulacao:
             log_error(f"Erro no loop de simulação: {e}")
             self.executando = False
 
-    def _atualizar(self, delta_tempo):
+    def passo(self, delta_tempo):
+        """
+        Avança a simulação em um único passo de tempo fixo, sem consultar o relógio real.
+        
+        Args:
+            delta_tempo (float): Tempo de simulação a avançar, em horas.
+        """
+        perfil = self.perfil
+        if perfil is not None:
+            perfil.iniciar_passo()
+        
+        # Atualizar tempo de simulação
+        self.tempo_simulacao += delta_tempo
+        
+        # Atualizar simulação
+        self._atualizar(delta_tempo, perfil)
+        
+        # Processar eventos pendentes
+        self._processar_eventos_pendentes()
+        if perfil is not None:
+            perfil.marcar("eventos")
+        
+        # Processar ações divinas pendentes
+        self._processar_acoes_divinas_pendentes()
+        if perfil is not None:
+            perfil.marcar("acoes_divinas")
+        
+        # Chamar callbacks de atualização
+        for callback in self.callbacks["atualizacao"]:
+            try:
+                callback(self)
+            except Exception as e:
+                log_error(f"Erro em callback de atualização: {e}")
+        
+        if perfil is not None:
+            perfil.marcar("callbacks")
+            contagens = {
+                "senciantes": len(self.senciantes),
+                "recursos": len(self.mundo.recursos),
+                "construcoes": len(self.mundo.construcoes),
+                "eventos_pendentes": len(self.eventos_pendentes)
+            }
+            if self.nivel_detalhe is not None:
+                for nivel, quantidade in self.nivel_detalhe.contagens().items():
+                    contagens[f"senciantes_{nivel}"] = quantidade
+            perfil.finalizar_passo(contagens)
+    
+    def executar_lote(self, delta_tempo=DEFAULT_UPDATE_INTERVAL, num_passos=None, tempo_final=None):
+        """
+        Executa a simulação sem interface e sem pausas, o mais rápido que a CPU permitir.
+        Para após `num_passos` passos ou quando o tempo de simulação atingir `tempo_final`,
+        o que ocorrer primeiro.
+        
+        Args:
+            delta_tempo (float, optional): Passo fixo de tempo em horas. Default é DEFAULT_UPDATE_INTERVAL.
+            num_passos (int, optional): Número máximo de passos a executar.
+            tempo_final (float, optional): Tempo de simulação (em horas) em que a execução termina.
+            
+        Returns:
+            dict: Resumo da execução (passos, tempo simulado, tempo real e passos por segundo).
+        """
+        if delta_tempo <= 0:
+            raise ValueError("delta_tempo deve ser positivo.")
+        if num_passos is None and tempo_final is None:
+            raise ValueError("Informe num_passos ou tempo_final.")
+        
+        passos = 0
+        inicio = time.perf_counter()
+        
+        while True:
+            if num_passos is not None and passos >= num_passos:
+                break
+            # Tolerância para acúmulo de erro de ponto flutuante no tempo de simulação
+            if tempo_final is not None and self.tempo_simulacao >= tempo_final - delta_tempo * 1e-6:
+                break
+            
+            self.passo(delta_tempo)
+            passos += 1
+        
+        tempo_real = time.perf_counter() - inicio
+        
+        return {
+            "passos": passos,
+            "delta_tempo": delta_tempo,
+            "tempo_simulacao": self.tempo_simulacao,
+            "tempo_real": tempo_real,
+            "passos_por_segundo": passos / tempo_real if tempo_real > 0 else float("inf"),
+            "num_senciantes": len(self.senciantes),
+            "estatisticas": dict(self.estatisticas)
+        }
+    
+    def _atualizar(self, delta_tempo, perfil=None):
         """
         Atualiza o estado da simulação.
 
         Args:
             delta_tempo (float): Tempo decorrido desde a última atualização em horas.
+            perfil (PerfilPassos, optional): Perfil que mede as fases do passo.
         """
         # Atualizar mundo
         self.mundo.atualizar(delta_tempo)
+        if perfil is not None:
+            perfil.marcar("mundo")
 
         # Atualizar Senciantes
         senciantes_mortos = []
 
-        for senciante_id, senciante in self.senciantes.items():
+        # Com população colunar, a fisiologia de todos é atualizada de uma vez
+        mortos_fisiologia = None
+        if self.populacao is not None:
+            self.populacao.sincronizar(self.senciantes)
+            if self.particionamento is not None:
+                # Fisiologia vetorizada e comportamento tile a tile, seguido da troca de halo
+                mortos_fisiologia = set(self.particionamento.atualizar(
+                    self.senciantes, self.populacao, self.mundo, delta_tempo
+                ))
+                if perfil is not None:
+                    perfil.marcar("senciantes.tiles")
+            else:
+                mortos_fisiologia = set(self.populacao.atualizar_fisiologia(delta_tempo))
+                if perfil is not None:
+                    perfil.marcar("senciantes.fisiologia")
+
+        nivel_detalhe = self.nivel_detalhe if self.particionamento is None else None
+        for senciante_id, senciante, delta_senciante, passos in self._senciantes_a_atualizar(delta_tempo, mortos_fisiologia):
             # Atualizar Senciante
-            if not senciante.atualizar(delta_tempo, self.mundo):
+            if mortos_fisiologia is None:
+                vivo = senciante.atualizar_fisiologia(delta_senciante, passos)
+                if perfil is not None:
+                    perfil.marcar("senciantes.fisiologia")
+            else:
+                vivo = senciante_id not in mortos_fisiologia
+            if vivo and self.particionamento is None:
+                senciante.atualizar_comportamento(delta_senciante, self.mundo, perfil, passos)
+                if nivel_detalhe is not None:
+                    nivel_detalhe.reagendar(senciante, delta_tempo)
+
+            if not vivo:
                 # Senciante morreu
                 senciantes_mortos.append(senciante_id)
 
@@ -288,15 +427,27 @@ class Simulacao:
                     except Exception as e:
                         log_error(f"Erro em callback de morte: {e}")
 
+                if perfil is not None:
+                    perfil.marcar("senciantes.mortes")
+
         # Remover Senciantes mortos
         for senciante_id in senciantes_mortos:
+            self.senciantes[senciante_id].vincular_indice(None)
+            self.senciantes[senciante_id].vincular_populacao(None)
+            self.senciantes[senciante_id].vincular_grafo(None)
             del self.senciantes[senciante_id]
+        if perfil is not None:
+            perfil.marcar("senciantes.mortes")
 
         # Processar interações entre Senciantes
         self._processar_interacoes()
+        if perfil is not None:
+            perfil.marcar("interacoes")
 
         # Chance de reprodução
         self._processar_reproducao()
+        if perfil is not None:
+            perfil.marcar("reproducao")
 
         # Registrar estatísticas no histórico
         self.mundo.historico.registrar_estatisticas(
@@ -304,6 +455,32 @@ class Simulacao:
             len(self.senciantes),
             self._contar_recursos()
         )
+        if perfil is not None:
+            perfil.marcar("estatisticas")
+    
+    def _senciantes_a_atualizar(self, delta_tempo, mortos_fisiologia):
+        """
+        Obtém os Senciantes a atualizar no passo. Com nível de detalhe, apenas os que
+        têm a vez no passo, com o tempo acumulado desde a última atualização.
+        
+        Args:
+            delta_tempo (float): Tempo do passo em horas.
+            mortos_fisiologia (set): IDs dos mortos na fisiologia colunar, ou None.
+            
+        Yields:
+            tuple: (senciante_id, Senciante, tempo a integrar, número de passos).
+        """
+        if self.nivel_detalhe is None or self.particionamento is not None:
+            for senciante_id, senciante in self.senciantes.items():
+                yield senciante_id, senciante, delta_tempo, 1
+            return
+        
+        atualizacoes = self.nivel_detalhe.avancar(delta_tempo, self.senciantes)
+        # Mortos na fisiologia colunar fora da vez também precisam ser processados
+        for senciante_id in (mortos_fisiologia or ()):
+            atualizacoes.setdefault(senciante_id, (delta_tempo, 1))
+        for senciante_id, (delta_senciante, passos) in atualizacoes.items():
+            yield senciante_id, self.senciantes[senciante_id], delta_senciante, passos
     
     def _determinar_causa_morte(self, senciante):
         """
@@ -322,7 +499,7 @@ class Simulacao:
             return "sede"
         elif senciante.estado["saude"] <= 0.1:
             return "doença"
-        elif senciante.idade > senciante.modificadores.get("longevidade", 1.0) * 0.9:
+        elif senciante.estado["idade"] > SENCIANTE_MAX_AGE * senciante.modificadores.get("longevidade", 1.0) * 0.9:
             return "velhice"
         else:
             return "desconhecida"
@@ -365,30 +542,12 @@ class Simulacao:
         """
         Processa interações entre Senciantes próximos.
         """
-        # Lista de pares de Senciantes que já interagiram neste ciclo
-        interacoes_processadas = set()
+        # Garantir que o índice espacial reflete o dicionário de Senciantes
+        self.mundo.sincronizar_senciantes(self.senciantes)
         
-        # Para cada Senciante
-        for senciante_id, senciante in self.senciantes.items():
-            # Encontrar Senciantes próximos
-            for outro_id, outro in self.senciantes.items():
-                # Ignorar a si mesmo
-                if senciante_id == outro_id:
-                    continue
-                
-                # Verificar se já interagiram neste ciclo
-                par = tuple(sorted([senciante_id, outro_id]))
-                if par in interacoes_processadas:
-                    continue
-                
-                # Calcular distância
-                distancia = ((senciante.posicao[0] - outro.posicao[0])**2 + 
-                             (senciante.posicao[1] - outro.posicao[1])**2)**0.5
-                
-                # Interagir se estiverem próximos
-                if distancia <= 2.0:
-                    self._interagir(senciante, outro)
-                    interacoes_processadas.add(par)
+        # Cada par próximo é gerado uma única vez pelo índice espacial
+        for senciante_id, outro_id in self.mundo.indice_senciantes.pares_proximos(2.0):
+            self._interagir(self.senciantes[senciante_id], self.senciantes[outro_id])
     
     def _interagir(self, senciante1, senciante2):
         """
@@ -398,16 +557,25 @@ class Simulacao:
             senciante1 (Senciante): Primeiro Senciante.
             senciante2 (Senciante): Segundo Senciante.
         """
+        # A interação devolve os dois à atualização a cada passo
+        if self.nivel_detalhe is not None:
+            self.nivel_detalhe.promover(senciante1.id)
+            self.nivel_detalhe.promover(senciante2.id)
+        
+        # No grafo social a relação é uma única aresta, vista pelos dois lados
+        compartilhada = senciante1.compartilha_relacoes(senciante2)
+        
         # Estabelecer relação se não existir
         if senciante2.id not in senciante1.relacoes:
             senciante1.estabelecer_relacao(senciante2.id, "conhecido", 0.3)
         
-        if senciante1.id not in senciante2.relacoes:
+        if not compartilhada and senciante1.id not in senciante2.relacoes:
             senciante2.estabelecer_relacao(senciante1.id, "conhecido", 0.3)
         
         # Fortalecer relação existente
         senciante1.fortalecer_relacao(senciante2.id, 0.05)
-        senciante2.fortalecer_relacao(senciante1.id, 0.05)
+        if not compartilhada:
+            senciante2.fortalecer_relacao(senciante1.id, 0.05)
         
         # Reduzir necessidade social
         senciante1.necessidades["social"] = max(0.0, senciante1.necessidades["social"] - 0.1)
@@ -446,63 +614,52 @@ class Simulacao:
         """
         Processa a reprodução entre Senciantes.
         """
-        # Lista de pares de Senciantes que já tentaram reproduzir neste ciclo
-        reproducoes_processadas = set()
+        # Garantir que o índice espacial reflete o dicionário de Senciantes
+        self.mundo.sincronizar_senciantes(self.senciantes)
+        
+        # Senciantes aptos a reproduzir neste ciclo
+        aptos = {
+            senciante_id for senciante_id, senciante in self.senciantes.items()
+            if senciante.pode_reproduzir()
+        }
+        if len(aptos) < 2:
+            return
         
-        # Para cada Senciante
-        for senciante_id, senciante in self.senciantes.items():
-            # Verificar se pode reproduzir
-            if not senciante.pode_reproduzir():
+        # Cada par próximo é gerado uma única vez pelo índice espacial
+        for senciante_id, outro_id in self.mundo.indice_senciantes.pares_proximos(2.0):
+            # Verificar se ambos podem reproduzir
+            if senciante_id not in aptos or outro_id not in aptos:
                 continue
             
-            # Encontrar parceiros potenciais
-            for outro_id, outro in self.senciantes.items():
-                # Ignorar a si mesmo
-                if senciante_id == outro_id:
+            senciante = self.senciantes[senciante_id]
+            outro = self.senciantes[outro_id]
+            
+            # Chance de reprodução
+            if random.random() < 0.5:
+                # Criar novo Senciante
+                novo_senciante = senciante.reproduzir(outro)
+                if novo_senciante is None:
                     continue
                 
-                # Verificar se já tentaram reproduzir neste ciclo
-                par = tuple(sorted([senciante_id, outro_id]))
-                if par in reproducoes_processadas:
-                    continue
+                # Adicionar ao mundo
+                self.senciantes[novo_senciante.id] = novo_senciante
                 
-                # Verificar se o outro pode reproduzir
-                if not outro.pode_reproduzir():
-                    continue
+                # Registrar nascimento no histórico
+                self.mundo.historico.registrar_nascimento(
+                    self.tempo_simulacao,
+                    novo_senciante.id,
+                    [senciante.id, outro.id]
+                )
                 
-                # Calcular distância
-                distancia = ((senciante.posicao[0] - outro.posicao[0])**2 + 
-                             (senciante.posicao[1] - outro.posicao[1])**2)**0.5
+                # Atualizar estatísticas
+                self.estatisticas["nascimentos"] += 1
                 
-                # Reproduzir se estiverem próximos
-                if distancia <= 2.0:
-                    # Chance de reprodução
-                    if random.random() < 0.5:
-                        # Criar novo Senciante
-                        novo_senciante = Senciante(senciante.posicao, 
-                                                   progenitores=[senciante.id, outro.id])
-                        
-                        # Adicionar ao mundo
-                        self.senciantes[novo_senciante.id] = novo_senciante
-                        
-                        # Registrar nascimento no histórico
-                        self.mundo.historico.registrar_nascimento(
-                            self.tempo_simulacao,
-                            novo_senciante.id,
-                            [senciante.id, outro.id]
-                        )
-                        
-                        # Atualizar estatísticas
-                        self.estatisticas["nascimentos"] += 1
-                        
-                        # Chamar callbacks de nascimento
-                        for callback in self.callbacks["nascimento"]:
-                            try:
-                                callback(self, novo_senciante.id)
-                            except Exception as e:
-                                log_error(f"Erro em callback de nascimento: {e}")
-                    
-                    reproducoes_processadas.add(par)
+                # Chamar callbacks de nascimento
+                for callback in self.callbacks["nascimento"]:
+                    try:
+                        callback(self, novo_senciante.id)
+                    except Exception as e:
+                        log_error(f"Erro em callback de nascimento: {e}")
     
     def _processar_eventos_pendentes(self):
         """
@@ -511,6 +668,12 @@ class Simulacao:
         for evento in self.eventos_pendentes:
             tipo = evento["tipo"]
             
+            # Os Senciantes envolvidos voltam à atualização a cada passo
+            if self.nivel_detalhe is not None:
+                for chave in ("proprietario_id", "inventor_id"):
+                    if chave in evento:
+                        self.nivel_detalhe.promover(evento[chave])
+            
             if tipo == "construcao":
                 # Criar construção
                 self.mundo.adicionar_construcao(
@@ -595,6 +758,9 @@ class Simulacao:
                 senciante_id = acao["senciante_id"]
                 if senciante_id in self.senciantes:
                     senciante = self.senciantes[senciante_id]
+                    if self.nivel_detalhe is not None:
+                        # As necessidades mudaram: reclassificar no próximo passo
+                        self.nivel_detalhe.promover(senciante_id)
                     
                     if "saude" in acao:
                         senciante.estado["saude"] = max(0.0, min(1.0, senciante.estado["saude"] + acao["saude"]))
@@ -688,6 +854,142 @@ class Simulacao:
             log_error(f"Callback não encontrado para o tipo {tipo}")
             return False
     
+    def __getstate__(self):
+        """
+        Estado usado nos snapshots. A thread de execução e os callbacks pertencem
+        ao processo atual e não são salvos; a simulação restaurada volta parada.
+        """
+        estado = self.__dict__.copy()
+        estado["thread_simulacao"] = None
+        estado["executando"] = False
+        estado["pausada"] = False
+        estado["callbacks"] = {tipo: [] for tipo in self.callbacks}
+        # Os processos trabalhadores e a memória compartilhada do particionamento também pertencem ao processo atual
+        estado["particionamento"] = None
+        # Os contadores de IDs são do processo; o snapshot leva os números já usados
+        estado["contadores_ids"] = registro_entidades.estado()
+        return estado
+    
+    def __setstate__(self, estado):
+        # Novos IDs não podem repetir os das entidades carregadas
+        registro_entidades.reservar(estado.pop("contadores_ids", {}))
+        self.__dict__.update(estado)
+    
+    def ativar_perfil(self, janela=1000, arquivo_trace=None):
+        """
+        Ativa a medição do tempo gasto em cada fase dos passos.
+        
+        Args:
+            janela (int, optional): Número de passos mantidos nos histogramas. Default é 1000.
+            arquivo_trace (str, optional): Arquivo onde gravar uma linha JSON por passo.
+            
+        Returns:
+            PerfilPassos: Perfil ativado.
+        """
+        self.desativar_perfil()
+        self.perfil = PerfilPassos(janela, arquivo_trace)
+        return self.perfil
+    
+    def desativar_perfil(self):
+        """
+        Desativa a medição de fases e fecha o arquivo de trace, se houver.
+        """
+        perfil = self.perfil
+        self.perfil = None
+        if perfil is not None:
+            perfil.fechar()
+    
+    def ativar_nivel_detalhe(self, intervalos=None):
+        """
+        Ativa o nível de detalhe: Senciantes parados ou se deslocando, longe de urgências,
+        interações, eventos e regiões observadas, passam a ser atualizados a cada poucos
+        passos, com o tempo acumulado. Sem efeito enquanto o particionamento estiver ativo.
+        
+        Args:
+            intervalos (dict, optional): Dicionário de nível: passos entre atualizações.
+                Default é LOD_INTERVALS.
+            
+        Returns:
+            AgendadorNivelDetalhe: Agendador ativado.
+        """
+        self.nivel_detalhe = AgendadorNivelDetalhe(intervalos)
+        return self.nivel_detalhe
+    
+    def desativar_nivel_detalhe(self):
+        """
+        Volta a atualizar todos os Senciantes a cada passo. Os que estavam fora da vez
+        recebem antes o tempo acumulado, sem agir.
+        """
+        nivel_detalhe = self.nivel_detalhe
+        self.nivel_detalhe = None
+        if nivel_detalhe is None:
+            return
+        
+        for senciante_id, (passo, tempo) in nivel_detalhe.ultima.items():
+            senciante = self.senciantes.get(senciante_id)
+            if senciante is not None and passo < nivel_detalhe.passo and self.populacao is None:
+                senciante.atualizar_fisiologia(nivel_detalhe.tempo - tempo, nivel_detalhe.passo - passo)
+    
+    def ativar_particionamento(self, processos=None, tiles=None, halo=None):
+        """
+        Ativa o passo particionado: o mapa é dividido em tiles e o comportamento dos
+        Senciantes de cada tile é atualizado em processos trabalhadores (com um processo,
+        no próprio processo principal). Usa a população colunar, que é criada se ainda não existir.
+        
+        Args:
+            processos (int, optional): Número de processos. Default é o número de CPUs.
+            tiles (tuple, optional): Número de tiles (colunas, linhas). Default é PARTITION_TILES.
+            halo (float, optional): Largura da borda replicada entre tiles. Default é PARTITION_HALO.
+            
+        Returns:
+            ParticionamentoEspacial: Particionamento ativado.
+        """
+        self.desativar_particionamento()
+        if self.populacao is None:
+            self.populacao = PopulacaoColunar(capacidade_inicial=max(64, len(self.senciantes) * 2))
+            self.populacao.sincronizar(self.senciantes)
+        self.particionamento = ParticionamentoEspacial(self.tamanho_mundo, processos, tiles, halo)
+        return self.particionamento
+    
+    def desativar_particionamento(self):
+        """
+        Desativa o passo particionado, encerrando os processos trabalhadores e liberando a memória compartilhada.
+        """
+        particionamento = self.particionamento
+        self.particionamento = None
+        if particionamento is not None:
+            particionamento.fechar()
+    
+    def salvar(self, caminho):
+        """
+        Salva um snapshot binário completo da simulação.
+        
+        Args:
+            caminho (str): Caminho do arquivo.
+        """
+        salvar_snapshot(self, caminho)
+        log_info(f"Snapshot da simulação salvo em {caminho}")
+    
+    @staticmethod
+    def carregar(caminho):
+        """
+        Restaura uma simulação a partir de um snapshot salvo com `salvar`.
+        
+        Args:
+            caminho (str): Caminho do arquivo.
+            
+        Returns:
+            Simulacao: Simulação restaurada (parada, sem callbacks registrados).
+            
+        Raises:
+            TypeError: Se o snapshot não contiver uma Simulacao.
+        """
+        simulacao = carregar_snapshot(caminho)
+        if not isinstance(simulacao, Simulacao):
+            raise TypeError(f"O snapshot em {caminho} não contém uma Simulacao")
+        log_info(f"Simulação restaurada de {caminho}")
+        return simulacao
+    
     def obter_estado(self):
         """
         Retorna o estado atual da simulação.
@@ -3,6 +3,7 @@ import time
 import json
 import uuid
 from enum import Enum
+from utils.persistencia import salvar_snapshot, carregar_snapshot
 
 class TipoEvento(Enum):
     NASCIMENTO = "nascimento"
@@ -1384,16 +1385,13 @@ class Simulacao:
 
 # Função para salvar o estado da simulação
 def salvar_simulacao(simulacao, caminho):
-    """Salva o estado da simulação em um arquivo JSON."""
-    with open(caminho, 'w') as f:
-        json.dump(simulacao.to_dict(), f, indent=2)
+    """Salva um snapshot binário completo da simulação."""
+    salvar_snapshot(simulacao, caminho)
 
 # Função para carregar o estado da simulação
 def carregar_simulacao(caminho):
-    """Carrega o estado da simulação de um arquivo JSON."""
-    # Implementação simplificada: criar uma nova simulação
-    # Em uma implementação completa, reconstruiríamos a simulação a partir dos dados
-    return Simulacao()
+    """Restaura a simulação a partir de um snapshot salvo com salvar_simulacao."""
+    return carregar_snapshot(caminho)
 
 # Exemplo de uso
 if __name__ == "__main__":
@@ -1405,7 +1403,7 @@ if __name__ == "__main__":
         simulacao.atualizar()
     
     # Salvar estado
-    salvar_simulacao(simulacao, "simulacao_estado.json")
+    salvar_simulacao(simulacao, "simulacao_estado.snap")
     
     print("Simulação inicializada e executada com sucesso!")
 
@@ -0,0 +1,46 @@
+"""
+Testes unitários para o módulo Agenda.
+"""
+
+import unittest
+
+from utils.agenda import Agenda
+
+class TestAgenda(unittest.TestCase):
+    """
+    Testes para a classe Agenda.
+    """
+
+    def test_vencidos_em_ordem(self):
+        """
+        Testa se apenas os itens vencidos saem, em ordem de vencimento e de agendamento.
+        """
+        agenda = Agenda()
+        agenda.agendar(5.0, "c")
+        agenda.agendar(1.0, "a")
+        agenda.agendar(1.0, "b")
+        agenda.agendar(9.0, "d")
+
+        self.assertEqual([item for _, item in agenda.vencidos(5.0)], ["a", "b", "c"])
+        self.assertEqual(len(agenda), 1)
+        self.assertEqual(agenda.proximo_vencimento(), 9.0)
+        self.assertEqual(list(agenda.vencidos(8.0)), [])
+
+    def test_cancelamento(self):
+        """
+        Testa o cancelamento preguiçoso de entradas.
+        """
+        agenda = Agenda()
+        entrada = agenda.agendar(1.0, "a")
+        agenda.agendar(2.0, "b")
+        agenda.cancelar(entrada)
+        agenda.cancelar(entrada)
+
+        self.assertFalse(Agenda.pendente(entrada))
+        self.assertEqual(len(agenda), 1)
+        self.assertEqual(agenda.proximo_vencimento(), 2.0)
+        self.assertEqual([item for _, item in agenda.vencidos(10.0)], ["b"])
+        self.assertIsNone(agenda.proximo_vencimento())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Testes unitários para o módulo AgendadorRiscos.
+"""
+
+import random
+import unittest
+
+from modelos.clima import Clima
+from utils.agendador_riscos import AgendadorRiscos
+
+class TestAgendadorRiscos(unittest.TestCase):
+    """
+    Testes para a classe AgendadorRiscos.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes.
+        """
+        random.seed(7)
+
+    def test_taxa_media_independe_do_passo(self):
+        """
+        Testa se o número de disparos segue a taxa com passos curtos e longos.
+        """
+        for passo in (0.01, 1.0, 500.0):
+            agendador = AgendadorRiscos()
+            agendador.registrar("evento", 0.5)
+            total = 0
+            for _ in range(int(1000.0 / passo)):
+                agendador.avancar(passo)
+                total += agendador.disparos("evento")
+
+            # Esperado: 500 disparos, desvio padrão de cerca de 22
+            self.assertAlmostEqual(total, 500, delta=80)
+            self.assertAlmostEqual(agendador.tempo, 1000.0)
+
+    def test_registrar_e_remover(self):
+        """
+        Testa a suspensão, a alteração de taxa e a remoção de eventos.
+        """
+        agendador = AgendadorRiscos()
+        agendador.registrar("nulo", 0.0)
+        agendador.registrar("raro", 1e-9)
+        agendador.avancar(100.0)
+        self.assertEqual(agendador.disparos("nulo"), 0)
+        self.assertEqual(agendador.disparos("raro"), 0)
+
+        # Mudar a taxa vale a partir do tempo atual
+        agendador.registrar("raro", 100.0)
+        self.assertGreater(agendador.avancar(1.0), 0)
+        self.assertGreater(agendador.disparos("raro"), 0)
+        self.assertEqual(agendador.disparos("raro"), 0)
+
+        agendador.avancar(1.0)
+        agendador.remover("raro")
+        self.assertNotIn("raro", agendador)
+        self.assertEqual(agendador.disparos("raro"), 0)
+        self.assertEqual(agendador.avancar(10.0), 0)
+
+    def test_clima_consome_disparos(self):
+        """
+        Testa se os eventos climáticos dependem dos disparos e das condições atuais.
+        """
+        clima = Clima()
+        clima.umidade = 0.9
+        clima.precipitacao = 0.0
+        clima.agendador.registrar("clima:chuva", 1000.0)
+        clima._gerar_eventos_climaticos(0.0)
+        self.assertEqual(clima.eventos_climaticos, [])
+
+        clima.agendador.avancar(1.0)
+        clima._gerar_eventos_climaticos(1.0)
+        # Após a primeira chuva a precipitação sobe e os demais disparos são descartados
+        self.assertEqual([e["tipo"] for e in clima.eventos_climaticos], ["chuva"])
+
+if __name__ == "__main__":
+    unittest.main()
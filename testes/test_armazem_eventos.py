@@ -0,0 +1,74 @@
+"""
+Testes unitários para o módulo ArmazemEventos.
+"""
+
+import random
+import unittest
+
+from modelos.historico import Historico
+from utils.armazem_eventos import ArmazemEventos
+from utils.helpers import registrar_evento
+
+class TestArmazemEventos(unittest.TestCase):
+    """
+    Testes para a classe ArmazemEventos e seu uso no Historico.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes.
+        """
+        random.seed(7)
+        self.armazem = ArmazemEventos(capacidade=100, largura_intervalo=10.0)
+        self.retidos = []
+
+        # Tempos levemente fora de ordem, como ocorre com eventos de mecânicas diferentes
+        for i in range(350):
+            tempo = i * 0.5 + random.uniform(-3.0, 3.0)
+            envolvidos = [f"s{random.randrange(20)}" for _ in range(random.randrange(3))]
+            evento = registrar_evento(random.choice(["morte", "nascimento", "descoberta"]), "teste", tempo, envolvidos)
+            self.armazem.append(evento)
+            self.retidos = (self.retidos + [evento])[-100:]
+
+    def test_buffer_circular(self):
+        """
+        Testa se o armazém retém apenas os eventos mais recentes, em ordem.
+        """
+        self.assertEqual(len(self.armazem), 100)
+        self.assertEqual(list(self.armazem), self.retidos)
+        self.assertEqual(self.armazem[-10:], self.retidos[-10:])
+        self.assertIs(self.armazem[0], self.retidos[0])
+        with self.assertRaises(IndexError):
+            self.armazem[100]
+
+    def test_consultas_indexadas(self):
+        """
+        Testa se as consultas indexadas equivalem a varreduras completas.
+        """
+        self.assertEqual(self.armazem.obter_por_tipo("morte"),
+                         [e for e in self.retidos if e["tipo"] == "morte"])
+        self.assertEqual(self.armazem.obter_por_envolvido("s4"),
+                         [e for e in self.retidos if "s4" in e["envolvidos"]])
+
+        for inicio, fim in [(140.0, 160.0), (0.0, float("inf")), (155.0, 155.5), (170.0, 120.0)]:
+            self.assertEqual(self.armazem.obter_por_periodo(inicio, fim),
+                             [e for e in self.retidos if inicio <= e["tempo"] <= fim])
+
+        # Entidades e intervalos que saíram do buffer não deixam índices para trás
+        envolvidos = {i for e in self.retidos for i in e["envolvidos"]}
+        self.assertEqual(set(self.armazem.indice_envolvido), envolvidos)
+
+    def test_historico(self):
+        """
+        Testa o Historico usando o armazém de eventos.
+        """
+        historico = Historico()
+        historico.registrar_morte(5.0, "a", "fome")
+        historico.registrar_nascimento(6.0, "b", ["c", "d"])
+
+        self.assertEqual([e["tipo"] for e in historico.obter_eventos_por_envolvido("b")], ["nascimento"])
+        self.assertEqual(len(historico.obter_eventos_por_periodo(0.0, 5.5)), 1)
+        self.assertEqual(len(historico.to_dict()["eventos"]), 2)
+
+if __name__ == "__main__":
+    unittest.main()
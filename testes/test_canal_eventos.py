@@ -0,0 +1,117 @@
+"""
+Testes unitários para o módulo CanalEventos.
+"""
+
+import json
+import random
+import unittest
+
+import api_server
+from simulacao import Simulacao
+from utils.canal_eventos import CanalEventos
+
+class TestCanalEventos(unittest.TestCase):
+    """
+    Testes para as classes CanalEventos e Assinante.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes.
+        """
+        random.seed(6)
+        self.canal = CanalEventos()
+
+    def test_filtros(self):
+        """
+        Testa os filtros por tipo, entidade e região.
+        """
+        mortes = self.canal.assinar(tipos=["morte"])
+        de_a = self.canal.assinar(entidades=["a"])
+        no_canto = self.canal.assinar(regiao=(0, 0, 10, 10))
+        todos = self.canal.assinar()
+
+        self.canal.publicar("morte", 1.0, ["a"], [5.0, 5.0], causa="fome")
+        self.canal.publicar("nascimento", 2.0, ["b"], [50.0, 5.0])
+        self.canal.publicar("tecnologia", 3.0, ["a"], tecnologia="fogo")
+
+        def tipos(assinante):
+            return [evento["tipo"] for evento in assinante.receber(10, timeout=0)[0]]
+
+        self.assertEqual(tipos(mortes), ["morte"])
+        self.assertEqual(tipos(de_a), ["morte", "tecnologia"])
+        # Eventos sem posição não passam pelo filtro de região
+        self.assertEqual(tipos(no_canto), ["morte"])
+        self.assertEqual(tipos(todos), ["morte", "nascimento", "tecnologia"])
+
+        self.canal.cancelar(todos)
+        self.canal.publicar("morte", 4.0, ["c"])
+        self.assertEqual(todos.receber(10, timeout=0), ([], 0))
+
+    def test_fila_limitada(self):
+        """
+        Testa se um assinante lento perde os eventos mais antigos sem bloquear a publicação.
+        """
+        lento = self.canal.assinar(tamanho_fila=3)
+        for i in range(5):
+            self.canal.publicar("nascimento", float(i), [str(i)])
+
+        eventos, descartados = lento.receber(2, timeout=0)
+        self.assertEqual([evento["seq"] for evento in eventos], [3, 4])
+        self.assertEqual(descartados, 2)
+
+        eventos, descartados = lento.receber(2, timeout=0)
+        self.assertEqual([evento["seq"] for evento in eventos], [5])
+        self.assertEqual(descartados, 0)
+
+    def test_eventos_da_simulacao(self):
+        """
+        Testa se os eventos registrados na simulação chegam ao canal.
+        """
+        simulacao = Simulacao([30, 30], 4)
+        self.canal.conectar(simulacao)
+        assinante = self.canal.assinar(tipos=["tecnologia"])
+
+        simulacao.adicionar_evento("tecnologia", {"tecnologia": "fogo", "inventor_id": "p2"})
+        simulacao.passo(0.1)
+
+        eventos, _ = assinante.receber(10, timeout=0)
+        self.assertEqual([(e["tipo"], e["entidades"], e["tecnologia"]) for e in eventos],
+                         [("tecnologia", ["p2"], "fogo")])
+        self.assertEqual(eventos[0]["tempo"], simulacao.tempo_simulacao)
+
+    def test_endpoint_stream(self):
+        """
+        Testa o endpoint /api/eventos/stream.
+        """
+        simulacao = Simulacao([30, 30], 4)
+        api_server.simulacao = simulacao
+        api_server.conectar_feed(simulacao)
+        try:
+            cliente = api_server.app.test_client()
+            resposta = cliente.get("/api/eventos/stream?tipos=morte&regiao=0,0,10,10", buffered=False)
+
+            api_server.canal_eventos.publicar("morte", 1.0, ["a"], [20.0, 20.0], causa="fome")
+            api_server.canal_eventos.publicar("morte", 2.0, ["b"], [5.0, 5.0], causa="idade")
+
+            mensagens = iter(resposta.response)
+            self.assertEqual(next(mensagens), b": conectado\n\n")
+            mensagem = next(mensagens).decode()
+            resposta.close()
+
+            self.assertTrue(mensagem.startswith("event: eventos\n"))
+            lote = json.loads(mensagem.split("data: ", 1)[1])
+            self.assertEqual([evento["entidades"] for evento in lote["eventos"]], [["b"]])
+            self.assertEqual(lote["descartados"], 0)
+            self.assertEqual(api_server.canal_eventos.assinantes, ())
+
+            erro = cliente.get("/api/eventos/stream?regiao=1,2").get_json()
+            self.assertEqual(erro["status"], "error")
+        finally:
+            api_server.simulacao = None
+            api_server.feed_alteracoes = None
+            api_server.publicador_estado = None
+            api_server.canal_eventos = None
+
+if __name__ == "__main__":
+    unittest.main()
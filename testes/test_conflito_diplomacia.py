@@ -0,0 +1,122 @@
+"""
+Testes unitários para o módulo MecanicaConflitoDiplomacia.
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from mecanicas.conflito_diplomacia import MecanicaConflitoDiplomacia
+from modelos.historico import Historico
+from utils.agendador_riscos import AgendadorRiscos
+
+class TestConflitoDiplomacia(unittest.TestCase):
+    """
+    Testes para os índices e a agenda da classe MecanicaConflitoDiplomacia.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes: dois grupos com líderes e recursos.
+        """
+        self.grupos = {
+            grupo_id: {
+                "membros": [f"{grupo_id}_{i}" for i in range(3)],
+                "lider_id": f"{grupo_id}_0",
+                "forca_total": 3.0,
+                "recursos": {"comida": 100.0, "agua": 100.0, "madeira": 100.0, "pedra": 100.0, "metal": 100.0},
+                "posicao_media": [0.0, 0.0]
+            }
+            for grupo_id in ("norte", "sul")
+        }
+        registro = SimpleNamespace(obter=lambda senciantes: self.grupos, invalidar=lambda: None)
+        self.mundo = SimpleNamespace(historico=Historico(), registro_grupos=registro, agendador_riscos=AgendadorRiscos())
+        self.mecanica = MecanicaConflitoDiplomacia(self.mundo)
+
+    def test_indice_por_par(self):
+        """
+        Testa se conflitos e tratados ativos são encontrados pelo par em qualquer ordem.
+        """
+        conflito_id = self.mecanica.iniciar_guerra_tribal("sul", "norte", "teste", self.grupos, {})
+        self.assertEqual([c["id"] for c in self.mecanica.conflitos_entre("norte", "sul")], [conflito_id])
+
+        # Um tratado de paz negociado encerra o conflito do par
+        with patch("mecanicas.conflito_diplomacia.chance", return_value=True):
+            tratado_id = self.mecanica._iniciar_negociacao("norte", "sul", "paz", self.grupos, {})
+
+        self.assertEqual(self.mecanica.conflitos_entre("sul", "norte"), [])
+        self.assertFalse(self.mecanica.conflitos[conflito_id]["ativo"])
+        self.assertEqual([t["id"] for t in self.mecanica.tratados_entre("sul", "norte", "paz")], [tratado_id])
+        self.assertEqual(list(self.mecanica.tratados_por_tipo["paz"]), [tratado_id])
+        self.assertEqual(list(self.mecanica.obter_conflitos_ativos()), [])
+
+    def test_trocas_apenas_quando_vencem(self):
+        """
+        Testa se os termos de troca são processados apenas na periodicidade e
+        se o tratado expira e sai dos índices.
+        """
+        with patch("mecanicas.conflito_diplomacia.chance", return_value=True):
+            tratado_id = self.mecanica._iniciar_negociacao("norte", "sul", "comercio", self.grupos, {})
+
+        trocas = []
+        with patch("mecanicas.conflito_diplomacia.chance", return_value=False), \
+                patch.object(self.mecanica, "_realizar_troca_comercial", side_effect=lambda *args: trocas.append(self.mecanica.tempo)):
+            for _ in range(200):
+                self.mecanica.atualizar(1.0, {})
+
+        self.assertEqual(trocas, [24.0, 48.0, 72.0, 96.0, 120.0, 144.0])
+        self.assertFalse(self.mecanica.tratados[tratado_id]["ativo"])
+        self.assertEqual(self.mecanica.tratados[tratado_id]["motivo_encerramento"], "expiracao")
+        self.assertEqual(self.mecanica.tratados_por_par, {})
+        self.assertEqual(len(self.mecanica.agenda_trocas), 0)
+
+    def test_batalhas_agendadas(self):
+        """
+        Testa se as batalhas de um conflito vêm do agendador e param quando ele termina.
+        """
+        agendador = self.mundo.agendador_riscos
+        # Sem grupos suficientes, disparos de novos conflitos e negociações são descartados
+        agendador.registrar("diplomacia:novo_conflito", 0.0)
+        agendador.registrar("diplomacia:negociacao", 0.0)
+        senciantes = {
+            membro: SimpleNamespace(habilidades={}, estado={"saude": 1.0})
+            for grupo in self.grupos.values() for membro in grupo["membros"]
+        }
+        conflito_id = self.mecanica.iniciar_guerra_tribal("norte", "sul", "teste", self.grupos, senciantes)
+        self.assertIn(f"diplomacia:batalha:{conflito_id}", agendador)
+
+        batalhas = []
+        with patch("mecanicas.conflito_diplomacia.chance", return_value=False), \
+                patch.object(self.mecanica, "_aplicar_consequencias_batalha", side_effect=lambda *args: batalhas.append(args)):
+            agendador.avancar(40.0)
+            self.mecanica.atualizar(40.0, senciantes)
+
+        # Um único passo longo conta todas as batalhas do intervalo (0.05 por hora)
+        self.assertEqual(len(batalhas), len(self.mecanica.conflitos[conflito_id]["batalhas"]))
+        self.assertGreater(len(batalhas), 0)
+
+        self.mecanica._encerrar_conflito(conflito_id, "acordo", "teste")
+        self.assertNotIn(f"diplomacia:batalha:{conflito_id}", agendador)
+
+    def test_dissolucao_e_violacao(self):
+        """
+        Testa o encerramento por dissolução de grupo e a violação de não agressão.
+        """
+        with patch("mecanicas.conflito_diplomacia.chance", return_value=True):
+            tratado_id = self.mecanica._iniciar_negociacao("norte", "sul", "nao_agressao", self.grupos, {})
+        self.mecanica.iniciar_guerra_tribal("norte", "sul", "teste", self.grupos, {})
+
+        with patch("mecanicas.conflito_diplomacia.chance", return_value=False):
+            self.mecanica.atualizar(1.0, {})
+        self.assertEqual(len(self.mecanica.tratados[tratado_id]["violacoes"]), 1)
+
+        del self.grupos["sul"]
+        with patch("mecanicas.conflito_diplomacia.chance", return_value=False):
+            self.mecanica.atualizar(1.0, {})
+        self.assertEqual(self.mecanica.tratados[tratado_id]["motivo_encerramento"], "dissolucao")
+        self.assertEqual(self.mecanica.obter_tratados_ativos(), {})
+        self.assertEqual(self.mecanica.conflitos_por_par, {})
+        self.assertEqual(len(self.mecanica.agenda_expiracoes), 0)
+
+if __name__ == "__main__":
+    unittest.main()
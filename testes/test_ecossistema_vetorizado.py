@@ -0,0 +1,187 @@
+"""
+Testes unitários para o módulo MotorEcossistemaVetorizado.
+"""
+
+import unittest
+import random
+from types import SimpleNamespace
+
+import numpy as np
+
+from mecanicas.ecossistema import MecanicaEcossistema
+from mecanicas.ecossistema_vetorizado import (
+    MotorEcossistemaVetorizado, GrupoEmpacotado, RAIO_PASTO, TAMANHO_MINIMO_GRUPO
+)
+from modelos.mundo import Mundo
+
+class TestMotorEcossistemaVetorizado(unittest.TestCase):
+    """
+    Testes para a classe MotorEcossistemaVetorizado.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes.
+        """
+        random.seed(11)
+        np.random.seed(11)
+
+        # Mecânica montada sem a geração aleatória de espécies
+        self.mecanica = MecanicaEcossistema.__new__(MecanicaEcossistema)
+        self.mecanica.mundo = Mundo([100, 100])
+        self.mecanica.fauna = {}
+        self.mecanica.flora = {}
+
+        for i, (dieta, tamanho) in enumerate([("herbivoro", "pequeno"), ("carnivoro", "grande"), ("onivoro", "medio")]):
+            especie_id = f"fauna_{i + 1}"
+            self.mecanica.fauna[especie_id] = SimpleNamespace(
+                id=especie_id, nome=especie_id, dieta=dieta, tamanho=tamanho,
+                forca=random.uniform(0.1, 0.9), velocidade=random.uniform(0.2, 0.8),
+                valor_nutricional=random.uniform(0.2, 0.8), biomas_adequados=["planicie"],
+                populacao=0, grupos=[self._grupo(especie_id) for _ in range(20)]
+            )
+
+        for i in range(3):
+            especie_id = f"flora_{i + 1}"
+            grupos = [self._grupo(especie_id) for _ in range(30)]
+            for grupo in grupos:
+                grupo["maturidade"] = random.uniform(0.5, 1.0)
+            self.mecanica.flora[especie_id] = SimpleNamespace(
+                id=especie_id, nome=especie_id, comestivel=i != 2, valor_nutricional=random.uniform(0.1, 0.9),
+                tempo_crescimento=random.uniform(24.0, 168.0), biomas_adequados=["planicie"],
+                populacao=0, grupos=grupos
+            )
+
+    def _grupo(self, especie_id):
+        return {
+            "especie_id": especie_id,
+            "posicao": [random.uniform(0, 100), random.uniform(0, 100)],
+            "tamanho": random.uniform(5, 50),
+            "bioma": "planicie"
+        }
+
+    def _copiar_grupos(self, especies):
+        return {especie_id: [dict(grupo) for grupo in especie.grupos] for especie_id, especie in especies.items()}
+
+    def test_empacotar_grupos(self):
+        """
+        Testa se os grupos viram visões sobre os arrays sem perder valores.
+        """
+        originais = self._copiar_grupos(self.mecanica.fauna)
+        motor = MotorEcossistemaVetorizado(self.mecanica)
+
+        self.assertEqual(len(motor.grupos_fauna), 60)
+        for especie_id, especie in self.mecanica.fauna.items():
+            for grupo, original in zip(especie.grupos, originais[especie_id]):
+                self.assertIsInstance(grupo, GrupoEmpacotado)
+                self.assertEqual(dict(grupo), original)
+
+        # Escritas pela visão chegam aos arrays
+        grupo = self.mecanica.fauna["fauna_1"].grupos[0]
+        grupo["tamanho"] -= 1.0
+        self.assertEqual(motor.grupos_fauna.tamanhos[grupo.linha], originais["fauna_1"][0]["tamanho"] - 1.0)
+
+    def test_equivale_a_referencia(self):
+        """
+        Testa crescimento, reprodução e morte natural contra os métodos por grupo da mecânica.
+        """
+        fauna_ref = self._copiar_grupos(self.mecanica.fauna)
+        flora_ref = self._copiar_grupos(self.mecanica.flora)
+        motor = MotorEcossistemaVetorizado(self.mecanica)
+
+        # Com delta_tempo = 50 a chance de reprodução da fauna é 1
+        motor._reproduzir_fauna(50.0)
+        motor._morte_natural_fauna(50.0)
+        motor._crescer_flora(10.0)
+        motor._morte_natural_flora(10.0)
+
+        for especie_id, grupos in fauna_ref.items():
+            for grupo, vetorizado in zip(grupos, self.mecanica.fauna[especie_id].grupos):
+                self.mecanica._reproduzir_grupo_fauna(grupo, 50.0)
+                self.mecanica._morte_natural_grupo_fauna(grupo, 50.0)
+                self.assertAlmostEqual(vetorizado["tamanho"], grupo["tamanho"], places=9)
+
+        for especie_id, grupos in flora_ref.items():
+            flora = self.mecanica.flora[especie_id]
+            for grupo, vetorizado in zip(grupos, flora.grupos):
+                self.mecanica._crescer_grupo_flora(grupo, flora, 10.0)
+                self.mecanica._morte_natural_grupo_flora(grupo, 10.0)
+                self.assertAlmostEqual(vetorizado["maturidade"], grupo["maturidade"], places=9)
+                self.assertAlmostEqual(vetorizado["tamanho"], grupo["tamanho"], places=9)
+
+    def test_atualizar(self):
+        """
+        Testa passos completos do motor.
+        """
+        motor = MotorEcossistemaVetorizado(self.mecanica)
+        grupos_flora = len(motor.grupos_flora)
+
+        for _ in range(50):
+            motor.atualizar(5.0)
+
+        largura, altura = self.mecanica.mundo.tamanho
+        for especies in (self.mecanica.fauna, self.mecanica.flora):
+            for especie in especies.values():
+                self.assertAlmostEqual(especie.populacao, sum(g["tamanho"] for g in especie.grupos), places=6)
+                for grupo in especie.grupos:
+                    self.assertGreaterEqual(grupo["tamanho"], 0.0)
+                    self.assertTrue(0 <= grupo["posicao"][0] <= largura)
+                    self.assertTrue(0 <= grupo["posicao"][1] <= altura)
+
+        # Novos grupos de flora entram nas listas das espécies
+        self.assertGreater(len(motor.grupos_flora), grupos_flora)
+        self.assertEqual(sum(len(f.grupos) for f in self.mecanica.flora.values()), len(motor.grupos_flora))
+
+    def test_alimentacao_pelo_indice(self):
+        """
+        Testa se herbívoros comem o grupo de flora comestível mais próximo dentro do raio.
+        """
+        motor = MotorEcossistemaVetorizado(self.mecanica)
+        fauna, flora = motor.grupos_fauna, motor.grupos_flora
+        linhas = np.flatnonzero(fauna.especies[:fauna.n] == motor.indices_especies["fauna"]["fauna_1"])
+        tamanhos = flora.tamanhos[:flora.n].copy()
+
+        # Alvo esperado por força bruta, com os tamanhos antes da fase
+        esperado = np.zeros(flora.n)
+        comestiveis = motor.comestivel_flora[flora.especies[:flora.n]]
+        for linha in linhas:
+            distancias = np.linalg.norm(flora.posicoes[:flora.n] - fauna.posicoes[linha], axis=1)
+            distancias[~comestiveis | (distancias > RAIO_PASTO)] = np.inf
+            if np.isfinite(distancias.min()):
+                alvo = int(np.argmin(distancias))
+                esperado[alvo] += min(fauna.tamanhos[linha] * 0.1, tamanhos[alvo] * 0.2)
+
+        motor._alimentar_herbivoros(linhas)
+        np.testing.assert_allclose(tamanhos - flora.tamanhos[:flora.n], esperado)
+
+        # Posições alteradas pelas visões chegam ao índice
+        grupo = self.mecanica.flora["flora_1"].grupos[0]
+        grupo["posicao"] = [1.0, 2.0]
+        self.assertEqual(flora.indice.obter_posicao(grupo.linha), (1.0, 2.0))
+
+    def test_compactar_grupos_extintos(self):
+        """
+        Testa se grupos extintos saem dos arrays e as visões restantes são remapeadas.
+        """
+        motor = MotorEcossistemaVetorizado(self.mecanica)
+        flora = motor.grupos_flora
+        especie = self.mecanica.flora["flora_2"]
+        vivos = [dict(grupo) for grupo in especie.grupos[15:]]
+        for grupo in especie.grupos[:15]:
+            grupo["tamanho"] = TAMANHO_MINIMO_GRUPO / 2
+
+        # Poucos grupos extintos: nada muda
+        motor._compactar("flora", self.mecanica.flora, flora)
+        self.assertEqual(len(flora), 90)
+
+        for grupo in self.mecanica.flora["flora_3"].grupos[:10]:
+            grupo["tamanho"] = 0.0
+        motor._compactar("flora", self.mecanica.flora, flora)
+
+        self.assertEqual(len(flora), 65)
+        self.assertEqual(len(flora.indice), 65)
+        self.assertEqual([dict(grupo) for grupo in especie.grupos], vivos)
+        self.assertEqual(sorted(g.linha for f in self.mecanica.flora.values() for g in f.grupos), list(range(65)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+Testes unitários para o executor headless.
+"""
+
+import unittest
+from executor_headless import executar_headless, main
+
+class TestExecutorHeadless(unittest.TestCase):
+    """
+    Testes para a execução em passos fixos.
+    """
+    
+    def test_executar_num_passos(self):
+        """
+        Testa a execução por um número fixo de passos.
+        """
+        simulacao, relatorio = executar_headless(num_passos=20, delta_tempo=0.1, semente=1,
+                                                 tamanho_mundo=[20, 20], num_senciantes=5)
+        
+        self.assertEqual(relatorio["passos"], 20)
+        self.assertAlmostEqual(simulacao.tempo_simulacao, 2.0)
+        self.assertGreater(relatorio["passos_por_segundo"], 0)
+        self.assertFalse(simulacao.executando)
+    
+    def test_executar_ate_tempo_final(self):
+        """
+        Testa a execução até um tempo de simulação.
+        """
+        simulacao, relatorio = executar_headless(tempo_final=1.0, delta_tempo=0.25, semente=1,
+                                                 tamanho_mundo=[20, 20], num_senciantes=5)
+        
+        self.assertEqual(relatorio["passos"], 4)
+        self.assertAlmostEqual(simulacao.tempo_simulacao, 1.0)
+    
+    def test_execucao_reproduzivel(self):
+        """
+        Testa se a mesma semente produz a mesma execução.
+        """
+        resultados = []
+        for _ in range(2):
+            simulacao, relatorio = executar_headless(num_passos=50, semente=42,
+                                                     tamanho_mundo=[20, 20], num_senciantes=10)
+            posicoes = [tuple(s.posicao) for s in simulacao.senciantes.values()]
+            resultados.append((posicoes, relatorio["estatisticas"]))
+        
+        self.assertEqual(resultados[0], resultados[1])
+    
+    def test_main_exige_limite(self):
+        """
+        Testa se a linha de comando exige número de passos ou tempo final.
+        """
+        with self.assertRaises(SystemExit):
+            main(["--semente", "1"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Testes unitários para o executor em lote de múltiplos mundos.
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import simulacao
+import utils.config as config
+from executor_lote import configuracao, executar_mundos, gerar_especificacoes
+
+class TestExecutorLote(unittest.TestCase):
+    """
+    Testes para a execução de vários mundos com sementes e configurações próprias.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes: as ferramentas de administração criam
+        diretórios no diretório atual, então cada teste roda em um diretório temporário.
+        """
+        self.diretorio_original = os.getcwd()
+        self.diretorio = tempfile.TemporaryDirectory()
+        os.chdir(self.diretorio.name)
+
+    def tearDown(self):
+        """
+        Restaura o diretório atual.
+        """
+        os.chdir(self.diretorio_original)
+        self.diretorio.cleanup()
+
+    def test_configuracao_temporaria(self):
+        """
+        Testa se as sobrescritas alcançam os módulos que importaram a constante e são desfeitas.
+        """
+        original = config.DEFAULT_INITIAL_SENCIANTES
+        with configuracao({"DEFAULT_INITIAL_SENCIANTES": 3}):
+            self.assertEqual(config.DEFAULT_INITIAL_SENCIANTES, 3)
+            self.assertEqual(simulacao.DEFAULT_INITIAL_SENCIANTES, 3)
+        self.assertEqual(simulacao.DEFAULT_INITIAL_SENCIANTES, original)
+
+        with self.assertRaises(ValueError):
+            with configuracao({"PARAMETRO_INEXISTENTE": 1}):
+                pass
+
+    def test_lote_sequencial(self):
+        """
+        Testa sementes, sobrescritas por mundo e métricas recebidas durante a execução.
+        """
+        especificacoes = gerar_especificacoes(2, semente_base=5, tamanho_mundo=[20, 20])
+        especificacoes.append(dict(especificacoes[0], config={"DEFAULT_INITIAL_SENCIANTES": 2}))
+        especificacoes[0]["config"] = {"DEFAULT_INITIAL_SENCIANTES": 2}
+
+        recebidas = []
+        resultado = executar_mundos(especificacoes, tempo_final=3.0, delta_tempo=0.5, intervalo_metricas=1.0,
+                                    processos=1, ao_receber_metricas=lambda i, m: recebidas.append((i, m["tempo"])))
+
+        self.assertEqual([r["passos"] for r in resultado["relatorios"]], [6, 6, 6])
+        self.assertEqual(len(recebidas), 9)
+        metricas = resultado["metricas"]
+        self.assertEqual(metricas["mundo"].tolist(), [0, 0, 0, 1, 1, 1, 2, 2, 2])
+        self.assertEqual(metricas["tempo"][:3].tolist(), [1.0, 2.0, 3.0])
+
+        # Mesma semente e mesma configuração produzem as mesmas métricas
+        np.testing.assert_array_equal(metricas["media_saude"][:3], metricas["media_saude"][6:])
+        self.assertEqual(resultado["relatorios"][0]["estatisticas"], resultado["relatorios"][2]["estatisticas"])
+        self.assertEqual(metricas["populacao_total"][0], 2)
+
+    def test_lote_em_processos(self):
+        """
+        Testa a execução em um pool de processos e o arquivo colunar agregado.
+        """
+        especificacoes = gerar_especificacoes(3, semente_base=1, tamanho_mundo=[20, 20], num_senciantes=4)
+        arquivo = os.path.join(self.diretorio.name, "lote.npz")
+
+        paralelo = executar_mundos(especificacoes, num_passos=10, delta_tempo=0.5, intervalo_metricas=2.0,
+                                   processos=2, arquivo_saida=arquivo)
+        sequencial = executar_mundos(especificacoes, num_passos=10, delta_tempo=0.5, intervalo_metricas=2.0,
+                                     processos=1)
+
+        self.assertEqual([r["mundo"] for r in paralelo["relatorios"]], [0, 1, 2])
+        self.assertEqual(
+            [r["estatisticas"] for r in paralelo["relatorios"]],
+            [r["estatisticas"] for r in sequencial["relatorios"]]
+        )
+
+        with np.load(arquivo) as dados:
+            self.assertEqual(dados["mundos/semente"].tolist(), [1, 2, 3])
+            self.assertEqual(dados["mundos/passos"].tolist(), [10, 10, 10])
+            self.assertEqual(len(dados["metricas/tempo"]), 9)
+            self.assertEqual(sorted(dados["metricas/mundo"].tolist()), [0, 0, 0, 1, 1, 1, 2, 2, 2])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Testes unitários para o módulo FeedAlteracoes.
+"""
+
+import json
+import random
+import unittest
+
+import api_server
+from simulacao import Simulacao
+from utils.feed_alteracoes import FeedAlteracoes
+
+class TestFeedAlteracoes(unittest.TestCase):
+    """
+    Testes para a classe FeedAlteracoes.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes.
+        """
+        random.seed(4)
+        self.simulacao = Simulacao([30, 30], 8)
+        self.feed = FeedAlteracoes()
+        self.feed.registrar(self.simulacao)
+        self.simulacao.registrar_callback("atualizacao", self.feed.registrar)
+
+    def _aplicar(self, cliente, alteracoes):
+        if alteracoes["completo"]:
+            cliente.clear()
+        cliente.update(alteracoes["criados"])
+        cliente.update(alteracoes["alterados"])
+        for senciante_id in alteracoes["removidos"]:
+            cliente.pop(senciante_id, None)
+
+    def _esperado(self):
+        return {i: FeedAlteracoes._registro_para_dict(FeedAlteracoes._registro(s))
+                for i, s in self.simulacao.senciantes.items()}
+
+    def test_estado_completo(self):
+        """
+        Testa a resposta completa para clientes novos.
+        """
+        alteracoes = self.feed.alteracoes_desde(0)
+
+        self.assertTrue(alteracoes["completo"])
+        self.assertEqual(alteracoes["versao"], 1)
+        self.assertEqual(alteracoes["criados"], self._esperado())
+
+    def test_cliente_acompanha_deltas(self):
+        """
+        Testa se aplicar os deltas reproduz o estado atual da simulação.
+        """
+        cliente = {}
+        versao = 0
+        for _ in range(40):
+            self.simulacao.passo(0.5)
+            alteracoes = self.feed.alteracoes_desde(versao, self.feed.id if versao else None)
+            self._aplicar(cliente, alteracoes)
+            versao = alteracoes["versao"]
+
+        self.assertEqual(versao, self.feed.versao)
+        self.assertEqual(cliente, self._esperado())
+
+    def test_sem_alteracoes_e_outro_feed(self):
+        """
+        Testa respostas vazias e a troca de feed.
+        """
+        self.simulacao.passo(0.1)
+        versao = self.feed.versao
+
+        alteracoes = self.feed.alteracoes_desde(versao, self.feed.id)
+        self.assertFalse(alteracoes["completo"])
+        self.assertEqual((alteracoes["criados"], alteracoes["alterados"], alteracoes["removidos"]), ({}, {}, []))
+
+        self.assertTrue(self.feed.alteracoes_desde(versao, "outro_feed")["completo"])
+        self.assertFalse(self.feed.aguardar(versao, timeout=0.01))
+
+    def test_endpoint_long_poll(self):
+        """
+        Testa o endpoint /api/alteracoes.
+        """
+        api_server.simulacao = self.simulacao
+        api_server.conectar_feed(self.simulacao)
+        try:
+            cliente = api_server.app.test_client()
+            dados = json.loads(cliente.get("/api/alteracoes").data)
+            self.assertTrue(dados["completo"])
+            self.assertEqual(len(dados["criados"]), len(self.simulacao.senciantes))
+
+            self.simulacao.passo(0.5)
+            resposta = cliente.get(f"/api/alteracoes?desde={dados['versao']}&feed_id={dados['feed_id']}&espera=1")
+            novos = json.loads(resposta.data)
+            self.assertFalse(novos["completo"])
+            self.assertEqual(novos["versao"], dados["versao"] + 1)
+        finally:
+            api_server.simulacao = None
+            api_server.feed_alteracoes = None
+            api_server.publicador_estado = None
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,6 +14,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from mecanicas.ferramentas_admin import FerramentasAdmin
 from modelos.mundo import Mundo
 from simulacao import Simulacao
+from utils.grafo_social import GrafoSocial
 
 class TestFerramentasAdmin(unittest.TestCase):
     """
@@ -217,30 +218,23 @@ class TestFerramentasAdmin(unittest.TestCase):
         """
         Testa a geração da rede social.
         """
-        # Criar senciantes mock com relações
+        # Criar senciantes mock, com as relações no grafo social do mundo
         senciante1 = MagicMock()
         senciante1.nome = "Senciante 1"
-        senciante1.relacoes = {
-            "s2": {"afinidade": 0.8},
-            "s3": {"afinidade": 0.6}
-        }
         
         senciante2 = MagicMock()
         senciante2.nome = "Senciante 2"
-        senciante2.relacoes = {
-            "s1": {"afinidade": 0.7},
-            "s3": {"afinidade": 0.5}
-        }
         
         senciante3 = MagicMock()
         senciante3.nome = "Senciante 3"
-        senciante3.relacoes = {
-            "s1": {"afinidade": 0.6},
-            "s2": {"afinidade": 0.4}
-        }
         
         senciantes = {"s1": senciante1, "s2": senciante2, "s3": senciante3}
         
+        self.mundo_mock.grafo_social = GrafoSocial()
+        self.mundo_mock.grafo_social.definir("s1", "s2", "amigo", 0.8, afinidade=0.8)
+        self.mundo_mock.grafo_social.definir("s1", "s3", "amigo", 0.6, afinidade=0.6)
+        self.mundo_mock.grafo_social.definir("s2", "s3", "conhecido", 0.5, afinidade=0.4)
+        
         # Gerar rede social
         caminho = self.ferramentas_admin.gerar_rede_social(senciantes)
         
@@ -257,31 +251,25 @@ class TestFerramentasAdmin(unittest.TestCase):
         senciante1.nome = "Senciante 1"
         senciante1.genoma.genes = {"carisma": 0.8}
         senciante1.habilidades = {"comunicacao": 0.7, "lideranca": 0.6}
-        senciante1.relacoes = {
-            "s2": {"influencia": 0.8},
-            "s3": {"influencia": 0.6}
-        }
         
         senciante2 = MagicMock()
         senciante2.nome = "Senciante 2"
         senciante2.genoma.genes = {"carisma": 0.6}
         senciante2.habilidades = {"comunicacao": 0.5, "lideranca": 0.4}
-        senciante2.relacoes = {
-            "s1": {"influencia": 0.3},
-            "s3": {"influencia": 0.5}
-        }
         
         senciante3 = MagicMock()
         senciante3.nome = "Senciante 3"
         senciante3.genoma.genes = {"carisma": 0.4}
         senciante3.habilidades = {"comunicacao": 0.3, "lideranca": 0.2}
-        senciante3.relacoes = {
-            "s1": {"influencia": 0.2},
-            "s2": {"influencia": 0.4}
-        }
         
         senciantes = {"s1": senciante1, "s2": senciante2, "s3": senciante3}
         
+        # Relações no grafo social do mundo, de onde vem o peso das influências
+        self.mundo_mock.grafo_social = GrafoSocial()
+        self.mundo_mock.grafo_social.definir("s1", "s2", "amigo", 0.8, afinidade=0.8)
+        self.mundo_mock.grafo_social.definir("s1", "s3", "amigo", 0.6, afinidade=0.6)
+        self.mundo_mock.grafo_social.definir("s2", "s3", "conhecido", 0.5)
+        
         # Visualizar rede de influência social
         img_base64 = self.ferramentas_admin.visualizar_rede_influencia_social(senciantes)
         
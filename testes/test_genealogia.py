@@ -0,0 +1,101 @@
+"""
+Testes unitários para o módulo GrafoGenealogico.
+"""
+
+import pickle
+import unittest
+
+from modelos.historico import Historico
+from utils.genealogia import GrafoGenealogico
+
+class TestGenealogia(unittest.TestCase):
+    """
+    Testes para a classe GrafoGenealogico.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes: dois irmãos (C, D), um meio-irmão (F),
+        o filho dos irmãos (E) e o filho de E com F (G).
+        """
+        self.grafo = GrafoGenealogico(capacidade_inicial=2)
+        self.grafo.registrar_nascimento("C", ["A", "B"])
+        self.grafo.registrar_nascimento("D", ["A", "B"])
+        self.grafo.registrar_nascimento("F", ["A", "X"])
+        self.grafo.registrar_nascimento("E", ["C", "D"])
+        self.grafo.registrar_nascimento("G", ["E", "F"])
+
+    def test_parentesco_e_endogamia(self):
+        """
+        Testa os valores conhecidos de parentesco e de coeficiente de endogamia.
+        """
+        self.assertAlmostEqual(self.grafo.parentesco("A", "A"), 0.5)
+        self.assertAlmostEqual(self.grafo.parentesco("C", "D"), 0.25)
+        self.assertAlmostEqual(self.grafo.parentesco("C", "F"), 0.125)
+        self.assertAlmostEqual(self.grafo.parentesco("A", "C"), 0.25)
+        self.assertAlmostEqual(self.grafo.parentesco("A", "Z"), 0.0)
+        self.assertAlmostEqual(self.grafo.coeficiente_endogamia("E"), 0.25)
+        self.assertAlmostEqual(self.grafo.coeficiente_endogamia("C"), 0.0)
+
+        # Pedigree completo e truncado concordam quando a profundidade basta
+        self.assertAlmostEqual(
+            self.grafo.coeficiente_endogamia("G", max_geracoes=None),
+            self.grafo.coeficiente_endogamia("G", max_geracoes=3)
+        )
+        # Com uma única geração, os progenitores contam como fundadores
+        self.assertAlmostEqual(self.grafo.coeficiente_endogamia("E", max_geracoes=1), 0.0)
+
+    def test_ancestrais_descendentes_e_geracoes(self):
+        """
+        Testa ancestrais, descendentes, linhagens, gerações e ancestrais comuns.
+        """
+        self.assertEqual(self.grafo.ancestrais("G"), {"E", "F", "C", "D", "A", "B", "X"})
+        self.assertEqual(self.grafo.ancestrais("G", max_geracoes=1), {"E", "F"})
+        self.assertEqual(self.grafo.descendentes("A"), {"C", "D", "F", "E", "G"})
+        self.assertEqual(self.grafo.descendentes("X", max_geracoes=1), {"F"})
+        self.assertEqual(self.grafo.tamanho_linhagem("B"), 4)
+        self.assertEqual(self.grafo.geracao("A"), 0)
+        self.assertEqual(self.grafo.geracao("G"), 3)
+        self.assertEqual(sorted(self.grafo.filhos_de("A")), ["C", "D", "F"])
+
+        self.assertEqual(self.grafo.ancestrais_comuns("C", "F"), {"A"})
+        self.assertEqual(self.grafo.ancestral_comum_mais_proximo("E", "F"), "A")
+        self.assertEqual(self.grafo.ancestral_comum_mais_proximo("G", "C"), "C")
+        self.assertIsNone(self.grafo.ancestral_comum_mais_proximo("B", "X"))
+
+    def test_invalidacao_cache(self):
+        """
+        Testa se novos nascimentos e progenitores tardios invalidam os resultados em cache.
+        """
+        self.assertEqual(self.grafo.tamanho_linhagem("X"), 2)
+        self.grafo.registrar_nascimento("H", ["G", "D"])
+        self.assertEqual(self.grafo.tamanho_linhagem("X"), 3)
+
+        # Um fundador que recebe progenitores muda ancestrais e gerações dos descendentes
+        self.assertAlmostEqual(self.grafo.parentesco("A", "X"), 0.0)
+        self.grafo.registrar_nascimento("X", ["B", "Y"])
+        self.assertIn("B", self.grafo.ancestrais("F"))
+        self.assertEqual(self.grafo.geracao("F"), 2)
+        self.assertAlmostEqual(self.grafo.parentesco("B", "X"), 0.25)
+
+        with self.assertRaises(ValueError):
+            self.grafo.registrar_nascimento("Z", ["Z"])
+
+    def test_historico(self):
+        """
+        Testa a árvore genealógica do Historico e sua restauração de um snapshot.
+        """
+        historico = Historico()
+        historico.registrar_nascimento(1.0, "C", ["A", "B"])
+        historico.registrar_nascimento(2.0, "E", ["C", "D"])
+
+        arvore = historico.obter_arvore_genealogica("C", 1, 1)
+        self.assertEqual([p["id"] for p in arvore["progenitores"]], ["A", "B"])
+        self.assertEqual([d["id"] for d in arvore["descendentes"]], ["E"])
+
+        restaurado = pickle.loads(pickle.dumps(historico))
+        self.assertIsInstance(restaurado.genealogia, GrafoGenealogico)
+        self.assertEqual(restaurado.genealogia.ancestrais("E"), {"A", "B", "C", "D"})
+
+if __name__ == "__main__":
+    unittest.main()
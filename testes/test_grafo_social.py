@@ -0,0 +1,133 @@
+"""
+Testes unitários para o módulo GrafoSocial.
+"""
+
+import importlib.util
+import math
+import unittest
+from unittest import mock
+
+from modelos.senciante import Senciante
+from simulacao import Simulacao
+from utils.config import RELATION_STRENGTH_DECAY_RATE, RELATION_STRENGTH_THRESHOLD, RELATION_SWEEP_INTERVAL
+from utils.grafo_social import GrafoSocial
+
+class TestGrafoSocial(unittest.TestCase):
+    """
+    Testes para a classe GrafoSocial.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes.
+        """
+        self.grafo = GrafoSocial(capacidade_inicial=2)
+
+    def test_vizinhos_e_graus(self):
+        """
+        Testa se cada relação é uma aresta não direcionada consultada pelos dois lados.
+        """
+        self.grafo.definir("a", "b", "amigo", 0.6, afinidade=0.4)
+        self.grafo.definir("a", "c", "conhecido", 0.3)
+        self.grafo.definir("c", "d", "familia", 0.9)
+        self.grafo.definir("b", "a", "amigo", 0.7)  # Mesma aresta, vista pelo outro lado
+
+        self.assertEqual(self.grafo.num_arestas, 3)
+        self.assertEqual(self.grafo.obter("b", "a"), {"tipo": "amigo", "forca": 0.7, "afinidade": 0.4})
+        self.assertEqual(set(self.grafo.vizinhos_de("a")), {"b", "c"})
+        self.assertEqual(self.grafo.grau("c"), 2)
+        self.assertEqual(self.grafo.grau("desconhecido"), 0)
+
+        centralidade = self.grafo.centralidade(normalizar=False)
+        self.assertEqual(centralidade, {"a": 2.0, "b": 1.0, "c": 2.0, "d": 1.0})
+        self.assertAlmostEqual(self.grafo.centralidade(ponderada=True)["c"], 1.2)
+
+        # Remover um Senciante remove suas arestas e libera o nó para reuso
+        self.grafo.remover("c")
+        self.assertEqual(self.grafo.num_arestas, 1)
+        self.assertEqual(self.grafo.grau("d"), 0)
+        self.grafo.definir("e", "d", "conhecido", 0.5)
+        self.assertEqual(self.grafo.nos["e"], 2)
+
+    def test_decaimento_e_compactacao(self):
+        """
+        Testa se a força decai na leitura e se arestas esquecidas são compactadas.
+        """
+        self.grafo.definir("a", "b", "conhecido", 0.2)
+        self.grafo.definir("a", "c", "amigo", 1.0)
+        self.grafo.avancar(10.0)
+        self.assertAlmostEqual(self.grafo.obter("a", "c")["forca"], math.exp(-RELATION_STRENGTH_DECAY_RATE * 10.0))
+
+        vida = math.log(0.2 / RELATION_STRENGTH_THRESHOLD) / RELATION_STRENGTH_DECAY_RATE
+        while self.grafo.tempo < vida + 1.0:
+            self.grafo.avancar(RELATION_SWEEP_INTERVAL / 2)
+
+        self.assertIsNone(self.grafo.obter("a", "b"))
+        self.assertEqual(list(self.grafo.vizinhos_de("a")), ["c"])
+        self.grafo.avancar(RELATION_SWEEP_INTERVAL)
+        self.assertEqual(self.grafo.num_arestas, 1)
+        self.assertEqual(self.grafo.vizinhos[self.grafo.nos["b"]], {})
+
+    def test_exportacao_networkx(self):
+        """
+        Testa a exportação para networkx, com os nós na ordem de inserção.
+        """
+        self.grafo.definir("a", "b", "amigo", 0.6, afinidade=0.4)
+        self.grafo.definir("b", "c", "conhecido", 0.5)
+
+        grafo_nx = self.grafo.para_networkx(["b", "a"])
+        self.assertEqual(list(grafo_nx.nodes), ["a", "b"])
+        self.assertEqual({frozenset((a, b)): dados for a, b, dados in grafo_nx.edges(data=True)},
+                         {frozenset(("a", "b")): {"tipo": "amigo", "forca": 0.6, "afinidade": 0.4}})
+        self.assertEqual(list(self.grafo.para_networkx().nodes), ["a", "b", "c"])
+
+    @unittest.skipUnless(importlib.util.find_spec("scipy"), "scipy não está instalado")
+    def test_exportacao_scipy(self):
+        """
+        Testa a exportação para uma matriz esparsa simétrica do scipy.
+        """
+        self.grafo.definir("a", "b", "amigo", 0.6, afinidade=0.4)
+        self.grafo.definir("b", "c", "conhecido", 0.5)
+
+        matriz, ids = self.grafo.para_scipy()
+        self.assertEqual(matriz.shape, (3, 3))
+        self.assertEqual(matriz.nnz, 4)
+        a, b, c = ids.index("a"), ids.index("b"), ids.index("c")
+        self.assertAlmostEqual(matriz[a, b], 0.6)
+        self.assertAlmostEqual(matriz[b, a], 0.6)
+        self.assertEqual(matriz[a, c], 0.0)
+
+        afinidades, _ = self.grafo.para_scipy("afinidade")
+        self.assertAlmostEqual(afinidades[b, a], 0.4)
+        with self.assertRaises(ValueError):
+            self.grafo.para_scipy("idade")
+
+    def test_senciantes_vinculados_ao_mundo(self):
+        """
+        Testa se os Senciantes de uma simulação passam a compartilhar as relações no grafo do mundo.
+        """
+        simulacao = Simulacao(tamanho_mundo=(20, 20), num_senciantes_inicial=0)
+        senciante1 = Senciante([5.0, 5.0])
+        senciante2 = Senciante([5.5, 5.0])
+        senciante1.estabelecer_relacao(senciante2.id, "amigo", 0.4)
+        simulacao.senciantes = {senciante1.id: senciante1, senciante2.id: senciante2}
+        simulacao.mundo.sincronizar_senciantes(simulacao.senciantes)
+
+        grafo = simulacao.mundo.grafo_social
+        self.assertIs(senciante1.grafo_social, grafo)
+        self.assertEqual(senciante2.relacoes[senciante1.id]["tipo"], "amigo")
+
+        # A interação (sem comunicação) fortalece a aresta compartilhada uma única vez
+        with mock.patch("simulacao.random.random", return_value=0.9):
+            simulacao._interagir(senciante1, senciante2)
+        self.assertEqual(grafo.num_arestas, 1)
+        self.assertAlmostEqual(senciante1.relacoes[senciante2.id]["forca"], 0.45)
+
+        # Ao sair do grafo, o Senciante leva suas relações consigo
+        senciante1.vincular_grafo(None)
+        self.assertNotIn(senciante1.id, grafo)
+        self.assertEqual(len(senciante2.relacoes), 0)
+        self.assertEqual(senciante1.relacoes.to_dict()[senciante2.id]["tipo"], "amigo")
+
+if __name__ == "__main__":
+    unittest.main()
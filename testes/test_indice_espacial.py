@@ -0,0 +1,119 @@
+"""
+Testes unitários para o módulo IndiceEspacial.
+"""
+
+import unittest
+import random
+from utils.indice_espacial import IndiceEspacial
+from modelos.mundo import Mundo
+from modelos.senciante import Senciante
+
+class TestIndiceEspacial(unittest.TestCase):
+    """
+    Testes para a classe IndiceEspacial.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes.
+        """
+        random.seed(42)
+        self.indice = IndiceEspacial(tamanho_celula=2.0)
+        self.posicoes = {}
+        for i in range(200):
+            posicao = [random.uniform(0, 40), random.uniform(0, 40)]
+            self.posicoes[i] = posicao
+            self.indice.inserir(i, posicao)
+
+    def _distancia(self, pos1, pos2):
+        return ((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2) ** 0.5
+
+    def test_inserir_remover(self):
+        """
+        Testa a inserção e remoção de entidades.
+        """
+        self.assertEqual(len(self.indice), 200)
+        self.assertIn(0, self.indice)
+
+        self.assertTrue(self.indice.remover(0))
+        self.assertFalse(self.indice.remover(0))
+        self.assertNotIn(0, self.indice)
+        self.assertEqual(len(self.indice), 199)
+
+    def test_buscar_raio(self):
+        """
+        Testa a busca por raio comparando com uma busca linear.
+        """
+        centro = [20.0, 20.0]
+        resultado = self.indice.buscar_raio(centro, 5.0)
+        esperado = {i for i, p in self.posicoes.items() if self._distancia(p, centro) <= 5.0}
+
+        self.assertEqual(set(resultado), esperado)
+
+        # Resultado deve vir ordenado por distância
+        distancias = [self._distancia(self.posicoes[i], centro) for i in resultado]
+        self.assertEqual(distancias, sorted(distancias))
+
+    def test_k_mais_proximos(self):
+        """
+        Testa a busca dos k vizinhos mais próximos.
+        """
+        centro = [3.0, 37.0]
+        resultado = self.indice.k_mais_proximos(centro, 7)
+        esperado = sorted(self.posicoes, key=lambda i: self._distancia(self.posicoes[i], centro))[:7]
+
+        self.assertEqual(resultado, esperado)
+
+        # Limitar por raio máximo
+        resultado = self.indice.k_mais_proximos(centro, 7, raio_maximo=0.5)
+        for i in resultado:
+            self.assertLessEqual(self._distancia(self.posicoes[i], centro), 0.5)
+
+    def test_atualizar_posicao(self):
+        """
+        Testa a movimentação de uma entidade entre células.
+        """
+        self.indice.atualizar(1, [100.0, 100.0])
+
+        self.assertEqual(self.indice.obter_posicao(1), (100.0, 100.0))
+        self.assertEqual(self.indice.buscar_raio([100.0, 100.0], 0.1), [1])
+
+    def test_pares_proximos(self):
+        """
+        Testa a descoberta de pares próximos comparando com uma busca quadrática.
+        """
+        pares = self.indice.pares_proximos(2.0)
+        normalizados = {tuple(sorted(par)) for par in pares}
+
+        # Cada par deve aparecer apenas uma vez
+        self.assertEqual(len(normalizados), len(pares))
+
+        esperado = set()
+        ids = list(self.posicoes)
+        for a in range(len(ids)):
+            for b in range(a + 1, len(ids)):
+                if self._distancia(self.posicoes[ids[a]], self.posicoes[ids[b]]) <= 2.0:
+                    esperado.add((ids[a], ids[b]))
+
+        self.assertEqual(normalizados, esperado)
+
+    def test_senciante_atualiza_indice(self):
+        """
+        Testa se o movimento de um Senciante vinculado atualiza o índice do mundo.
+        """
+        mundo = Mundo([20, 20])
+        senciante = Senciante([5.0, 5.0])
+        senciantes = {senciante.id: senciante}
+
+        mundo.sincronizar_senciantes(senciantes)
+        self.assertIn(senciante.id, mundo.indice_senciantes)
+
+        senciante.posicao = [15.0, 15.0]
+        self.assertEqual(mundo.indice_senciantes.obter_posicao(senciante.id), (15.0, 15.0))
+
+        # Senciantes removidos do dicionário saem do índice
+        mundo.sincronizar_senciantes({})
+        self.assertEqual(len(mundo.indice_senciantes), 0)
+
+if __name__ == "__main__":
+    unittest.main()
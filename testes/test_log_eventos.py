@@ -0,0 +1,83 @@
+"""
+Testes unitários para o módulo LogEventos.
+"""
+
+import json
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from modelos.historico import Historico
+from utils.helpers import registrar_evento
+from utils.log_eventos import LogEventos
+
+class TestLogEventos(unittest.TestCase):
+    """
+    Testes para a classe LogEventos e seu uso no Historico.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes.
+        """
+        random.seed(8)
+        self.diretorio = tempfile.mkdtemp()
+        self.opcoes = {"tamanho_segmento": 20000, "registros_por_bloco": 16, "registros_por_fsync": 50}
+        self.log = LogEventos(self.diretorio, **self.opcoes)
+        self.eventos = []
+        for i in range(1000):
+            evento = registrar_evento(random.choice(["morte", "nascimento"]), "teste", i * 0.5 + random.uniform(-2, 2), ["s1"])
+            self.log.registrar(evento)
+            self.eventos.append(json.loads(json.dumps(evento)))
+
+    def tearDown(self):
+        """
+        Limpeza após os testes.
+        """
+        self.log.fechar()
+        shutil.rmtree(self.diretorio)
+
+    def test_consulta_por_intervalo(self):
+        """
+        Testa consultas por intervalo e tipo em vários segmentos.
+        """
+        segmentos = [n for n in os.listdir(self.diretorio) if n.endswith(".log")]
+        self.assertGreater(len(segmentos), 1)
+
+        self.assertEqual(self.log.consultar(100.0, 120.0), [e for e in self.eventos if 100.0 <= e["tempo"] <= 120.0])
+        self.assertEqual(self.log.consultar(tipo="morte"), [e for e in self.eventos if e["tipo"] == "morte"])
+        self.assertEqual(self.log.consultar(), self.eventos)
+
+    def test_reabertura_apos_queda(self):
+        """
+        Testa se um registro truncado é descartado e o log continua após reabrir.
+        """
+        self.log._arquivo.write(b"\x40\x00\x00\x00incompleto")
+        self.log._arquivo.flush()
+
+        log = LogEventos(self.diretorio, **self.opcoes)
+        self.assertEqual(log.num_registros, 1000)
+        self.assertEqual(log.consultar(), self.eventos)
+
+        log.registrar(registrar_evento("descoberta", "teste", 1000.0))
+        log.fechar()
+        self.assertEqual(LogEventos(self.diretorio, **self.opcoes).consultar(999.0, 1001.0)[0]["tipo"], "descoberta")
+
+    def test_historico_le_eventos_descartados(self):
+        """
+        Testa se o Historico consulta o disco para eventos fora da memória.
+        """
+        historico = Historico()
+        historico.ativar_log_eventos(os.path.join(self.diretorio, "historico"))
+        for i in range(1500):
+            historico.registrar_morte(float(i), f"s{i}", "fome")
+
+        self.assertEqual(len(historico.eventos), 1000)
+        self.assertEqual([e["envolvidos"] for e in historico.obter_eventos_por_periodo(10.0, 11.0)], [["s10"], ["s11"]])
+        self.assertEqual(len(list(historico.reproduzir_eventos(tipo="morte"))), 1500)
+        historico.fechar_log_eventos()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+Testes unitários para o módulo de memórias.
+"""
+
+import math
+import pickle
+import unittest
+
+from modelos.memoria import ArmazemMemorias, Memoria
+from modelos.senciante import Senciante
+from utils.config import MEMORY_DECAY_RATE, MEMORY_THRESHOLD
+
+class TestArmazemMemorias(unittest.TestCase):
+    """
+    Testes para a classe ArmazemMemorias.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes.
+        """
+        self.armazem = ArmazemMemorias(dono=7, capacidade=4)
+
+    def test_envelhecimento_na_leitura(self):
+        """
+        Testa se a importância decai com o tempo decorrido e se memórias abaixo do limiar são esquecidas.
+        """
+        self.armazem.adicionar("evento", "fraca", 0.5)
+        self.armazem.avancar(10.0)
+        self.armazem.adicionar("evento", "recente", 0.5)
+        self.armazem.adicionar("evento", "permanente", 0.9)
+        self.armazem.avancar(5.0)
+
+        fraca, recente, permanente = self.armazem
+        self.assertAlmostEqual(fraca.importancia, 0.5 * math.exp(-MEMORY_DECAY_RATE * 15.0))
+        self.assertAlmostEqual(recente.importancia, 0.5 * math.exp(-MEMORY_DECAY_RATE * 5.0))
+        self.assertEqual(permanente.importancia, 0.9)
+        self.assertEqual(recente.tempo, 10.0)
+
+        # A primeira memória cai abaixo do limiar antes da segunda
+        vida = math.log(0.5 / MEMORY_THRESHOLD) / MEMORY_DECAY_RATE
+        self.armazem.avancar(vida - 15.0 + 1.0)
+        self.assertEqual([m.conteudo for m in self.armazem], ["recente", "permanente"])
+        self.armazem.avancar(10.0)
+        self.assertEqual([m.conteudo for m in self.armazem], ["permanente"])
+
+    def test_capacidade_mantem_as_mais_importantes(self):
+        """
+        Testa se, acima da capacidade, a memória de menor importância atual é descartada.
+        """
+        self.armazem.adicionar("evento", "antiga", 0.7)
+        self.armazem.avancar(50.0)  # 0.7 * e^-0.5 ~ 0.42
+        for conteudo, importancia in [("a", 0.5), ("b", 0.6), ("c", 0.95), ("d", 0.45)]:
+            self.armazem.adicionar("evento", conteudo, importancia)
+
+        self.assertEqual(len(self.armazem), 4)
+        self.assertEqual([m.conteudo for m in self.armazem], ["a", "b", "c", "d"])
+        self.assertEqual(self.armazem[-1].conteudo, "d")
+        self.assertIsInstance(self.armazem[0], Memoria)
+        self.assertEqual(self.armazem[0].id, (7, 2))
+
+        self.armazem.adicionar("evento", "e", 0.2)
+        self.assertEqual([m.conteudo for m in self.armazem], ["a", "b", "c", "d"])
+
+    def test_indice_por_tipo(self):
+        """
+        Testa a consulta por tipo, com e sem índice.
+        """
+        self.armazem.adicionar("localizacao", "recurso em [1, 2]", 0.3)
+        self.armazem.adicionar("social", "conversa", 0.9)
+        self.armazem.adicionar("localizacao", "recurso em [3, 4]", 0.9)
+        self.assertIn("localizacao", self.armazem.indices)
+
+        self.assertEqual([m.conteudo for m in self.armazem.por_tipo("localizacao")],
+                         ["recurso em [1, 2]", "recurso em [3, 4]"])
+        self.assertEqual([m.conteudo for m in self.armazem.por_tipo("social")], ["conversa"])
+
+        # Memórias descartadas saem do índice
+        for i in range(3):
+            self.armazem.adicionar("social", str(i), 0.85)
+        self.assertEqual([m.conteudo for m in self.armazem.por_tipo("localizacao")], ["recurso em [3, 4]"])
+
+    def test_replicacao_por_alteracoes(self):
+        """
+        Testa se uma cópia do armazém acompanha o original aplicando só as alterações desde a marca.
+        """
+        self.armazem.adicionar("localizacao", "rio", 0.5)
+        self.armazem.adicionar("social", "conversa", 0.9)
+        copia = pickle.loads(pickle.dumps(self.armazem))
+        marca = (self.armazem.sequencia, len(self.armazem.entradas))
+
+        # Só o relógio avançou: nenhuma entrada é enviada
+        self.armazem.avancar(1.0)
+        alteracoes = self.armazem.alteracoes_desde(*marca)
+        self.assertIsNone(alteracoes.sequencias)
+        copia.aplicar_alteracoes(alteracoes)
+        self.assertEqual(copia.tempo, self.armazem.tempo)
+
+        # Só entradas novas: a cópia as inclui sem reconstruir o heap
+        self.armazem.adicionar("localizacao", "novo", 0.5)
+        copia.aplicar_alteracoes(self.armazem.alteracoes_desde(*marca))
+        self.assertEqual([m.conteudo for m in copia], ["rio", "conversa", "novo"])
+        marca = (self.armazem.sequencia, len(self.armazem.entradas))
+
+        # Novas memórias, com descarte das menos importantes acima da capacidade
+        for i in range(4):
+            self.armazem.adicionar("localizacao", str(i), 0.6 + i * 0.1)
+        alteracoes = self.armazem.alteracoes_desde(*marca)
+        self.assertEqual(len(alteracoes.novas), 3)
+        copia.aplicar_alteracoes(alteracoes)
+
+        self.assertEqual([m.conteudo for m in copia], ["conversa", "1", "2", "3"])
+        self.assertEqual([m.conteudo for m in copia.por_tipo("localizacao")], ["1", "2", "3"])
+
+        # O heap reconstruído descarta na cópia a mesma memória que no original
+        for armazem in (copia, self.armazem):
+            armazem.adicionar("evento", "forte", 0.99)
+        self.assertEqual([m.conteudo for m in copia], [m.conteudo for m in self.armazem])
+
+    def test_snapshot_preserva_idade_das_memorias(self):
+        """
+        Testa se as memórias de um Senciante restaurado de um snapshot mantêm a idade e a importância.
+        """
+        senciante = Senciante([10.0, 10.0])
+        senciante.memoria.adicionar("teste", "antiga", 0.6)
+        senciante.memoria.avancar(5.0)
+        senciante.memoria.adicionar("teste", "recente", 0.6)
+
+        restaurado = pickle.loads(pickle.dumps(senciante))
+        self.assertEqual([(m.conteudo, m.tempo, m.importancia) for m in restaurado.memoria],
+                         [(m.conteudo, m.tempo, m.importancia) for m in senciante.memoria])
+        self.assertLess(restaurado.memoria[0].importancia, restaurado.memoria[1].importancia)
+
+        # O ID de cada memória inclui o dono, pois a sequência se repete entre Senciantes
+        outro = Senciante([20.0, 20.0])
+        outro.memoria.adicionar("teste", "antiga", 0.6)
+        self.assertEqual(restaurado.memoria[0].id, (senciante.id, 1))
+        self.assertNotEqual(outro.memoria[0].id, senciante.memoria[0].id)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -125,6 +125,47 @@ class TestMundo(unittest.TestCase):
         self.assertEqual(len(recursos), 1)
         self.assertEqual(recursos[0].tipo, "comida")
     
+    def test_recursos_proximos_ordenados_por_distancia(self):
+        """
+        Testa se a busca de recursos retorna do mais próximo para o mais distante
+        e ignora recursos esgotados.
+        """
+        # Limpar recursos existentes
+        self.mundo.recursos = {}
+        
+        # Inserir o recurso mais distante primeiro
+        distante = Recurso("comida", [18.0, 10.0], 1.0)
+        proximo = Recurso("comida", [11.0, 10.0], 1.0)
+        self.mundo.adicionar_recurso(distante)
+        self.mundo.adicionar_recurso(proximo)
+        
+        recursos = self.mundo.encontrar_recursos_proximos([10.0, 10.0], 10.0, "comida")
+        self.assertEqual(recursos, [proximo, distante])
+        
+        # Recurso esgotado sai da busca
+        proximo.coletar(1.0)
+        recursos = self.mundo.encontrar_recursos_proximos([10.0, 10.0], 10.0, "comida")
+        self.assertEqual(recursos, [distante])
+        
+        # Recurso removido do mundo também
+        self.mundo.remover_recurso(distante.id)
+        self.assertEqual(self.mundo.encontrar_recursos_proximos([10.0, 10.0], 10.0), [])
+    
+    def test_encontrar_construcoes_proximas(self):
+        """
+        Testa a busca de construções próximas após adicionar e remover construções.
+        """
+        abrigo = Construcao("abrigo_simples", [20.0, 20.0], 1.0)
+        ferramenta = Construcao("ferramenta_simples", [22.0, 20.0], 1.0)
+        self.mundo.adicionar_construcao(abrigo)
+        self.mundo.adicionar_construcao(ferramenta)
+        
+        self.assertEqual(self.mundo.encontrar_construcoes_proximas([23.0, 20.0], 5.0), [ferramenta, abrigo])
+        self.assertEqual(self.mundo.encontrar_construcoes_proximas([23.0, 20.0], 5.0, "abrigo_simples"), [abrigo])
+        
+        self.mundo.remover_construcao(abrigo.id)
+        self.assertEqual(self.mundo.encontrar_construcoes_proximas([23.0, 20.0], 5.0), [ferramenta])
+    
     def test_adicionar_construcao(self):
         """
         Testa a adição de uma construção ao mundo.
@@ -0,0 +1,123 @@
+"""
+Testes unitários para o módulo AgendadorNivelDetalhe.
+"""
+
+import pickle
+import unittest
+
+from modelos.nivel_detalhe import AgendadorNivelDetalhe
+from modelos.senciante import Senciante
+from simulacao import Simulacao
+
+class TestAgendadorNivelDetalhe(unittest.TestCase):
+    """
+    Testes para a classe AgendadorNivelDetalhe.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes.
+        """
+        self.agendador = AgendadorNivelDetalhe({"reduzido": 4, "minimo": 16})
+        self.senciante = Senciante([5.0, 5.0])
+        self.senciante.atividade_atual = "descansar"
+        self.senciante.modificadores = {}
+        for necessidade in self.senciante.necessidades:
+            self.senciante.necessidades[necessidade] = 0.0
+        self.senciantes = {self.senciante.id: self.senciante}
+
+    def _executar(self, passos, delta_tempo=0.1):
+        """
+        Avança o agendador, reagendando os Senciantes atualizados como faz a simulação.
+
+        Returns:
+            list: Tuplas (passo, tempo acumulado, passos acumulados) das atualizações do Senciante.
+        """
+        atualizacoes = []
+        for _ in range(passos):
+            for senciante_id, (delta, acumulados) in self.agendador.avancar(delta_tempo, self.senciantes).items():
+                atualizacoes.append((self.agendador.passo, round(delta, 6), acumulados))
+                self.agendador.reagendar(self.senciantes[senciante_id], delta_tempo)
+        return atualizacoes
+
+    def test_senciante_ocioso_atualizado_com_tempo_acumulado(self):
+        """
+        Testa se um Senciante parado e sem necessidades iminentes é atualizado a cada 16 passos.
+        """
+        atualizacoes = self._executar(33)
+
+        self.assertEqual(atualizacoes, [(1, 0.1, 1), (17, 1.6, 16), (33, 1.6, 16)])
+        self.assertEqual(self.agendador.contagens(), {"completo": 0, "reduzido": 0, "minimo": 1})
+
+    def test_necessidade_iminente_reduz_intervalo(self):
+        """
+        Testa se necessidades prestes a ficar urgentes ou fatais mantêm o Senciante mais detalhado.
+        """
+        # Sede (0.1 por hora) urgente em 0.6: 16 passos de 0.1h ultrapassariam o limiar, 4 não
+        self.senciante.necessidades["sede"] = 0.55
+        self.assertEqual(self.agendador.classificar(self.senciante, 0.1), "reduzido")
+
+        # Em 4 passos a sede passaria do limiar: nível completo
+        self.senciante.necessidades["sede"] = 0.58
+        self.assertEqual(self.agendador.classificar(self.senciante, 0.1), "completo")
+
+        # Já urgente, mas longe de ser fatal: não precisa de detalhe
+        self.senciante.necessidades["sede"] = 0.7
+        self.assertEqual(self.agendador.classificar(self.senciante, 0.1), "minimo")
+
+        # Fome perto do limiar crítico (morte)
+        self.senciante.necessidades["fome"] = 0.89
+        self.assertEqual(self.agendador.classificar(self.senciante, 0.1), "completo")
+
+        # Quem se desloca não vai ao nível mínimo
+        self.senciante.necessidades["sede"] = self.senciante.necessidades["fome"] = 0.0
+        self.senciante.atividade_atual = "procurar_agua"
+        self.assertEqual(self.agendador.classificar(self.senciante, 0.1), "reduzido")
+
+    def test_promocao_e_regiao_observada(self):
+        """
+        Testa se interações e regiões observadas devolvem o Senciante à atualização a cada passo.
+        """
+        self._executar(1)
+        self.agendador.promover(self.senciante.id)
+        self.assertEqual(self._executar(1), [(2, 0.1, 1)])
+        self.assertEqual(self.agendador.niveis[self.senciante.id], "completo")
+
+        # Sem nova promoção, volta ao nível mínimo
+        self._executar(1)
+        self.assertEqual(self.agendador.niveis[self.senciante.id], "minimo")
+
+        # Observar a região o promove no passo seguinte, mesmo fora da vez
+        self.agendador.observar((0, 0, 10, 10))
+        self.assertEqual(self._executar(2), [(4, 0.1, 1), (5, 0.1, 1)])
+        self.agendador.deixar_de_observar((0, 0, 10, 10))
+        self.assertEqual(self.agendador.regioes_observadas, ())
+
+        # As regiões observadas não vão para snapshots
+        self.agendador.observar((20, 20, 30, 30))
+        restaurado = pickle.loads(pickle.dumps(self.agendador))
+        self.assertEqual(restaurado.regioes_observadas, ())
+        self.assertEqual(restaurado.proximo, self.agendador.proximo)
+
+    def test_simulacao_com_nivel_detalhe(self):
+        """
+        Testa se a simulação integra o tempo acumulado ao atualizar um Senciante fora da vez.
+        """
+        simulacao = Simulacao(tamanho_mundo=(20, 20), num_senciantes_inicial=0)
+        simulacao.senciantes = dict(self.senciantes)
+        simulacao.ativar_nivel_detalhe()
+
+        idade = self.senciante.estado["idade"]
+        for _ in range(10):
+            simulacao.passo(0.1)
+
+        self.assertEqual(simulacao.nivel_detalhe.niveis[self.senciante.id], "minimo")
+        self.assertAlmostEqual(self.senciante.estado["idade"], idade + 0.1)
+
+        # Ao desativar, o tempo pendente é integrado
+        simulacao.desativar_nivel_detalhe()
+        self.assertIsNone(simulacao.nivel_detalhe)
+        self.assertAlmostEqual(self.senciante.estado["idade"], idade + 1.0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+"""
+Testes unitários para o particionamento espacial do passo da simulação.
+"""
+
+import pickle
+import random
+import unittest
+
+import numpy as np
+
+from modelos.construcao import Construcao
+from modelos.particionamento import GradeTiles
+from modelos.recurso import Recurso
+from simulacao import Simulacao
+
+class TestParticionamento(unittest.TestCase):
+    """
+    Testes para GradeTiles e ParticionamentoEspacial.
+    """
+
+    def _executar(self, processos, passos=20):
+        """
+        Executa uma simulação particionada a partir de uma semente fixa.
+
+        Args:
+            processos (int): Número de processos do particionamento.
+            passos (int, optional): Número de passos. Default é 20.
+
+        Returns:
+            tuple: (estado dos Senciantes, quantidades dos recursos), sem IDs.
+        """
+        random.seed(11)
+        np.random.seed(11)
+        simulacao = Simulacao((120, 120), 30)
+        simulacao.ativar_particionamento(processos=processos, tiles=(3, 2), halo=25.0)
+        try:
+            simulacao.executar_lote(0.1, num_passos=passos // 2)
+            # Forçar a realocação das colunas (e da memória compartilhada) no meio da execução
+            simulacao.populacao._expandir()
+            simulacao.executar_lote(0.1, num_passos=passos - passos // 2)
+        finally:
+            simulacao.desativar_particionamento()
+
+        senciantes = sorted(
+            (tuple(s.posicao), round(s.necessidades["fome"], 12), round(s.estado["idade"], 12),
+             s.atividade_atual, len(s.memoria))
+            for s in simulacao.senciantes.values()
+        )
+        recursos = sorted((tuple(r.posicao), round(r.quantidade, 12)) for r in simulacao.mundo.recursos.values())
+        return senciantes, recursos
+
+    def test_grade_tiles(self):
+        """
+        Testa a atribuição de posições aos tiles e aos halos.
+        """
+        grade = GradeTiles((100, 60), tiles=(4, 3), halo=5.0)
+        self.assertEqual(len(grade), 12)
+        self.assertEqual(grade.tile([0, 0]), 0)
+        self.assertEqual(grade.tile([30, 25]), 1 + 1 * 4)
+        # Posições na borda direita ou fora do mapa ficam no tile da borda
+        self.assertEqual(grade.tile([100, 60]), 11)
+        self.assertEqual(grade.tile([-3, 70]), 8)
+
+        posicoes = np.array([[0, 0], [30, 25], [100, 60], [-3, 70]], dtype=float)
+        self.assertEqual(grade.tiles_de(posicoes).tolist(), [0, 5, 11, 8])
+
+        # Longe das bordas, só o próprio tile; perto de um canto, os quatro tiles ao redor
+        self.assertEqual(grade.tiles_com_halo([37.5, 30]), [5])
+        self.assertEqual(sorted(grade.tiles_com_halo([49, 41])), [5, 6, 9, 10])
+
+        with self.assertRaises(ValueError):
+            GradeTiles((100, 60), tiles=(0, 3))
+
+    def test_resultado_independe_do_numero_de_processos(self):
+        """
+        Testa se o passo em processos trabalhadores, com memória compartilhada, dá o mesmo
+        resultado que os mesmos tiles atualizados no processo principal.
+        """
+        self.assertEqual(self._executar(processos=1), self._executar(processos=2))
+
+    def test_troca_de_halo(self):
+        """
+        Testa se as coletas de dois tiles em um recurso do halo são aplicadas ao recurso real.
+        """
+        random.seed(3)
+        simulacao = Simulacao((100, 100), 2)
+        simulacao.ativar_particionamento(processos=1, tiles=(2, 1), halo=10.0)
+
+        recurso = Recurso("comida", [50.0, 50.0], 1.5)
+        simulacao.mundo.recursos = {recurso.id: recurso}
+
+        # Um Senciante de cada lado da borda entre os dois tiles, ambos junto ao recurso
+        for senciante, x in zip(simulacao.senciantes.values(), (49.5, 50.5)):
+            senciante.posicao = [x, 50.0]
+            for chave in senciante.necessidades:
+                senciante.necessidades[chave] = 0.0
+            senciante.estado["energia"] = 1.0
+            senciante.atividade_atual = "buscar_comida"
+            senciante.alvo_atual = recurso
+
+        simulacao.particionamento.atualizar(simulacao.senciantes, simulacao.populacao, simulacao.mundo, 0.1)
+        simulacao.desativar_particionamento()
+
+        self.assertEqual(recurso.quantidade, 0.0)
+        self.assertEqual(simulacao.mundo.encontrar_recursos_proximos([50.0, 50.0], 5.0), [])
+        for senciante in simulacao.senciantes.values():
+            self.assertIsNone(senciante.alvo_atual)
+            self.assertAlmostEqual(senciante.inventario["comida"], 0.5)
+            self.assertEqual(senciante.memoria[-1].tipo, "coleta")
+
+    def test_ocupantes_voltam_da_troca_de_halo(self):
+        """
+        Testa se um Senciante que ocupa um abrigo no tile passa a ocupar o abrigo real.
+        """
+        random.seed(3)
+        simulacao = Simulacao((100, 100), 1)
+        simulacao.ativar_particionamento(processos=1, tiles=(2, 1), halo=10.0)
+
+        abrigo = Construcao("abrigo", [30.0, 50.0], 1.0)
+        simulacao.mundo.construcoes = {abrigo.id: abrigo}
+
+        senciante = next(iter(simulacao.senciantes.values()))
+        senciante.posicao = [30.0, 50.0]
+        for chave in senciante.necessidades:
+            senciante.necessidades[chave] = 0.0
+        # Sono abaixo do limiar de urgência, para que o descanso continue em vez de recomeçar
+        senciante.estado["energia"] = 0.5
+        senciante.necessidades["sono"] = 0.5
+        senciante.atividade_atual = "descansar"
+        senciante.alvo_atual = abrigo
+
+        simulacao.particionamento.atualizar(simulacao.senciantes, simulacao.populacao, simulacao.mundo, 0.1)
+        simulacao.desativar_particionamento()
+
+        self.assertEqual(abrigo.ocupantes, [senciante.id])
+        self.assertIs(senciante.alvo_atual, abrigo)
+
+    def test_replicas_residentes(self):
+        """
+        Testa se as réplicas ficam no trabalhador entre os passos e recebem apenas os
+        campos alterados no processo principal.
+        """
+        random.seed(5)
+        simulacao = Simulacao((100, 100), 3)
+        simulacao.ativar_particionamento(processos=2, tiles=(2, 1), halo=10.0)
+        particionamento = simulacao.particionamento
+        mensagens = []
+        for trabalhador in particionamento.trabalhadores:
+            enviar = trabalhador.enviar
+            trabalhador.enviar = lambda mensagem, enviar=enviar: mensagens.append(mensagem) or enviar(mensagem)
+        try:
+            particionamento.atualizar(simulacao.senciantes, simulacao.populacao, simulacao.mundo, 0.1)
+            senciante = next(iter(simulacao.senciantes.values()))
+            residente = particionamento.residentes[senciante.id]
+            self.assertEqual(sum(len(mensagem["entram"]) for mensagem in mensagens), 3)
+
+            # Alterações feitas no processo principal (como nas interações) chegam à mesma réplica
+            senciante.inventario["madeira"] = 2.0
+            senciante.memoria.adicionar("social", "conversa", 0.8)
+
+            del mensagens[:]
+            particionamento.atualizar(simulacao.senciantes, simulacao.populacao, simulacao.mundo, 0.1)
+            slot, trabalhador = residente
+            self.assertEqual(particionamento.residentes[senciante.id], residente)
+            self.assertEqual([mensagem["entram"] for mensagem in mensagens], [{}, {}])
+            self.assertEqual(set(mensagens[trabalhador]["alteracoes"][slot]), {"inventario", "memoria"})
+            self.assertEqual(senciante.inventario["madeira"], 2.0)
+            self.assertIn("conversa", [m.conteudo for m in senciante.memoria])
+        finally:
+            simulacao.desativar_particionamento()
+
+    def test_snapshot_sem_particionamento(self):
+        """
+        Testa se os processos trabalhadores e a memória compartilhada ficam fora dos snapshots.
+        """
+        simulacao = Simulacao((50, 50), 4)
+        simulacao.ativar_particionamento(processos=1)
+        restaurada = pickle.loads(pickle.dumps(simulacao))
+        simulacao.desativar_particionamento()
+
+        self.assertIsNone(restaurada.particionamento)
+        self.assertIsNotNone(restaurada.populacao)
+
+if __name__ == "__main__":
+    unittest.main()
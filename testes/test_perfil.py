@@ -0,0 +1,103 @@
+"""
+Testes unitários para o módulo PerfilPassos.
+"""
+
+import json
+import os
+import random
+import tempfile
+import unittest
+
+import api_server
+from simulacao import Simulacao
+from utils.perfil import HistogramaRolante, PerfilPassos
+
+class TestPerfilPassos(unittest.TestCase):
+    """
+    Testes para as classes HistogramaRolante e PerfilPassos.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes.
+        """
+        random.seed(6)
+        self.simulacao = Simulacao([30, 30], 8)
+
+    def test_histograma_rolante(self):
+        """
+        Testa os percentis e o descarte das amostras antigas.
+        """
+        histograma = HistogramaRolante(janela=100)
+        for valor in range(1, 201):
+            histograma.registrar(float(valor))
+
+        resumo = histograma.resumo()
+        self.assertEqual(resumo["amostras"], 100)
+        self.assertAlmostEqual(resumo["p50"], 150.5)
+        self.assertEqual(resumo["max"], 200.0)
+        self.assertEqual(HistogramaRolante().resumo()["amostras"], 0)
+
+    def test_fases_do_passo(self):
+        """
+        Testa se as fases do passo são medidas e se o total é coerente.
+        """
+        perfil = self.simulacao.ativar_perfil(janela=50)
+        self.simulacao.executar_lote(0.5, num_passos=10)
+
+        resumo = perfil.resumo()
+        self.assertEqual(resumo["passos"], 10)
+        self.assertEqual(resumo["contagens"]["senciantes"], len(self.simulacao.senciantes))
+        for fase in ("mundo", "senciantes.fisiologia", "senciantes.decisao", "interacoes", "reproducao", "callbacks"):
+            self.assertEqual(resumo["fases"][fase]["amostras"], 10)
+
+        soma_medias = sum(fase["media"] for fase in resumo["fases"].values())
+        self.assertLessEqual(soma_medias, resumo["passo"]["media"] * 1.01)
+
+        self.simulacao.desativar_perfil()
+        self.simulacao.passo(0.5)
+        self.assertIsNone(self.simulacao.perfil)
+        self.assertEqual(perfil.num_passos, 10)
+
+    def test_arquivo_trace_e_fase_externa(self):
+        """
+        Testa o trace por passo e a medição de fases externas.
+        """
+        with tempfile.TemporaryDirectory() as diretorio:
+            caminho = os.path.join(diretorio, "trace.jsonl")
+            perfil = self.simulacao.ativar_perfil(arquivo_trace=caminho)
+            self.simulacao.executar_lote(0.5, num_passos=3)
+            with perfil.fase("mecanica.teste"):
+                pass
+            self.simulacao.desativar_perfil()
+
+            with open(caminho) as f:
+                linhas = [json.loads(linha) for linha in f]
+
+        self.assertEqual([linha["passo"] for linha in linhas], [1, 2, 3])
+        self.assertIn("senciantes.decisao", linhas[0]["fases"])
+        self.assertEqual(perfil.resumo()["fases"]["mecanica.teste"]["amostras"], 1)
+
+    def test_endpoint_perf(self):
+        """
+        Testa os endpoints /api/perf.
+        """
+        api_server.simulacao = self.simulacao
+        try:
+            cliente = api_server.app.test_client()
+            self.assertFalse(json.loads(cliente.get("/api/perf").data)["ativo"])
+
+            cliente.post("/api/perf", json={"ativo": True})
+            self.simulacao.executar_lote(0.5, num_passos=2)
+            dados = json.loads(cliente.get("/api/perf").data)
+            self.assertTrue(dados["ativo"])
+            self.assertEqual(dados["passos"], 2)
+            self.assertIn("p95", dados["fases"]["senciantes.decisao"])
+
+            cliente.post("/api/perf", json={"ativo": False})
+            self.assertIsNone(self.simulacao.perfil)
+        finally:
+            api_server.simulacao = None
+
+if __name__ == "__main__":
+    unittest.main()
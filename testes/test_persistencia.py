@@ -0,0 +1,128 @@
+"""
+Testes unitários para o módulo de persistência (snapshots binários).
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+from simulacao import Simulacao
+from utils.helpers import caminho_no_diretorio
+from utils.persistencia import serializar_snapshot, desserializar_snapshot, ErroSnapshot
+
+class TestPersistencia(unittest.TestCase):
+    """
+    Testes para salvar e restaurar snapshots da simulação.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes.
+        """
+        random.seed(5)
+        np.random.seed(5)
+        self.simulacao = Simulacao([50, 50], 15)
+        self.simulacao.registrar_callback("atualizacao", lambda s: None)
+        self.simulacao.executar_lote(0.1, num_passos=30)
+
+        # Garantir memórias e relações para comparar
+        senciantes = list(self.simulacao.senciantes.values())
+        senciantes[0].estabelecer_relacao(senciantes[1].id, "amizade", 0.7)
+        senciantes[0]._adicionar_memoria("teste", "Memória de teste", 0.9)
+
+    def _salvar_e_carregar(self, simulacao):
+        with tempfile.TemporaryDirectory() as diretorio:
+            caminho = os.path.join(diretorio, "estado.snap")
+            simulacao.salvar(caminho)
+            return Simulacao.carregar(caminho)
+
+    def test_restaurar_simulacao(self):
+        """
+        Testa se o snapshot restaura Senciantes, mundo e histórico.
+        """
+        restaurada = self._salvar_e_carregar(self.simulacao)
+
+        self.assertEqual(restaurada.tempo_simulacao, self.simulacao.tempo_simulacao)
+        self.assertEqual(restaurada.estatisticas, self.simulacao.estatisticas)
+        self.assertEqual(restaurada.mundo.to_dict(), self.simulacao.mundo.to_dict())
+        self.assertEqual(
+            {i: s.to_dict() for i, s in restaurada.senciantes.items()},
+            {i: s.to_dict() for i, s in self.simulacao.senciantes.items()}
+        )
+
+        # Threads e callbacks não são salvos
+        self.assertFalse(restaurada.executando)
+        self.assertEqual(restaurada.callbacks["atualizacao"], [])
+
+    def test_indices_restaurados(self):
+        """
+        Testa se os índices espaciais continuam vinculados após restaurar.
+        """
+        restaurada = self._salvar_e_carregar(self.simulacao)
+
+        recurso = next(iter(restaurada.mundo.recursos.values()))
+        self.assertIs(recurso.indice_espacial, restaurada.mundo.recursos.indice)
+        self.assertIn(recurso, restaurada.mundo.encontrar_recursos_proximos(recurso.posicao, 0.1))
+
+        senciante = next(iter(restaurada.senciantes.values()))
+        senciante.posicao = [1.0, 2.0]
+        self.assertEqual(restaurada.mundo.indice_senciantes.obter_posicao(senciante.id), (1.0, 2.0))
+
+        # A simulação restaurada continua executando
+        restaurada.executar_lote(0.1, num_passos=5)
+
+    def test_continua_igual_a_original(self):
+        """
+        Testa se a simulação restaurada evolui como a original com a mesma semente.
+        """
+        restaurada = self._salvar_e_carregar(self.simulacao)
+
+        for simulacao in (self.simulacao, restaurada):
+            random.seed(9)
+            np.random.seed(9)
+            simulacao.executar_lote(0.1, num_passos=20)
+
+        # IDs de Senciantes nascidos depois do snapshot são novos UUIDs; comparar o estado
+        def resumo(simulacao):
+            return [(s.posicao, dict(s.estado), dict(s.necessidades)) for s in simulacao.senciantes.values()]
+
+        self.assertEqual(restaurada.estatisticas, self.simulacao.estatisticas)
+        self.assertEqual(resumo(restaurada), resumo(self.simulacao))
+
+    def test_populacao_colunar(self):
+        """
+        Testa se a população colunar é restaurada com as visões ligadas aos arrays.
+        """
+        simulacao = Simulacao([50, 50], 10, populacao_colunar=True)
+        simulacao.executar_lote(0.1, num_passos=5)
+        restaurada = desserializar_snapshot(serializar_snapshot(simulacao))
+
+        senciante = next(iter(restaurada.senciantes.values()))
+        senciante.estado["saude"] = 0.123
+        slot = restaurada.populacao.slots[senciante.id]
+        self.assertEqual(restaurada.populacao.estado[slot, 1], 0.123)
+
+    def test_arquivo_invalido(self):
+        """
+        Testa a rejeição de arquivos que não são snapshots.
+        """
+        with self.assertRaises(ErroSnapshot):
+            desserializar_snapshot(b"{\"json\": true}")
+
+    def test_nome_de_snapshot_restrito_ao_diretorio(self):
+        """
+        Testa se nomes recebidos pela API não saem do diretório de snapshots.
+        """
+        self.assertEqual(caminho_no_diretorio("snapshots", "estado.snap", (".snap",)),
+                         os.path.join("snapshots", "estado.snap"))
+
+        for nome in ("../estado.snap", "/tmp/estado.snap", "sub/estado.snap", "sub\\estado.snap",
+                     "..snap", ".oculto.snap", "", None, "estado.txt"):
+            with self.assertRaises(ValueError):
+                caminho_no_diretorio("snapshots", nome, (".snap",))
+
+if __name__ == "__main__":
+    unittest.main()
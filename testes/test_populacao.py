@@ -0,0 +1,106 @@
+"""
+Testes unitários para o módulo PopulacaoColunar.
+"""
+
+import unittest
+import random
+from modelos.populacao import PopulacaoColunar, VisaoColunar
+from modelos.senciante import Senciante
+from simulacao import Simulacao
+
+class TestPopulacaoColunar(unittest.TestCase):
+    """
+    Testes para a classe PopulacaoColunar.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes.
+        """
+        random.seed(7)
+        self.populacao = PopulacaoColunar(capacidade_inicial=4)
+        self.senciantes = {}
+        for _ in range(10):
+            senciante = Senciante([random.uniform(0, 50), random.uniform(0, 50)])
+            senciante.necessidades["fome"] = random.uniform(0.0, 0.9)
+            senciante.necessidades["sede"] = random.uniform(0.0, 0.9)
+            senciante.estado["energia"] = random.uniform(0.0, 1.0)
+            senciante.estado["saude"] = random.uniform(0.2, 1.0)
+            self.senciantes[senciante.id] = senciante
+
+    def test_visoes(self):
+        """
+        Testa se os Senciantes vinculados leem e escrevem nos arrays da população.
+        """
+        senciante = next(iter(self.senciantes.values()))
+        fome = senciante.necessidades["fome"]
+        senciante.habilidades["arte"] = 0.3
+
+        self.populacao.sincronizar(self.senciantes)
+
+        # A capacidade inicial deve ter sido expandida
+        self.assertEqual(len(self.populacao), 10)
+        self.assertGreaterEqual(self.populacao.capacidade, 10)
+        self.assertIsInstance(senciante.necessidades, VisaoColunar)
+        self.assertEqual(senciante.necessidades["fome"], fome)
+        self.assertEqual(senciante.habilidades["arte"], 0.3)
+
+        senciante.estado["saude"] = 0.25
+        slot = self.populacao.slots[senciante.id]
+        self.assertEqual(self.populacao.estado[slot, 1], 0.25)
+
+        # Ao desvincular, os valores voltam para dicionários comuns
+        senciante.vincular_populacao(None)
+        self.assertIsInstance(senciante.estado, dict)
+        self.assertEqual(senciante.estado["saude"], 0.25)
+        self.assertEqual(senciante.habilidades["arte"], 0.3)
+        self.assertNotIn(senciante.id, self.populacao)
+
+    def test_atualizar_fisiologia_equivale_ao_escalar(self):
+        """
+        Testa se a atualização vetorizada produz os mesmos valores da atualização por Senciante.
+        """
+        referencia = {}
+        for senciante_id, senciante in self.senciantes.items():
+            copia = Senciante(list(senciante.posicao), senciante.genoma)
+            copia.necessidades = dict(senciante.necessidades)
+            copia.estado = dict(senciante.estado)
+            referencia[senciante_id] = copia
+
+        self.populacao.sincronizar(self.senciantes)
+
+        for _ in range(50):
+            mortos = set(self.populacao.atualizar_fisiologia(0.5))
+            mortos_esperados = {
+                senciante_id for senciante_id, copia in referencia.items()
+                if not copia.atualizar_fisiologia(0.5)
+            }
+            self.assertEqual(mortos, mortos_esperados)
+
+            for senciante_id, copia in referencia.items():
+                senciante = self.senciantes[senciante_id]
+                for chave, valor in copia.necessidades.items():
+                    self.assertAlmostEqual(senciante.necessidades[chave], valor, places=12)
+                for chave, valor in copia.estado.items():
+                    self.assertAlmostEqual(senciante.estado[chave], valor, places=12)
+
+            for senciante_id in mortos:
+                self.senciantes.pop(senciante_id).vincular_populacao(None)
+                del referencia[senciante_id]
+            self.populacao.sincronizar(self.senciantes)
+
+    def test_simulacao_colunar(self):
+        """
+        Testa a simulação com população colunar.
+        """
+        random.seed(3)
+        simulacao = Simulacao([50, 50], 20, populacao_colunar=True)
+        simulacao.executar_lote(0.5, num_passos=20)
+
+        self.assertEqual(len(simulacao.populacao), len(simulacao.senciantes))
+        for senciante in simulacao.senciantes.values():
+            self.assertIs(senciante.populacao, simulacao.populacao)
+            self.assertIsInstance(senciante.to_dict()["estado"], dict)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Testes unitários para o módulo PublicadorEstado.
+"""
+
+import json
+import random
+import unittest
+
+import api_server
+from simulacao import Simulacao
+from utils.publicador_estado import PublicadorEstado
+
+class TestPublicadorEstado(unittest.TestCase):
+    """
+    Testes para a classe PublicadorEstado.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes.
+        """
+        random.seed(5)
+        self.simulacao = Simulacao([30, 30], 8)
+        self.publicador = PublicadorEstado()
+        self.simulacao.registrar_callback("atualizacao", self.publicador)
+
+    def test_snapshot_equivale_to_dict(self):
+        """
+        Testa se o snapshot tem o mesmo conteúdo da serialização direta.
+        """
+        self.simulacao.passo(0.5)
+        snapshot = self.publicador.atual
+
+        self.assertEqual(json.loads(snapshot.secoes["estado"]), json.loads(json.dumps(self.simulacao.to_dict())))
+        self.assertEqual(json.loads(snapshot.secoes["construcoes"]),
+                         [c.to_dict() for c in self.simulacao.mundo.construcoes.values()])
+        for senciante_id, senciante in self.simulacao.senciantes.items():
+            self.assertEqual(json.loads(snapshot.senciantes[senciante_id]), json.loads(json.dumps(senciante.to_dict())))
+
+    def test_snapshot_imutavel(self):
+        """
+        Testa se snapshots publicados não mudam com os passos seguintes.
+        """
+        self.simulacao.passo(0.5)
+        snapshot = self.publicador.atual
+        estado = snapshot.secoes["estado"]
+
+        self.simulacao.passo(0.5)
+        self.assertIsNot(self.publicador.atual, snapshot)
+        self.assertEqual(self.publicador.atual.versao, snapshot.versao + 1)
+        self.assertEqual(snapshot.secoes["estado"], estado)
+
+        with self.assertRaises(AttributeError):
+            snapshot.versao = 0
+        with self.assertRaises(TypeError):
+            snapshot.secoes["estado"] = "{}"
+
+    def test_intervalo_minimo(self):
+        """
+        Testa se passos dentro do intervalo mínimo não publicam.
+        """
+        publicador = PublicadorEstado(intervalo_minimo=60.0)
+        publicador(self.simulacao)
+        snapshot = publicador.atual
+        publicador(self.simulacao)
+        self.assertIs(publicador.atual, snapshot)
+
+    def test_endpoints_servem_snapshot(self):
+        """
+        Testa se os endpoints GET servem o snapshot publicado.
+        """
+        api_server.simulacao = self.simulacao
+        api_server.conectar_feed(self.simulacao)
+        try:
+            cliente = api_server.app.test_client()
+            senciante_id = next(iter(self.simulacao.senciantes))
+
+            resposta = cliente.get(f"/api/senciante/{senciante_id}")
+            self.assertEqual(resposta.mimetype, "application/json")
+            # Em JSON as chaves inteiras (IDs) viram strings
+            esperado = json.loads(json.dumps(self.simulacao.senciantes[senciante_id].to_dict()))
+            self.assertEqual(json.loads(resposta.data), esperado)
+
+            dados = json.loads(cliente.get("/api/estado").data)
+            self.assertEqual(dados["estado"]["tempo_simulacao"], self.simulacao.tempo_simulacao)
+            self.assertEqual(json.loads(cliente.get("/api/clima").data), self.simulacao.mundo.clima.to_dict())
+            self.assertEqual(json.loads(cliente.get("/api/senciante/inexistente").data)["status"], "error")
+        finally:
+            api_server.simulacao = None
+            api_server.feed_alteracoes = None
+            api_server.publicador_estado = None
+
+if __name__ == "__main__":
+    unittest.main()
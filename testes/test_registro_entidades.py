@@ -0,0 +1,76 @@
+"""
+Testes unitários para o módulo RegistroEntidades.
+"""
+
+import pickle
+import unittest
+
+from modelos.recurso import Recurso
+from modelos.senciante import Senciante
+from simulacao import Simulacao
+from utils.registro_entidades import RegistroEntidades, registro_entidades
+
+class TestRegistroEntidades(unittest.TestCase):
+    """
+    Testes para a classe RegistroEntidades.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes.
+        """
+        self.registro = RegistroEntidades()
+
+    def test_ids_crescentes_por_tipo(self):
+        """
+        Testa se os IDs crescem dentro de cada tipo e nunca colidem entre tipos.
+        """
+        senciantes = [self.registro.gerar("senciante") for _ in range(3)]
+        recursos = [self.registro.gerar("recurso") for _ in range(3)]
+
+        self.assertEqual(senciantes, sorted(senciantes))
+        self.assertTrue(set(senciantes).isdisjoint(recursos))
+        self.assertEqual(self.registro.tipo_de(recursos[0]), "recurso")
+        self.assertEqual(self.registro.contadores["senciante"], 3)
+
+        with self.assertRaises(ValueError):
+            self.registro.gerar("planeta")
+
+        # As entidades do jogo usam o registro do processo
+        senciante = Senciante([1.0, 1.0])
+        self.assertIsInstance(senciante.id, int)
+        self.assertEqual(registro_entidades.tipo_de(senciante.id), "senciante")
+        self.assertEqual(registro_entidades.tipo_de(Recurso("agua", (1, 1), 10).id), "recurso")
+
+    def test_ids_recebidos_de_fora(self):
+        """
+        Testa a conversão de IDs recebidos pela API, que são os próprios inteiros.
+        """
+        entidade_id = self.registro.gerar("construcao")
+
+        self.assertEqual(self.registro.interno(str(entidade_id)), entidade_id)
+        self.assertEqual(self.registro.interno(f" {entidade_id} "), entidade_id)
+        self.assertEqual(self.registro.interno(entidade_id), entidade_id)
+
+        # Valores que não são IDs passam inalterados (a busca pela entidade falha)
+        self.assertEqual(self.registro.interno("fantasma"), "fantasma")
+        self.assertEqual(self.registro.interno("construcao-1"), "construcao-1")
+
+    def test_snapshot_reserva_ids_usados(self):
+        """
+        Testa se, ao carregar um snapshot em um processo novo, novos IDs não repetem os já usados.
+        """
+        simulacao = Simulacao(tamanho_mundo=(20, 20), num_senciantes_inicial=0)
+        senciante = Senciante([5.0, 5.0])
+        simulacao.senciantes[senciante.id] = senciante
+        dados = pickle.dumps(simulacao)
+
+        # Simular um processo novo, com contadores zerados
+        registro_entidades.contadores = dict.fromkeys(registro_entidades.contadores, 0)
+        restaurada = pickle.loads(dados)
+
+        self.assertNotIn("contadores_ids", restaurada.__dict__)
+        self.assertGreater(Senciante([1.0, 1.0]).id, senciante.id)
+
+if __name__ == "__main__":
+    unittest.main()
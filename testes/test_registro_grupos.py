@@ -0,0 +1,78 @@
+"""
+Testes unitários para o módulo RegistroGrupos.
+"""
+
+import unittest
+from types import SimpleNamespace
+from utils.registro_grupos import RegistroGrupos
+from modelos.mundo import Mundo
+from modelos.senciante import Senciante
+
+class TestRegistroGrupos(unittest.TestCase):
+    """
+    Testes para a classe RegistroGrupos.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes.
+        """
+        self.registro = RegistroGrupos()
+        self.senciantes = {}
+        for i, (grupo_id, posicao) in enumerate([("tribo", [0.0, 0.0]), ("tribo", [10.0, 20.0]), (None, [5.0, 5.0])]):
+            senciante = Senciante(posicao)
+            senciante.grupo_id = grupo_id
+            senciante.inventario = {"comida": 1.0 + i}
+            senciante.habilidades["lideranca"] = 0.6 + i * 0.1
+            senciante.moralidade = SimpleNamespace(valores={"cooperacao": 0.2 * (i + 1)})
+            self.senciantes[senciante.id] = senciante
+        self.ids = list(self.senciantes)
+
+    def test_agregacao(self):
+        """
+        Testa a agregação dos membros de um grupo.
+        """
+        grupos = self.registro.obter(self.senciantes)
+
+        self.assertEqual(set(grupos), {"tribo", f"individual_{self.ids[2]}"})
+
+        tribo = grupos["tribo"]
+        self.assertEqual(tribo["membros"], self.ids[:2])
+        self.assertEqual(tribo["posicao_media"], [5.0, 10.0])
+        self.assertEqual(tribo["recursos"], {"comida": 3.0})
+        self.assertAlmostEqual(tribo["valores_morais"]["cooperacao"], 0.3)
+        self.assertEqual(tribo["lider_id"], self.ids[1])
+        self.assertEqual(self.registro.contar_grupos(self.senciantes), 1)
+
+    def test_cache_e_invalidacao(self):
+        """
+        Testa se a tabela é reconstruída apenas quando está suja.
+        """
+        primeira = self.registro.obter(self.senciantes)
+        self.assertIs(self.registro.obter(self.senciantes), primeira)
+        self.assertEqual(self.registro.reconstrucoes, 1)
+
+        # Mudança de participação só aparece após invalidar
+        self.senciantes[self.ids[2]].grupo_id = "tribo"
+        self.assertEqual(len(self.registro.obter(self.senciantes)), 2)
+        self.registro.invalidar()
+        self.assertEqual(len(self.registro.obter(self.senciantes)["tribo"]["membros"]), 3)
+
+        # Remover um Senciante força a reconstrução
+        del self.senciantes[self.ids[0]]
+        self.assertEqual(self.registro.obter(self.senciantes)["tribo"]["membros"], self.ids[1:])
+        self.assertEqual(self.registro.reconstrucoes, 3)
+
+    def test_mundo_invalida_a_cada_passo(self):
+        """
+        Testa se o mundo invalida o registro a cada atualização.
+        """
+        mundo = Mundo([20, 20])
+        mundo.registro_grupos.obter(self.senciantes)
+        self.assertFalse(mundo.registro_grupos.sujo)
+
+        mundo.atualizar(0.1)
+        self.assertTrue(mundo.registro_grupos.sujo)
+
+if __name__ == "__main__":
+    unittest.main()
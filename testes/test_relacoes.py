@@ -0,0 +1,78 @@
+"""
+Testes unitários para o módulo RelacoesSociais.
+"""
+
+import math
+import pickle
+import unittest
+
+from modelos.relacoes import RelacoesSociais
+from modelos.senciante import Senciante
+from utils.config import RELATION_STRENGTH_DECAY_RATE, RELATION_STRENGTH_THRESHOLD, RELATION_SWEEP_INTERVAL
+
+class TestRelacoesSociais(unittest.TestCase):
+    """
+    Testes para a classe RelacoesSociais.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes.
+        """
+        self.senciante = Senciante([10.0, 10.0])
+
+    def test_forca_calculada_na_leitura(self):
+        """
+        Testa se a força decai pelo tempo desde a última alteração.
+        """
+        self.senciante.estabelecer_relacao("a", "amigo", 0.6)
+        self.senciante._atualizar_relacoes(10.0)
+        self.senciante._atualizar_relacoes(10.0)
+
+        esperado = 0.6 * math.exp(-RELATION_STRENGTH_DECAY_RATE * 20.0)
+        self.assertAlmostEqual(self.senciante.relacoes["a"]["forca"], esperado)
+
+        # Fortalecer parte da força atual e reinicia o decaimento
+        self.senciante.fortalecer_relacao("a", 0.1)
+        self.assertAlmostEqual(self.senciante.relacoes["a"]["forca"], esperado + 0.1)
+        self.senciante._atualizar_relacoes(5.0)
+        self.assertAlmostEqual(self.senciante.relacoes["a"]["forca"],
+                               (esperado + 0.1) * math.exp(-RELATION_STRENGTH_DECAY_RATE * 5.0))
+        self.assertEqual(self.senciante.relacoes["a"]["tipo"], "amigo")
+
+    def test_esquecimento_e_compactacao(self):
+        """
+        Testa se relações fracas somem na leitura e saem da memória na compactação.
+        """
+        relacoes = RelacoesSociais()
+        relacoes["fraca"] = {"tipo": "conhecido", "forca": 0.2}
+        relacoes["forte"] = {"tipo": "amigo", "forca": 1.0}
+
+        vida = math.log(0.2 / RELATION_STRENGTH_THRESHOLD) / RELATION_STRENGTH_DECAY_RATE
+        passo = min(vida + 1.0, RELATION_SWEEP_INTERVAL) / 2
+        while relacoes.tempo < vida + 1.0:
+            relacoes.avancar(passo)
+
+        self.assertNotIn("fraca", relacoes)
+        self.assertEqual(list(relacoes), ["forte"])
+        self.assertEqual(len(relacoes), 1)
+        self.assertIsNone(relacoes.get("fraca"))
+
+        # A entrada ainda pode estar na memória até a próxima compactação
+        relacoes.avancar(RELATION_SWEEP_INTERVAL)
+        self.assertEqual(list(relacoes.entradas), ["forte"])
+
+    def test_snapshot_preserva_decaimento(self):
+        """
+        Testa se as relações de um Senciante restaurado de um snapshot continuam decaindo de onde pararam.
+        """
+        self.senciante.estabelecer_relacao("a", "amigo", 0.7)
+        self.senciante._atualizar_relacoes(10.0)
+
+        restaurado = pickle.loads(pickle.dumps(self.senciante))
+        self.assertAlmostEqual(restaurado.relacoes["a"]["forca"], self.senciante.relacoes["a"]["forca"])
+        restaurado._atualizar_relacoes(5.0)
+        self.assertAlmostEqual(restaurado.relacoes["a"]["forca"], 0.7 * math.exp(-RELATION_STRENGTH_DECAY_RATE * 15.0))
+
+if __name__ == "__main__":
+    unittest.main()
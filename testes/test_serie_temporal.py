@@ -0,0 +1,72 @@
+"""
+Testes unitários para o módulo SerieTemporal.
+"""
+
+import unittest
+
+import numpy as np
+
+from modelos.historico import Historico
+from utils.serie_temporal import SerieTemporal
+
+class TestSerieTemporal(unittest.TestCase):
+    """
+    Testes para as classes CamadaSerie e SerieTemporal.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes.
+        """
+        self.serie = SerieTemporal({"hora": 1.0, "dia": 24.0}, max_pontos_brutos=100, max_pontos_agregados=1000)
+        self.tempos = np.arange(0.0, 48.0, 0.25)
+        self.valores = np.sin(self.tempos) * 10.0
+        for tempo, valor in zip(self.tempos, self.valores):
+            self.serie.registrar(tempo, valor)
+
+    def test_memoria_limitada(self):
+        """
+        Testa se a camada bruta retém apenas as amostras mais recentes.
+        """
+        self.assertLessEqual(len(self.serie.bruto), 100)
+        dados = self.serie.consultar()
+        self.assertEqual(dados["tempo"][-1], 47.75)
+        self.assertEqual(dados["valor"], self.valores[-len(dados["valor"]):].tolist())
+
+    def test_agregados(self):
+        """
+        Testa mínimo, média e máximo por hora e o intervalo em aberto.
+        """
+        horas = self.serie.consultar(10.0, 11.0, resolucao="hora")
+        self.assertEqual(horas["tempo"], [10.0, 11.0])
+        janela = self.valores[(self.tempos >= 10.0) & (self.tempos < 11.0)]
+        self.assertAlmostEqual(horas["minimo"][0], janela.min())
+        self.assertAlmostEqual(horas["media"][0], janela.mean())
+        self.assertAlmostEqual(horas["maximo"][0], janela.max())
+        self.assertEqual(horas["amostras"][0], 4)
+
+        # O segundo dia ainda está em aberto e aparece por último
+        dias = self.serie.consultar(resolucao="dia")
+        self.assertEqual(dias["tempo"], [0.0, 24.0])
+        self.assertAlmostEqual(dias["media"][1], self.valores[self.tempos >= 24.0].mean())
+
+        with self.assertRaises(ValueError):
+            self.serie.consultar(resolucao="semana")
+
+    def test_historico(self):
+        """
+        Testa as séries do Historico e sua serialização reduzida.
+        """
+        historico = Historico()
+        for i in range(2000):
+            historico.registrar_estatisticas(i * 0.1, 10 + i % 3, {"madeira": 5.0})
+
+        self.assertEqual(historico.obter_serie("recursos", "madeira", 1.0, 1.25)["valor"], [5.0, 5.0, 5.0])
+        self.assertIsNone(historico.obter_serie("recursos", "pedra"))
+
+        pontos = historico.to_dict()["estatisticas"]["populacao"]
+        self.assertLessEqual(len(pontos), 500)
+        self.assertEqual(pontos[0], [0.0, historico.obter_serie("populacao", resolucao="hora")["media"][0]])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+Testes unitários para o gerenciador de sessões (vários mundos por servidor).
+"""
+
+import os
+import random
+import tempfile
+import time
+import unittest
+
+import api_server
+from sessoes import GerenciadorSessoes
+
+class TestSessoes(unittest.TestCase):
+    """
+    Testes para as classes Sessao e GerenciadorSessoes.
+    """
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes.
+        """
+        random.seed(9)
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.gerenciador = GerenciadorSessoes(self.diretorio.name, max_trabalhadores=2, tempo_ocioso=60.0)
+
+    def tearDown(self):
+        """
+        Limpeza após os testes.
+        """
+        self.gerenciador.encerrar(descarregar=False)
+        self.diretorio.cleanup()
+
+    def _aguardar_passos(self, sessao, timeout=5.0):
+        """
+        Aguarda até o pool executar ao menos um passo do mundo.
+        """
+        limite = time.monotonic() + timeout
+        while sessao.simulacao.tempo_simulacao == 0 and time.monotonic() < limite:
+            time.sleep(0.02)
+
+    def test_passos_no_pool(self):
+        """
+        Testa se os mundos em execução avançam no pool e podem ser pausados.
+        """
+        vale = self.gerenciador.criar("vale", tamanho_mundo=(30, 30), num_senciantes_inicial=4)
+        parado = self.gerenciador.criar("parado", iniciar=False, tamanho_mundo=(30, 30), num_senciantes_inicial=4)
+
+        self._aguardar_passos(vale)
+        self.assertGreater(vale.simulacao.tempo_simulacao, 0)
+        self.assertEqual(parado.simulacao.tempo_simulacao, 0)
+
+        with vale.trava:
+            self.assertTrue(vale.simulacao.pausar())
+            tempo = vale.simulacao.tempo_simulacao
+        time.sleep(0.1)
+        self.assertEqual(vale.simulacao.tempo_simulacao, tempo)
+
+    def test_descarregar_e_recarregar(self):
+        """
+        Testa se mundos ociosos vão para o disco e voltam, em execução, no próximo acesso.
+        """
+        sessao = self.gerenciador.criar("vale", tamanho_mundo=(30, 30), num_senciantes_inicial=4)
+        self._aguardar_passos(sessao)
+
+        descarregados = self.gerenciador.descarregar_ociosos(time.monotonic() + 61.0)
+        self.assertEqual(descarregados, ["vale"])
+        self.assertTrue(sessao.descartada)
+        self.assertTrue(os.path.exists(self.gerenciador.caminho_snapshot("vale")))
+        self.assertEqual(self.gerenciador.listar(),
+                         [{"mundo_id": "vale", "carregado": False, "executando": True}])
+
+        recarregada = self.gerenciador.obter("vale")
+        self.assertIsNot(recarregada, sessao)
+        self.assertTrue(recarregada.executando)
+        self.assertGreaterEqual(recarregada.simulacao.tempo_simulacao, sessao.simulacao.tempo_simulacao)
+        self.assertEqual(len(recarregada.simulacao.senciantes), len(sessao.simulacao.senciantes))
+
+        # Um acesso recente adia o descarregamento
+        self.assertEqual(self.gerenciador.descarregar_ociosos(), [])
+
+    def test_acesso_depois_da_listagem_de_ociosos(self):
+        """
+        Testa se um mundo acessado depois de ser escolhido como ocioso não é descarregado.
+        """
+        sessao = self.gerenciador.criar("vale", iniciar=False, tamanho_mundo=(20, 20), num_senciantes_inicial=2)
+
+        # Instante usado como limite de ociosidade, seguido de um acesso concorrente
+        limite = time.monotonic()
+        self.assertIs(self.gerenciador.obter("vale"), sessao)
+
+        self.assertFalse(self.gerenciador.descarregar("vale", acessado_antes_de=limite))
+        self.assertFalse(sessao.descartada)
+        self.assertTrue(self.gerenciador.descarregar("vale", acessado_antes_de=time.monotonic() + 1.0))
+        self.assertTrue(sessao.descartada)
+
+    def test_ids_de_mundo(self):
+        """
+        Testa a validação e a unicidade dos IDs de mundo.
+        """
+        self.gerenciador.criar("vale", iniciar=False, tamanho_mundo=(20, 20), num_senciantes_inicial=2)
+
+        with self.assertRaises(ValueError):
+            self.gerenciador.criar("vale", iniciar=False)
+        with self.assertRaises(ValueError):
+            self.gerenciador.criar("../vale", iniciar=False)
+        self.assertIsNone(self.gerenciador.obter("../vale"))
+        self.assertIsNone(self.gerenciador.obter("montanha"))
+
+        self.assertTrue(self.gerenciador.remover("vale"))
+        self.assertFalse(self.gerenciador.remover("vale"))
+
+    def test_rotas_por_mundo(self):
+        """
+        Testa os endpoints /api/mundos/<mundo_id>/... da API.
+        """
+        anterior = api_server.gerenciador_sessoes
+        api_server.gerenciador_sessoes = self.gerenciador
+        try:
+            cliente = api_server.app.test_client()
+
+            resposta = cliente.post('/api/mundos', json={
+                "mundo_id": "vale", "iniciar": False, "tamanho_mundo": [30, 30], "num_senciantes_iniciais": 3
+            }).get_json()
+            self.assertEqual(resposta, {"status": "success", "mundo_id": "vale"})
+
+            estado = cliente.get('/api/mundos/vale/estado').get_json()
+            self.assertEqual(estado["estado"]["num_senciantes"], 3)
+
+            resposta = cliente.post('/api/mundos/vale/acelerar', json={"fator": 2}).get_json()
+            self.assertEqual(resposta["status"], "success")
+            self.assertEqual(self.gerenciador.obter("vale").simulacao.velocidade, 2.0)
+
+            resposta = cliente.get('/api/mundos/montanha/estado').get_json()
+            self.assertEqual(resposta["status"], "error")
+
+            # Snapshots salvos e carregados por nome, sempre no diretório do gerenciador
+            resposta = cliente.post('/api/mundos/vale/salvar', json={"nome": "copia.snap"}).get_json()
+            self.assertEqual(resposta["status"], "success")
+            self.assertTrue(os.path.exists(self.gerenciador.caminho_salvo("copia.snap")))
+            resposta = cliente.post('/api/mundos/vale/carregar', json={"nome": "copia.snap"}).get_json()
+            self.assertEqual(resposta["status"], "success")
+            for nome in ("../vale.snap", "/tmp/copia.snap"):
+                resposta = cliente.post('/api/mundos/vale/carregar', json={"nome": nome}).get_json()
+                self.assertEqual(resposta["status"], "error")
+                resposta = cliente.post('/api/mundos/vale/salvar', json={"nome": nome}).get_json()
+                self.assertEqual(resposta["status"], "error")
+
+            self.assertEqual([m["mundo_id"] for m in cliente.get('/api/mundos').get_json()], ["vale"])
+            self.assertEqual(cliente.delete('/api/mundos/vale').get_json()["status"], "success")
+        finally:
+            api_server.gerenciador_sessoes = anterior
+
+if __name__ == "__main__":
+    unittest.main()
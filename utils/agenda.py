@@ -0,0 +1,97 @@
+"""
+Agenda de eventos temporizados para as mecânicas do jogo "O Mundo dos Senciantes".
+Os eventos ficam em uma fila de prioridade (heap) ordenada pelo tempo de
+vencimento, de modo que cada passo toca apenas os eventos vencidos em vez de
+percorrer tudo o que está agendado.
+"""
+
+import heapq
+import itertools
+
+
+class Agenda:
+    """
+    Fila de prioridade de eventos por tempo de vencimento.
+    Eventos com o mesmo vencimento saem na ordem em que foram agendados.
+    O cancelamento é preguiçoso: a entrada fica no heap e é descartada quando vence.
+    """
+
+    def __init__(self):
+        """
+        Inicializa uma nova agenda vazia.
+        """
+        self._heap = []  # Entradas [vencimento, sequência, item, ativa]
+        self._sequencia = itertools.count()
+        self._ativas = 0
+
+    def __len__(self):
+        return self._ativas
+
+    def agendar(self, vencimento, item):
+        """
+        Agenda um item.
+
+        Args:
+            vencimento (float): Tempo em que o item vence.
+            item: Item agendado.
+
+        Returns:
+            list: Entrada da agenda, que pode ser passada para `cancelar`.
+        """
+        entrada = [vencimento, next(self._sequencia), item, True]
+        heapq.heappush(self._heap, entrada)
+        self._ativas += 1
+        return entrada
+
+    def cancelar(self, entrada):
+        """
+        Cancela uma entrada agendada.
+
+        Args:
+            entrada (list): Entrada retornada por `agendar`.
+        """
+        if entrada[3]:
+            entrada[3] = False
+            self._ativas -= 1
+
+    @staticmethod
+    def pendente(entrada):
+        """
+        Verifica se uma entrada ainda não venceu nem foi cancelada.
+
+        Args:
+            entrada (list): Entrada retornada por `agendar`.
+
+        Returns:
+            bool: True se a entrada continua agendada.
+        """
+        return entrada[3]
+
+    def proximo_vencimento(self):
+        """
+        Obtém o vencimento do próximo item ativo.
+
+        Returns:
+            float: Tempo de vencimento, ou None se a agenda estiver vazia.
+        """
+        while self._heap and not self._heap[0][3]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def vencidos(self, tempo):
+        """
+        Retira da agenda os itens com vencimento até `tempo`, em ordem de vencimento.
+        Itens reagendados durante a iteração para um tempo até `tempo` também são retornados.
+
+        Args:
+            tempo (float): Tempo atual.
+
+        Yields:
+            tuple: (vencimento, item).
+        """
+        while self._heap and self._heap[0][0] <= tempo:
+            entrada = heapq.heappop(self._heap)
+            if entrada[3]:
+                entrada[3] = False
+                self._ativas -= 1
+                yield entrada[0], entrada[2]
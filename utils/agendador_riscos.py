@@ -0,0 +1,114 @@
+"""
+Agendador de eventos estocásticos para o jogo "O Mundo dos Senciantes".
+Em vez de sortear `chance(taxa * delta_tempo)` a cada passo, cada subsistema
+registra a taxa (por hora) de um evento e o agendador sorteia o instante do
+próximo disparo pela distribuição exponencial, mantendo os disparos em uma
+agenda (heap). Cada passo processa apenas os disparos vencidos, e passos
+longos contam todos os disparos do intervalo em vez de no máximo um.
+"""
+
+import random
+
+from utils.agenda import Agenda
+
+
+class AgendadorRiscos:
+    """
+    Processo de Poisson por chave de evento, com taxas constantes por trechos.
+    Como a distribuição exponencial não tem memória, mudar a taxa de uma chave
+    equivale a sortear de novo o próximo disparo a partir do tempo atual.
+
+    O dono do agendador chama `avancar` uma vez por passo; os subsistemas
+    consomem os disparos acumulados de cada chave com `disparos`. Condições que
+    dependem do estado (ex: umidade mínima para chover) são verificadas no
+    consumo: descartar o disparo quando a condição é falsa equivale a uma taxa
+    nula enquanto ela durar.
+    """
+
+    def __init__(self):
+        """
+        Inicializa um novo agendador vazio.
+        """
+        self.tempo = 0.0  # Tempo acumulado em horas
+        self.agenda = Agenda()  # Itens: chave do evento
+        self.taxas = {}  # Dicionário de chave: taxa de disparo por hora
+        self._entradas = {}  # Dicionário de chave: entrada na agenda
+        self._disparos = {}  # Dicionário de chave: disparos ainda não consumidos
+
+    def __len__(self):
+        return len(self.taxas)
+
+    def __contains__(self, chave):
+        return chave in self.taxas
+
+    def _agendar(self, chave, inicio):
+        taxa = self.taxas[chave]
+        if taxa > 0:
+            self._entradas[chave] = self.agenda.agendar(inicio + random.expovariate(taxa), chave)
+        else:
+            self._entradas.pop(chave, None)
+
+    def registrar(self, chave, taxa):
+        """
+        Registra um evento ou altera sua taxa.
+
+        Args:
+            chave (hashable): Identificador do evento.
+            taxa (float): Número médio de disparos por hora (0 suspende o evento).
+        """
+        if self.taxas.get(chave) == taxa:
+            return
+
+        entrada = self._entradas.pop(chave, None)
+        if entrada is not None:
+            self.agenda.cancelar(entrada)
+        self.taxas[chave] = taxa
+        self._agendar(chave, self.tempo)
+
+    def remover(self, chave):
+        """
+        Remove um evento e descarta seus disparos não consumidos.
+
+        Args:
+            chave (hashable): Identificador do evento.
+        """
+        entrada = self._entradas.pop(chave, None)
+        if entrada is not None:
+            self.agenda.cancelar(entrada)
+        self.taxas.pop(chave, None)
+        self._disparos.pop(chave, None)
+
+    def avancar(self, delta_tempo):
+        """
+        Avança o tempo, acumulando os disparos vencidos de cada evento.
+
+        Args:
+            delta_tempo (float): Tempo decorrido em horas.
+
+        Returns:
+            int: Número de disparos no intervalo.
+        """
+        fim = self.tempo + delta_tempo
+        total = 0
+
+        # O próximo disparo de cada chave é agendado a partir do anterior e, se
+        # vencer dentro do intervalo, sai na mesma iteração
+        for vencimento, chave in self.agenda.vencidos(fim):
+            self._disparos[chave] = self._disparos.get(chave, 0) + 1
+            self._agendar(chave, vencimento)
+            total += 1
+
+        self.tempo = fim
+        return total
+
+    def disparos(self, chave):
+        """
+        Consome os disparos acumulados de um evento.
+
+        Args:
+            chave (hashable): Identificador do evento.
+
+        Returns:
+            int: Número de disparos desde o último consumo.
+        """
+        return self._disparos.pop(chave, 0)
@@ -0,0 +1,190 @@
+"""
+Armazém de eventos para o histórico do jogo "O Mundo dos Senciantes".
+Guarda os eventos mais recentes em um buffer circular de capacidade fixa, com
+índices secundários por tipo, por entidade envolvida e por intervalo de tempo,
+para que as consultas custem proporcionalmente ao tamanho do resultado.
+"""
+
+import bisect
+import math
+from collections import deque
+from collections.abc import Sequence
+
+
+class ArmazemEventos(Sequence):
+    """
+    Buffer circular de eventos com índices secundários.
+    Cada evento recebe um número de sequência crescente; a posição no buffer é a
+    sequência módulo a capacidade, e os índices guardam sequências em ordem
+    crescente, de modo que o evento descartado é sempre o primeiro de cada índice.
+    Como sequência, se comporta como a lista dos eventos retidos, do mais antigo
+    para o mais recente.
+    """
+
+    def __init__(self, capacidade, largura_intervalo=24.0):
+        """
+        Inicializa um novo armazém vazio.
+
+        Args:
+            capacidade (int): Número máximo de eventos retidos.
+            largura_intervalo (float, optional): Largura, em horas, dos intervalos do
+                índice temporal. Default é 24.0.
+        """
+        if capacidade <= 0:
+            raise ValueError("A capacidade deve ser positiva.")
+        if largura_intervalo <= 0:
+            raise ValueError("A largura do intervalo deve ser positiva.")
+
+        self.capacidade = capacidade
+        self.largura_intervalo = float(largura_intervalo)
+        # Entradas (evento, envolvidos indexados, intervalo); a posição é sequência % capacidade
+        self._buffer = [None] * capacidade
+        self._inicio = 0  # Sequência do evento mais antigo retido
+        self._fim = 0  # Sequência do próximo evento
+        self.indice_tipo = {}  # Dicionário de tipo: deque de sequências
+        self.indice_envolvido = {}  # Dicionário de entidade_id: deque de sequências
+        self.indice_intervalo = {}  # Dicionário de intervalo: deque de sequências
+        self._intervalos = []  # Intervalos presentes, ordenados
+
+    def __len__(self):
+        return self._fim - self._inicio
+
+    @property
+    def descartados(self):
+        """
+        int: Número de eventos já descartados por falta de capacidade.
+        """
+        return self._inicio
+
+    def __iter__(self):
+        for sequencia in range(self._inicio, self._fim):
+            yield self._buffer[sequencia % self.capacidade][0]
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self._evento(self._inicio + i) for i in range(*indice.indices(len(self)))]
+
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de evento fora do intervalo")
+        return self._evento(self._inicio + indice)
+
+    def _evento(self, sequencia):
+        return self._buffer[sequencia % self.capacidade][0]
+
+    def _intervalo(self, tempo):
+        return math.floor(tempo / self.largura_intervalo)
+
+    @staticmethod
+    def _indexar(indice, chave, sequencia):
+        fila = indice.get(chave)
+        if fila is None:
+            fila = indice[chave] = deque()
+        fila.append(sequencia)
+
+    @staticmethod
+    def _desindexar(indice, chave):
+        fila = indice[chave]
+        fila.popleft()
+        if not fila:
+            del indice[chave]
+            return True
+        return False
+
+    def append(self, evento):
+        """
+        Adiciona um evento, descartando o mais antigo se o armazém estiver cheio.
+
+        Args:
+            evento (dict): Evento com "tipo", "tempo" e "envolvidos".
+        """
+        if len(self) == self.capacidade:
+            self._descartar_mais_antigo()
+
+        sequencia = self._fim
+        # Envolvidos repetidos são indexados uma única vez
+        envolvidos = tuple(dict.fromkeys(evento.get("envolvidos") or ()))
+        intervalo = self._intervalo(evento["tempo"])
+
+        self._buffer[sequencia % self.capacidade] = (evento, envolvidos, intervalo)
+        self._fim += 1
+
+        self._indexar(self.indice_tipo, evento["tipo"], sequencia)
+        for entidade_id in envolvidos:
+            self._indexar(self.indice_envolvido, entidade_id, sequencia)
+
+        if intervalo not in self.indice_intervalo:
+            bisect.insort(self._intervalos, intervalo)
+        self._indexar(self.indice_intervalo, intervalo, sequencia)
+
+    def _descartar_mais_antigo(self):
+        """
+        Remove o evento mais antigo do buffer e dos índices.
+        """
+        posicao = self._inicio % self.capacidade
+        evento, envolvidos, intervalo = self._buffer[posicao]
+        self._buffer[posicao] = None
+        self._inicio += 1
+
+        self._desindexar(self.indice_tipo, evento["tipo"])
+        for entidade_id in envolvidos:
+            self._desindexar(self.indice_envolvido, entidade_id)
+        if self._desindexar(self.indice_intervalo, intervalo):
+            del self._intervalos[bisect.bisect_left(self._intervalos, intervalo)]
+
+    def obter_por_tipo(self, tipo):
+        """
+        Obtém os eventos de um tipo.
+
+        Args:
+            tipo (str): Tipo do evento.
+
+        Returns:
+            list: Eventos do tipo, do mais antigo para o mais recente.
+        """
+        return [self._evento(s) for s in self.indice_tipo.get(tipo, ())]
+
+    def obter_por_envolvido(self, entidade_id):
+        """
+        Obtém os eventos que envolvem uma entidade.
+
+        Args:
+            entidade_id (str): ID da entidade.
+
+        Returns:
+            list: Eventos que envolvem a entidade, do mais antigo para o mais recente.
+        """
+        return [self._evento(s) for s in self.indice_envolvido.get(entidade_id, ())]
+
+    def obter_por_periodo(self, tempo_inicio, tempo_fim):
+        """
+        Obtém os eventos ocorridos em um período (limites inclusivos).
+
+        Args:
+            tempo_inicio (float): Tempo inicial.
+            tempo_fim (float): Tempo final.
+
+        Returns:
+            list: Eventos do período, na ordem em que foram registrados.
+        """
+        if tempo_inicio > tempo_fim:
+            return []
+
+        # Limites infinitos abrangem todos os intervalos
+        limite_inicio = self._intervalo(tempo_inicio) if math.isfinite(tempo_inicio) else tempo_inicio
+        limite_fim = self._intervalo(tempo_fim) if math.isfinite(tempo_fim) else tempo_fim
+        primeiro = bisect.bisect_left(self._intervalos, limite_inicio)
+        ultimo = bisect.bisect_right(self._intervalos, limite_fim)
+
+        sequencias = []
+        for intervalo in self._intervalos[primeiro:ultimo]:
+            sequencias.extend(
+                s for s in self.indice_intervalo[intervalo]
+                if tempo_inicio <= self._evento(s)["tempo"] <= tempo_fim
+            )
+
+        # Intervalos diferentes podem intercalar sequências se os tempos vierem fora de ordem
+        if ultimo - primeiro > 1:
+            sequencias.sort()
+        return [self._evento(s) for s in sequencias]
@@ -0,0 +1,213 @@
+"""
+Canal de eventos da simulação para clientes conectados.
+O canal assina os callbacks de nascimento, morte e evento (construções e
+tecnologias) da Simulacao e distribui cada ocorrência para as filas dos
+assinantes cujos filtros (tipo, entidade, região) a aceitam. As filas são
+limitadas: quando um cliente lento deixa a sua encher, os eventos mais antigos
+são descartados e contados, e o passo da simulação nunca espera por ele.
+"""
+
+import threading
+from collections import deque
+
+from utils.config import EVENT_STREAM_QUEUE_SIZE
+
+# Tipos de evento publicados pelo canal
+TIPOS_EVENTO = ("nascimento", "morte", "construcao", "tecnologia")
+
+
+class Assinante:
+    """
+    Classe que representa um cliente do canal, com seus filtros e sua fila.
+    """
+
+    def __init__(self, tipos=None, entidades=None, regiao=None, tamanho_fila=EVENT_STREAM_QUEUE_SIZE):
+        """
+        Inicializa um novo assinante.
+
+        Args:
+            tipos (iterable, optional): Tipos de evento aceitos. None aceita todos.
+            entidades (iterable, optional): IDs de entidades; aceita os eventos que envolvem
+                alguma delas. None aceita todos.
+            regiao (tuple, optional): (x_min, y_min, x_max, y_max); aceita os eventos com
+                posição dentro dela. None aceita todos.
+            tamanho_fila (int, optional): Número máximo de eventos na fila.
+                Default é EVENT_STREAM_QUEUE_SIZE.
+        """
+        self.tipos = frozenset(tipos) if tipos is not None else None
+        self.entidades = frozenset(entidades) if entidades is not None else None
+        self.regiao = tuple(regiao) if regiao is not None else None
+        self.fila = deque(maxlen=tamanho_fila)
+        self.descartados = 0  # Eventos descartados por fila cheia desde a última leitura
+        self.condicao = threading.Condition()
+
+    def aceita(self, evento):
+        """
+        Verifica se um evento passa pelos filtros do assinante.
+
+        Args:
+            evento (dict): Evento publicado.
+
+        Returns:
+            bool: True se o evento deve ser entregue.
+        """
+        if self.tipos is not None and evento["tipo"] not in self.tipos:
+            return False
+
+        if self.entidades is not None and self.entidades.isdisjoint(evento["entidades"]):
+            return False
+
+        if self.regiao is not None:
+            posicao = evento.get("posicao")
+            if posicao is None:
+                return False
+            x_min, y_min, x_max, y_max = self.regiao
+            if not (x_min <= posicao[0] <= x_max and y_min <= posicao[1] <= y_max):
+                return False
+
+        return True
+
+    def entregar(self, evento):
+        """
+        Coloca um evento na fila sem bloquear, descartando o mais antigo se ela estiver cheia.
+
+        Args:
+            evento (dict): Evento publicado.
+        """
+        with self.condicao:
+            if len(self.fila) == self.fila.maxlen:
+                self.descartados += 1
+            self.fila.append(evento)
+            self.condicao.notify()
+
+    def receber(self, max_eventos, timeout=None):
+        """
+        Retira um lote de eventos da fila, aguardando se ela estiver vazia.
+
+        Args:
+            max_eventos (int): Número máximo de eventos no lote.
+            timeout (float, optional): Tempo máximo de espera em segundos. None espera indefinidamente.
+
+        Returns:
+            tuple: (lista de eventos, eventos descartados desde a última leitura).
+        """
+        with self.condicao:
+            if not self.fila:
+                self.condicao.wait(timeout)
+
+            lote = []
+            while self.fila and len(lote) < max_eventos:
+                lote.append(self.fila.popleft())
+
+            descartados = self.descartados
+            self.descartados = 0
+            return lote, descartados
+
+
+class CanalEventos:
+    """
+    Classe que publica os eventos de uma simulação para os assinantes.
+    Os callbacks rodam na thread da simulação e apenas copiam cada evento para
+    as filas; a leitura e a serialização ficam com as threads dos clientes.
+    """
+
+    def __init__(self, tamanho_fila=EVENT_STREAM_QUEUE_SIZE):
+        """
+        Inicializa um novo canal sem assinantes.
+
+        Args:
+            tamanho_fila (int, optional): Tamanho padrão da fila de cada assinante.
+                Default é EVENT_STREAM_QUEUE_SIZE.
+        """
+        self.tamanho_fila = tamanho_fila
+        self.sequencia = 0  # Número do último evento publicado
+        self.assinantes = ()  # Tupla imutável, trocada a cada assinatura, para iterar sem trava
+        self.trava = threading.Lock()
+
+    def conectar(self, simulacao):
+        """
+        Registra o canal nos callbacks da simulação.
+
+        Args:
+            simulacao (Simulacao): Simulação cujos eventos serão publicados.
+        """
+        simulacao.registrar_callback("nascimento", self._ao_nascer)
+        simulacao.registrar_callback("morte", self._ao_morrer)
+        # Construções e tecnologias também disparam callbacks próprios, mas só o de evento traz a posição
+        simulacao.registrar_callback("evento", self._ao_registrar_evento)
+
+    def assinar(self, tipos=None, entidades=None, regiao=None, tamanho_fila=None):
+        """
+        Cria um assinante com os filtros indicados.
+
+        Args:
+            tipos (iterable, optional): Tipos de evento aceitos. None aceita todos.
+            entidades (iterable, optional): IDs de entidades de interesse. None aceita todos.
+            regiao (tuple, optional): (x_min, y_min, x_max, y_max). None aceita todos.
+            tamanho_fila (int, optional): Tamanho da fila. Default é o tamanho do canal.
+
+        Returns:
+            Assinante: Novo assinante.
+        """
+        assinante = Assinante(tipos, entidades, regiao, tamanho_fila or self.tamanho_fila)
+        with self.trava:
+            self.assinantes = self.assinantes + (assinante,)
+        return assinante
+
+    def cancelar(self, assinante):
+        """
+        Remove um assinante do canal.
+
+        Args:
+            assinante (Assinante): Assinante a remover.
+        """
+        with self.trava:
+            self.assinantes = tuple(a for a in self.assinantes if a is not assinante)
+
+    def publicar(self, tipo, tempo, entidades, posicao=None, **dados):
+        """
+        Publica um evento para os assinantes que o aceitam.
+
+        Args:
+            tipo (str): Tipo do evento.
+            tempo (float): Tempo de simulação do evento.
+            entidades (list): IDs das entidades envolvidas.
+            posicao (list, optional): Posição do evento no mundo.
+            **dados: Dados específicos do evento.
+
+        Returns:
+            dict: Evento publicado.
+        """
+        self.sequencia += 1
+        evento = {
+            "seq": self.sequencia,
+            "tipo": tipo,
+            "tempo": tempo,
+            "entidades": entidades,
+            "posicao": list(posicao) if posicao is not None else None,
+            **dados
+        }
+
+        for assinante in self.assinantes:
+            if assinante.aceita(evento):
+                assinante.entregar(evento)
+        return evento
+
+    def _ao_nascer(self, simulacao, senciante_id):
+        senciante = simulacao.senciantes.get(senciante_id)
+        posicao = senciante.posicao if senciante is not None else None
+        self.publicar("nascimento", simulacao.tempo_simulacao, [senciante_id], posicao)
+
+    def _ao_morrer(self, simulacao, senciante_id, causa):
+        senciante = simulacao.senciantes.get(senciante_id)
+        posicao = senciante.posicao if senciante is not None else None
+        self.publicar("morte", simulacao.tempo_simulacao, [senciante_id], posicao, causa=causa)
+
+    def _ao_registrar_evento(self, simulacao, evento):
+        tipo = evento["tipo"]
+        if tipo == "construcao":
+            self.publicar("construcao", simulacao.tempo_simulacao, [evento["proprietario_id"]],
+                          evento.get("posicao"), tipo_construcao=evento["tipo_construcao"])
+        elif tipo == "tecnologia":
+            self.publicar("tecnologia", simulacao.tempo_simulacao, [evento["inventor_id"]],
+                          tecnologia=evento["tecnologia"])
@@ -6,6 +6,19 @@ Contém constantes e configurações globais para o motor de simulação.
 # Configurações do servidor
 SERVER_HOST = '0.0.0.0'
 SERVER_PORT = 5000
+SERVER_THREADS = 16  # Threads do servidor HTTP de produção
+SERVER_SNAPSHOT_DIR = "snapshots"  # Único diretório em que /api/salvar e /api/carregar leem e gravam
+SERVER_TRACE_DIR = "traces"  # Único diretório em que POST /api/perf grava os arquivos de trace
+SERVER_EVENT_LOG_DIR = "logs_eventos"  # Raiz dos logs de eventos em disco pedidos pela API (diretorio_log_eventos)
+
+# Configurações das sessões (vários mundos no mesmo servidor)
+SESSION_MAX_WORKERS = 8  # Threads que executam os passos dos mundos em execução
+SESSION_IDLE_TIMEOUT = 600.0  # Segundos sem acesso até um mundo ser salvo em disco e descarregado
+SESSION_SNAPSHOT_DIR = "snapshots_mundos"  # Diretório dos snapshots dos mundos descarregados
+
+# Configurações do canal de eventos (/api/eventos/stream)
+EVENT_STREAM_QUEUE_SIZE = 1000  # Eventos guardados por cliente; os mais antigos são descartados
+EVENT_STREAM_BATCH = 100  # Número máximo de eventos por mensagem enviada
 
 # Configurações da simulação
 DEFAULT_WORLD_SIZE = [100, 100]  # Tamanho padrão do mundo [largura, altura]
@@ -13,6 +26,17 @@ DEFAULT_INITIAL_SENCIANTES = 10  # Número inicial de Senciantes
 DEFAULT_SIMULATION_SPEED = 1.0   # Velocidade padrão da simulação (1.0 = tempo real)
 DEFAULT_UPDATE_INTERVAL = 0.1    # Intervalo de atualização da simulação em segundos
 
+# Configurações do particionamento espacial (passo da simulação em vários processos)
+PARTITION_TILES = (4, 4)  # Número de tiles (colunas, linhas) em que o mapa é dividido
+PARTITION_HALO = 25.0  # Largura da borda de cada tile replicada dos vizinhos (maior que o raio de busca dos Senciantes)
+
+# Configurações do nível de detalhe (LOD) da atualização dos Senciantes
+LOD_INTERVALS = {
+    "completo": 1,               # Senciantes observados, em interação ou perto de uma urgência
+    "reduzido": 4,               # Senciantes se deslocando
+    "minimo": 16                 # Senciantes parados (ociosos, descansando ou se limpando)
+}
+
 # Configurações de Senciantes
 SENCIANTE_MAX_AGE = 48.0         # Idade máxima em horas (2 dias)
 SENCIANTE_REPRODUCTION_MIN_AGE = 5.0  # Idade mínima para reprodução em horas
@@ -101,6 +125,8 @@ GENE_INHERITANCE_RATE = 0.5  # Probabilidade de herdar um gene de um progenitor
 LEARNING_BASE_RATE = 0.01  # Taxa base de aprendizado por hora
 MEMORY_DECAY_RATE = 0.01  # Taxa de decaimento da importância da memória por hora
 MEMORY_THRESHOLD = 0.1  # Limiar abaixo do qual a memória é esquecida
+MEMORY_CAPACITY = 50  # Número máximo de memórias de cada Senciante
+MEMORY_INDEXED_TYPES = ("localizacao",)  # Tipos de memória com índice próprio no armazém de memórias
 
 # Configurações de comunicação
 COMMUNICATION_EVOLUTION_STAGES = [
@@ -157,6 +183,7 @@ RELATION_TYPES = [
 ]
 RELATION_STRENGTH_DECAY_RATE = 0.01  # Taxa de decaimento da força da relação por hora
 RELATION_STRENGTH_THRESHOLD = 0.1  # Limiar abaixo do qual a relação é esquecida
+RELATION_SWEEP_INTERVAL = 24.0  # Horas entre as remoções das relações esquecidas da memória
 
 # Configurações de ações divinas
 DIVINE_ACTION_TYPES = [
@@ -178,4 +205,9 @@ DIVINE_ACTION_MAX_DURATION = 24.0  # Horas
 
 # Configurações de histórico
 HISTORY_MAX_EVENTS = 1000  # Número máximo de eventos a serem armazenados
+HISTORY_TIME_BUCKET = 24.0  # Largura (em horas) dos intervalos do índice temporal de eventos
+HISTORY_SERIES_RESOLUTIONS = {"hora": 1.0, "dia": 24.0}  # Resoluções agregadas das séries (em horas)
+HISTORY_SERIES_MAX_RAW_POINTS = 10000  # Amostras brutas retidas por série
+HISTORY_SERIES_MAX_AGGREGATED_POINTS = 10000  # Intervalos retidos por série em cada resolução
+GENEALOGY_MAX_GENERATIONS = 6  # Gerações de ancestrais consideradas no parentesco e na endogamia
 
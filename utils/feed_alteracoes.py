@@ -0,0 +1,180 @@
+"""
+Feed de alterações versionado para clientes da simulação.
+A cada passo a simulação recebe um número de versão e o feed guarda apenas o
+que mudou em cada Senciante (posição, necessidades, estado e atividade), para
+que os clientes peçam "alterações desde a versão N" em vez do estado completo.
+"""
+
+import threading
+from collections import OrderedDict, deque
+
+from utils.helpers import gerar_uuid
+
+
+class FeedAlteracoes:
+    """
+    Classe que mantém o feed de alterações dos Senciantes de uma simulação.
+    Deve ser registrada como callback de "atualizacao" da Simulacao; leituras
+    podem ser feitas de outras threads.
+    """
+
+    def __init__(self, max_versoes_remocao=10000):
+        """
+        Inicializa um novo feed vazio.
+
+        Args:
+            max_versoes_remocao (int, optional): Número de remoções guardadas. Clientes mais
+                atrasados que isso recebem o estado completo. Default é 10000.
+        """
+        self.id = gerar_uuid()
+        self.versao = 0
+        self.registros = {}  # Dicionário de senciante_id: registro compacto
+        self.criado_em = {}  # Dicionário de senciante_id: versão de criação
+        self.alterado_em = OrderedDict()  # senciante_id: versão da última alteração, da mais antiga para a mais recente
+        self.removidos = deque(maxlen=max_versoes_remocao)  # (versão, senciante_id)
+        self.versao_minima = 0  # Menor versão a partir da qual o feed ainda é completo
+        self.condicao = threading.Condition()
+
+    @staticmethod
+    def _registro(senciante):
+        """
+        Cria o registro compacto de um Senciante.
+
+        Args:
+            senciante (Senciante): Senciante.
+
+        Returns:
+            tuple: (posição, itens de necessidades, itens de estado, atividade atual).
+        """
+        return (
+            tuple(senciante.posicao),
+            tuple(senciante.necessidades.items()),
+            tuple(senciante.estado.items()),
+            senciante.atividade_atual
+        )
+
+    @staticmethod
+    def _registro_para_dict(registro):
+        """
+        Converte um registro compacto em dicionário serializável.
+
+        Args:
+            registro (tuple): Registro compacto.
+
+        Returns:
+            dict: Registro como dicionário.
+        """
+        posicao, necessidades, estado, atividade = registro
+        return {
+            "posicao": list(posicao),
+            "necessidades": dict(necessidades),
+            "estado": dict(estado),
+            "atividade_atual": atividade
+        }
+
+    def registrar(self, simulacao):
+        """
+        Registra um novo passo da simulação, calculando as alterações desde o anterior.
+        Assinatura compatível com callbacks de "atualizacao".
+
+        Args:
+            simulacao (Simulacao): Simulação atualizada.
+        """
+        senciantes = simulacao.senciantes
+
+        with self.condicao:
+            versao = self.versao + 1
+
+            # Criados e alterados
+            for senciante_id, senciante in senciantes.items():
+                registro = self._registro(senciante)
+                anterior = self.registros.get(senciante_id)
+
+                if anterior is None:
+                    self.criado_em[senciante_id] = versao
+                elif anterior == registro:
+                    continue
+
+                self.registros[senciante_id] = registro
+                self.alterado_em[senciante_id] = versao
+                self.alterado_em.move_to_end(senciante_id)
+
+            # Removidos
+            if len(self.registros) > len(senciantes):
+                for senciante_id in [i for i in self.registros if i not in senciantes]:
+                    del self.registros[senciante_id]
+                    del self.criado_em[senciante_id]
+                    del self.alterado_em[senciante_id]
+
+                    if len(self.removidos) == self.removidos.maxlen:
+                        # A remoção mais antiga será descartada
+                        self.versao_minima = self.removidos[0][0]
+                    self.removidos.append((versao, senciante_id))
+
+            self.versao = versao
+            self.condicao.notify_all()
+
+    def alteracoes_desde(self, versao, feed_id=None):
+        """
+        Obtém as alterações ocorridas após uma versão.
+
+        Args:
+            versao (int): Última versão conhecida pelo cliente (0 para o estado completo).
+            feed_id (str, optional): ID do feed conhecido pelo cliente. Se for diferente
+                do atual (outra simulação), o estado completo é enviado.
+
+        Returns:
+            dict: {"feed_id", "versao", "completo", "criados", "alterados", "removidos"}.
+                Em respostas completas, todos os Senciantes vêm em "criados".
+        """
+        with self.condicao:
+            completo = (
+                versao <= 0 or versao < self.versao_minima or versao > self.versao or
+                (feed_id is not None and feed_id != self.id)
+            )
+
+            criados = {}
+            alterados = {}
+            removidos = []
+
+            if completo:
+                for senciante_id, registro in self.registros.items():
+                    criados[senciante_id] = self._registro_para_dict(registro)
+            else:
+                # Percorrer do mais recente para o mais antigo até a versão do cliente
+                for senciante_id in reversed(self.alterado_em):
+                    if self.alterado_em[senciante_id] <= versao:
+                        break
+                    registro = self._registro_para_dict(self.registros[senciante_id])
+                    if self.criado_em[senciante_id] > versao:
+                        criados[senciante_id] = registro
+                    else:
+                        alterados[senciante_id] = registro
+
+                for versao_remocao, senciante_id in reversed(self.removidos):
+                    if versao_remocao <= versao:
+                        break
+                    removidos.append(senciante_id)
+
+            return {
+                "feed_id": self.id,
+                "versao": self.versao,
+                "completo": completo,
+                "criados": criados,
+                "alterados": alterados,
+                "removidos": removidos
+            }
+
+    def aguardar(self, versao, timeout=None):
+        """
+        Bloqueia até que o feed passe da versão informada ou o tempo se esgote.
+
+        Args:
+            versao (int): Versão conhecida pelo cliente.
+            timeout (float, optional): Tempo máximo de espera em segundos.
+
+        Returns:
+            bool: True se há uma versão mais nova que `versao`.
+        """
+        with self.condicao:
+            return self.condicao.wait_for(lambda: self.versao > versao, timeout)
@@ -0,0 +1,490 @@
+"""
+Grafo genealógico para o jogo "O Mundo dos Senciantes".
+Cada Senciante vira um nó inteiro; os progenitores ficam em um array NumPy
+(dois por nó) e os filhos em uma adjacência compacta (CSR) reconstruída sob
+demanda. Sobre essa estrutura são calculados ancestrais e descendentes,
+ancestrais comuns, parentesco, coeficiente de endogamia, tamanho de linhagens
+e geração de cada Senciante.
+"""
+
+import numpy as np
+
+from utils.config import GENEALOGY_MAX_GENERATIONS
+
+
+class GrafoGenealogico:
+    """
+    Classe que armazena a genealogia dos Senciantes.
+    A geração de um nó é 0 para fundadores e 1 + a maior geração dos progenitores,
+    de modo que um ancestral sempre tem geração menor que seus descendentes.
+
+    Resultados que dependem de nascimentos futuros (descendentes, linhagens, filhos)
+    são invalidados a cada `registrar_nascimento`. Ancestrais e parentescos de
+    Senciantes já registrados não mudam com novos nascimentos e continuam em cache,
+    exceto quando um fundador recebe progenitores depois de registrado.
+    """
+
+    def __init__(self, capacidade_inicial=1024):
+        """
+        Inicializa um novo grafo vazio.
+
+        Args:
+            capacidade_inicial (int, optional): Número de nós pré-alocados. Default é 1024.
+        """
+        self.ids = {}  # Dicionário de senciante_id: nó
+        self.nomes = []  # Lista de nó: senciante_id
+        self.progenitores = np.full((capacidade_inicial, 2), -1, dtype=np.int32)
+        self.geracoes = np.zeros(capacidade_inicial, dtype=np.int32)
+        self.versao = 0  # Incrementada a cada nascimento
+
+        self._filhos = None  # (versão, início por nó, filhos) em formato CSR
+        self._cache_descendentes = {}  # (nó, max_geracoes): array de nós, da versão atual
+        self._cache_ancestrais = {}  # nó: dicionário de nó ancestral: distância
+        self._cache_parentesco = {}  # (nó, nó): coeficiente de parentesco
+
+    def __len__(self):
+        return len(self.nomes)
+
+    def __contains__(self, senciante_id):
+        return senciante_id in self.ids
+
+    def _no(self, senciante_id):
+        """
+        Obtém o nó de um Senciante, criando-o como fundador se não existir.
+
+        Args:
+            senciante_id (str): ID do Senciante.
+
+        Returns:
+            int: Nó do Senciante.
+        """
+        no = self.ids.get(senciante_id)
+        if no is None:
+            no = len(self.nomes)
+            if no == len(self.geracoes):
+                # Crescer por duplicação
+                self.progenitores = np.concatenate([self.progenitores, np.full_like(self.progenitores, -1)])
+                self.geracoes = np.concatenate([self.geracoes, np.zeros_like(self.geracoes)])
+            self.ids[senciante_id] = no
+            self.nomes.append(senciante_id)
+        return no
+
+    def registrar_nascimento(self, senciante_id, progenitores):
+        """
+        Registra um Senciante e seus progenitores. Progenitores ainda desconhecidos
+        são registrados como fundadores.
+
+        Args:
+            senciante_id (str): ID do Senciante nascido.
+            progenitores (list): IDs dos progenitores (no máximo dois).
+
+        Raises:
+            ValueError: Se houver mais de dois progenitores ou o Senciante for seu próprio progenitor.
+        """
+        if len(progenitores) > 2:
+            raise ValueError("Um Senciante tem no máximo dois progenitores.")
+        if senciante_id in progenitores:
+            raise ValueError("Um Senciante não pode ser seu próprio progenitor.")
+
+        nos_progenitores = [self._no(p) for p in progenitores]
+        existia = senciante_id in self.ids
+        no = self._no(senciante_id)
+
+        self.progenitores[no] = -1
+        self.progenitores[no, :len(nos_progenitores)] = nos_progenitores
+        self.versao += 1
+        self._cache_descendentes.clear()
+
+        if existia:
+            # Um nó já registrado ganhou progenitores: ancestrais, parentescos e gerações
+            # de seus descendentes mudam
+            self._cache_ancestrais.clear()
+            self._cache_parentesco.clear()
+            self._recalcular_geracoes()
+        elif nos_progenitores:
+            self.geracoes[no] = self.geracoes[nos_progenitores].max() + 1
+
+    def _recalcular_geracoes(self):
+        """
+        Recalcula a geração de todos os nós por relaxação até o ponto fixo.
+        """
+        n = len(self.nomes)
+        progenitores = self.progenitores[:n]
+        geracoes = np.zeros(n, dtype=np.int32)
+
+        for _ in range(n):
+            # Geração dos progenitores (-1 para progenitor ausente)
+            pais = np.where(progenitores >= 0, geracoes[np.maximum(progenitores, 0)], -1)
+            novas = pais.max(axis=1) + 1
+            if np.array_equal(novas, geracoes):
+                break
+            geracoes = novas
+
+        self.geracoes[:n] = geracoes
+
+    def _adjacencia_filhos(self):
+        """
+        Obtém a adjacência de filhos em formato CSR, reconstruindo-a se houve nascimentos.
+
+        Returns:
+            tuple: (início, filhos); os filhos do nó i são filhos[início[i]:início[i + 1]].
+        """
+        if self._filhos is None or self._filhos[0] != self.versao:
+            n = len(self.nomes)
+            progenitores = self.progenitores[:n]
+            filhos, coluna = np.nonzero(progenitores >= 0)
+            pais = progenitores[filhos, coluna]
+
+            ordem = np.argsort(pais, kind="stable")
+            inicio = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(np.bincount(pais, minlength=n), out=inicio[1:])
+            self._filhos = (self.versao, inicio, filhos[ordem].astype(np.int32))
+
+        return self._filhos[1], self._filhos[2]
+
+    def _niveis_ancestrais(self, no, max_distancia=None):
+        """
+        Calcula a distância (em gerações) de um nó a cada um de seus ancestrais.
+
+        Args:
+            no (int): Nó.
+            max_distancia (int, optional): Distância máxima. Se None, todos os ancestrais
+                (resultado mantido em cache).
+
+        Returns:
+            dict: Dicionário de nó ancestral: menor distância (o próprio nó tem distância 0).
+        """
+        niveis = self._cache_ancestrais.get(no)
+        if niveis is not None:
+            if max_distancia is None:
+                return niveis
+            return {a: d for a, d in niveis.items() if d <= max_distancia}
+
+        niveis = {no: 0}
+        fronteira = np.array([no], dtype=np.int32)
+        distancia = 0
+        while len(fronteira) and (max_distancia is None or distancia < max_distancia):
+            distancia += 1
+            pais = self.progenitores[fronteira].ravel()
+            novos = [p for p in np.unique(pais[pais >= 0]).tolist() if p not in niveis]
+            for p in novos:
+                niveis[p] = distancia
+            fronteira = np.array(novos, dtype=np.int32)
+
+        if max_distancia is None:
+            self._cache_ancestrais[no] = niveis
+        return niveis
+
+    def _descendentes(self, no, max_geracoes=None):
+        """
+        Calcula os descendentes de um nó.
+
+        Args:
+            no (int): Nó.
+            max_geracoes (int, optional): Número máximo de gerações abaixo. Se None, todas.
+
+        Returns:
+            numpy.ndarray: Nós descendentes (sem o próprio nó).
+        """
+        chave = (no, max_geracoes)
+        resultado = self._cache_descendentes.get(chave)
+        if resultado is not None:
+            return resultado
+
+        inicio, filhos = self._adjacencia_filhos()
+        visitado = np.zeros(len(self.nomes), dtype=bool)
+        visitado[no] = True
+        fronteira = np.array([no], dtype=np.int64)
+        geracao = 0
+
+        while len(fronteira) and (max_geracoes is None or geracao < max_geracoes):
+            geracao += 1
+            # Concatenar os trechos de filhos de todos os nós da fronteira
+            contagens = inicio[fronteira + 1] - inicio[fronteira]
+            total = int(contagens.sum())
+            if total == 0:
+                break
+            deslocamentos = np.arange(total) - np.repeat(np.cumsum(contagens) - contagens, contagens)
+            candidatos = filhos[np.repeat(inicio[fronteira], contagens) + deslocamentos]
+
+            fronteira = np.unique(candidatos[~visitado[candidatos]]).astype(np.int64)
+            visitado[fronteira] = True
+
+        visitado[no] = False
+        resultado = np.flatnonzero(visitado)
+        self._cache_descendentes[chave] = resultado
+        return resultado
+
+    def progenitores_de(self, senciante_id):
+        """
+        Obtém os progenitores de um Senciante.
+
+        Args:
+            senciante_id (str): ID do Senciante.
+
+        Returns:
+            list: IDs dos progenitores (vazia para fundadores e Senciantes desconhecidos).
+        """
+        no = self.ids.get(senciante_id)
+        if no is None:
+            return []
+        return [self.nomes[p] for p in self.progenitores[no].tolist() if p >= 0]
+
+    def filhos_de(self, senciante_id):
+        """
+        Obtém os filhos de um Senciante, em ordem de registro.
+
+        Args:
+            senciante_id (str): ID do Senciante.
+
+        Returns:
+            list: IDs dos filhos.
+        """
+        no = self.ids.get(senciante_id)
+        if no is None:
+            return []
+        inicio, filhos = self._adjacencia_filhos()
+        return [self.nomes[f] for f in filhos[inicio[no]:inicio[no + 1]].tolist()]
+
+    def geracao(self, senciante_id):
+        """
+        Obtém a geração de um Senciante (0 para fundadores).
+
+        Args:
+            senciante_id (str): ID do Senciante.
+
+        Returns:
+            int: Geração, ou None se o Senciante não estiver registrado.
+        """
+        no = self.ids.get(senciante_id)
+        return None if no is None else int(self.geracoes[no])
+
+    def ancestrais(self, senciante_id, max_geracoes=None):
+        """
+        Obtém os ancestrais de um Senciante.
+
+        Args:
+            senciante_id (str): ID do Senciante.
+            max_geracoes (int, optional): Número máximo de gerações acima. Se None, todas.
+
+        Returns:
+            set: IDs dos ancestrais.
+        """
+        no = self.ids.get(senciante_id)
+        if no is None:
+            return set()
+        return {
+            self.nomes[a] for a, distancia in self._niveis_ancestrais(no).items()
+            if 0 < distancia and (max_geracoes is None or distancia <= max_geracoes)
+        }
+
+    def descendentes(self, senciante_id, max_geracoes=None):
+        """
+        Obtém os descendentes de um Senciante.
+
+        Args:
+            senciante_id (str): ID do Senciante.
+            max_geracoes (int, optional): Número máximo de gerações abaixo. Se None, todas.
+
+        Returns:
+            set: IDs dos descendentes.
+        """
+        no = self.ids.get(senciante_id)
+        if no is None:
+            return set()
+        return {self.nomes[d] for d in self._descendentes(no, max_geracoes).tolist()}
+
+    def tamanho_linhagem(self, senciante_id):
+        """
+        Conta os descendentes de um Senciante.
+
+        Args:
+            senciante_id (str): ID do Senciante.
+
+        Returns:
+            int: Número de descendentes.
+        """
+        no = self.ids.get(senciante_id)
+        return 0 if no is None else len(self._descendentes(no))
+
+    def ancestrais_comuns(self, senciante_a, senciante_b, max_geracoes=None):
+        """
+        Obtém os ancestrais comuns de dois Senciantes.
+
+        Args:
+            senciante_a (str): ID do primeiro Senciante.
+            senciante_b (str): ID do segundo Senciante.
+            max_geracoes (int, optional): Número máximo de gerações acima de cada um. Se None, todas.
+
+        Returns:
+            set: IDs dos ancestrais comuns (um Senciante pode ser ancestral do outro).
+        """
+        if senciante_a not in self.ids or senciante_b not in self.ids:
+            return set()
+        niveis_a = self._niveis_ancestrais(self.ids[senciante_a], max_geracoes)
+        niveis_b = self._niveis_ancestrais(self.ids[senciante_b], max_geracoes)
+        return {self.nomes[no] for no in niveis_a.keys() & niveis_b.keys()}
+
+    def ancestral_comum_mais_proximo(self, senciante_a, senciante_b):
+        """
+        Obtém o ancestral comum mais próximo de dois Senciantes (menor soma das distâncias).
+        A busca sobe as duas ancestralidades com profundidade crescente e para assim que
+        nenhum ancestral mais distante puder melhorar o resultado.
+
+        Args:
+            senciante_a (str): ID do primeiro Senciante.
+            senciante_b (str): ID do segundo Senciante.
+
+        Returns:
+            str: ID do ancestral comum mais próximo, ou None se não houver.
+        """
+        if senciante_a not in self.ids or senciante_b not in self.ids:
+            return None
+        no_a, no_b = self.ids[senciante_a], self.ids[senciante_b]
+        limite_geracoes = int(max(self.geracoes[no_a], self.geracoes[no_b]))
+
+        profundidade = 1
+        while True:
+            niveis_a = self._niveis_ancestrais(no_a, profundidade)
+            niveis_b = self._niveis_ancestrais(no_b, profundidade)
+            comuns = niveis_a.keys() & niveis_b.keys()
+
+            if comuns:
+                melhor = min(comuns, key=lambda no: (niveis_a[no] + niveis_b[no], no))
+                # Ancestrais além da profundidade somam pelo menos profundidade + 1
+                if niveis_a[melhor] + niveis_b[melhor] <= profundidade + 1 or profundidade >= limite_geracoes:
+                    return self.nomes[melhor]
+            elif profundidade >= limite_geracoes:
+                return None
+
+            profundidade *= 2
+
+    def _parentesco(self, a, b, max_geracoes=None, raiz=None):
+        """
+        Calcula o coeficiente de parentesco (kinship) entre dois nós pelo método tabular:
+        φ(x, x) = (1 + F(x)) / 2 e, para x mais novo que y, φ(x, y) = (φ(pai, y) + φ(mãe, y)) / 2.
+        Usa uma pilha explícita para não depender do limite de recursão.
+
+        Com `max_geracoes`, apenas ancestrais a até essa distância de `raiz` (ou de `a` e
+        `b`) têm progenitores conhecidos; os mais antigos contam como fundadores.
+
+        Args:
+            a (int): Primeiro nó.
+            b (int): Segundo nó.
+            max_geracoes (int, optional): Profundidade do pedigree considerado. Se None, completo.
+            raiz (int, optional): Nó a partir do qual a profundidade é medida.
+
+        Returns:
+            float: Coeficiente de parentesco.
+        """
+        if max_geracoes is None:
+            memo = self._cache_parentesco
+            progenitores = lambda no: [p for p in self.progenitores[no].tolist() if p >= 0]
+        else:
+            memo = {}
+            niveis = {}
+            for origem in ((raiz,) if raiz is not None else (a, b)):
+                for no, distancia in self._niveis_ancestrais(origem, max_geracoes).items():
+                    niveis[no] = min(distancia, niveis.get(no, distancia))
+            progenitores = lambda no: (
+                [p for p in self.progenitores[no].tolist() if p >= 0]
+                if niveis.get(no, max_geracoes) < max_geracoes else []
+            )
+
+        pilha = [(a, b)]
+
+        while pilha:
+            x, y = pilha[-1]
+            chave = (x, y) if x <= y else (y, x)
+            if chave in memo:
+                pilha.pop()
+                continue
+
+            if x == y:
+                pais = progenitores(x)
+                dependencias = [tuple(pais)] if len(pais) == 2 else []
+            else:
+                # Expandir o mais novo, que não pode ser ancestral do outro
+                if self.geracoes[x] < self.geracoes[y]:
+                    x, y = y, x
+                dependencias = [(p, y) for p in progenitores(x)]
+
+            pendentes = [
+                d for d in dependencias
+                if ((d[0], d[1]) if d[0] <= d[1] else (d[1], d[0])) not in memo
+            ]
+            if pendentes:
+                pilha.extend(pendentes)
+                continue
+
+            valores = [memo[(p, q) if p <= q else (q, p)] for p, q in dependencias]
+            if x == y:
+                memo[chave] = (1.0 + (valores[0] if valores else 0.0)) / 2.0
+            else:
+                memo[chave] = sum(valores) / 2.0
+            pilha.pop()
+
+        return memo[(a, b) if a <= b else (b, a)]
+
+    def parentesco(self, senciante_a, senciante_b, max_geracoes=GENEALOGY_MAX_GENERATIONS):
+        """
+        Calcula o coeficiente de parentesco entre dois Senciantes: a probabilidade de
+        um alelo tomado ao acaso de cada um ser idêntico por descendência.
+
+        Args:
+            senciante_a (str): ID do primeiro Senciante.
+            senciante_b (str): ID do segundo Senciante.
+            max_geracoes (int, optional): Gerações de ancestrais consideradas acima de cada
+                Senciante. Default é GENEALOGY_MAX_GENERATIONS; None usa o pedigree completo,
+                cujo custo cresce com o quadrado do número de ancestrais.
+
+        Returns:
+            float: Coeficiente de parentesco (0.0 se algum não estiver registrado).
+        """
+        if senciante_a not in self.ids or senciante_b not in self.ids:
+            return 0.0
+        return self._parentesco(self.ids[senciante_a], self.ids[senciante_b], max_geracoes)
+
+    def coeficiente_endogamia(self, senciante_id, max_geracoes=GENEALOGY_MAX_GENERATIONS):
+        """
+        Calcula o coeficiente de endogamia de Wright de um Senciante, igual ao
+        parentesco entre seus progenitores.
+
+        Args:
+            senciante_id (str): ID do Senciante.
+            max_geracoes (int, optional): Gerações de ancestrais consideradas. Default é
+                GENEALOGY_MAX_GENERATIONS; None usa o pedigree completo.
+
+        Returns:
+            float: Coeficiente de endogamia (0.0 sem dois progenitores conhecidos).
+        """
+        no = self.ids.get(senciante_id)
+        if no is None:
+            return 0.0
+        pai, mae = self.progenitores[no].tolist()
+        if pai < 0 or mae < 0:
+            return 0.0
+        return self._parentesco(pai, mae, max_geracoes, raiz=no)
+
+    def resumo_linhagem(self, senciante_id):
+        """
+        Gera um resumo da linhagem de um Senciante para painéis.
+
+        Args:
+            senciante_id (str): ID do Senciante.
+
+        Returns:
+            dict: Geração, progenitores, filhos, número de ancestrais e descendentes e
+                coeficiente de endogamia, ou None se o Senciante não estiver registrado.
+        """
+        if senciante_id not in self.ids:
+            return None
+        return {
+            "id": senciante_id,
+            "geracao": self.geracao(senciante_id),
+            "progenitores": self.progenitores_de(senciante_id),
+            "filhos": self.filhos_de(senciante_id),
+            "num_ancestrais": len(self._niveis_ancestrais(self.ids[senciante_id])) - 1,
+            "num_descendentes": self.tamanho_linhagem(senciante_id),
+            "endogamia": self.coeficiente_endogamia(senciante_id)
+        }
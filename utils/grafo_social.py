@@ -0,0 +1,482 @@
+"""
+Grafo social para o jogo "O Mundo dos Senciantes".
+Guarda as relações de todos os Senciantes de um mundo em uma única estrutura
+esparsa: cada Senciante vira um nó inteiro, cada par relacionado uma aresta não
+direcionada, e os atributos das arestas (tipo, força, afinidade) ficam em
+arrays NumPy. A vizinhança de cada nó é um dicionário de nó vizinho: aresta,
+de modo que consultas de vizinhos custam O(grau), e graus, centralidades e
+exportações para scipy/networkx operam sobre os arrays inteiros.
+
+Como nas relações de um Senciante avulso (RelacoesSociais), a força decai
+exponencialmente e é calculada na leitura a partir da força e do instante da
+última alteração; arestas esquecidas somem imediatamente das consultas e são
+removidas por uma compactação periódica.
+"""
+
+from collections.abc import MutableMapping
+
+import numpy as np
+
+from utils.config import (
+    RELATION_STRENGTH_DECAY_RATE, RELATION_STRENGTH_THRESHOLD, RELATION_SWEEP_INTERVAL, RELATION_TYPES
+)
+
+
+class GrafoSocial:
+    """
+    Classe que armazena as relações sociais entre Senciantes.
+    Nós e arestas liberados são reaproveitados; os arrays crescem por duplicação.
+    """
+
+    def __init__(self, capacidade_inicial=256):
+        """
+        Inicializa um novo grafo vazio.
+
+        Args:
+            capacidade_inicial (int, optional): Número de arestas pré-alocadas. Default é 256.
+        """
+        capacidade = max(1, int(capacidade_inicial))
+
+        # Nós
+        self.nos = {}  # Dicionário de senciante_id: nó
+        self.ids = []  # Lista de nó: senciante_id (None para nós livres)
+        self.vizinhos = []  # Lista de nó: {nó vizinho: aresta}
+        self.nos_livres = []
+
+        # Arestas (uma linha por aresta)
+        self.extremos = np.full((capacidade, 2), -1, dtype=np.int32)
+        self.tipos = np.zeros(capacidade, dtype=np.int8)  # Índice em RELATION_TYPES
+        self.forcas = np.zeros(capacidade)  # Força na última alteração
+        self.tempos = np.zeros(capacidade)  # Instante da última alteração
+        self.afinidades = np.zeros(capacidade)
+        self.ativas = np.zeros(capacidade, dtype=bool)
+        self.arestas_livres = []
+        self.limite = 0  # Maior aresta já usada + 1
+
+        self.tempo = 0.0  # Relógio do grafo, em horas
+        self.proxima_compactacao = RELATION_SWEEP_INTERVAL
+
+    def __len__(self):
+        return len(self.nos)
+
+    def __contains__(self, senciante_id):
+        return senciante_id in self.nos
+
+    @property
+    def num_arestas(self):
+        """
+        int: Número de arestas guardadas, incluindo as esquecidas ainda não compactadas.
+        """
+        return int(np.count_nonzero(self.ativas[:self.limite]))
+
+    # Nós
+
+    def adicionar(self, senciante_id):
+        """
+        Adiciona um Senciante ao grafo.
+
+        Args:
+            senciante_id (str): ID do Senciante.
+
+        Returns:
+            int: Nó do Senciante.
+        """
+        no = self.nos.get(senciante_id)
+        if no is not None:
+            return no
+
+        if self.nos_livres:
+            no = self.nos_livres.pop()
+            self.ids[no] = senciante_id
+        else:
+            no = len(self.ids)
+            self.ids.append(senciante_id)
+            self.vizinhos.append({})
+        self.nos[senciante_id] = no
+        return no
+
+    def remover(self, senciante_id):
+        """
+        Remove um Senciante e todas as suas relações.
+
+        Args:
+            senciante_id (str): ID do Senciante.
+
+        Returns:
+            bool: True se o Senciante estava no grafo.
+        """
+        no = self.nos.pop(senciante_id, None)
+        if no is None:
+            return False
+
+        for vizinho, aresta in self.vizinhos[no].items():
+            del self.vizinhos[vizinho][no]
+            self._liberar_aresta(aresta)
+        self.vizinhos[no] = {}
+        self.ids[no] = None
+        self.nos_livres.append(no)
+        return True
+
+    def sincronizar(self, senciantes):
+        """
+        Remove do grafo os Senciantes que não fazem mais parte de um dicionário.
+
+        Args:
+            senciantes (dict): Dicionário de id: Senciante.
+        """
+        if len(self.nos) > len(senciantes):
+            for senciante_id in [i for i in self.nos if i not in senciantes]:
+                self.remover(senciante_id)
+
+    # Arestas
+
+    def _expandir(self):
+        """
+        Dobra a capacidade dos arrays de arestas.
+        """
+        capacidade = len(self.ativas)
+        for nome in ("extremos", "tipos", "forcas", "tempos", "afinidades", "ativas"):
+            antigo = getattr(self, nome)
+            novo = np.zeros((capacidade * 2,) + antigo.shape[1:], dtype=antigo.dtype)
+            novo[:capacidade] = antigo
+            setattr(self, nome, novo)
+        self.extremos[capacidade:] = -1
+
+    def _liberar_aresta(self, aresta):
+        self.ativas[aresta] = False
+        self.extremos[aresta] = -1
+        self.arestas_livres.append(aresta)
+
+    def _aresta(self, senciante_a, senciante_b):
+        """
+        Obtém a aresta entre dois Senciantes, se ainda não tiver sido esquecida.
+
+        Returns:
+            int: Aresta, ou None.
+        """
+        no_a = self.nos.get(senciante_a)
+        no_b = self.nos.get(senciante_b)
+        if no_a is None or no_b is None:
+            return None
+        aresta = self.vizinhos[no_a].get(no_b)
+        if aresta is None or self._forca(aresta) < RELATION_STRENGTH_THRESHOLD:
+            return None
+        return aresta
+
+    def _forca(self, aresta):
+        forca = self.forcas[aresta]
+        decorrido = self.tempo - self.tempos[aresta]
+        if decorrido == 0:
+            return float(forca)
+        return float(forca * np.exp(-RELATION_STRENGTH_DECAY_RATE * decorrido))
+
+    def _relacao(self, aresta):
+        return {
+            "tipo": RELATION_TYPES[self.tipos[aresta]],
+            "forca": self._forca(aresta),
+            "afinidade": float(self.afinidades[aresta])
+        }
+
+    def obter(self, senciante_a, senciante_b):
+        """
+        Obtém a relação entre dois Senciantes.
+
+        Args:
+            senciante_a (str): ID de um Senciante.
+            senciante_b (str): ID do outro Senciante.
+
+        Returns:
+            dict: {"tipo", "forca", "afinidade"} com a força atual, ou None se não houver relação.
+        """
+        aresta = self._aresta(senciante_a, senciante_b)
+        return self._relacao(aresta) if aresta is not None else None
+
+    def definir(self, senciante_a, senciante_b, tipo, forca, afinidade=None):
+        """
+        Cria ou substitui a relação entre dois Senciantes, adicionando-os ao grafo se preciso.
+        A força passa a decair a partir do tempo atual.
+
+        Args:
+            senciante_a (str): ID de um Senciante.
+            senciante_b (str): ID do outro Senciante.
+            tipo (str): Tipo da relação (um de RELATION_TYPES).
+            forca (float): Força da relação.
+            afinidade (float, optional): Afinidade da relação. Se None, mantém a atual (0.0 em novas relações).
+
+        Raises:
+            ValueError: Se o tipo for desconhecido ou os dois IDs forem iguais.
+        """
+        if tipo not in RELATION_TYPES:
+            raise ValueError(f"Tipo de relação desconhecido: {tipo}")
+        if senciante_a == senciante_b:
+            raise ValueError("Um Senciante não pode se relacionar consigo mesmo.")
+
+        no_a = self.adicionar(senciante_a)
+        no_b = self.adicionar(senciante_b)
+
+        aresta = self.vizinhos[no_a].get(no_b)
+        if aresta is None:
+            if self.arestas_livres:
+                aresta = self.arestas_livres.pop()
+            else:
+                if self.limite >= len(self.ativas):
+                    self._expandir()
+                aresta = self.limite
+                self.limite += 1
+            self.extremos[aresta] = (no_a, no_b)
+            self.ativas[aresta] = True
+            self.afinidades[aresta] = 0.0
+            self.vizinhos[no_a][no_b] = aresta
+            self.vizinhos[no_b][no_a] = aresta
+
+        self.tipos[aresta] = RELATION_TYPES.index(tipo)
+        self.forcas[aresta] = forca
+        self.tempos[aresta] = self.tempo
+        if afinidade is not None:
+            self.afinidades[aresta] = afinidade
+
+    def remover_relacao(self, senciante_a, senciante_b):
+        """
+        Remove a relação entre dois Senciantes.
+
+        Returns:
+            bool: True se a relação existia.
+        """
+        aresta = self._aresta(senciante_a, senciante_b)
+        if aresta is None:
+            return False
+
+        no_a, no_b = self.extremos[aresta].tolist()
+        del self.vizinhos[no_a][no_b]
+        del self.vizinhos[no_b][no_a]
+        self._liberar_aresta(aresta)
+        return True
+
+    # Consultas
+
+    def vizinhos_de(self, senciante_id):
+        """
+        Obtém as relações de um Senciante, em O(grau).
+
+        Args:
+            senciante_id (str): ID do Senciante.
+
+        Returns:
+            dict: Dicionário de outro_id: {"tipo", "forca", "afinidade"}.
+        """
+        no = self.nos.get(senciante_id)
+        if no is None:
+            return {}
+
+        relacoes = {}
+        for vizinho, aresta in self.vizinhos[no].items():
+            if self._forca(aresta) >= RELATION_STRENGTH_THRESHOLD:
+                relacoes[self.ids[vizinho]] = self._relacao(aresta)
+        return relacoes
+
+    def grau(self, senciante_id):
+        """
+        Obtém o número de relações de um Senciante, em O(grau).
+
+        Args:
+            senciante_id (str): ID do Senciante.
+
+        Returns:
+            int: Número de relações ainda não esquecidas.
+        """
+        no = self.nos.get(senciante_id)
+        if no is None:
+            return 0
+        return sum(1 for aresta in self.vizinhos[no].values()
+                   if self._forca(aresta) >= RELATION_STRENGTH_THRESHOLD)
+
+    def forcas_atuais(self):
+        """
+        Calcula a força atual de todas as arestas.
+
+        Returns:
+            tuple: (arestas válidas, forças atuais), arrays alinhados.
+        """
+        n = self.limite
+        arestas = np.flatnonzero(self.ativas[:n])
+        forcas = self.forcas[arestas] * np.exp(-RELATION_STRENGTH_DECAY_RATE * (self.tempo - self.tempos[arestas]))
+        validas = forcas >= RELATION_STRENGTH_THRESHOLD
+        return arestas[validas], forcas[validas]
+
+    def centralidade(self, ponderada=False, normalizar=True):
+        """
+        Calcula a centralidade de grau de todos os Senciantes.
+
+        Args:
+            ponderada (bool, optional): Se True, soma as forças das relações em vez de contá-las.
+                Default é False.
+            normalizar (bool, optional): Se True e não ponderada, divide pelo número de
+                outros Senciantes. Default é True.
+
+        Returns:
+            dict: Dicionário de senciante_id: centralidade.
+        """
+        arestas, forcas = self.forcas_atuais()
+        extremos = self.extremos[arestas]
+        pesos = np.concatenate([forcas, forcas]) if ponderada else None
+        valores = np.bincount(extremos.T.ravel(), weights=pesos, minlength=len(self.ids))
+
+        if not ponderada and normalizar and len(self.nos) > 1:
+            valores = valores / (len(self.nos) - 1)
+
+        return {senciante_id: float(valores[no]) for senciante_id, no in self.nos.items()}
+
+    # Manutenção
+
+    def avancar(self, delta_tempo):
+        """
+        Avança o relógio do grafo, compactando-o quando chegar a hora.
+
+        Args:
+            delta_tempo (float): Tempo decorrido em horas.
+        """
+        self.tempo += delta_tempo
+        if self.tempo >= self.proxima_compactacao:
+            self.compactar()
+
+    def compactar(self):
+        """
+        Remove as arestas já esquecidas.
+
+        Returns:
+            int: Número de arestas removidas.
+        """
+        n = self.limite
+        arestas = np.flatnonzero(self.ativas[:n])
+        forcas = self.forcas[arestas] * np.exp(-RELATION_STRENGTH_DECAY_RATE * (self.tempo - self.tempos[arestas]))
+        esquecidas = arestas[forcas < RELATION_STRENGTH_THRESHOLD]
+
+        for aresta, (no_a, no_b) in zip(esquecidas.tolist(), self.extremos[esquecidas].tolist()):
+            del self.vizinhos[no_a][no_b]
+            del self.vizinhos[no_b][no_a]
+            self._liberar_aresta(aresta)
+
+        self.proxima_compactacao = self.tempo + RELATION_SWEEP_INTERVAL
+        return len(esquecidas)
+
+    # Exportação
+
+    def para_scipy(self, atributo="forca"):
+        """
+        Exporta o grafo como matriz de adjacência esparsa simétrica (requer scipy).
+
+        Args:
+            atributo (str, optional): Peso das entradas: "forca", "afinidade" ou "tipo"
+                (índice em RELATION_TYPES + 1). Default é "forca".
+
+        Returns:
+            tuple: (scipy.sparse.csr_matrix n x n, lista de nó: senciante_id).
+        """
+        from scipy import sparse
+
+        arestas, forcas = self.forcas_atuais()
+        if atributo == "forca":
+            pesos = forcas
+        elif atributo == "afinidade":
+            pesos = self.afinidades[arestas]
+        elif atributo == "tipo":
+            pesos = self.tipos[arestas].astype(float) + 1
+        else:
+            raise ValueError(f"Atributo desconhecido: {atributo}")
+
+        a, b = self.extremos[arestas].T
+        n = len(self.ids)
+        matriz = sparse.coo_matrix(
+            (np.concatenate([pesos, pesos]), (np.concatenate([a, b]), np.concatenate([b, a]))),
+            shape=(n, n)
+        )
+        return matriz.tocsr(), list(self.ids)
+
+    def para_networkx(self, senciantes=None):
+        """
+        Exporta o grafo para networkx, com tipo, forca e afinidade em cada aresta.
+
+        Args:
+            senciantes (iterable, optional): IDs a incluir. Default são todos os nós.
+
+        Returns:
+            networkx.Graph: Grafo exportado.
+        """
+        import networkx as nx
+
+        # Nós na ordem de inserção no grafo, para uma exportação determinística
+        if senciantes is None:
+            ordem = list(self.nos)
+        else:
+            pedidos = set(senciantes)
+            ordem = [senciante_id for senciante_id in self.nos if senciante_id in pedidos]
+        incluidos = set(ordem)
+
+        grafo = nx.Graph()
+        grafo.add_nodes_from(ordem)
+
+        arestas, forcas = self.forcas_atuais()
+        for aresta, forca, (no_a, no_b) in zip(arestas.tolist(), forcas.tolist(), self.extremos[arestas].tolist()):
+            senciante_a, senciante_b = self.ids[no_a], self.ids[no_b]
+            if senciante_a in incluidos and senciante_b in incluidos:
+                grafo.add_edge(senciante_a, senciante_b, tipo=RELATION_TYPES[self.tipos[aresta]],
+                               forca=forca, afinidade=float(self.afinidades[aresta]))
+        return grafo
+
+
+class VisaoRelacoes(MutableMapping):
+    """
+    Relações de um Senciante no grafo social, com a mesma interface de RelacoesSociais.
+    Os dicionários devolvidos são cópias: alterações devem ser gravadas de volta
+    com `relacoes[senciante_id] = relacao`.
+    """
+
+    def __init__(self, grafo, senciante_id):
+        """
+        Inicializa uma nova visão.
+
+        Args:
+            grafo (GrafoSocial): Grafo social.
+            senciante_id (str): ID do Senciante dono das relações.
+        """
+        self.grafo = grafo
+        self.senciante_id = senciante_id
+
+    def __getitem__(self, outro_id):
+        relacao = self.grafo.obter(self.senciante_id, outro_id)
+        if relacao is None:
+            raise KeyError(outro_id)
+        return relacao
+
+    def __setitem__(self, outro_id, relacao):
+        self.grafo.definir(self.senciante_id, outro_id, relacao["tipo"], relacao["forca"], relacao.get("afinidade"))
+
+    def __delitem__(self, outro_id):
+        if not self.grafo.remover_relacao(self.senciante_id, outro_id):
+            raise KeyError(outro_id)
+
+    def __contains__(self, outro_id):
+        return self.grafo._aresta(self.senciante_id, outro_id) is not None
+
+    def __iter__(self):
+        return iter(self.grafo.vizinhos_de(self.senciante_id))
+
+    def __len__(self):
+        return self.grafo.grau(self.senciante_id)
+
+    def items(self):
+        return self.grafo.vizinhos_de(self.senciante_id).items()
+
+    def avancar(self, delta_tempo):
+        """
+        O relógio das relações é o do grafo, avançado pelo mundo; não faz nada.
+        """
+
+    def to_dict(self):
+        """
+        Converte as relações para um dicionário.
+
+        Returns:
+            dict: Dicionário de outro_id: {"tipo", "forca", "afinidade"}.
+        """
+        return self.grafo.vizinhos_de(self.senciante_id)
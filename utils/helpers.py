@@ -4,11 +4,15 @@ Contém funções auxiliares usadas em várias partes do sistema.
 """
 
 import random
+import re
+import os
 import uuid
 import math
 import logging
 from datetime import datetime
 
+from utils.registro_entidades import registro_entidades
+
 # Configuração de logging
 logging.basicConfig(
     level=logging.INFO,
@@ -21,15 +25,55 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-def gerar_id():
+# Nomes de arquivo recebidos de fora (API): sem separadores de diretório, sem começar com "."
+_PADRAO_NOME_ARQUIVO = re.compile(r"^[A-Za-z0-9_-][A-Za-z0-9_.-]{0,127}$")
+
+def gerar_id(tipo="entidade"):
     """
     Gera um ID único para entidades do jogo.
     
+    Args:
+        tipo (str, optional): Tipo da entidade (ver utils.registro_entidades.TIPOS_ENTIDADE).
+            Default é "entidade".
+    
+    Returns:
+        int: ID inteiro, crescente dentro do tipo.
+    """
+    return registro_entidades.gerar(tipo)
+
+def gerar_uuid():
+    """
+    Gera um identificador único entre processos e execuções, para mundos e feeds
+    referenciados pelos clientes.
+    
     Returns:
-        str: ID único no formato de string.
+        str: UUID no formato de string.
     """
     return str(uuid.uuid4())
 
+def caminho_no_diretorio(diretorio, nome, extensoes=None):
+    """
+    Resolve um nome de arquivo recebido de fora dentro de um diretório configurado.
+    Apenas nomes simples são aceitos: caminhos absolutos, separadores de diretório
+    e ".." são rejeitados, de modo que o arquivo nunca fica fora do diretório.
+    
+    Args:
+        diretorio (str): Diretório configurado.
+        nome (str): Nome do arquivo.
+        extensoes (tuple, optional): Extensões aceitas (ex: (".snap",)). Se None, aceita qualquer uma.
+    
+    Returns:
+        str: Caminho do arquivo dentro do diretório.
+    
+    Raises:
+        ValueError: Se o nome for inválido.
+    """
+    if not isinstance(nome, str) or not _PADRAO_NOME_ARQUIVO.match(nome) or ".." in nome:
+        raise ValueError("O nome deve ter até 128 letras, dígitos, '_', '-' ou '.', sem diretórios nem '..'.")
+    if extensoes is not None and not nome.endswith(tuple(extensoes)):
+        raise ValueError(f"O nome deve terminar em {', '.join(extensoes)}.")
+    return os.path.join(diretorio, nome)
+
 def calcular_distancia(pos1, pos2):
     """
     Calcula a distância euclidiana entre duas posições.
@@ -156,7 +200,7 @@ def registrar_evento(tipo, descricao, tempo, envolvidos=None):
         envolvidos = []
         
     return {
-        "id": gerar_id(),
+        "id": gerar_id("evento"),
         "tipo": tipo,
         "descricao": descricao,
         "tempo": tempo,
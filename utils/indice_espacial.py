@@ -0,0 +1,567 @@
+"""
+Módulo de indexação espacial para o jogo "O Mundo dos Senciantes".
+Mantém entidades em uma grade uniforme para acelerar consultas de proximidade.
+"""
+
+import heapq
+import math
+
+
+class IndiceEspacial:
+    """
+    Índice espacial baseado em uma grade uniforme (spatial hash).
+    Cada entidade ocupa a célula correspondente à sua posição, de modo que
+    consultas por raio e por vizinhos mais próximos examinam apenas as
+    células vizinhas em vez de todas as entidades.
+    """
+
+    def __init__(self, tamanho_celula=2.0):
+        """
+        Inicializa um novo índice espacial.
+
+        Args:
+            tamanho_celula (float, optional): Lado de cada célula da grade. Default é 2.0.
+        """
+        if tamanho_celula <= 0:
+            raise ValueError("O tamanho da célula deve ser positivo.")
+
+        self.tamanho_celula = float(tamanho_celula)
+        self.celulas = {}  # Dicionário de (cx, cy): {entidade_id: None} (ordem de inserção determinística)
+        self.posicoes = {}  # Dicionário de entidade_id: (x, y)
+        self.celula_entidade = {}  # Dicionário de entidade_id: (cx, cy)
+
+    def __len__(self):
+        return len(self.posicoes)
+
+    def __contains__(self, entidade_id):
+        return entidade_id in self.posicoes
+
+    def _celula(self, posicao):
+        """
+        Calcula a célula da grade que contém uma posição.
+
+        Args:
+            posicao (list): Posição [x, y].
+
+        Returns:
+            tuple: Coordenadas (cx, cy) da célula.
+        """
+        return (
+            math.floor(posicao[0] / self.tamanho_celula),
+            math.floor(posicao[1] / self.tamanho_celula)
+        )
+
+    def inserir(self, entidade_id, posicao):
+        """
+        Insere uma entidade no índice. Se já existir, apenas atualiza sua posição.
+
+        Args:
+            entidade_id: Identificador da entidade.
+            posicao (list): Posição [x, y] da entidade.
+        """
+        if entidade_id in self.posicoes:
+            self.atualizar(entidade_id, posicao)
+            return
+
+        celula = self._celula(posicao)
+        self.posicoes[entidade_id] = (posicao[0], posicao[1])
+        self.celula_entidade[entidade_id] = celula
+
+        if celula not in self.celulas:
+            self.celulas[celula] = {}
+        self.celulas[celula][entidade_id] = None
+
+    def remover(self, entidade_id):
+        """
+        Remove uma entidade do índice.
+
+        Args:
+            entidade_id: Identificador da entidade.
+
+        Returns:
+            bool: True se a entidade foi removida, False se não estava no índice.
+        """
+        if entidade_id not in self.posicoes:
+            return False
+
+        celula = self.celula_entidade.pop(entidade_id)
+        del self.posicoes[entidade_id]
+
+        ocupantes = self.celulas[celula]
+        ocupantes.pop(entidade_id, None)
+        if not ocupantes:
+            del self.celulas[celula]
+
+        return True
+
+    def atualizar(self, entidade_id, posicao):
+        """
+        Atualiza a posição de uma entidade, movendo-a de célula se necessário.
+
+        Args:
+            entidade_id: Identificador da entidade.
+            posicao (list): Nova posição [x, y].
+        """
+        if entidade_id not in self.posicoes:
+            self.inserir(entidade_id, posicao)
+            return
+
+        self.posicoes[entidade_id] = (posicao[0], posicao[1])
+
+        nova_celula = self._celula(posicao)
+        celula_atual = self.celula_entidade[entidade_id]
+        if nova_celula == celula_atual:
+            return
+
+        # Trocar de célula
+        ocupantes = self.celulas[celula_atual]
+        ocupantes.pop(entidade_id, None)
+        if not ocupantes:
+            del self.celulas[celula_atual]
+
+        if nova_celula not in self.celulas:
+            self.celulas[nova_celula] = {}
+        self.celulas[nova_celula][entidade_id] = None
+        self.celula_entidade[entidade_id] = nova_celula
+
+    def limpar(self):
+        """
+        Remove todas as entidades do índice.
+        """
+        self.celulas = {}
+        self.posicoes = {}
+        self.celula_entidade = {}
+
+    def ids(self):
+        """
+        Obtém os identificadores de todas as entidades indexadas.
+
+        Returns:
+            list: Lista de identificadores.
+        """
+        return list(self.posicoes)
+
+    def obter_posicao(self, entidade_id):
+        """
+        Obtém a posição indexada de uma entidade.
+
+        Args:
+            entidade_id: Identificador da entidade.
+
+        Returns:
+            tuple: Posição (x, y), ou None se a entidade não está no índice.
+        """
+        return self.posicoes.get(entidade_id)
+
+    def buscar_raio(self, posicao, raio):
+        """
+        Encontra as entidades dentro de um raio a partir de uma posição.
+
+        Args:
+            posicao (list): Posição central [x, y].
+            raio (float): Raio de busca.
+
+        Returns:
+            list: Lista de identificadores ordenada da entidade mais próxima para a mais distante.
+        """
+        return [entidade_id for _, entidade_id in self.buscar_raio_com_distancias(posicao, raio)]
+
+    def buscar_raio_com_distancias(self, posicao, raio):
+        """
+        Encontra as entidades dentro de um raio, junto com o quadrado de suas distâncias.
+
+        Args:
+            posicao (list): Posição central [x, y].
+            raio (float): Raio de busca.
+
+        Returns:
+            list: Lista de tuplas (distancia_quadrada, entidade_id), da mais próxima para a mais distante.
+        """
+        if raio < 0 or not self.posicoes:
+            return []
+
+        x, y = posicao[0], posicao[1]
+        raio_quadrado = raio * raio
+        cx_min, cy_min = self._celula((x - raio, y - raio))
+        cx_max, cy_max = self._celula((x + raio, y + raio))
+
+        encontrados = []
+        for cx in range(cx_min, cx_max + 1):
+            for cy in range(cy_min, cy_max + 1):
+                ocupantes = self.celulas.get((cx, cy))
+                if not ocupantes:
+                    continue
+                for entidade_id in ocupantes:
+                    ex, ey = self.posicoes[entidade_id]
+                    distancia_quadrada = (ex - x) ** 2 + (ey - y) ** 2
+                    if distancia_quadrada <= raio_quadrado:
+                        encontrados.append((distancia_quadrada, entidade_id))
+
+        encontrados.sort(key=lambda item: item[0])
+        return encontrados
+
+    def k_mais_proximos(self, posicao, k, raio_maximo=None):
+        """
+        Encontra as k entidades mais próximas de uma posição.
+        A busca expande anéis de células a partir da célula central e para assim
+        que nenhuma célula ainda não visitada pode conter uma entidade mais próxima.
+
+        Args:
+            posicao (list): Posição central [x, y].
+            k (int): Número máximo de entidades a retornar.
+            raio_maximo (float, optional): Distância máxima considerada. Se None, sem limite.
+
+        Returns:
+            list: Lista de até k identificadores, da mais próxima para a mais distante.
+        """
+        if k <= 0 or not self.posicoes:
+            return []
+
+        x, y = posicao[0], posicao[1]
+        cx0, cy0 = self._celula(posicao)
+        limite_quadrado = raio_maximo * raio_maximo if raio_maximo is not None else math.inf
+
+        melhores = []  # Max-heap de (-distancia_quadrada, entidade_id)
+        vistos = 0  # Entidades já examinadas; ao ver todas, não há por que expandir
+        anel = 0
+        while vistos < len(self.posicoes):
+            # Distância mínima possível até qualquer célula deste anel
+            if anel > 0:
+                distancia_minima = (anel - 1) * self.tamanho_celula
+                distancia_minima_quadrada = distancia_minima * distancia_minima
+                if distancia_minima_quadrada > limite_quadrado:
+                    break
+                if len(melhores) == k and distancia_minima_quadrada > -melhores[0][0]:
+                    break
+
+            for cx, cy in self._celulas_do_anel(cx0, cy0, anel):
+                ocupantes = self.celulas.get((cx, cy))
+                if not ocupantes:
+                    continue
+                vistos += len(ocupantes)
+                for entidade_id in ocupantes:
+                    ex, ey = self.posicoes[entidade_id]
+                    distancia_quadrada = (ex - x) ** 2 + (ey - y) ** 2
+                    if distancia_quadrada > limite_quadrado:
+                        continue
+                    if len(melhores) < k:
+                        heapq.heappush(melhores, (-distancia_quadrada, entidade_id))
+                    elif distancia_quadrada < -melhores[0][0]:
+                        heapq.heapreplace(melhores, (-distancia_quadrada, entidade_id))
+
+            anel += 1
+
+        melhores.sort(key=lambda item: -item[0])
+        return [entidade_id for _, entidade_id in melhores]
+
+    def _celulas_do_anel(self, cx0, cy0, anel):
+        """
+        Gera as células que formam o anel quadrado de raio `anel` ao redor de uma célula.
+
+        Args:
+            cx0 (int): Coordenada x da célula central.
+            cy0 (int): Coordenada y da célula central.
+            anel (int): Distância (em células) do anel ao centro.
+
+        Yields:
+            tuple: Coordenadas (cx, cy) de cada célula do anel.
+        """
+        if anel == 0:
+            yield (cx0, cy0)
+            return
+
+        for cx in range(cx0 - anel, cx0 + anel + 1):
+            yield (cx, cy0 - anel)
+            yield (cx, cy0 + anel)
+        for cy in range(cy0 - anel + 1, cy0 + anel):
+            yield (cx0 - anel, cy)
+            yield (cx0 + anel, cy)
+
+    def pares_proximos(self, raio):
+        """
+        Encontra todos os pares de entidades a no máximo `raio` de distância.
+        Cada par é gerado uma única vez, examinando apenas metade da vizinhança
+        de cada célula.
+
+        Args:
+            raio (float): Distância máxima entre as entidades do par.
+
+        Returns:
+            list: Lista de tuplas (entidade_id1, entidade_id2).
+        """
+        raio_quadrado = raio * raio
+        alcance = max(1, math.ceil(raio / self.tamanho_celula))
+
+        # Metade das células vizinhas (ordem lexicográfica positiva)
+        deslocamentos = [
+            (dx, dy)
+            for dx in range(0, alcance + 1)
+            for dy in range(-alcance, alcance + 1)
+            if dx > 0 or dy > 0
+        ]
+
+        pares = []
+        posicoes = self.posicoes
+        for (cx, cy), ocupantes in self.celulas.items():
+            lista = list(ocupantes)
+
+            # Pares dentro da mesma célula
+            for i in range(len(lista)):
+                id1 = lista[i]
+                x1, y1 = posicoes[id1]
+                for j in range(i + 1, len(lista)):
+                    id2 = lista[j]
+                    x2, y2 = posicoes[id2]
+                    if (x1 - x2) ** 2 + (y1 - y2) ** 2 <= raio_quadrado:
+                        pares.append((id1, id2))
+
+            # Pares com células vizinhas
+            for dx, dy in deslocamentos:
+                vizinhos = self.celulas.get((cx + dx, cy + dy))
+                if not vizinhos:
+                    continue
+                for id1 in lista:
+                    x1, y1 = posicoes[id1]
+                    for id2 in vizinhos:
+                        x2, y2 = posicoes[id2]
+                        if (x1 - x2) ** 2 + (y1 - y2) ** 2 <= raio_quadrado:
+                            pares.append((id1, id2))
+
+        return pares
+
+
+class IndiceEspacialPorTipo:
+    """
+    Conjunto de índices espaciais, um por tipo de entidade.
+    Permite buscas restritas a um tipo (ex: só recursos de "agua") sem
+    examinar entidades de outros tipos.
+    """
+
+    def __init__(self, tamanho_celula=10.0):
+        """
+        Inicializa um novo índice espacial por tipo.
+
+        Args:
+            tamanho_celula (float, optional): Lado de cada célula das grades. Default é 10.0.
+        """
+        self.tamanho_celula = tamanho_celula
+        self.indices = {}  # Dicionário de tipo: IndiceEspacial
+        self.tipos = {}  # Dicionário de entidade_id: tipo
+
+    def __len__(self):
+        return len(self.tipos)
+
+    def __contains__(self, entidade_id):
+        return entidade_id in self.tipos
+
+    def inserir(self, entidade_id, tipo, posicao):
+        """
+        Insere uma entidade no índice do seu tipo.
+
+        Args:
+            entidade_id: Identificador da entidade.
+            tipo (str): Tipo da entidade.
+            posicao (list): Posição [x, y] da entidade.
+        """
+        if self.tipos.get(entidade_id, tipo) != tipo:
+            self.remover(entidade_id)
+
+        if tipo not in self.indices:
+            self.indices[tipo] = IndiceEspacial(self.tamanho_celula)
+
+        self.indices[tipo].inserir(entidade_id, posicao)
+        self.tipos[entidade_id] = tipo
+
+    def remover(self, entidade_id):
+        """
+        Remove uma entidade do índice.
+
+        Args:
+            entidade_id: Identificador da entidade.
+
+        Returns:
+            bool: True se a entidade foi removida, False se não estava no índice.
+        """
+        tipo = self.tipos.pop(entidade_id, None)
+        if tipo is None:
+            return False
+
+        indice = self.indices[tipo]
+        indice.remover(entidade_id)
+        if not len(indice):
+            del self.indices[tipo]
+
+        return True
+
+    def limpar(self):
+        """
+        Remove todas as entidades do índice.
+        """
+        self.indices = {}
+        self.tipos = {}
+
+    def buscar_raio(self, posicao, raio, tipo=None):
+        """
+        Encontra as entidades dentro de um raio a partir de uma posição.
+
+        Args:
+            posicao (list): Posição central [x, y].
+            raio (float): Raio de busca.
+            tipo (str, optional): Tipo de entidade a buscar. Se None, busca todos.
+
+        Returns:
+            list: Lista de identificadores ordenada da entidade mais próxima para a mais distante.
+        """
+        if tipo is not None:
+            indice = self.indices.get(tipo)
+            return indice.buscar_raio(posicao, raio) if indice else []
+
+        encontrados = []
+        for indice in self.indices.values():
+            encontrados.extend(indice.buscar_raio_com_distancias(posicao, raio))
+
+        encontrados.sort(key=lambda item: item[0])
+        return [entidade_id for _, entidade_id in encontrados]
+
+    def k_mais_proximos(self, posicao, k, tipo=None, raio_maximo=None):
+        """
+        Encontra as k entidades mais próximas de uma posição.
+
+        Args:
+            posicao (list): Posição central [x, y].
+            k (int): Número máximo de entidades a retornar.
+            tipo (str, optional): Tipo de entidade a buscar. Se None, busca todos.
+            raio_maximo (float, optional): Distância máxima considerada. Se None, sem limite.
+
+        Returns:
+            list: Lista de até k identificadores, da mais próxima para a mais distante.
+        """
+        if tipo is not None:
+            indice = self.indices.get(tipo)
+            return indice.k_mais_proximos(posicao, k, raio_maximo) if indice else []
+
+        candidatos = []
+        for indice in self.indices.values():
+            for entidade_id in indice.k_mais_proximos(posicao, k, raio_maximo):
+                ex, ey = indice.posicoes[entidade_id]
+                candidatos.append(((ex - posicao[0]) ** 2 + (ey - posicao[1]) ** 2, entidade_id))
+
+        candidatos.sort(key=lambda item: item[0])
+        return [entidade_id for _, entidade_id in candidatos[:k]]
+
+
+class ColecaoEspacial(dict):
+    """
+    Dicionário de id: entidade que mantém um IndiceEspacialPorTipo sincronizado.
+    Cada entidade inserida é vinculada ao índice através de `vincular_indice`,
+    e desvinculada quando sai da coleção.
+    """
+
+    def __init__(self, entidades=None, tamanho_celula=10.0):
+        """
+        Inicializa uma nova coleção espacial.
+
+        Args:
+            entidades (dict, optional): Dicionário inicial de id: entidade.
+            tamanho_celula (float, optional): Lado de cada célula do índice. Default é 10.0.
+        """
+        super().__init__()
+        self.indice = IndiceEspacialPorTipo(tamanho_celula)
+        if entidades:
+            self.update(entidades)
+
+    def __reduce__(self):
+        # As entidades já guardam o índice ao qual estão vinculadas; restaurar sem revinculá-las
+        return (_restaurar_colecao, (self.__class__, self.indice, dict(self)))
+
+    def __setitem__(self, chave, entidade):
+        anterior = dict.get(self, chave)
+        if anterior is not None and anterior is not entidade:
+            anterior.vincular_indice(None)
+
+        dict.__setitem__(self, chave, entidade)
+        entidade.vincular_indice(self.indice)
+
+    def __delitem__(self, chave):
+        entidade = dict.__getitem__(self, chave)
+        dict.__delitem__(self, chave)
+        entidade.vincular_indice(None)
+
+    def pop(self, chave, *padrao):
+        if chave not in self:
+            if padrao:
+                return padrao[0]
+            raise KeyError(chave)
+        entidade = dict.pop(self, chave)
+        entidade.vincular_indice(None)
+        return entidade
+
+    def popitem(self):
+        chave, entidade = dict.popitem(self)
+        entidade.vincular_indice(None)
+        return chave, entidade
+
+    def setdefault(self, chave, entidade=None):
+        if chave not in self:
+            self[chave] = entidade
+        return dict.__getitem__(self, chave)
+
+    def update(self, *args, **kwargs):
+        for chave, entidade in dict(*args, **kwargs).items():
+            self[chave] = entidade
+
+    def clear(self):
+        for entidade in self.values():
+            entidade.vincular_indice(None)
+        dict.clear(self)
+        self.indice.limpar()
+
+    def buscar_raio(self, posicao, raio, tipo=None):
+        """
+        Encontra as entidades da coleção dentro de um raio.
+
+        Args:
+            posicao (list): Posição central [x, y].
+            raio (float): Raio de busca.
+            tipo (str, optional): Tipo de entidade a buscar. Se None, busca todos.
+
+        Returns:
+            list: Lista de entidades, da mais próxima para a mais distante.
+        """
+        return [dict.__getitem__(self, entidade_id) for entidade_id in self.indice.buscar_raio(posicao, raio, tipo)]
+
+    def k_mais_proximos(self, posicao, k, tipo=None, raio_maximo=None):
+        """
+        Encontra as k entidades da coleção mais próximas de uma posição.
+
+        Args:
+            posicao (list): Posição central [x, y].
+            k (int): Número máximo de entidades a retornar.
+            tipo (str, optional): Tipo de entidade a buscar. Se None, busca todos.
+            raio_maximo (float, optional): Distância máxima considerada. Se None, sem limite.
+
+        Returns:
+            list: Lista de até k entidades, da mais próxima para a mais distante.
+        """
+        return [
+            dict.__getitem__(self, entidade_id)
+            for entidade_id in self.indice.k_mais_proximos(posicao, k, tipo, raio_maximo)
+        ]
+
+
+def _restaurar_colecao(classe, indice, entidades):
+    """
+    Reconstrói uma ColecaoEspacial serializada, reaproveitando o índice salvo.
+
+    Args:
+        classe (type): Classe da coleção.
+        indice (IndiceEspacialPorTipo): Índice salvo junto com a coleção.
+        entidades (dict): Dicionário de id: entidade.
+
+    Returns:
+        ColecaoEspacial: Coleção restaurada.
+    """
+    colecao = classe.__new__(classe)
+    colecao.indice = indice
+    dict.update(colecao, entidades)
+    return colecao
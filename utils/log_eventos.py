@@ -0,0 +1,372 @@
+"""
+Log de eventos em disco para o histórico do jogo "O Mundo dos Senciantes".
+Todos os eventos registrados são gravados em segmentos binários somente-anexação,
+com fsync em lotes. Um índice esparso por blocos de registros (tempo mínimo e
+máximo de cada bloco) permite reproduzir ou consultar qualquer intervalo de
+tempo lendo apenas os blocos que o cobrem.
+
+Formato de cada registro em um segmento (`segmento_NNNNNN.log`):
+    tamanho (uint32) | tempo (float64) | crc32 (uint32) | evento em JSON (UTF-8)
+
+Formato de cada entrada do índice (`segmento_NNNNNN.idx`):
+    início (uint64) | fim (uint64) | tempo mínimo (float64) | tempo máximo (float64) |
+    registros (uint32)
+"""
+
+import json
+import os
+import struct
+import threading
+import zlib
+
+_REGISTRO = struct.Struct("<IdI")
+_ENTRADA_INDICE = struct.Struct("<QQddI")
+
+
+class BlocoIndice:
+    """
+    Entrada do índice esparso: um trecho contíguo de registros de um segmento.
+    """
+
+    __slots__ = ("segmento", "inicio", "fim", "tempo_minimo", "tempo_maximo", "registros")
+
+    def __init__(self, segmento, inicio, fim=None, tempo_minimo=float("inf"),
+                 tempo_maximo=float("-inf"), registros=0):
+        self.segmento = segmento
+        self.inicio = inicio
+        self.fim = inicio if fim is None else fim
+        self.tempo_minimo = tempo_minimo
+        self.tempo_maximo = tempo_maximo
+        self.registros = registros
+
+    def incluir(self, fim, tempo):
+        """
+        Estende o bloco com um registro.
+
+        Args:
+            fim (int): Posição do fim do registro no segmento.
+            tempo (float): Tempo do registro.
+        """
+        self.fim = fim
+        self.tempo_minimo = min(self.tempo_minimo, tempo)
+        self.tempo_maximo = max(self.tempo_maximo, tempo)
+        self.registros += 1
+
+    def sobrepoe(self, tempo_inicio, tempo_fim):
+        return self.registros > 0 and self.tempo_maximo >= tempo_inicio and self.tempo_minimo <= tempo_fim
+
+
+def _varrer_segmento(caminho, inicio=0, fim=None):
+    """
+    Lê os registros válidos de um segmento.
+
+    Args:
+        caminho (str): Caminho do segmento.
+        inicio (int, optional): Posição inicial. Default é 0.
+        fim (int, optional): Posição final. Se None, até o fim do arquivo.
+
+    Yields:
+        tuple: (início do registro, fim do registro, tempo, bytes do evento). A leitura
+            para no primeiro registro truncado ou corrompido.
+    """
+    with open(caminho, "rb") as f:
+        f.seek(inicio)
+        posicao = inicio
+        while fim is None or posicao < fim:
+            cabecalho = f.read(_REGISTRO.size)
+            if len(cabecalho) < _REGISTRO.size:
+                return
+
+            tamanho, tempo, crc = _REGISTRO.unpack(cabecalho)
+            dados = f.read(tamanho)
+            if len(dados) < tamanho or zlib.crc32(dados) != crc:
+                return
+
+            proxima = posicao + _REGISTRO.size + tamanho
+            yield posicao, proxima, tempo, dados
+            posicao = proxima
+
+
+class LogEventos:
+    """
+    Classe que mantém o log de eventos segmentado em um diretório.
+    Ao abrir um diretório existente, o log continua a partir do último registro
+    válido (registros truncados por uma queda são descartados).
+    """
+
+    def __init__(self, diretorio, tamanho_segmento=64 * 1024 * 1024, registros_por_bloco=256,
+                 registros_por_fsync=256):
+        """
+        Abre (ou cria) o log de eventos em um diretório.
+
+        Args:
+            diretorio (str): Diretório dos segmentos.
+            tamanho_segmento (int, optional): Tamanho, em bytes, a partir do qual um novo
+                segmento é iniciado. Default é 64 MiB.
+            registros_por_bloco (int, optional): Registros por entrada do índice esparso. Default é 256.
+            registros_por_fsync (int, optional): Registros gravados entre chamadas a fsync. Default é 256.
+        """
+        self.diretorio = diretorio
+        self.tamanho_segmento = tamanho_segmento
+        self.registros_por_bloco = registros_por_bloco
+        self.registros_por_fsync = registros_por_fsync
+        self._lock = threading.Lock()
+        self._abrir()
+
+    @property
+    def num_registros(self):
+        """
+        int: Número de eventos no log.
+        """
+        with self._lock:
+            self._garantir_aberto()
+            return self._num_registros
+
+    def _caminho(self, segmento, extensao):
+        return os.path.join(self.diretorio, f"segmento_{segmento:06d}.{extensao}")
+
+    def _abrir(self):
+        """
+        Carrega os índices dos segmentos existentes e prepara o último para anexação.
+        """
+        os.makedirs(self.diretorio, exist_ok=True)
+
+        segmentos = sorted(
+            int(nome[len("segmento_"):-len(".log")])
+            for nome in os.listdir(self.diretorio)
+            if nome.startswith("segmento_") and nome.endswith(".log")
+        )
+
+        self.blocos = []  # Blocos fechados de todos os segmentos, em ordem
+        self._num_registros = 0
+        self._pendentes_fsync = 0
+
+        for segmento in segmentos:
+            self.blocos.extend(self._carregar_indice(segmento, completar=segmento != segmentos[-1]))
+
+        self.segmento = segmentos[-1] if segmentos else 1
+        caminho_log = self._caminho(self.segmento, "log")
+        blocos_segmento = [b for b in self.blocos if b.segmento == self.segmento]
+        inicio = blocos_segmento[-1].fim if blocos_segmento else 0
+
+        # Reconstruir o bloco em aberto a partir dos registros após o último bloco indexado
+        self.bloco = BlocoIndice(self.segmento, inicio)
+        if os.path.exists(caminho_log):
+            for _, fim, tempo, _ in _varrer_segmento(caminho_log, inicio):
+                self.bloco.incluir(fim, tempo)
+
+        # Descartar registros truncados no fim do segmento
+        self._arquivo = open(caminho_log, "ab")
+        if self._arquivo.tell() > self.bloco.fim:
+            self._arquivo.truncate(self.bloco.fim)
+            self._arquivo.seek(self.bloco.fim)
+        self._indice = open(self._caminho(self.segmento, "idx"), "ab")
+
+        self._num_registros = sum(b.registros for b in self.blocos) + self.bloco.registros
+
+    def _carregar_indice(self, segmento, completar=False):
+        """
+        Carrega o índice de um segmento, descartando entradas que apontam além do fim
+        do arquivo (índice gravado antes dos dados em uma queda).
+
+        Args:
+            segmento (int): Número do segmento.
+            completar (bool, optional): Se True, indexa os registros do segmento que
+                ficaram fora do índice. Default é False.
+
+        Returns:
+            list: Blocos do segmento.
+        """
+        tamanho_log = os.path.getsize(self._caminho(segmento, "log"))
+        caminho_indice = self._caminho(segmento, "idx")
+
+        blocos = []
+        if os.path.exists(caminho_indice):
+            with open(caminho_indice, "rb") as f:
+                conteudo = f.read()
+            for i in range(len(conteudo) // _ENTRADA_INDICE.size):
+                inicio, fim, minimo, maximo, registros = _ENTRADA_INDICE.unpack_from(conteudo, i * _ENTRADA_INDICE.size)
+                if fim > tamanho_log:
+                    break
+                blocos.append(BlocoIndice(segmento, inicio, fim, minimo, maximo, registros))
+
+            # Reescrever o índice se havia entradas inválidas ou incompletas
+            if len(conteudo) != len(blocos) * _ENTRADA_INDICE.size:
+                with open(caminho_indice, "wb") as f:
+                    for bloco in blocos:
+                        f.write(self._empacotar(bloco))
+
+        inicio = blocos[-1].fim if blocos else 0
+        if completar and inicio < tamanho_log:
+            novos = [BlocoIndice(segmento, inicio)]
+            for _, fim, tempo, _ in _varrer_segmento(self._caminho(segmento, "log"), inicio):
+                if novos[-1].registros >= self.registros_por_bloco:
+                    novos.append(BlocoIndice(segmento, novos[-1].fim))
+                novos[-1].incluir(fim, tempo)
+
+            novos = [bloco for bloco in novos if bloco.registros > 0]
+            with open(caminho_indice, "ab") as f:
+                for bloco in novos:
+                    f.write(self._empacotar(bloco))
+            blocos.extend(novos)
+
+        return blocos
+
+    @staticmethod
+    def _empacotar(bloco):
+        return _ENTRADA_INDICE.pack(bloco.inicio, bloco.fim, bloco.tempo_minimo, bloco.tempo_maximo, bloco.registros)
+
+    def registrar(self, evento):
+        """
+        Anexa um evento ao log.
+
+        Args:
+            evento (dict): Evento com "tempo".
+        """
+        dados = json.dumps(evento, ensure_ascii=False, default=str).encode("utf-8")
+        tempo = float(evento["tempo"])
+
+        with self._lock:
+            self._garantir_aberto()
+            self._arquivo.write(_REGISTRO.pack(len(dados), tempo, zlib.crc32(dados)))
+            self._arquivo.write(dados)
+            self.bloco.incluir(self._arquivo.tell(), tempo)
+            self._num_registros += 1
+
+            if self.bloco.registros >= self.registros_por_bloco:
+                self._fechar_bloco()
+
+            self._pendentes_fsync += 1
+            if self._pendentes_fsync >= self.registros_por_fsync:
+                self._sincronizar()
+
+            if self.bloco.fim >= self.tamanho_segmento:
+                self._rotacionar()
+
+    def _fechar_bloco(self):
+        """
+        Grava o bloco em aberto no índice e inicia um novo.
+        """
+        if self.bloco.registros == 0:
+            return
+        self._indice.write(self._empacotar(self.bloco))
+        self.blocos.append(self.bloco)
+        self.bloco = BlocoIndice(self.segmento, self.bloco.fim)
+
+    def _sincronizar(self):
+        # Os dados vão para o disco antes do índice que aponta para eles
+        self._arquivo.flush()
+        os.fsync(self._arquivo.fileno())
+        self._indice.flush()
+        os.fsync(self._indice.fileno())
+        self._pendentes_fsync = 0
+
+    def _rotacionar(self):
+        """
+        Fecha o segmento atual e inicia o próximo.
+        """
+        self._fechar_bloco()
+        self._sincronizar()
+        self._arquivo.close()
+        self._indice.close()
+
+        self.segmento += 1
+        self.bloco = BlocoIndice(self.segmento, 0)
+        self._arquivo = open(self._caminho(self.segmento, "log"), "ab")
+        self._indice = open(self._caminho(self.segmento, "idx"), "ab")
+
+    def _garantir_aberto(self):
+        # Logs restaurados de snapshots só abrem os arquivos no primeiro uso
+        if self._arquivo is None:
+            self._abrir()
+
+    def sincronizar(self):
+        """
+        Força a gravação em disco (fsync) dos registros pendentes.
+        """
+        with self._lock:
+            if self._arquivo is not None and not self._arquivo.closed:
+                self._sincronizar()
+
+    def reproduzir(self, tempo_inicio=None, tempo_fim=None, tipo=None):
+        """
+        Reproduz os eventos do log em um intervalo de tempo, na ordem em que foram
+        registrados, lendo do disco apenas os blocos que cobrem o intervalo.
+
+        Args:
+            tempo_inicio (float, optional): Tempo inicial (inclusivo). Se None, desde o início.
+            tempo_fim (float, optional): Tempo final (inclusivo). Se None, até o fim.
+            tipo (str, optional): Se informado, apenas eventos desse tipo.
+
+        Yields:
+            dict: Eventos do intervalo.
+        """
+        inicio = float("-inf") if tempo_inicio is None else tempo_inicio
+        fim = float("inf") if tempo_fim is None else tempo_fim
+
+        with self._lock:
+            self._garantir_aberto()
+            # Tornar visíveis os registros ainda no buffer de escrita
+            if not self._arquivo.closed:
+                self._arquivo.flush()
+            blocos = [b for b in self.blocos if b.sobrepoe(inicio, fim)]
+            if self.bloco.sobrepoe(inicio, fim):
+                blocos.append(BlocoIndice(self.bloco.segmento, self.bloco.inicio, self.bloco.fim,
+                                          self.bloco.tempo_minimo, self.bloco.tempo_maximo,
+                                          self.bloco.registros))
+
+        # Blocos vizinhos do mesmo segmento são lidos em um único trecho
+        trechos = []
+        for bloco in blocos:
+            if trechos and trechos[-1][0] == bloco.segmento and trechos[-1][2] == bloco.inicio:
+                trechos[-1][2] = bloco.fim
+            else:
+                trechos.append([bloco.segmento, bloco.inicio, bloco.fim])
+
+        for segmento, inicio_trecho, fim_trecho in trechos:
+            for _, _, tempo, dados in _varrer_segmento(self._caminho(segmento, "log"), inicio_trecho, fim_trecho):
+                if inicio <= tempo <= fim:
+                    evento = json.loads(dados)
+                    if tipo is None or evento.get("tipo") == tipo:
+                        yield evento
+
+    def consultar(self, tempo_inicio=None, tempo_fim=None, tipo=None):
+        """
+        Obtém os eventos do log em um intervalo de tempo.
+
+        Args:
+            tempo_inicio (float, optional): Tempo inicial (inclusivo).
+            tempo_fim (float, optional): Tempo final (inclusivo).
+            tipo (str, optional): Se informado, apenas eventos desse tipo.
+
+        Returns:
+            list: Eventos do intervalo, na ordem em que foram registrados.
+        """
+        return list(self.reproduzir(tempo_inicio, tempo_fim, tipo))
+
+    def fechar(self):
+        """
+        Grava o bloco em aberto e os registros pendentes e fecha os arquivos.
+        """
+        with self._lock:
+            if self._arquivo is None or self._arquivo.closed:
+                return
+            self._fechar_bloco()
+            self._sincronizar()
+            self._arquivo.close()
+            self._indice.close()
+
+    def __getstate__(self):
+        # Os arquivos pertencem ao processo atual; o log é reaberto no primeiro uso após a restauração
+        self.sincronizar()
+        return {
+            "diretorio": self.diretorio,
+            "tamanho_segmento": self.tamanho_segmento,
+            "registros_por_bloco": self.registros_por_bloco,
+            "registros_por_fsync": self.registros_por_fsync
+        }
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self._lock = threading.Lock()
+        self._arquivo = None
@@ -0,0 +1,222 @@
+"""
+Perfil de desempenho por fase do passo da simulação.
+Cada passo é dividido em fases (mundo, fisiologia, decisões, interações, ...) e
+a duração de cada fase entra em um histograma rolante com as últimas N amostras,
+de onde saem p50, p95 e máximo. Desativado, o perfil não custa nada além de um
+teste de None por fase.
+"""
+
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+
+class HistogramaRolante:
+    """
+    Janela circular com as últimas amostras de uma medida.
+    """
+
+    def __init__(self, janela=1000):
+        """
+        Inicializa um novo histograma vazio.
+
+        Args:
+            janela (int, optional): Número de amostras mantidas. Default é 1000.
+        """
+        self.amostras = np.zeros(janela)
+        self.posicao = 0
+        self.total = 0  # Número de amostras registradas desde o início
+        self.maximo = 0.0  # Máximo desde o início
+
+    def registrar(self, valor):
+        """
+        Registra uma amostra, descartando a mais antiga se a janela estiver cheia.
+
+        Args:
+            valor (float): Valor da amostra.
+        """
+        self.amostras[self.posicao] = valor
+        self.posicao = (self.posicao + 1) % len(self.amostras)
+        self.total += 1
+        if valor > self.maximo:
+            self.maximo = valor
+
+    def resumo(self):
+        """
+        Calcula as estatísticas da janela atual.
+
+        Returns:
+            dict: {"amostras", "media", "p50", "p95", "max", "max_total"}, em segundos.
+        """
+        n = min(self.total, len(self.amostras))
+        if n == 0:
+            return {"amostras": 0, "media": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0, "max_total": 0.0}
+
+        janela = self.amostras[:n]
+        p50, p95 = np.percentile(janela, [50, 95])
+        return {
+            "amostras": n,
+            "media": float(janela.mean()),
+            "p50": float(p50),
+            "p95": float(p95),
+            "max": float(janela.max()),
+            "max_total": self.maximo
+        }
+
+
+class PerfilPassos:
+    """
+    Classe que mede o tempo gasto em cada fase dos passos da simulação.
+    Um passo começa com `iniciar_passo`, cada fase é encerrada com `marcar` (que
+    atribui à fase o tempo desde a marca anterior) e o passo termina com `finalizar_passo`.
+    """
+
+    def __init__(self, janela=1000, arquivo_trace=None):
+        """
+        Inicializa um novo perfil.
+
+        Args:
+            janela (int, optional): Número de passos mantidos nos histogramas. Default é 1000.
+            arquivo_trace (str, optional): Arquivo onde gravar uma linha JSON por passo
+                com a duração de cada fase. Se None, não grava trace.
+        """
+        self.janela = janela
+        self.fases = {}  # Dicionário de nome da fase: HistogramaRolante
+        self.passo_total = HistogramaRolante(janela)
+        self.fim_passos = deque(maxlen=janela)  # Instantes de término dos últimos passos
+        self.num_passos = 0
+        self.contagens = {}  # Contagens de entidades no último passo
+        self.arquivo_trace = arquivo_trace
+        self._trace = open(arquivo_trace, "a") if arquivo_trace else None
+        self._atual = None  # Dicionário de fase: duração do passo em andamento
+        self._inicio = 0.0
+        self._ultimo = 0.0
+
+    def iniciar_passo(self):
+        """
+        Inicia a medição de um passo.
+        """
+        self._atual = {}
+        self._inicio = self._ultimo = time.perf_counter()
+
+    def marcar(self, fase):
+        """
+        Atribui à fase o tempo decorrido desde a marca anterior.
+        Fases marcadas várias vezes no mesmo passo (ex: por Senciante) são somadas.
+
+        Args:
+            fase (str): Nome da fase.
+        """
+        agora = time.perf_counter()
+        self._atual[fase] = self._atual.get(fase, 0.0) + agora - self._ultimo
+        self._ultimo = agora
+
+    def acumular(self, fase, duracao):
+        """
+        Soma uma duração medida externamente a uma fase do passo em andamento.
+        Fora de um passo, a duração é registrada diretamente no histograma da fase.
+
+        Args:
+            fase (str): Nome da fase.
+            duracao (float): Duração em segundos.
+        """
+        if self._atual is None:
+            self._histograma(fase).registrar(duracao)
+        else:
+            self._atual[fase] = self._atual.get(fase, 0.0) + duracao
+
+    @contextmanager
+    def fase(self, nome):
+        """
+        Mede um bloco de código como uma fase (ex: o `atualizar` de uma mecânica).
+
+        Args:
+            nome (str): Nome da fase.
+        """
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.acumular(nome, time.perf_counter() - inicio)
+            # O bloco não deve ser contado de novo na próxima marca
+            self._ultimo = time.perf_counter()
+
+    def finalizar_passo(self, contagens=None):
+        """
+        Encerra a medição do passo, registrando as fases nos histogramas.
+
+        Args:
+            contagens (dict, optional): Contagens de entidades no fim do passo.
+        """
+        fim = time.perf_counter()
+        duracao = fim - self._inicio
+
+        for fase, tempo in self._atual.items():
+            self._histograma(fase).registrar(tempo)
+        self.passo_total.registrar(duracao)
+        self.fim_passos.append(fim)
+        self.num_passos += 1
+        if contagens is not None:
+            self.contagens = contagens
+
+        if self._trace is not None:
+            self._trace.write(json.dumps({
+                "passo": self.num_passos,
+                "duracao": duracao,
+                "fases": self._atual,
+                "contagens": self.contagens
+            }) + "\n")
+
+        self._atual = None
+
+    def _histograma(self, fase):
+        histograma = self.fases.get(fase)
+        if histograma is None:
+            histograma = self.fases[fase] = HistogramaRolante(self.janela)
+        return histograma
+
+    def passos_por_segundo(self):
+        """
+        Calcula a taxa de passos na janela atual.
+
+        Returns:
+            float: Passos por segundo (0.0 com menos de dois passos).
+        """
+        if len(self.fim_passos) < 2:
+            return 0.0
+        intervalo = self.fim_passos[-1] - self.fim_passos[0]
+        return (len(self.fim_passos) - 1) / intervalo if intervalo > 0 else 0.0
+
+    def resumo(self):
+        """
+        Gera o resumo do perfil.
+
+        Returns:
+            dict: Passos medidos, passos por segundo, estatísticas do passo e de cada fase
+                e as contagens de entidades do último passo.
+        """
+        return {
+            "passos": self.num_passos,
+            "passos_por_segundo": self.passos_por_segundo(),
+            "passo": self.passo_total.resumo(),
+            "fases": {fase: histograma.resumo() for fase, histograma in list(self.fases.items())},
+            "contagens": dict(self.contagens)
+        }
+
+    def fechar(self):
+        """
+        Fecha o arquivo de trace, se houver.
+        """
+        if self._trace is not None:
+            self._trace.close()
+            self._trace = None
+
+    def __getstate__(self):
+        # O arquivo de trace pertence ao processo atual e não é salvo
+        estado = self.__dict__.copy()
+        estado["_trace"] = None
+        estado["arquivo_trace"] = None
+        return estado
@@ -0,0 +1,137 @@
+"""
+Snapshots binários da simulação para o jogo "O Mundo dos Senciantes".
+O grafo de objetos (Simulacao, Mundo, Senciantes, mecânicas anexadas, histórico)
+é serializado com pickle (protocolo 5) e os arrays NumPy são gravados crus,
+fora do fluxo do pickle, sem cópias intermediárias.
+
+Formato do arquivo:
+    MAGICO (8 bytes) | versão (uint32) | número de buffers (uint32) |
+    tamanho do pickle (uint64) | pickle | [tamanho do buffer (uint64) | buffer] * n
+
+Snapshots executam código ao serem carregados (como qualquer pickle);
+carregue apenas arquivos de origem confiável.
+"""
+
+import io
+import pickle
+import struct
+
+MAGICO = b"SENCSNAP"
+VERSAO_SNAPSHOT = 1
+
+_CABECALHO = struct.Struct("<8sIIQ")
+_TAMANHO = struct.Struct("<Q")
+
+
+class ErroSnapshot(Exception):
+    """
+    Erro levantado quando um arquivo não é um snapshot válido.
+    """
+
+
+def serializar_snapshot(objeto):
+    """
+    Serializa um objeto (normalmente uma Simulacao) para o formato de snapshot.
+
+    Args:
+        objeto (object): Objeto a ser serializado.
+
+    Returns:
+        bytes: Conteúdo do snapshot.
+    """
+    saida = io.BytesIO()
+    escrever_snapshot(objeto, saida)
+    return saida.getvalue()
+
+
+def escrever_snapshot(objeto, arquivo):
+    """
+    Escreve o snapshot de um objeto em um arquivo binário aberto.
+
+    Args:
+        objeto (object): Objeto a ser serializado.
+        arquivo (file): Arquivo aberto em modo binário para escrita.
+    """
+    buffers = []
+    dados = pickle.dumps(objeto, protocol=5, buffer_callback=buffers.append)
+
+    arquivo.write(_CABECALHO.pack(MAGICO, VERSAO_SNAPSHOT, len(buffers), len(dados)))
+    arquivo.write(dados)
+
+    for buffer in buffers:
+        bruto = buffer.raw()
+        arquivo.write(_TAMANHO.pack(bruto.nbytes))
+        arquivo.write(bruto)
+
+
+def ler_snapshot(arquivo):
+    """
+    Lê um snapshot de um arquivo binário aberto.
+
+    Args:
+        arquivo (file): Arquivo aberto em modo binário para leitura.
+
+    Returns:
+        object: Objeto restaurado.
+
+    Raises:
+        ErroSnapshot: Se o arquivo não for um snapshot válido.
+    """
+    cabecalho = arquivo.read(_CABECALHO.size)
+    if len(cabecalho) < _CABECALHO.size:
+        raise ErroSnapshot("Arquivo de snapshot truncado")
+
+    magico, versao, num_buffers, tamanho = _CABECALHO.unpack(cabecalho)
+    if magico != MAGICO:
+        raise ErroSnapshot("Arquivo não é um snapshot da simulação")
+    if versao != VERSAO_SNAPSHOT:
+        raise ErroSnapshot(f"Versão de snapshot não suportada: {versao}")
+
+    dados = arquivo.read(tamanho)
+
+    buffers = []
+    for _ in range(num_buffers):
+        (tamanho_buffer,) = _TAMANHO.unpack(arquivo.read(_TAMANHO.size))
+        # bytearray para que os arrays restaurados sejam graváveis
+        buffers.append(bytearray(arquivo.read(tamanho_buffer)))
+
+    return pickle.loads(dados, buffers=buffers)
+
+
+def desserializar_snapshot(conteudo):
+    """
+    Restaura um objeto a partir do conteúdo de um snapshot.
+
+    Args:
+        conteudo (bytes): Conteúdo gerado por `serializar_snapshot`.
+
+    Returns:
+        object: Objeto restaurado.
+    """
+    return ler_snapshot(io.BytesIO(conteudo))
+
+
+def salvar_snapshot(objeto, caminho):
+    """
+    Salva o snapshot de um objeto em um arquivo.
+
+    Args:
+        objeto (object): Objeto a ser salvo (normalmente uma Simulacao).
+        caminho (str): Caminho do arquivo.
+    """
+    with open(caminho, 'wb') as f:
+        escrever_snapshot(objeto, f)
+
+
+def carregar_snapshot(caminho):
+    """
+    Carrega um snapshot de um arquivo.
+
+    Args:
+        caminho (str): Caminho do arquivo.
+
+    Returns:
+        object: Objeto restaurado.
+    """
+    with open(caminho, 'rb') as f:
+        return ler_snapshot(f)
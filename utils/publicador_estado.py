@@ -0,0 +1,154 @@
+"""
+Publicação de snapshots imutáveis do estado da simulação para a API.
+Ao final de cada passo, a thread da simulação serializa o estado para JSON e
+troca a referência do snapshot publicado (buffer duplo). As threads de requisição
+só leem o snapshot já publicado, sem locks e sem tocar nos objetos vivos.
+"""
+
+import json
+import time
+from types import MappingProxyType
+
+
+def _json(valor):
+    return json.dumps(valor, separators=(",", ":"))
+
+
+def _objeto_json(pares):
+    """
+    Monta um objeto JSON a partir de pares (chave, valor já serializado).
+
+    Args:
+        pares (iterable): Pares de chave e JSON.
+
+    Returns:
+        str: Objeto JSON.
+    """
+    # Chaves inteiras (IDs de entidades) viram strings, como em json.dumps
+    return "{" + ",".join(f"{json.dumps(str(chave))}:{valor}" for chave, valor in pares) + "}"
+
+
+class SnapshotEstado:
+    """
+    Snapshot imutável e já serializado do estado da simulação.
+    """
+
+    __slots__ = ("versao", "tempo_simulacao", "secoes", "senciantes")
+
+    def __init__(self, versao, tempo_simulacao, secoes, senciantes):
+        """
+        Inicializa um novo snapshot.
+
+        Args:
+            versao (int): Número do snapshot, crescente.
+            tempo_simulacao (float): Tempo de simulação no momento da publicação.
+            secoes (dict): Dicionário de nome da seção: JSON.
+            senciantes (dict): Dicionário de senciante_id: JSON.
+        """
+        object.__setattr__(self, "versao", versao)
+        object.__setattr__(self, "tempo_simulacao", tempo_simulacao)
+        object.__setattr__(self, "secoes", MappingProxyType(dict(secoes)))
+        object.__setattr__(self, "senciantes", MappingProxyType(dict(senciantes)))
+
+    def __setattr__(self, nome, valor):
+        raise AttributeError("SnapshotEstado é imutável")
+
+
+class PublicadorEstado:
+    """
+    Classe que publica snapshots do estado da simulação.
+    Deve ser registrada como callback de "atualizacao" da Simulacao.
+    """
+
+    def __init__(self, intervalo_minimo=0.0):
+        """
+        Inicializa um novo publicador.
+
+        Args:
+            intervalo_minimo (float, optional): Intervalo mínimo, em segundos reais, entre
+                publicações. Passos mais próximos que isso não publicam. Default é 0.0.
+        """
+        self.intervalo_minimo = intervalo_minimo
+        self.atual = None  # Último SnapshotEstado publicado
+        self.ultima_publicacao = 0.0
+        self._geografia = None  # (geografia, JSON) da última geografia serializada
+
+    def __call__(self, simulacao):
+        """
+        Publica um snapshot se o intervalo mínimo tiver passado.
+        Assinatura compatível com callbacks de "atualizacao".
+
+        Args:
+            simulacao (Simulacao): Simulação atualizada.
+        """
+        agora = time.monotonic()
+        if self.atual is not None and agora - self.ultima_publicacao < self.intervalo_minimo:
+            return
+
+        self.publicar(simulacao)
+        self.ultima_publicacao = agora
+
+    def _geografia_json(self, mundo):
+        # A geografia é gerada uma vez por mundo; reaproveitar a serialização
+        if self._geografia is None or self._geografia[0] is not mundo.geografia:
+            geografia = {
+                "elevacao": mundo.geografia["elevacao"].tolist(),
+                "biomas": mundo.geografia["biomas"].tolist()
+            }
+            self._geografia = (mundo.geografia, _json(geografia))
+        return self._geografia[1]
+
+    def publicar(self, simulacao):
+        """
+        Serializa o estado da simulação e publica o novo snapshot.
+        Deve ser chamado pela thread que atualiza a simulação.
+
+        Args:
+            simulacao (Simulacao): Simulação a publicar.
+
+        Returns:
+            SnapshotEstado: Snapshot publicado.
+        """
+        mundo = simulacao.mundo
+
+        senciantes = {senciante_id: _json(senciante.to_dict())
+                      for senciante_id, senciante in simulacao.senciantes.items()}
+        senciantes_json = _objeto_json(senciantes.items())
+
+        recursos_json = _objeto_json((i, _json(r.to_dict())) for i, r in mundo.recursos.items())
+        construcoes = {i: _json(c.to_dict()) for i, c in mundo.construcoes.items()}
+        historico_json = _json(mundo.historico.to_dict())
+        clima_json = _json(mundo.clima.to_dict())
+
+        mundo_json = _objeto_json([
+            ("tamanho", _json(mundo.tamanho)),
+            ("geografia", self._geografia_json(mundo)),
+            ("recursos", recursos_json),
+            ("construcoes", _objeto_json(construcoes.items())),
+            ("clima", clima_json),
+            ("historico", historico_json)
+        ])
+
+        # Mesmo formato de Simulacao.to_dict()
+        estado_json = _objeto_json([
+            ("estado", _json(simulacao.obter_estado())),
+            ("mundo", mundo_json),
+            ("senciantes", senciantes_json),
+            ("historico", historico_json)
+        ])
+
+        secoes = {
+            "estado": estado_json,
+            "senciantes": senciantes_json,
+            "recursos": recursos_json,
+            "construcoes": "[" + ",".join(construcoes.values()) + "]",
+            "historico": historico_json,
+            "clima": clima_json
+        }
+
+        versao = self.atual.versao + 1 if self.atual is not None else 1
+        snapshot = SnapshotEstado(versao, simulacao.tempo_simulacao, secoes, senciantes)
+
+        # Troca atômica da referência; leitores continuam com o snapshot anterior até aqui
+        self.atual = snapshot
+        return snapshot
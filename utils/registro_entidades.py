@@ -0,0 +1,115 @@
+"""
+Registro de IDs de entidades para o jogo "O Mundo dos Senciantes".
+As entidades recebem IDs inteiros compactos, crescentes por tipo de entidade,
+em vez de strings UUID: comparar e usar como chave de dicionário um inteiro
+pequeno é bem mais barato que fazer o hash de uma string de 36 caracteres.
+
+O tipo fica nos bits mais baixos do ID, de modo que IDs de tipos diferentes
+nunca colidem (os eventos, por exemplo, misturam Senciantes e construções).
+A forma externa do ID, usada pela API e pelo `to_dict` das entidades, é o
+próprio inteiro.
+"""
+
+import threading
+
+# Tipos de entidade; a posição na tupla é o código guardado no ID e não deve mudar
+TIPOS_ENTIDADE = (
+    "entidade", "senciante", "memoria", "recurso", "construcao", "evento",
+    "doenca", "artefato", "territorio", "flora", "fauna"
+)
+BITS_TIPO = 4
+
+
+class RegistroEntidades:
+    """
+    Classe que gera os IDs das entidades e converte os IDs recebidos de fora (texto) para inteiros.
+    Os contadores são do processo; os snapshots guardam o estado deles (`estado`)
+    para que, ao carregar um mundo, novos IDs não repitam os já usados (`reservar`).
+    """
+
+    def __init__(self):
+        """
+        Inicializa um novo registro com todos os contadores zerados.
+        """
+        self.codigos = {tipo: codigo for codigo, tipo in enumerate(TIPOS_ENTIDADE)}
+        self.contadores = dict.fromkeys(TIPOS_ENTIDADE, 0)  # Dicionário de tipo: último número gerado
+        self.trava = threading.Lock()
+
+    def gerar(self, tipo="entidade"):
+        """
+        Gera um novo ID.
+
+        Args:
+            tipo (str, optional): Tipo da entidade (um de TIPOS_ENTIDADE). Default é "entidade".
+
+        Returns:
+            int: ID da entidade.
+
+        Raises:
+            ValueError: Se o tipo for desconhecido.
+        """
+        codigo = self.codigos.get(tipo)
+        if codigo is None:
+            raise ValueError(f"Tipo de entidade desconhecido: {tipo}")
+
+        with self.trava:
+            numero = self.contadores[tipo] + 1
+            self.contadores[tipo] = numero
+        return (numero << BITS_TIPO) | codigo
+
+    @staticmethod
+    def tipo_de(entidade_id):
+        """
+        Obtém o tipo de uma entidade a partir do ID.
+
+        Args:
+            entidade_id (int): ID da entidade.
+
+        Returns:
+            str: Tipo da entidade.
+        """
+        return TIPOS_ENTIDADE[entidade_id & ((1 << BITS_TIPO) - 1)]
+
+    def interno(self, valor):
+        """
+        Converte um ID recebido de fora para a forma interna.
+        Aceita o inteiro em texto ("193") ou o próprio inteiro; outras strings são devolvidas
+        como estão e não correspondem a nenhuma entidade.
+
+        Args:
+            valor (str ou int): ID recebido.
+
+        Returns:
+            int ou str: ID interno.
+        """
+        if isinstance(valor, int):
+            return valor
+
+        valor = valor.strip()
+        return int(valor) if valor.isdigit() else valor
+
+    def estado(self):
+        """
+        Obtém o estado dos contadores, para salvar junto de um snapshot.
+
+        Returns:
+            dict: Dicionário de tipo: último número gerado.
+        """
+        with self.trava:
+            return dict(self.contadores)
+
+    def reservar(self, contadores):
+        """
+        Avança os contadores para depois dos números já usados por um snapshot carregado.
+
+        Args:
+            contadores (dict): Dicionário de tipo: último número gerado, como devolvido por `estado`.
+        """
+        with self.trava:
+            for tipo, numero in contadores.items():
+                if tipo in self.contadores and numero > self.contadores[tipo]:
+                    self.contadores[tipo] = numero
+
+
+# Registro do processo, usado por `utils.helpers.gerar_id`
+registro_entidades = RegistroEntidades()
@@ -0,0 +1,169 @@
+"""
+Registro de grupos de Senciantes para o jogo "O Mundo dos Senciantes".
+Agrega membros, liderança, recursos, valores morais, tecnologias e cultura de
+cada grupo uma única vez por passo, para que todas as mecânicas consumam a
+mesma tabela em vez de reconstruí-la.
+"""
+
+
+class RegistroGrupos:
+    """
+    Classe que mantém a tabela de grupos de Senciantes em cache.
+    A tabela é reconstruída apenas quando o registro está sujo: no início de cada
+    passo (`Mundo.atualizar`), após `invalidar()` ou quando outro dicionário de
+    Senciantes é consultado.
+    """
+
+    def __init__(self):
+        """
+        Inicializa um novo registro de grupos vazio.
+        """
+        self.grupos = {}  # Dicionário de grupo_id: grupo
+        self.sujo = True
+        self.reconstrucoes = 0  # Número de vezes que a tabela foi reconstruída
+        self._senciantes = None
+        self._num_senciantes = 0
+
+    def invalidar(self):
+        """
+        Marca a tabela como desatualizada. Deve ser chamado quando a participação
+        em grupos, os inventários ou a moralidade dos Senciantes mudarem no meio de um passo.
+        """
+        self.sujo = True
+
+    def obter(self, senciantes):
+        """
+        Obtém a tabela de grupos, reconstruindo-a se necessário.
+
+        Args:
+            senciantes (dict): Dicionário de Senciantes (id: Senciante).
+
+        Returns:
+            dict: Dicionário de grupo_id: grupo. Senciantes sem grupo formam grupos
+                individuais com id "individual_<senciante_id>". A tabela é compartilhada
+                entre as mecânicas e não deve ser alterada.
+        """
+        if self.sujo or senciantes is not self._senciantes or len(senciantes) != self._num_senciantes:
+            self.grupos = self._construir(senciantes)
+            self.sujo = False
+            self._senciantes = senciantes
+            self._num_senciantes = len(senciantes)
+            self.reconstrucoes += 1
+
+        return self.grupos
+
+    def contar_grupos(self, senciantes, incluir_individuais=False):
+        """
+        Conta os grupos sociais.
+
+        Args:
+            senciantes (dict): Dicionário de Senciantes (id: Senciante).
+            incluir_individuais (bool, optional): Se True, conta também Senciantes sem grupo. Default é False.
+
+        Returns:
+            int: Número de grupos.
+        """
+        grupos = self.obter(senciantes)
+        if incluir_individuais:
+            return len(grupos)
+        return sum(1 for grupo_id in grupos if not grupo_id.startswith("individual_"))
+
+    def _construir(self, senciantes):
+        """
+        Constrói a tabela de grupos a partir dos Senciantes.
+
+        Args:
+            senciantes (dict): Dicionário de Senciantes (id: Senciante).
+
+        Returns:
+            dict: Dicionário de grupos identificados.
+        """
+        grupos = {}
+
+        for senciante_id, senciante in senciantes.items():
+            # Verificar se o Senciante tem um grupo
+            grupo_id = getattr(senciante, "grupo_id", None)
+
+            # Se não tiver grupo, considerar como indivíduo
+            if grupo_id is None:
+                grupo_id = f"individual_{senciante_id}"
+
+            grupo = grupos.get(grupo_id)
+            if grupo is None:
+                grupo = grupos[grupo_id] = {
+                    "membros": [],
+                    "lider_id": None,
+                    "posicao_media": [0.0, 0.0],
+                    "forca_total": 0.0,
+                    "nivel_cultural": 0.0,
+                    "recursos": {},
+                    "valores_morais": {},
+                    "tecnologias": set(),
+                    "artefatos": [],
+                    "locais_sagrados": [],
+                    "tradicoes": []
+                }
+
+            grupo["membros"].append(senciante_id)
+            n = len(grupo["membros"])
+
+            # Atualizar posição média
+            if n == 1:
+                grupo["posicao_media"] = list(senciante.posicao)
+            else:
+                grupo["posicao_media"][0] = ((n - 1) * grupo["posicao_media"][0] + senciante.posicao[0]) / n
+                grupo["posicao_media"][1] = ((n - 1) * grupo["posicao_media"][1] + senciante.posicao[1]) / n
+
+            habilidades = getattr(senciante, "habilidades", None)
+            if habilidades is not None:
+                lideranca = habilidades.get("lideranca", 0.0)
+
+                # Força individual
+                grupo["forca_total"] += 1.0 + habilidades.get("combate", 0.0) * 2.0 + lideranca * 1.0
+
+                # Nível cultural
+                nivel_cultural_individual = (
+                    habilidades.get("arte", 0.0) * 0.5 +
+                    habilidades.get("comunicacao", 0.0) * 0.3 +
+                    habilidades.get("espiritualidade", 0.0) * 0.2
+                )
+                grupo["nivel_cultural"] += nivel_cultural_individual / n
+
+                # Verificar se é líder
+                if lideranca > 0.5:
+                    if grupo["lider_id"] is None or lideranca > senciantes[grupo["lider_id"]].habilidades.get("lideranca", 0.0):
+                        grupo["lider_id"] = senciante_id
+            else:
+                grupo["forca_total"] += 1.0
+
+            # Coletar recursos
+            for recurso, quantidade in senciante.inventario.items():
+                grupo["recursos"][recurso] = grupo["recursos"].get(recurso, 0.0) + quantidade
+
+            # Coletar valores morais
+            moralidade = getattr(senciante, "moralidade", None)
+            if moralidade is not None:
+                for valor, nivel in moralidade.valores.items():
+                    grupo["valores_morais"].setdefault(valor, []).append(nivel)
+
+            # Coletar tecnologias
+            if hasattr(senciante, "tecnologias"):
+                grupo["tecnologias"].update(senciante.tecnologias)
+
+            # Coletar artefatos, locais sagrados e tradições
+            for chave, atributo in (("artefatos", "artefatos_conhecidos"),
+                                    ("locais_sagrados", "locais_sagrados_conhecidos"),
+                                    ("tradicoes", "tradicoes_conhecidas")):
+                conhecidos = getattr(senciante, atributo, None)
+                if conhecidos:
+                    lista = grupo[chave]
+                    lista.extend([item for item in conhecidos if item not in lista])
+
+        # Calcular valores morais médios
+        for grupo in grupos.values():
+            grupo["valores_morais"] = {
+                valor: sum(niveis) / len(niveis)
+                for valor, niveis in grupo["valores_morais"].items()
+            }
+
+        return grupos
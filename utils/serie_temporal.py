@@ -0,0 +1,200 @@
+"""
+Séries temporais colunares para as estatísticas do histórico.
+Cada série guarda as amostras brutas e agregados por intervalo (mínimo, média
+e máximo por hora e por dia, por exemplo) em arrays NumPy pré-alocados. Cada
+camada tem capacidade máxima; quando enche, as amostras mais antigas daquela
+camada são descartadas, de modo que a memória fica limitada e os agregados
+mais grossos preservam o histórico longo.
+"""
+
+import numpy as np
+
+
+class CamadaSerie:
+    """
+    Tabela colunar de tamanho limitado, em ordem cronológica.
+    As colunas ficam em um único array (linhas x colunas) que cresce por
+    duplicação até a capacidade máxima. Leitores obtêm `(dados, n)` em uma única
+    leitura de atributo, de modo que consultas de outras threads veem sempre um
+    estado consistente.
+    """
+
+    def __init__(self, colunas, capacidade_maxima, capacidade_inicial=256):
+        """
+        Inicializa uma nova camada vazia.
+
+        Args:
+            colunas (tuple): Nomes das colunas (a primeira é o tempo).
+            capacidade_maxima (int): Número máximo de linhas retidas.
+            capacidade_inicial (int, optional): Linhas pré-alocadas. Default é 256.
+        """
+        self.colunas = colunas
+        self.capacidade_maxima = capacidade_maxima
+        dados = np.empty((min(capacidade_inicial, capacidade_maxima), len(colunas)))
+        self.vista = (dados, 0)  # (array de linhas, número de linhas válidas)
+
+    def __len__(self):
+        return self.vista[1]
+
+    def adicionar(self, linha):
+        """
+        Adiciona uma linha ao fim da camada.
+
+        Args:
+            linha (tuple): Valores de cada coluna.
+        """
+        dados, n = self.vista
+
+        if n == len(dados):
+            if len(dados) < self.capacidade_maxima:
+                # Crescer por duplicação
+                novos = np.empty((min(len(dados) * 2, self.capacidade_maxima), len(self.colunas)))
+                novos[:n] = dados[:n]
+            else:
+                # Descartar o quarto mais antigo
+                descarte = max(1, n // 4)
+                novos = np.empty_like(dados)
+                novos[:n - descarte] = dados[descarte:n]
+                n -= descarte
+            dados = novos
+
+        dados[n] = linha
+        self.vista = (dados, n + 1)
+
+    def consultar(self, tempo_inicio=None, tempo_fim=None):
+        """
+        Obtém as linhas com tempo no intervalo (limites inclusivos).
+
+        Args:
+            tempo_inicio (float, optional): Tempo inicial. Se None, desde o início.
+            tempo_fim (float, optional): Tempo final. Se None, até o fim.
+
+        Returns:
+            numpy.ndarray: Cópia das linhas do intervalo.
+        """
+        dados, n = self.vista
+        tempos = dados[:n, 0]
+
+        inicio = 0 if tempo_inicio is None else np.searchsorted(tempos, tempo_inicio, side="left")
+        fim = n if tempo_fim is None else np.searchsorted(tempos, tempo_fim, side="right")
+        return dados[inicio:fim].copy()
+
+
+class SerieTemporal:
+    """
+    Série temporal de valores numéricos com agregação em múltiplas resoluções.
+    As amostras devem chegar em ordem de tempo; amostras atrasadas entram no
+    intervalo em aberto de cada resolução.
+    """
+
+    COLUNAS_BRUTAS = ("tempo", "valor")
+    COLUNAS_AGREGADAS = ("tempo", "minimo", "media", "maximo", "amostras")
+
+    def __init__(self, resolucoes, max_pontos_brutos, max_pontos_agregados):
+        """
+        Inicializa uma nova série vazia.
+
+        Args:
+            resolucoes (dict): Dicionário de nome: largura do intervalo em horas.
+            max_pontos_brutos (int): Número máximo de amostras brutas retidas.
+            max_pontos_agregados (int): Número máximo de intervalos retidos por resolução.
+        """
+        self.bruto = CamadaSerie(self.COLUNAS_BRUTAS, max_pontos_brutos)
+        self.resolucoes = dict(resolucoes)
+        self.agregados = {
+            nome: CamadaSerie(self.COLUNAS_AGREGADAS, max_pontos_agregados)
+            for nome in self.resolucoes
+        }
+        # Intervalo em aberto de cada resolução: [início, mínimo, soma, máximo, amostras]
+        self.abertos = {nome: None for nome in self.resolucoes}
+
+    def __len__(self):
+        return len(self.bruto)
+
+    def registrar(self, tempo, valor):
+        """
+        Registra uma amostra.
+
+        Args:
+            tempo (float): Tempo da simulação.
+            valor (float): Valor da amostra.
+        """
+        self.bruto.adicionar((tempo, valor))
+
+        for nome, largura in self.resolucoes.items():
+            inicio = (tempo // largura) * largura
+            aberto = self.abertos[nome]
+
+            if aberto is not None and inicio > aberto[0]:
+                # O intervalo anterior está completo
+                self._fechar(nome)
+                aberto = None
+
+            if aberto is None:
+                self.abertos[nome] = [inicio, valor, valor, valor, 1]
+            else:
+                aberto[1] = min(aberto[1], valor)
+                aberto[2] += valor
+                aberto[3] = max(aberto[3], valor)
+                aberto[4] += 1
+
+    def _fechar(self, nome):
+        inicio, minimo, soma, maximo, amostras = self.abertos[nome]
+        self.agregados[nome].adicionar((inicio, minimo, soma / amostras, maximo, amostras))
+        self.abertos[nome] = None
+
+    def consultar(self, tempo_inicio=None, tempo_fim=None, resolucao="bruto"):
+        """
+        Obtém os pontos da série em um intervalo de tempo.
+
+        Args:
+            tempo_inicio (float, optional): Tempo inicial. Se None, desde o início.
+            tempo_fim (float, optional): Tempo final. Se None, até o fim.
+            resolucao (str, optional): "bruto" ou o nome de uma resolução. Default é "bruto".
+
+        Returns:
+            dict: Dicionário de coluna: lista de valores. Nas resoluções agregadas, o
+                tempo é o início de cada intervalo e o intervalo em aberto vem por último.
+
+        Raises:
+            ValueError: Se a resolução não existir.
+        """
+        if resolucao == "bruto":
+            linhas = self.bruto.consultar(tempo_inicio, tempo_fim)
+            colunas = self.COLUNAS_BRUTAS
+        elif resolucao in self.agregados:
+            linhas = self.agregados[resolucao].consultar(tempo_inicio, tempo_fim)
+            colunas = self.COLUNAS_AGREGADAS
+
+            aberto = self.abertos[resolucao]
+            if aberto is not None and (tempo_inicio is None or aberto[0] >= tempo_inicio) and \
+                    (tempo_fim is None or aberto[0] <= tempo_fim):
+                inicio, minimo, soma, maximo, amostras = aberto
+                linhas = np.vstack([linhas, [(inicio, minimo, soma / amostras, maximo, amostras)]])
+        else:
+            raise ValueError(f"Resolução desconhecida: {resolucao}")
+
+        return {coluna: linhas[:, i].tolist() for i, coluna in enumerate(colunas)}
+
+    def pontos(self, max_pontos=500):
+        """
+        Obtém a série como lista de [tempo, valor] na resolução mais fina que caiba
+        em `max_pontos` (valores agregados são médias).
+
+        Args:
+            max_pontos (int, optional): Número máximo de pontos. Default é 500.
+
+        Returns:
+            list: Lista de [tempo, valor].
+        """
+        resolucao = "bruto"
+        if len(self.bruto) > max_pontos:
+            # Da resolução mais fina para a mais grossa
+            for nome in sorted(self.resolucoes, key=self.resolucoes.get):
+                resolucao = nome
+                if len(self.agregados[nome]) + 1 <= max_pontos:
+                    break
+
+        dados = self.consultar(resolucao=resolucao)
+        valores = dados["valor"] if resolucao == "bruto" else dados["media"]
+        return [[t, v] for t, v in zip(dados["tempo"], valores)][-max_pontos:]